@@ -18,9 +18,12 @@
 
 -- 확장 모듈 활성화
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+CREATE EXTENSION IF NOT EXISTS pg_trgm;              -- 상품명 부분 검색 (트라이그램 인덱스)
 
 -- 기존 테이블 삭제 (주의: 모든 데이터가 삭제됩니다!)
--- DROP TABLE IF EXISTS products CASCADE;
+-- DROP VIEW IF EXISTS products;
+-- DROP TABLE IF EXISTS product_metrics CASCADE;
+-- DROP TABLE IF EXISTS product_info CASCADE;
 -- DROP TABLE IF EXISTS categories CASCADE;
 -- DROP TABLE IF EXISTS crawl_history CASCADE;
 
@@ -42,31 +45,63 @@ COMMENT ON COLUMN categories.is_active IS '활성 상태';
 COMMENT ON COLUMN categories.created_at IS '생성 시간';
 
 -- =====================================================
--- Products 테이블 (상품 정보)
+-- Product_Info 테이블 (상품 정보 - 거의 바뀌지 않는 넓은 컬럼)
 -- =====================================================
-CREATE TABLE IF NOT EXISTS products (
+CREATE TABLE IF NOT EXISTS product_info (
     product_id VARCHAR(255) PRIMARY KEY,              -- 네이버 상품 ID
     category_name VARCHAR(100),                       -- 카테고리명 (예: "여성의류")
     product_name TEXT NOT NULL,                       -- 상품명
     search_tags TEXT[],                                -- 검색 태그 배열
-    price INTEGER,                                     -- 가격 (원)
-    rating DECIMAL(2,1),                               -- 평점 (0.0 ~ 5.0)
     product_url TEXT,                                  -- 상품 상세 페이지 URL
     thumbnail_url TEXT,                                -- 썸네일 이미지 URL
     brand_name VARCHAR(100),                          -- 브랜드명
+    crawled_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,   -- 크롤링 시간
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,   -- 업데이트 시간
+    content_hash VARCHAR(32)                          -- 변경 감지 해시 (같으면 UPSERT가 행을 갱신하지 않음)
+);
+
+-- Product_Info 인덱스 (조회 패턴 기준 - src/database/query_indexes.py와 같은 목록)
+CREATE INDEX IF NOT EXISTS idx_crawled_at ON product_info(crawled_at);
+CREATE INDEX IF NOT EXISTS idx_product_search_tags ON product_info USING GIN (search_tags);           -- 태그 검색 (@>)
+CREATE INDEX IF NOT EXISTS idx_product_name_trgm ON product_info USING GIN (product_name gin_trgm_ops); -- 상품명 ILIKE '%...%'
+
+-- Product_Info 코멘트
+COMMENT ON TABLE product_info IS '네이버 쇼핑 상품 정보 (가격/리뷰 등 자주 바뀌는 값은 product_metrics)';
+COMMENT ON COLUMN product_info.content_hash IS '변경 감지 해시 (product_id 외 product_info 컬럼 md5, 크롤러에서 계산)';
+
+-- =====================================================
+-- Product_Metrics 테이블 (재수집마다 바뀌는 좁은 컬럼)
+-- =====================================================
+-- 인덱스는 PK만 + fillfactor 70 → 갱신이 같은 페이지 안 HOT update로 처리 (인덱스/넓은 행 재기록 없음)
+CREATE TABLE IF NOT EXISTS product_metrics (
+    product_id VARCHAR(255) PRIMARY KEY
+        REFERENCES product_info(product_id) ON DELETE CASCADE,  -- 네이버 상품 ID
+    price INTEGER,                                     -- 가격 (원)
+    rating DECIMAL(2,1),                               -- 평점 (0.0 ~ 5.0)
     discount_rate INTEGER,                             -- 할인율 (%)
     review_count INTEGER DEFAULT 0,                   -- 리뷰 수
-    crawled_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,   -- 크롤링 시간
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP    -- 업데이트 시간
-);
+) WITH (fillfactor = 70);
 
--- Products 인덱스
-CREATE INDEX IF NOT EXISTS idx_product_name ON products(product_name);
-CREATE INDEX IF NOT EXISTS idx_product_price ON products(price);
-CREATE INDEX IF NOT EXISTS idx_crawled_at ON products(crawled_at);
+-- Product_Metrics 코멘트
+COMMENT ON TABLE product_metrics IS '상품 가격/할인율/리뷰 수/평점 (자주 바뀌는 값, HOT update용 fillfactor 70)';
+
+-- =====================================================
+-- Products 뷰 (호환용 - 기존 13개 필드 조회 쿼리 그대로 사용)
+-- =====================================================
+-- 저장은 product_info/product_metrics에 직접 (DatabaseConnector가 자동 처리)
+CREATE OR REPLACE VIEW products AS
+SELECT
+    i.product_id, i.category_name, i.product_name, i.search_tags,
+    m.price, m.rating, i.product_url, i.thumbnail_url, i.brand_name,
+    m.discount_rate, m.review_count, i.crawled_at,
+    GREATEST(i.updated_at, m.updated_at) AS updated_at,
+    i.content_hash
+FROM product_info i
+LEFT JOIN product_metrics m ON m.product_id = i.product_id;
 
 -- Products 코멘트
-COMMENT ON TABLE products IS '네이버 쇼핑 상품 정보 (13개 필드)';
+COMMENT ON VIEW products IS '네이버 쇼핑 상품 정보 (13개 필드, product_info + product_metrics 호환 뷰)';
 COMMENT ON COLUMN products.product_id IS '네이버 상품 ID (Primary Key)';
 COMMENT ON COLUMN products.category_name IS '카테고리명 [1순위]';
 COMMENT ON COLUMN products.product_name IS '상품명 [1순위]';
@@ -78,6 +113,7 @@ COMMENT ON COLUMN products.thumbnail_url IS '썸네일 이미지 URL [2순위]';
 COMMENT ON COLUMN products.brand_name IS '브랜드명 [3순위]';
 COMMENT ON COLUMN products.discount_rate IS '할인율 (%) [3순위]';
 COMMENT ON COLUMN products.review_count IS '리뷰 수 [3순위]';
+COMMENT ON COLUMN products.content_hash IS '변경 감지 해시 (product_info 컬럼 기준)';
 COMMENT ON COLUMN products.crawled_at IS '크롤링 시간 [3순위]';
 COMMENT ON COLUMN products.updated_at IS '업데이트 시간 [3순위]';
 
@@ -98,6 +134,10 @@ CREATE TABLE IF NOT EXISTS crawl_history (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP    -- 생성 시간
 );
 
+-- Crawl_History 인덱스 (재개 지점 조회: 카테고리/타입/상태 조건 + 최신 시작 시간)
+CREATE INDEX IF NOT EXISTS idx_crawl_history_resume
+    ON crawl_history(category_name, crawl_type, status, start_time DESC);
+
 -- Crawl_History 코멘트
 COMMENT ON TABLE crawl_history IS '크롤링 실행 이력';
 COMMENT ON COLUMN crawl_history.history_id IS '이력 ID';
@@ -112,6 +152,66 @@ COMMENT ON COLUMN crawl_history.status IS '상태 (running, completed, failed, p
 COMMENT ON COLUMN crawl_history.error_message IS '오류 메시지';
 COMMENT ON COLUMN crawl_history.created_at IS '생성 시간';
 
+-- =====================================================
+-- Product_Id_Map 테이블 (리스트 키 → 상품 ID 매핑)
+-- =====================================================
+CREATE TABLE IF NOT EXISTS product_id_map (
+    listing_key VARCHAR(255) PRIMARY KEY,             -- 리스트 카드 키 (nvMid 또는 쿼리 제외 URL)
+    product_id VARCHAR(255) NOT NULL,                 -- 상세 페이지에서 확인한 상품 ID
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,   -- 생성 시간
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP    -- 업데이트 시간
+);
+
+-- Product_Id_Map 인덱스
+CREATE INDEX IF NOT EXISTS idx_product_id_map_product ON product_id_map(product_id);
+
+-- Product_Id_Map 코멘트
+COMMENT ON TABLE product_id_map IS '리스트 href(nvMid) → 상품 ID 매핑 (클릭 전 중복 체크용)';
+COMMENT ON COLUMN product_id_map.listing_key IS '리스트 카드 키 (nvMid 또는 쿼리 제외 URL)';
+COMMENT ON COLUMN product_id_map.product_id IS '상세 페이지에서 확인한 상품 ID';
+
+-- =====================================================
+-- Product_Snapshots 테이블 (가격/리뷰 이력, 월별 파티션)
+-- =====================================================
+-- 추적 값(가격/할인율/리뷰 수/평점)이 마지막 이력과 다를 때만 1행 추가 (append-only)
+-- 컬럼 순서는 정렬 패딩이 없도록 8 → 4 → 2바이트 → 가변 길이
+CREATE TABLE IF NOT EXISTS product_snapshots (
+    captured_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,  -- 수집 시간 (파티션 키)
+    price INTEGER,                                     -- 가격 (원)
+    review_count INTEGER,                              -- 리뷰 수
+    discount_rate SMALLINT,                            -- 할인율 (%)
+    rating_x10 SMALLINT,                               -- 평점 × 10 (4.5 → 45)
+    product_id VARCHAR(255) NOT NULL                   -- 네이버 상품 ID
+) PARTITION BY RANGE (captured_at);
+
+-- Product_Snapshots 인덱스 (상품별 기간 조회 + 마지막 이력 조회)
+CREATE INDEX IF NOT EXISTS idx_product_snapshots_product_time ON product_snapshots(product_id, captured_at);
+
+-- 월별 파티션 (이번 달부터 12개월, 크롤러가 연결 시 이번 달 파티션을 다시 확인/생성)
+DO $$
+DECLARE
+    month_start DATE := date_trunc('month', CURRENT_DATE);
+BEGIN
+    FOR i IN 0..12 LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF product_snapshots FOR VALUES FROM (%L) TO (%L)',
+            'product_snapshots_' || to_char(month_start + make_interval(months => i), 'YYYYMM'),
+            month_start + make_interval(months => i),
+            month_start + make_interval(months => i + 1)
+        );
+    END LOOP;
+END $$;
+CREATE TABLE IF NOT EXISTS product_snapshots_default PARTITION OF product_snapshots DEFAULT;
+
+-- Product_Snapshots 코멘트
+COMMENT ON TABLE product_snapshots IS '상품 가격/리뷰 이력 (값이 바뀔 때만 추가, 월별 파티션)';
+COMMENT ON COLUMN product_snapshots.captured_at IS '수집 시간 (파티션 키)';
+COMMENT ON COLUMN product_snapshots.price IS '가격 (원)';
+COMMENT ON COLUMN product_snapshots.review_count IS '리뷰 수';
+COMMENT ON COLUMN product_snapshots.discount_rate IS '할인율 (%)';
+COMMENT ON COLUMN product_snapshots.rating_x10 IS '평점 × 10 (4.5 → 45)';
+COMMENT ON COLUMN product_snapshots.product_id IS '네이버 상품 ID';
+
 -- =====================================================
 -- 테이블 생성 확인
 -- =====================================================
@@ -119,7 +219,11 @@ SELECT 'Categories 테이블' as table_name, COUNT(*) as record_count FROM categ
 UNION ALL
 SELECT 'Products 테이블', COUNT(*) FROM products
 UNION ALL
-SELECT 'Crawl_History 테이블', COUNT(*) FROM crawl_history;
+SELECT 'Crawl_History 테이블', COUNT(*) FROM crawl_history
+UNION ALL
+SELECT 'Product_Id_Map 테이블', COUNT(*) FROM product_id_map
+UNION ALL
+SELECT 'Product_Snapshots 테이블', COUNT(*) FROM product_snapshots;
 
 -- =====================================================
 -- 유용한 쿼리들
@@ -153,4 +257,19 @@ SELECT 'Crawl_History 테이블', COUNT(*) FROM crawl_history;
 -- SELECT category_name, category_id, created_at
 -- FROM categories
 -- WHERE is_active = true
--- ORDER BY category_name;
\ No newline at end of file
+-- ORDER BY category_name;
+
+-- 6. 상품 가격/리뷰 추이 (최근 90일, 파티션 + (product_id, captured_at) 인덱스 사용)
+-- SELECT captured_at, price, discount_rate, review_count, rating_x10 / 10.0 AS rating
+-- FROM product_snapshots
+-- WHERE product_id = '2735313334'
+--   AND captured_at >= CURRENT_DATE - INTERVAL '90 days'
+-- ORDER BY captured_at;
+
+-- 7. 태그/상품명 검색 (idx_product_search_tags / idx_product_name_trgm)
+-- SELECT product_id, product_name, price, review_count
+-- FROM products
+-- WHERE search_tags @> ARRAY['린넨']
+--   AND product_name ILIKE '%린넨 셔츠%'
+-- ORDER BY review_count DESC NULLS LAST
+-- LIMIT 50;
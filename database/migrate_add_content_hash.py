@@ -0,0 +1,74 @@
+"""
+products 테이블에 변경 감지 해시 컬럼 추가
+- content_hash VARCHAR(32)  (product_id 외 컬럼 md5, 크롤러에서 계산)
+
+기존 행은 NULL로 시작 → 다음에 다시 수집될 때 1회 갱신되면서 해시가 채워지고,
+그 뒤로는 내용이 같으면 UPSERT가 행을 건드리지 않음 (dead tuple/WAL 없음)
+"""
+import sys
+sys.path.append('/home/dino/MyProjects/Crawl')
+
+from src.database.db_connector import DatabaseConnector
+
+def migrate():
+    """DB 마이그레이션 실행"""
+    db = DatabaseConnector()
+
+    try:
+        db.connect()
+        cursor = db.conn.cursor()
+
+        print("[마이그레이션] products 테이블 업데이트 시작...")
+
+        # 1. content_hash 컬럼 추가
+        try:
+            cursor.execute("""
+                ALTER TABLE products
+                ADD COLUMN IF NOT EXISTS content_hash VARCHAR(32)
+            """)
+            print("  ✓ content_hash 컬럼 추가 완료")
+        except Exception as e:
+            print(f"  [경고] content_hash 추가 실패: {e}")
+
+        # 2. 코멘트
+        try:
+            cursor.execute("""
+                COMMENT ON COLUMN products.content_hash
+                IS '변경 감지 해시 (product_id 외 컬럼 md5, 크롤러에서 계산)'
+            """)
+            print("  ✓ content_hash 코멘트 추가 완료")
+        except Exception as e:
+            print(f"  [경고] 코멘트 추가 실패: {e}")
+
+        # 3. 커밋
+        db.conn.commit()
+        print("\n[마이그레이션] 완료!")
+
+        # 4. 테이블 구조 확인
+        cursor.execute("""
+            SELECT column_name, data_type, is_nullable, column_default
+            FROM information_schema.columns
+            WHERE table_name = 'products'
+            ORDER BY ordinal_position
+        """)
+
+        print("\n[테이블 구조] products:")
+        print(f"{'컬럼명':<25} {'타입':<20} {'NULL':<10} {'기본값':<15}")
+        print("-" * 70)
+
+        for row in cursor.fetchall():
+            col_name, data_type, is_null, default_val = row
+            print(f"{col_name:<25} {data_type:<20} {is_null:<10} {str(default_val):<15}")
+
+        cursor.close()
+
+    except Exception as e:
+        print(f"[오류] 마이그레이션 실패: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate()
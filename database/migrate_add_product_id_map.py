@@ -0,0 +1,76 @@
+"""
+product_id_map 테이블 추가 (리스트 href → 상품 ID 매핑)
+- listing_key VARCHAR(255) PRIMARY KEY  (nvMid 또는 쿼리 제외 URL)
+- product_id VARCHAR(255) NOT NULL      (상세 페이지에서 확인한 상품 ID)
+"""
+import sys
+sys.path.append('/home/dino/MyProjects/Crawl')
+
+from src.database.db_connector import DatabaseConnector
+
+def migrate():
+    """DB 마이그레이션 실행"""
+    db = DatabaseConnector()
+
+    try:
+        db.connect()
+        cursor = db.conn.cursor()
+
+        print("[마이그레이션] product_id_map 테이블 생성 시작...")
+
+        # 1. 테이블 생성
+        try:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS product_id_map (
+                    listing_key VARCHAR(255) PRIMARY KEY,
+                    product_id VARCHAR(255) NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            print("  ✓ product_id_map 테이블 생성 완료")
+        except Exception as e:
+            print(f"  [경고] product_id_map 생성 실패: {e}")
+
+        # 2. 상품 ID 인덱스 (상품 → 리스트 키 역조회)
+        try:
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_product_id_map_product
+                ON product_id_map(product_id)
+            """)
+            print("  ✓ idx_product_id_map_product 인덱스 추가 완료")
+        except Exception as e:
+            print(f"  [경고] 인덱스 추가 실패: {e}")
+
+        # 3. 커밋
+        db.conn.commit()
+        print("\n[마이그레이션] 완료!")
+
+        # 4. 테이블 구조 확인
+        cursor.execute("""
+            SELECT column_name, data_type, is_nullable, column_default
+            FROM information_schema.columns
+            WHERE table_name = 'product_id_map'
+            ORDER BY ordinal_position
+        """)
+
+        print("\n[테이블 구조] product_id_map:")
+        print(f"{'컬럼명':<25} {'타입':<20} {'NULL':<10} {'기본값':<15}")
+        print("-" * 70)
+
+        for row in cursor.fetchall():
+            col_name, data_type, is_null, default_val = row
+            print(f"{col_name:<25} {data_type:<20} {is_null:<10} {str(default_val):<15}")
+
+        cursor.close()
+
+    except Exception as e:
+        print(f"[오류] 마이그레이션 실패: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,109 @@
+"""
+product_snapshots 테이블 추가 (가격/리뷰 이력, 월별 파티션)
+- captured_at TIMESTAMP NOT NULL  (파티션 키)
+- price / review_count INTEGER, discount_rate / rating_x10 SMALLINT
+- product_id VARCHAR(255) NOT NULL
+- (product_id, captured_at) 인덱스 + 이번 달부터 12개월 파티션 + DEFAULT 파티션
+
+다시 실행하면 없는 달 파티션만 추가 (월 1회 실행 권장, 크롤러도 저장할 때 그 달 파티션을 확인)
+"""
+import sys
+sys.path.append('/home/dino/MyProjects/Crawl')
+
+from datetime import date
+
+from src.database.db_connector import DatabaseConnector, snapshot_partition
+
+# 미리 만들 월 파티션 수 (이번 달 포함)
+MONTHS_AHEAD = 13
+
+def migrate():
+    """DB 마이그레이션 실행"""
+    db = DatabaseConnector()
+
+    try:
+        db.connect()
+        cursor = db.conn.cursor()
+
+        print("[마이그레이션] product_snapshots 테이블 생성 시작...")
+
+        # 1. 파티션 테이블 생성
+        try:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS product_snapshots (
+                    captured_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    price INTEGER,
+                    review_count INTEGER,
+                    discount_rate SMALLINT,
+                    rating_x10 SMALLINT,
+                    product_id VARCHAR(255) NOT NULL
+                ) PARTITION BY RANGE (captured_at)
+            """)
+            print("  ✓ product_snapshots 테이블 생성 완료")
+        except Exception as e:
+            print(f"  [경고] product_snapshots 생성 실패: {e}")
+
+        # 2. 상품별 기간 조회 인덱스 (파티션마다 자동 생성)
+        try:
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_product_snapshots_product_time
+                ON product_snapshots(product_id, captured_at)
+            """)
+            print("  ✓ idx_product_snapshots_product_time 인덱스 추가 완료")
+        except Exception as e:
+            print(f"  [경고] 인덱스 추가 실패: {e}")
+
+        # 3. 월별 파티션 + DEFAULT 파티션
+        month = date.today().replace(day=1)
+        for _ in range(MONTHS_AHEAD):
+            name, start, end = snapshot_partition(month)
+            try:
+                cursor.execute(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF product_snapshots "
+                    f"FOR VALUES FROM ('{start}') TO ('{end}')"
+                )
+                print(f"  ✓ {name} 파티션 ({start} ~ {end})")
+            except Exception as e:
+                print(f"  [경고] {name} 파티션 생성 실패: {e}")
+            month = end
+
+        try:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS product_snapshots_default
+                PARTITION OF product_snapshots DEFAULT
+            """)
+            print("  ✓ product_snapshots_default 파티션")
+        except Exception as e:
+            print(f"  [경고] DEFAULT 파티션 생성 실패: {e}")
+
+        # 4. 커밋
+        db.conn.commit()
+        print("\n[마이그레이션] 완료!")
+
+        # 5. 파티션 목록 확인
+        cursor.execute("""
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = 'product_snapshots'
+            ORDER BY child.relname
+        """)
+
+        print("\n[파티션] product_snapshots:")
+        print("-" * 40)
+        for (name,) in cursor.fetchall():
+            print(f"  {name}")
+
+        cursor.close()
+
+    except Exception as e:
+        print(f"[오류] 마이그레이션 실패: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,77 @@
+"""
+조회 패턴에 맞춘 인덱스로 교체 (목록: src/database/query_indexes.py)
+- 제거: idx_product_name (상품명 btree - 긴 TEXT, 쓰는 쿼리 없음)
+- 추가: idx_crawl_history_resume (category_name, crawl_type, status, start_time DESC)
+- 추가: idx_product_search_tags (search_tags GIN)
+- 추가: idx_product_name_trgm (product_name pg_trgm GIN)
+
+CREATE INDEX CONCURRENTLY로 만들어 크롤러가 실행 중이어도 쓰기가 막히지 않음 (autocommit)
+효과 확인: python scripts/run/benchmark_queries.py
+"""
+import sys
+sys.path.append('/home/dino/MyProjects/Crawl')
+
+from src.database.db_connector import DatabaseConnector
+from src.database.query_indexes import (
+    QUERY_INDEXES, DROPPED_INDEXES, apply_query_indexes, product_table
+)
+
+def migrate():
+    """DB 마이그레이션 실행"""
+    db = DatabaseConnector()
+
+    try:
+        db.connect()
+        db.conn.autocommit = True  # CONCURRENTLY는 트랜잭션 밖에서만 실행 가능
+        cursor = db.conn.cursor()
+
+        print("[마이그레이션] 조회 인덱스 교체 시작...")
+
+        # 1. 인덱스 제거/추가 (pg_trgm 확장 포함)
+        try:
+            created = apply_query_indexes(cursor, concurrently=True)
+            for name in DROPPED_INDEXES:
+                print(f"  ✓ {name} 제거")
+            for name, _, purpose in QUERY_INDEXES:
+                state = "추가 완료" if name in created else "이미 있음"
+                print(f"  ✓ {name} {state} - {purpose}")
+        except Exception as e:
+            print(f"  [경고] 인덱스 교체 실패: {e}")
+
+        # 2. 통계 갱신 (새 인덱스를 플래너가 바로 사용)
+        try:
+            cursor.execute("ANALYZE crawl_history")
+            cursor.execute(f"ANALYZE {product_table(cursor)}")
+            print("  ✓ 통계 갱신 완료")
+        except Exception as e:
+            print(f"  [경고] 통계 갱신 실패: {e}")
+
+        print("\n[마이그레이션] 완료!")
+
+        # 3. 인덱스 목록 확인
+        cursor.execute("""
+            SELECT tablename, indexname, pg_size_pretty(pg_relation_size(indexname::regclass))
+            FROM pg_indexes
+            WHERE schemaname = current_schema()
+              AND tablename IN ('products', 'product_info', 'product_metrics', 'crawl_history')
+            ORDER BY tablename, indexname
+        """)
+
+        print("\n[인덱스] 상품/크롤링 이력:")
+        print(f"{'테이블':<20} {'인덱스':<35} {'크기':<10}")
+        print("-" * 65)
+        for table, index, size in cursor.fetchall():
+            print(f"{table:<20} {index:<35} {size:<10}")
+
+        cursor.close()
+
+    except Exception as e:
+        print(f"[오류] 마이그레이션 실패: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,145 @@
+"""
+products 테이블을 product_info + product_metrics로 분리 (자주 바뀌는 값만 좁은 테이블로)
+- product_metrics: product_id, price, rating, discount_rate, review_count, updated_at
+  인덱스는 PK만 + fillfactor 70 → 재수집 때 가격/리뷰 갱신이 HOT update로 처리
+- product_info: 기존 products 테이블 이름 변경 (가격 인덱스/지표 컬럼 제거)
+- products: 두 테이블을 합친 호환 뷰 (기존 컬럼 순서 유지 → category_analysis.sql 등 조회 그대로 동작)
+
+한 트랜잭션으로 실행 (중간에 실패하면 전부 되돌림). 이미 분리됐으면 아무것도 하지 않음
+content_hash는 product_info 컬럼 기준으로 바뀌므로 다음 수집 때 상품마다 1회 갱신됨
+"""
+import sys
+sys.path.append('/home/dino/MyProjects/Crawl')
+
+from src.database.db_connector import DatabaseConnector
+
+METRIC_COLUMNS = DatabaseConnector.METRIC_COLUMNS
+
+def migrate():
+    """DB 마이그레이션 실행"""
+    db = DatabaseConnector()
+
+    try:
+        db.connect()
+        cursor = db.conn.cursor()
+
+        print("[마이그레이션] products → product_info + product_metrics 분리 시작...")
+
+        cursor.execute("SELECT relkind FROM pg_class WHERE relname = 'products'")
+        found = cursor.fetchone()
+        if found is None:
+            print("  [경고] products 테이블이 없습니다 - create_tables.sql로 새로 만드세요")
+            return
+        if found[0] == 'v':
+            print("  ✓ 이미 분리됨 (products는 호환 뷰)")
+            return
+
+        try:
+            # 1. content_hash 컬럼 (없으면 추가) + 기존 컬럼 순서
+            cursor.execute("ALTER TABLE products ADD COLUMN IF NOT EXISTS content_hash VARCHAR(32)")
+            cursor.execute("""
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_name = 'products' AND table_schema = current_schema()
+                ORDER BY ordinal_position
+            """)
+            columns = [name for (name,) in cursor.fetchall()]
+            print(f"  ✓ products 컬럼 {len(columns)}개 확인")
+
+            # 2. product_metrics 생성 + 현재 값 복사
+            cursor.execute("""
+                CREATE TABLE product_metrics (
+                    product_id VARCHAR(255) PRIMARY KEY,
+                    price INTEGER,
+                    rating DECIMAL(2,1),
+                    discount_rate INTEGER,
+                    review_count INTEGER DEFAULT 0,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                ) WITH (fillfactor = 70)
+            """)
+            cursor.execute(f"""
+                INSERT INTO product_metrics (product_id, {', '.join(METRIC_COLUMNS)}, updated_at)
+                SELECT product_id, {', '.join(METRIC_COLUMNS)}, updated_at
+                FROM products
+            """)
+            print(f"  ✓ product_metrics 생성 + {cursor.rowcount}행 복사 (fillfactor 70)")
+
+            # 3. products → product_info (지표 컬럼/가격 인덱스 제거)
+            cursor.execute("DROP INDEX IF EXISTS idx_product_price")
+            cursor.execute("ALTER TABLE products RENAME TO product_info")
+            cursor.execute(
+                "ALTER TABLE product_info "
+                + ', '.join(f"DROP COLUMN {col}" for col in METRIC_COLUMNS)
+            )
+            print("  ✓ products → product_info 이름 변경 + 지표 컬럼 제거")
+
+            # 4. 외래 키 (복사 후 추가 - 행마다 검사하지 않음)
+            cursor.execute("""
+                ALTER TABLE product_metrics
+                ADD CONSTRAINT product_metrics_product_id_fkey
+                FOREIGN KEY (product_id) REFERENCES product_info(product_id) ON DELETE CASCADE
+            """)
+            print("  ✓ product_metrics → product_info 외래 키 추가")
+
+            # 5. 호환 뷰 (기존 컬럼 순서 그대로)
+            select = []
+            for col in columns:
+                if col in METRIC_COLUMNS:
+                    select.append(f"m.{col}")
+                elif col == 'updated_at':
+                    select.append("GREATEST(i.updated_at, m.updated_at) AS updated_at")
+                else:
+                    select.append(f"i.{col}")
+            cursor.execute(f"""
+                CREATE VIEW products AS
+                SELECT {', '.join(select)}
+                FROM product_info i
+                LEFT JOIN product_metrics m ON m.product_id = i.product_id
+            """)
+            print("  ✓ products 호환 뷰 생성")
+
+            # 6. 코멘트
+            cursor.execute("""
+                COMMENT ON TABLE product_metrics
+                IS '재수집마다 바뀌는 상품 지표 (PK 인덱스만, fillfactor 70 → HOT update)'
+            """)
+            cursor.execute("""
+                COMMENT ON VIEW products
+                IS '호환 뷰: product_info + product_metrics (쓰기는 두 테이블에 직접)'
+            """)
+
+            # 7. 커밋
+            db.conn.commit()
+        except Exception:
+            db.conn.rollback()
+            print("  [경고] 분리 실패 - 모든 변경을 되돌렸습니다")
+            raise
+
+        print("\n[마이그레이션] 완료!")
+
+        # 8. 테이블 확인
+        cursor.execute("""
+            SELECT c.relname, c.reloptions, c.reltuples::bigint
+            FROM pg_class c
+            WHERE c.relname IN ('product_info', 'product_metrics')
+            ORDER BY c.relname
+        """)
+
+        print("\n[테이블] 분리 결과:")
+        print(f"{'테이블':<20} {'옵션':<25} {'예상 행 수':<15}")
+        print("-" * 60)
+        for name, options, tuples in cursor.fetchall():
+            print(f"{name:<20} {str(options or '-'):<25} {tuples:<15}")
+
+        cursor.close()
+
+    except Exception as e:
+        print(f"[오류] 마이그레이션 실패: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate()
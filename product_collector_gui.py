@@ -376,7 +376,40 @@ class ProductCollectorGUI:
             text_color=self.colors['text_secondary']
         ).pack(side="left", padx=8)
 
-        # 섹션 3: 실행 버튼
+        # 섹션 3: 실행 옵션
+        ctk.CTkLabel(
+            control_inner,
+            text="실행 옵션",
+            font=("Arial", 13, "bold"),
+            text_color=self.colors['text_primary']
+        ).pack(anchor="w", pady=(0, 8))
+
+        option_frame = ctk.CTkFrame(control_inner, fg_color=self.colors['bg_input'], corner_radius=6)
+        option_frame.pack(fill="x", pady=(0, 20))
+
+        # 처리량 모드: 상품 테두리/오버레이/slow_mo 생략 (수집 결과는 동일)
+        self.throughput_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(
+            option_frame,
+            text="처리량 모드 (화면 효과 끔)",
+            variable=self.throughput_var,
+            font=("Arial", 11),
+            fg_color=self.colors['accent_blue'],
+            hover_color=self.colors['hover_blue']
+        ).pack(anchor="w", padx=12, pady=(12, 8))
+
+        # 브라우저 숨기기 (캡차가 뜨면 직접 입력할 수 없음)
+        self.headless_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(
+            option_frame,
+            text="브라우저 숨기기",
+            variable=self.headless_var,
+            font=("Arial", 11),
+            fg_color=self.colors['accent_blue'],
+            hover_color=self.colors['hover_blue']
+        ).pack(anchor="w", padx=12, pady=(0, 12))
+
+        # 섹션 4: 실행 버튼
         self.start_button = ctk.CTkButton(
             control_inner,
             text="▶ 수집 시작",
@@ -616,6 +649,9 @@ class ProductCollectorGUI:
         elif status == 'skipped':
             status_text = "DUP"
             status_color = self.colors['accent_yellow']
+        elif status == 'pending':
+            status_text = "..."
+            status_color = self.colors['text_secondary']
         else:
             status_text = "ERR"
             status_color = self.colors['accent_red']
@@ -869,6 +905,9 @@ class ProductCollectorGUI:
             elif status == 'skipped':
                 status_text = "DUP"
                 status_color = self.colors['accent_yellow']
+            elif status == 'pending':
+                status_text = "..."
+                status_color = self.colors['text_secondary']
             else:
                 status_text = "ERR"
                 status_color = self.colors['accent_red']
@@ -1079,12 +1118,16 @@ DB상태: {status_text}"""
             self._log(f"수집 모드: 개수 지정 ({product_count}개)")
         else:
             self._log(f"수집 모드: 무한 (중지 버튼으로 멈춤)")
+        throughput_mode = self.throughput_var.get()
+        headless = self.headless_var.get()
+        if throughput_mode:
+            self._log("실행 모드: 처리량 모드 (화면 효과 끔)")
         self._log("="*60)
 
-        # 별도 스레드에서 실행
+        # 별도 스레드에서 실행 (tkinter 변수는 메인 스레드에서 미리 읽음)
         thread = threading.Thread(
             target=self._run_crawler,
-            args=(category_name, product_count),
+            args=(category_name, product_count, throughput_mode, headless),
             daemon=True
         )
         thread.start()
@@ -1170,7 +1213,8 @@ DB상태: {status_text}"""
             logger.error(traceback.format_exc())
             logger.error("=" * 70)
 
-    def _run_crawler(self, category_name: str, product_count: Optional[int]):
+    def _run_crawler(self, category_name: str, product_count: Optional[int],
+                     throughput_mode: bool = False, headless: bool = False):
         """크롤러 실행"""
         logger.info("=" * 70)
         logger.info(f"크롤러 실행 시작: 카테고리={category_name}, 개수={product_count}")
@@ -1190,8 +1234,9 @@ DB상태: {status_text}"""
                 category_name=category_name,
                 category_id=category_id,
                 product_count=product_count,  # None = 무한
-                headless=False,
-                save_to_db=True  # DB 직접 저장
+                headless=headless,
+                save_to_db=True,  # DB 직접 저장
+                throughput_mode=throughput_mode  # 화면 효과/slow_mo 생략
             )
             logger.debug("✓ SimpleCrawler 생성 완료")
 
@@ -0,0 +1,295 @@
+"""조회 쿼리 벤치마크 (합성 데이터 수백만 행, 인덱스 적용 전/후 비교)
+
+별도 스키마(bench_queries)에 product_info / product_metrics / products 뷰 / crawl_history를
+같은 구조로 만들고 합성 데이터를 채운 뒤,
+database/category_analysis.sql 쿼리 전체와 DatabaseConnector 조회를 시간 측정
+→ query_indexes.py 인덱스 적용 → 다시 측정해 비교 (실제 테이블은 건드리지 않음)
+
+데이터는 setseed로 고정 → 같은 옵션이면 매번 같은 데이터
+
+사용 예:
+    python scripts/run/benchmark_queries.py                      # 300만 행 생성 후 측정
+    python scripts/run/benchmark_queries.py --rows 500000         # 빠르게
+    python scripts/run/benchmark_queries.py --reuse --keep        # 만든 데이터 재사용 + 스키마 유지
+"""
+import argparse
+import contextlib
+import io
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.database.db_connector import DatabaseConnector
+from src.database.query_indexes import DROPPED_INDEXES, QUERY_INDEXES, apply_query_indexes
+
+ANALYSIS_SQL = project_root / 'database' / 'category_analysis.sql'
+
+MAIN_CATEGORIES = ['패션의류', '패션잡화', '화장품/미용', '디지털/가전', '가구/인테리어',
+                   '출산/육아', '식품', '스포츠/레저', '생활/건강', '여가/생활편의']
+CRAWL_CATEGORIES = ['여성의류', '남성의류', '여성언더웨어/잠옷', '남성언더웨어/잠옷', '여성신발',
+                    '남성신발', '여성가방', '남성가방', '주얼리', '시계']
+NAME_WORDS = ['린넨', '셔츠', '원피스', '니트', '가디건', '청바지', '슬랙스', '자켓', '코트', '블라우스',
+              '오버핏', '루즈핏', '여름', '겨울', '데일리', '베이직', '스트라이프', '체크', '롱', '크롭']
+
+
+def _pg_text_array(items: List[str]) -> str:
+    return "ARRAY[" + ', '.join("'" + item.replace("'", "''") + "'" for item in items) + "]"
+
+
+def load_analysis_queries(path: Path = ANALYSIS_SQL) -> List[Tuple[str, str]]:
+    """category_analysis.sql → [(제목, 쿼리)] (제목은 바로 위 '-- 1. ...' 주석)"""
+    queries, lines, title = [], [], ''
+    for line in path.read_text(encoding='utf-8').splitlines():
+        stripped = line.strip()
+        header = re.match(r'--\s*(\d+(?:-\d+)?\.\s.+)', stripped)
+        if header:
+            title = header.group(1)
+            continue
+        if stripped.startswith('--') or not stripped:
+            continue
+        lines.append(line)
+        if stripped.endswith(';'):
+            queries.append((title, '\n'.join(lines).rstrip(';')))
+            lines = []
+    return queries
+
+
+def create_dataset(cursor, rows: int, history_rows: int):
+    """합성 데이터 생성 (create_tables.sql 분리 구조 + category_analysis.sql용 category_fullname)"""
+    cursor.execute("SELECT setseed(0.42)")
+
+    cursor.execute("""
+        CREATE TABLE product_info (
+            product_id VARCHAR(255) PRIMARY KEY,
+            category_name VARCHAR(100),
+            category_fullname TEXT,
+            product_name TEXT NOT NULL,
+            search_tags TEXT[],
+            product_url TEXT,
+            thumbnail_url TEXT,
+            brand_name VARCHAR(100),
+            crawled_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            content_hash VARCHAR(32)
+        )
+    """)
+    cursor.execute(f"""
+        INSERT INTO product_info (product_id, category_name, category_fullname, product_name, search_tags,
+                                  product_url, thumbnail_url, brand_name, crawled_at, updated_at)
+        SELECT
+            (8000000000 + g)::text,
+            ({_pg_text_array(CRAWL_CATEGORIES)})[1 + g % {len(CRAWL_CATEGORIES)}],
+            CASE WHEN g % 20 = 0 THEN NULL
+                 ELSE ({_pg_text_array(MAIN_CATEGORIES)})[1 + (g / 7) % {len(MAIN_CATEGORIES)}]
+                      || '>중분류' || (1 + (random() * 7)::int)
+                      || CASE WHEN depth >= 3 THEN '>소분류' || (1 + (random() * 9)::int) ELSE '' END
+                      || CASE WHEN depth >= 4 THEN '>세분류' || (1 + (random() * 5)::int) ELSE '' END
+            END,
+            words[1 + (random() * {len(NAME_WORDS) - 1})::int] || ' '
+                || words[1 + (random() * {len(NAME_WORDS) - 1})::int] || ' '
+                || words[1 + (random() * {len(NAME_WORDS) - 1})::int] || ' ' || g,
+            ARRAY(SELECT '태그' || (random() * 500)::int FROM generate_series(1, 2 + g % 5)),
+            'https://smartstore.naver.com/main/products/' || (8000000000 + g),
+            'https://shop-phinf.pstatic.net/' || g || '.jpg',
+            CASE WHEN g % 3 = 0 THEN NULL ELSE '브랜드' || (random() * 3000)::int END,
+            now() - random() * INTERVAL '180 days',
+            now() - random() * INTERVAL '30 days'
+        FROM (
+            SELECT g, 2 + (random() * 2)::int AS depth, {_pg_text_array(NAME_WORDS)} AS words
+            FROM generate_series(1, {int(rows)}) g
+        ) s
+    """)
+
+    cursor.execute("""
+        CREATE TABLE product_metrics (
+            product_id VARCHAR(255) PRIMARY KEY REFERENCES product_info(product_id) ON DELETE CASCADE,
+            price INTEGER,
+            rating DECIMAL(2,1),
+            discount_rate INTEGER,
+            review_count INTEGER DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        ) WITH (fillfactor = 70)
+    """)
+    cursor.execute("""
+        INSERT INTO product_metrics (product_id, price, rating, discount_rate, review_count, updated_at)
+        SELECT product_id,
+               CASE WHEN random() < 0.02 THEN NULL ELSE (1000 + random() * 199000)::int END,
+               round((3 + random() * 2)::numeric, 1),
+               (random() * 70)::int,
+               (power(random(), 3) * 5000)::int,
+               updated_at
+        FROM product_info
+    """)
+
+    cursor.execute("""
+        CREATE VIEW products AS
+        SELECT i.product_id, i.category_name, i.category_fullname, i.product_name, i.search_tags,
+               m.price, m.rating, i.product_url, i.thumbnail_url, i.brand_name,
+               m.discount_rate, m.review_count, i.crawled_at,
+               GREATEST(i.updated_at, m.updated_at) AS updated_at, i.content_hash
+        FROM product_info i
+        LEFT JOIN product_metrics m ON m.product_id = i.product_id
+    """)
+
+    cursor.execute("""
+        CREATE TABLE crawl_history (
+            history_id SERIAL PRIMARY KEY,
+            crawl_type VARCHAR(50) NOT NULL,
+            category_name VARCHAR(100),
+            start_time TIMESTAMP NOT NULL,
+            end_time TIMESTAMP,
+            total_categories INTEGER DEFAULT 0,
+            total_products INTEGER DEFAULT 0,
+            last_product_index INTEGER DEFAULT 0,
+            status VARCHAR(20) DEFAULT 'running',
+            error_message TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    cursor.execute(f"""
+        INSERT INTO crawl_history (crawl_type, category_name, start_time, end_time,
+                                   total_products, last_product_index, status)
+        SELECT
+            CASE WHEN g % 4 = 0 THEN 'category' ELSE 'product' END,
+            ({_pg_text_array(CRAWL_CATEGORIES)})[1 + g % {len(CRAWL_CATEGORIES)}],
+            now() - g * INTERVAL '1 minute',
+            now() - g * INTERVAL '1 minute' + INTERVAL '20 minutes',
+            (random() * 1000)::int,
+            (random() * 1000)::int,
+            (ARRAY['completed', 'completed', 'completed', 'failed', 'paused', 'running'])[1 + (random() * 5)::int]
+        FROM generate_series(1, {int(history_rows)}) g
+    """)
+
+    # 기존 create_tables.sql 인덱스 (교체 전 기준)
+    cursor.execute("CREATE INDEX idx_crawled_at ON product_info(crawled_at)")
+
+
+def reset_baseline(cursor, schema: str):
+    """인덱스를 교체 전 상태로 (새 인덱스 제거 + 기존 product_name btree 복원)"""
+    for name, _, _ in QUERY_INDEXES:
+        cursor.execute(f"DROP INDEX IF EXISTS {schema}.{name}")
+    for name in DROPPED_INDEXES:
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON product_info(product_name)")
+    cursor.execute("ANALYZE product_info")
+    cursor.execute("ANALYZE product_metrics")
+    cursor.execute("ANALYZE crawl_history")
+
+
+def connector_queries(db: DatabaseConnector, cursor) -> List[Tuple[str, Callable]]:
+    """DatabaseConnector 조회 (크롤러/분석에서 실제로 호출하는 메서드)"""
+    cursor.execute("SELECT product_id FROM product_info ORDER BY product_id DESC LIMIT 1")
+    existing_id = cursor.fetchone()[0]
+    batch = [
+        (CRAWL_CATEGORIES[0], {'product_id': str(8000000000 + i), 'product_name': f'벤치마크 상품 {i}',
+                               'price': 10000 + i, 'review_count': i % 50, 'search_tags': ['태그1']})
+        for i in range(1, 1001)
+    ]
+    return [
+        ("중복 체크 (is_duplicate_product)", lambda: db.is_duplicate_product(existing_id, {})),
+        ("재개 지점 조회 (get_last_crawl_progress)", lambda: db.get_last_crawl_progress(CRAWL_CATEGORIES[3])),
+        ("태그 검색 (search_products tag)", lambda: db.search_products(tag='태그123')),
+        ("상품명 검색 (search_products keyword)", lambda: db.search_products(keyword='스트라이프 원피스')),
+        ("카테고리 + 태그 검색", lambda: db.search_products(tag='태그7', category_name=CRAWL_CATEGORIES[1])),
+        ("일괄 UPSERT 1000개 (upsert_products)", lambda: db.upsert_products(batch, skip_duplicates=False)),
+    ]
+
+
+def time_call(func: Callable, repeat: int) -> float:
+    """1회 워밍업 후 repeat회 실행 → 중앙값 (ms)"""
+    samples = []
+    with contextlib.redirect_stdout(io.StringIO()):  # 커넥터 로그 숨김
+        func()
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def run_phase(db: DatabaseConnector, cursor, repeat: int) -> List[Tuple[str, float]]:
+    results = []
+    for title, sql in load_analysis_queries():
+        def query(sql=sql):
+            cursor.execute(sql)
+            cursor.fetchall()
+        results.append((f"[분석] {title}", time_call(query, repeat)))
+        db.conn.rollback()
+    for title, func in connector_queries(db, cursor):
+        results.append((f"[DB] {title}", time_call(func, repeat)))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="조회 쿼리 벤치마크 (합성 데이터, 인덱스 전/후)")
+    parser.add_argument('--rows', type=int, default=3_000_000, help="합성 상품 수 (기본 300만)")
+    parser.add_argument('--history', type=int, default=200_000, help="합성 크롤링 이력 수 (기본 20만)")
+    parser.add_argument('--repeat', type=int, default=3, help="쿼리당 측정 횟수 (중앙값 사용)")
+    parser.add_argument('--schema', default='bench_queries', help="벤치마크 전용 스키마 이름")
+    parser.add_argument('--reuse', action='store_true', help="스키마가 있으면 데이터 재생성 안 함")
+    parser.add_argument('--keep', action='store_true', help="끝난 뒤 스키마 유지")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"조회 쿼리 벤치마크 (스키마 {args.schema})")
+    print("=" * 70)
+
+    db = DatabaseConnector()
+    db.snapshots_enabled = False  # 이력은 측정 대상 아님 (public.product_snapshots에 쓰지 않음)
+    try:
+        db.connect()
+        cursor = db.conn.cursor()
+
+        cursor.execute("SELECT to_regnamespace(%s) IS NOT NULL", (args.schema,))
+        exists = cursor.fetchone()[0]
+        if not (args.reuse and exists):
+            cursor.execute(f"DROP SCHEMA IF EXISTS {args.schema} CASCADE")
+            cursor.execute(f"CREATE SCHEMA {args.schema}")
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm SCHEMA public")  # 벤치마크 스키마에 설치되지 않도록
+        cursor.execute(f"SET search_path TO {args.schema}, public")
+        if not (args.reuse and exists):
+            started = time.monotonic()
+            print(f"[벤치마크] 합성 데이터 생성: 상품 {args.rows:,}개 | 이력 {args.history:,}개 ...")
+            create_dataset(cursor, args.rows, args.history)
+            db.conn.commit()
+            print(f"[벤치마크] 생성 완료 ({time.monotonic() - started:.1f}초)")
+
+        reset_baseline(cursor, args.schema)
+        db.conn.commit()
+        print("[벤치마크] 측정 1/2: 교체 전 인덱스")
+        before = run_phase(db, cursor, args.repeat)
+
+        started = time.monotonic()
+        created = apply_query_indexes(cursor)
+        cursor.execute("ANALYZE product_info")
+        cursor.execute("ANALYZE crawl_history")
+        db.conn.commit()
+        print(f"[벤치마크] 인덱스 적용: {', '.join(created)} ({time.monotonic() - started:.1f}초)")
+        print("[벤치마크] 측정 2/2: 교체 후 인덱스")
+        after = run_phase(db, cursor, args.repeat)
+
+        print("\n" + "=" * 70)
+        print(f"{'쿼리':<48} {'전(ms)':>9} {'후(ms)':>9} {'배율':>6}")
+        print("-" * 70)
+        for (title, old), (_, new) in zip(before, after):
+            ratio = old / new if new else 0.0
+            print(f"{title[:48]:<48} {old:>9.1f} {new:>9.1f} {ratio:>5.1f}x")
+        print("=" * 70)
+
+        if not args.keep:
+            cursor.execute(f"DROP SCHEMA {args.schema} CASCADE")
+        cursor.execute("RESET search_path")  # 풀에 반납되는 연결에 남기지 않음
+        db.conn.commit()
+        cursor.close()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""JSON 결과 파일 대량 가져오기 (COPY → 스테이징 → products 병합)
+
+사용 예:
+    python scripts/run/bulk_import.py                       # data/*.json 전체
+    python scripts/run/bulk_import.py data/womens_*.json --category 여성의류
+    python scripts/run/bulk_import.py data/a.json --update  # 이미 있는 상품도 최신 값으로 갱신
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.database.db_connector import DatabaseConnector
+from src.database.bulk_loader import BulkLoader
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON 결과 파일 대량 가져오기 (COPY)")
+    parser.add_argument('paths', nargs='*', default=[str(project_root / 'data' / '*.json')],
+                        help="JSON 파일 경로 또는 glob 패턴 (기본: data/*.json)")
+    parser.add_argument('--category', help="파일의 category 대신 사용할 카테고리 이름")
+    parser.add_argument('--update', action='store_true', help="이미 있는 상품도 최신 값으로 갱신")
+    args = parser.parse_args()
+
+    print("=" * 50)
+    print("JSON 대량 가져오기 (COPY)")
+    print("=" * 50)
+
+    db = DatabaseConnector()
+    try:
+        db.connect()
+        totals = BulkLoader(db).import_json_files(
+            args.paths, category_name=args.category, skip_duplicates=not args.update
+        )
+    finally:
+        db.close()
+
+    print("=" * 50)
+    print(f"파일 {totals['files']}개 | 상품 {totals['rows']}개")
+    print(f"저장 {totals['saved']}개 | 갱신 {totals['updated']}개 | 변경 없음 {totals['unchanged']}개 | "
+          f"스킵 {totals['skipped']}개 | 실패 {totals['failed']}개")
+    print(f"소요 {totals['seconds']:.2f}초 ({totals['rows_per_sec']:,.0f}행/초)")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+브라우저 재시작 정책 (무한 수집 장시간 실행용)
+상품 N개 수집 또는 브라우저 메모리(RSS) 임계치 초과 시 브라우저를 닫고 새로 띄움
+재진입 후에는 이미 처리한 상품 ID(nvMid)를 건너뛰고 마지막 위치까지 빠르게 스크롤
+"""
+
+import os
+from typing import Dict, Iterable, Optional, Set
+
+try:
+    import psutil  # 선택 의존성 - 없으면 메모리 기준 재시작만 비활성화
+except ImportError:
+    psutil = None
+
+# 브라우저 프로세스 이름 (Playwright 드라이버 node 프로세스는 제외)
+BROWSER_PROCESS_NAMES = ('firefox', 'chrome', 'chromium', 'webkit', 'minibrowser')
+
+
+def browser_rss_mb(root_pid: Optional[int] = None) -> Optional[float]:
+    """
+    현재 프로세스가 띄운 브라우저 프로세스 RSS 합계 (MB)
+
+    Returns:
+        float 또는 None (psutil 없음 / 측정 실패)
+    """
+    if psutil is None:
+        return None
+
+    try:
+        root = psutil.Process(root_pid or os.getpid())
+        total = 0
+        for child in root.children(recursive=True):
+            try:
+                name = child.name().lower()
+                if any(browser in name for browser in BROWSER_PROCESS_NAMES):
+                    total += child.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue  # 측정 중 종료된 탭 프로세스
+        return total / 1024 / 1024
+    except Exception:
+        return None
+
+
+class BrowserRecycler:
+    """
+    브라우저 재시작 판단 + 처리한 상품 ID 기록
+
+    - after_products: 브라우저 1회 실행당 수집 상품 수 상한 (None/0 = 사용 안 함)
+    - max_rss_mb: 브라우저 프로세스 RSS 합계 상한 (None/0 = 사용 안 함, psutil 필요)
+    - handled_keys: 이전 브라우저에서 처리한 상품 ID (수집/중복/오류 모두) → 재진입 후 클릭/DB 체크 없이 SKIP
+
+    사용 예:
+        recycler = BrowserRecycler(after_products=500, max_rss_mb=2500)
+        reason = recycler.check(collected_count)
+        if reason:
+            recycler.remember(queue.keys, processed_indices)
+            ... 브라우저 재시작 ...
+            recycler.start_session(collected_count)
+    """
+
+    def __init__(self, after_products: Optional[int] = None, max_rss_mb: Optional[float] = None,
+                 rss_probe=browser_rss_mb):
+        self.after_products = after_products or None
+        self.max_rss_mb = max_rss_mb or None
+        self._rss_probe = rss_probe
+
+        if self.max_rss_mb and psutil is None and rss_probe is browser_rss_mb:
+            print("[재시작] psutil 미설치 - 메모리 기준 재시작 비활성화 (pip install psutil)")
+            self.max_rss_mb = None
+
+        self.handled_keys: Set[str] = set()
+        self.last_key: Optional[str] = None  # 마지막으로 처리한 상품 ID (위치 복원 목표)
+        self.last_position = 0  # 마지막 처리 상품의 리스트 순번 + 1 (상품이 사라졌을 때 복원 중단 기준)
+        self.session_start = 0  # 현재 브라우저 시작 시점의 누적 수집 개수
+
+        # 통계
+        self.recycle_count = 0
+        self.restored_skips = 0  # 재진입 후 처리 기록으로 건너뛴 상품 수
+        self.last_rss_mb: Optional[float] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.after_products or self.max_rss_mb)
+
+    def check(self, collected_count: int) -> Optional[str]:
+        """
+        재시작이 필요하면 이유 문자열, 아니면 None
+
+        Args:
+            collected_count: 전체 누적 수집 개수
+        """
+        if self.after_products and collected_count - self.session_start >= self.after_products:
+            return f"브라우저당 {self.after_products}개 수집"
+
+        if self.max_rss_mb:
+            self.last_rss_mb = self._rss_probe()
+            if self.last_rss_mb is not None and self.last_rss_mb >= self.max_rss_mb:
+                return f"브라우저 메모리 {self.last_rss_mb:.0f}MB ≥ {self.max_rss_mb:.0f}MB"
+
+        return None
+
+    def remember(self, keys: Iterable[str], processed_indices: Iterable[int]):
+        """현재 리스트 페이지에서 처리한 상품 ID 기록 (재시작 직전 호출)"""
+        keys = list(keys)
+        processed = sorted(i for i in processed_indices if 0 <= i < len(keys))
+        self.handled_keys.update(keys[i] for i in processed)
+        if processed:
+            self.last_key = keys[processed[-1]]
+            self.last_position = processed[-1] + 1
+
+    def is_handled(self, key: Optional[str]) -> bool:
+        """이전 브라우저에서 이미 처리한 상품이면 True (건너뛴 개수 집계)"""
+        if key is not None and key in self.handled_keys:
+            self.restored_skips += 1
+            return True
+        return False
+
+    def start_session(self, collected_count: int):
+        """새 브라우저 시작 기록"""
+        self.recycle_count += 1
+        self.session_start = collected_count
+
+    def get_stats(self) -> Dict:
+        return {
+            'recycles': self.recycle_count,
+            'handled_keys': len(self.handled_keys),
+            'restored_skips': self.restored_skips,
+            'last_rss_mb': self.last_rss_mb,
+        }
+
+    def print_stats(self):
+        """재시작 통계 출력"""
+        if not self.enabled:
+            return
+        print(f"\n[통계] 브라우저 재시작 {self.recycle_count}회 | "
+              f"처리 기록 {len(self.handled_keys)}개 | 재진입 후 SKIP {self.restored_skips}개", end='')
+        if self.last_rss_mb is not None:
+            print(f" | 마지막 RSS {self.last_rss_mb:.0f}MB")
+        else:
+            print()
@@ -0,0 +1,412 @@
+"""
+상세 페이지 필드 일괄 추출기
+13개 필드를 page.evaluate 1회로 수집 (Playwright 왕복 최소화)
+"""
+
+import re
+from datetime import datetime
+from typing import Dict
+
+# =====================================================
+# 브라우저 내부 추출 스크립트
+# =====================================================
+# - 내장 상품 데이터 (ctx = embedded_state_context()): 앱 상태 > JSON-LD 순으로 먼저 읽음
+#   → 아래 DOM 탐색은 내장 데이터에 없는 필드만 실행, 필드별 출처는 sources로 반환
+# - 상품명/가격: 고정 셀렉터
+# - 할인율/리뷰/평점: 요약 영역(상품명+가격 공통 조상)의 텍스트 노드만 탐색
+#   → 못 찾으면 문서 전체 텍스트 노드 탐색 (querySelectorAll('*') 스캔 제거)
+# - 태그: <a> 텍스트를 브라우저 안에서 한 번에 수집 (링크마다 inner_text() 왕복 제거)
+# - 레이아웃 템플릿 (ctx = LayoutTemplateCache.payload()):
+#   지문(레이아웃 + 구조 마커)이 같은 페이지에서 찾은 셀렉터가 있으면 텍스트 탐색 없이 바로 사용
+#   → 템플릿 셀렉터 값이 필드 검사를 통과하지 못하면 기존 탐색으로 찾고 새 셀렉터를 학습
+EXTRACT_DETAIL_JS = r'''(ctx) => {
+    ctx = ctx || {};
+    const nameElem = document.querySelector('h3.DCVBehA8ZB');
+    const priceElem = document.querySelector('strong.Izp3Con8h8');
+
+    // 0. 레이아웃 지문 (레이아웃 키 + 구조 마커 존재 여부) → 템플릿 선택
+    const markers = (ctx.markers || []).map((selector) => {
+        try {
+            return document.querySelector(selector) ? '1' : '0';
+        } catch (e) {
+            return '0';
+        }
+    }).join('');
+    const fingerprint = `${ctx.layout || 'unknown'}:${markers}`;
+    const template = (ctx.templates || {})[fingerprint] || {};
+    const templateHits = [];
+    const templateMisses = [];  // 템플릿 셀렉터는 안 맞았는데 탐색으로는 찾은 필드 (셀렉터 변경)
+    const learned = {};
+
+    // 1. 내장 상품 데이터 (앱 상태 > JSON-LD) → 값이 있는 필드는 DOM 탐색 생략
+    const embedded = {};
+    const sources = {};
+    const pick = (obj, path) => {
+        let value = obj;
+        for (const key of path.split('.')) {
+            if (value === null || typeof value !== 'object') return null;
+            value = value[key];
+        }
+        return value === undefined ? null : value;
+    };
+    const hasPath = (obj, path) => {  // 값이 비어 있어도(null, [], '') 키가 있으면 true
+        let value = obj;
+        for (const key of path.split('.')) {
+            if (value === null || typeof value !== 'object' || !(key in value)) return false;
+            value = value[key];
+        }
+        return true;
+    };
+    const toNumber = (value) => {
+        if (typeof value === 'number') return Number.isFinite(value) ? value : null;
+        if (typeof value !== 'string') return null;
+        const match = value.replace(/,/g, '').match(/\d+(\.\d+)?/);
+        return match ? parseFloat(match[0]) : null;
+    };
+    const toText = (value, maxLength) => {
+        if (typeof value !== 'string') return null;
+        const text = value.trim();
+        return text && text.length < maxLength ? text : null;
+    };
+    // DOM 탐색 결과와 같은 형태로 변환 (build_product_data가 그대로 처리)
+    const normalize = {
+        product_name: (value) => toText(value, 200),
+        price_text: (value) => {
+            const number = toNumber(value);
+            return number ? String(Math.round(number)) : null;
+        },
+        discount_rate: (value) => {
+            const number = toNumber(value);
+            return number ? String(Math.round(number)) : null;
+        },
+        review_count: (value) => {
+            const number = toNumber(value);
+            return number === null ? null : String(Math.round(number));
+        },
+        rating: (value) => toNumber(value) || null,
+        brand_name: (value) => toText(value, 50),
+        search_tags: (value) => {
+            const items = Array.isArray(value) ? value : (typeof value === 'string' ? value.split(',') : []);
+            const tags = items
+                .map((item) => (typeof item === 'string' ? item : (item && (item.text || item.name)) || ''))
+                .map((tag) => String(tag).replace(/#/g, '').trim())
+                .filter((tag) => tag.length > 1 && tag.length < 30);
+            return tags.length ? Array.from(new Set(tags)) : null;
+        },
+        thumbnail_url: (value) => toText(value, 2000),
+    };
+    const fill = (obj, paths, source) => {
+        if (!obj) return;
+        for (const [field, fieldPaths] of Object.entries(paths || {})) {
+            if (embedded[field] !== undefined || !normalize[field]) continue;
+            for (const path of fieldPaths) {
+                const value = normalize[field](pick(obj, path));
+                if (value !== null) {
+                    embedded[field] = value;
+                    sources[field] = source;
+                    break;
+                }
+            }
+        }
+    };
+
+    // 1-1. 앱 상태: 알려진 상품 경로 → 없으면 상품명 + 가격 경로를 모두 가진 첫 객체 (너비 우선, 노드 수 제한)
+    const statePaths = ctx.state_paths || {};
+    const isProduct = (node) =>
+        node && typeof node === 'object' && !Array.isArray(node) &&
+        (statePaths.product_name || []).some((path) => typeof pick(node, path) === 'string') &&
+        (statePaths.price_text || []).some((path) => pick(node, path) !== null);
+    const findProduct = (root) => {
+        for (const path of ctx.state_product_paths || []) {
+            const node = pick(root, path);
+            if (isProduct(node)) return node;
+        }
+        const queue = [root];
+        for (let i = 0; i < queue.length && i < 5000; i++) {
+            const node = queue[i];
+            if (isProduct(node)) return node;
+            for (const value of Object.values(node)) {
+                if (value && typeof value === 'object' && queue.length < 20000) queue.push(value);
+            }
+        }
+        return null;
+    };
+    let stateProduct = null;
+    for (const name of ctx.state_globals || []) {
+        let state = null;
+        try {
+            state = window[name];
+            if (!state) {
+                const script = document.getElementById(name);  // <script id="__NEXT_DATA__"> 직렬화 상태
+                state = script ? JSON.parse(script.textContent) : null;
+            }
+        } catch (e) {}
+        if (state && typeof state === 'object') stateProduct = findProduct(state);
+        if (stateProduct) break;
+    }
+    fill(stateProduct, statePaths, 'app_state');
+    // 앱 상태 상품 객체에 경로가 있는 필드 (값이 비어 있어도 포함 → 지연 필드 정책이 "상품에 없음"으로 판단하는 근거)
+    const stateFields = stateProduct
+        ? Object.keys(statePaths).filter((field) => statePaths[field].some((path) => hasPath(stateProduct, path)))
+        : [];
+
+    // 1-2. JSON-LD: @type Product 객체 (배열/@graph 안도 확인)
+    const findLd = (node) => {
+        if (!node || typeof node !== 'object') return null;
+        if (Array.isArray(node)) {
+            for (const item of node) {
+                const found = findLd(item);
+                if (found) return found;
+            }
+            return null;
+        }
+        const type = node['@type'];
+        if (type === 'Product' || (Array.isArray(type) && type.includes('Product'))) return node;
+        return findLd(node['@graph']);
+    };
+    let ldProduct = null;
+    if (ctx.json_ld_paths) {
+        for (const script of document.querySelectorAll('script[type="application/ld+json"]')) {
+            try {
+                ldProduct = findLd(JSON.parse(script.textContent));
+            } catch (e) {}
+            if (ldProduct) break;
+        }
+    }
+    fill(ldProduct, ctx.json_ld_paths, 'json_ld');
+
+    // 2. 요약 영역 찾기 (상품명과 가격을 모두 포함하는 가장 가까운 조상)
+    let scope = null;
+    if (nameElem) {
+        let candidate = nameElem.parentElement;
+        for (let depth = 0; candidate && depth < 8; depth++) {
+            if (!priceElem || candidate.contains(priceElem)) {
+                scope = candidate;
+                break;
+            }
+            candidate = candidate.parentElement;
+        }
+    }
+
+    // 3. 필드별 값 검사 (탐색 결과와 템플릿 셀렉터 결과 모두 같은 검사 사용)
+    const tests = {
+        discount_rate: (elem) => {
+            const text = elem.textContent || '';
+            if (text.length < 20 && elem.children.length <= 1) {
+                const match = text.match(/(\d+)%/);
+                if (match) return match[1];
+            }
+            return null;
+        },
+        review_count: (elem) => {
+            const text = elem.textContent || '';
+            if (text.length < 20) {
+                const match = text.match(/리뷰\s*([\d,]+)/);
+                if (match) return match[1].replace(/,/g, '');
+            }
+            return null;
+        },
+        rating: (elem) => {
+            const text = elem.textContent || '';
+            if (text.length < 30 && /평점|별점/.test(text)) {
+                const match = text.match(/(\d+\.\d+)/);
+                if (match) return parseFloat(match[1]);
+            }
+            return null;
+        },
+        // 상품정보 테이블의 '브랜드' 셀 옆 값
+        brand_name: (elem) => {
+            const label = elem.previousElementSibling;
+            if (!label || (label.textContent || '').trim() !== '브랜드') return null;
+            const value = (elem.textContent || '').trim();
+            return value && value.length < 50 ? value : null;
+        },
+    };
+
+    // 4. 텍스트 노드 기준 탐색: keyword가 들어있는 텍스트 노드의 부모 2단계까지만 검사 → [값, 요소]
+    const findByText = (root, keyword, test) => {
+        if (!root) return null;
+        const walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT);
+        let node;
+        while ((node = walker.nextNode())) {
+            if (!keyword.test(node.nodeValue)) continue;
+            let elem = node.parentElement;
+            for (let up = 0; elem && up < 3; up++, elem = elem.parentElement) {
+                const result = test(elem);
+                if (result !== null) return [result, elem];
+            }
+        }
+        return null;
+    };
+    const findScoped = (keyword, test) =>
+        findByText(scope, keyword, test) ?? findByText(document.body, keyword, test);
+
+    // 5. 찾은 요소 → 다음 페이지에서 바로 쓸 셀렉터
+    //    (요소 자체 또는 클래스 있는 조상 기준, 이 페이지에서 첫 번째로 그 요소를 가리키는 경우만)
+    const cssPart = (elem, requireClass) => {
+        const classes = Array.from(elem.classList).filter((name) => /^[A-Za-z_][\w-]*$/.test(name));
+        if (!classes.length && requireClass) return null;
+        return elem.tagName.toLowerCase() + classes.map((name) => `.${name}`).join('');
+    };
+    const uniqueSelector = (elem) => {
+        const own = cssPart(elem, false);
+        if (document.querySelector(own) === elem) return own;
+        let ancestor = elem.parentElement;
+        for (let depth = 0; ancestor && ancestor !== document.body && depth < 4; depth++) {
+            const part = cssPart(ancestor, true);
+            if (part) {
+                const selector = `${part} ${own}`;
+                if (document.querySelector(selector) === elem) return selector;
+            }
+            ancestor = ancestor.parentElement;
+        }
+        return null;
+    };
+
+    // 6. 내장 데이터 → 템플릿 셀렉터 → 실패하면 탐색 + 학습
+    const resolve = (field, discover) => {
+        if (embedded[field] !== undefined) return embedded[field];
+        const selector = template[field];
+        if (selector) {
+            let elem = null;
+            try {
+                elem = document.querySelector(selector);
+            } catch (e) {}
+            const value = elem ? tests[field](elem) : null;
+            if (value !== null) {
+                templateHits.push(field);
+                sources[field] = 'template';
+                return value;
+            }
+        }
+        const found = discover();
+        if (!found) return null;  // 이 페이지에 값이 없음 (할인 없는 상품 등) → 템플릿 유지
+        if (selector) templateMisses.push(field);
+        sources[field] = 'dom';
+        const learnedSelector = uniqueSelector(found[1]);
+        if (learnedSelector && learnedSelector !== selector) learned[field] = learnedSelector;
+        return found[0];
+    };
+
+    const discount = resolve('discount_rate', () => findScoped(/%/, tests.discount_rate));
+    const review = resolve('review_count', () => findScoped(/리뷰/, tests.review_count));
+    const rating = resolve('rating', () => findScoped(/평점|별점/, tests.rating));
+    const brand = resolve('brand_name', () => {
+        for (const cell of document.querySelectorAll('th, td')) {
+            if ((cell.textContent || '').trim() !== '브랜드') continue;
+            const next = cell.nextElementSibling;
+            const value = next ? tests.brand_name(next) : null;
+            if (value !== null) return [value, next];
+        }
+        return null;
+    });
+
+    // 7. 검색 태그 (#으로 시작하는 링크)
+    let tags = embedded.search_tags;
+    if (tags === undefined) {
+        tags = [];
+        const seen = new Set();
+        for (const link of document.querySelectorAll('a')) {
+            const text = (link.textContent || '').trim();
+            if (!text.startsWith('#')) continue;
+            const clean = text.replace(/#/g, '').trim();
+            if (clean.length > 1 && clean.length < 30 && !seen.has(clean)) {
+                seen.add(clean);
+                tags.push(clean);
+            }
+        }
+        if (tags.length) sources.search_tags = 'dom';
+    }
+
+    // 8. 상품명/가격/썸네일 (내장 데이터에 없으면 고정 셀렉터)
+    const fromDom = (field, read) => {
+        if (embedded[field] !== undefined) return embedded[field];
+        const value = read();
+        if (value) sources[field] = 'dom';
+        return value || null;
+    };
+    const thumb = document.querySelector('img[class*="image"]');
+
+    return {
+        product_name: fromDom('product_name', () => nameElem && nameElem.innerText),
+        price_text: fromDom('price_text', () => priceElem && priceElem.innerText),
+        discount_rate: discount,
+        review_count: review,
+        rating: rating,
+        brand_name: brand,
+        search_tags: tags,
+        thumbnail_url: fromDom('thumbnail_url', () => thumb && thumb.getAttribute('src')),
+        scoped: !!scope,
+        sources: sources,
+        embedded: { app_state: !!stateProduct, json_ld: !!ldProduct, state_fields: stateFields },
+        fingerprint: fingerprint,
+        template_hits: templateHits,
+        template_misses: templateMisses,
+        learned: learned
+    };
+}'''
+
+
+def build_product_data(raw: Dict, url: str, category_name: str) -> Dict:
+    """
+    추출 스크립트 결과를 13개 필드 딕셔너리로 변환
+
+    Args:
+        raw: EXTRACT_DETAIL_JS 반환값
+        url: 상세 페이지 URL (page.url)
+        category_name: 카테고리명
+
+    Returns:
+        dict: SimpleCrawler 형식 상품 데이터
+    """
+    data = {}
+
+    # 1. product_id (URL에서 추출)
+    match = re.search(r'/products/(\d+)', url or '')
+    data['product_id'] = match.group(1) if match else None
+
+    # 2. category_name
+    data['category_name'] = category_name
+
+    # 3. product_name
+    data['product_name'] = raw.get('product_name')
+
+    # 4. brand_name
+    data['brand_name'] = raw.get('brand_name')
+
+    # 5. price
+    price_clean = re.sub(r'[^\d]', '', raw.get('price_text') or '')
+    data['price'] = int(price_clean) if price_clean else None
+
+    # 6. discount_rate
+    discount = raw.get('discount_rate')
+    data['discount_rate'] = int(discount) if discount else None
+
+    # 7. review_count
+    review = raw.get('review_count')
+    data['review_count'] = int(review) if review else 0
+
+    # 8. rating
+    data['rating'] = raw.get('rating')
+
+    # 9. search_tags
+    data['search_tags'] = list(raw.get('search_tags') or [])
+
+    # 10. product_url
+    data['product_url'] = url
+
+    # 11. thumbnail_url
+    data['thumbnail_url'] = raw.get('thumbnail_url')
+
+    # 12, 13. 타임스탬프
+    now = datetime.now()
+    data['crawled_at'] = now.isoformat()
+    data['updated_at'] = now.isoformat()
+
+    # 필드별 출처 (app_state / json_ld / template / dom, DB에는 저장하지 않음)
+    sources = dict(raw.get('sources') or {})
+    if 'price_text' in sources:
+        sources['price'] = sources.pop('price_text')
+    data['_field_sources'] = sources
+
+    return data
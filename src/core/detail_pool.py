@@ -0,0 +1,139 @@
+"""
+상세 페이지 워커 풀
+같은 BrowserContext 안에 상세 탭 N개를 열어두고 상품 URL을 병렬로 수집
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+class DetailWorkerPool:
+    """
+    상세 탭 N개를 재사용하는 워커 풀
+
+    - 워커마다 전용 탭 1개 (goto로 재사용, 매번 새 탭 열지 않음)
+    - 결과는 작업 목록 순서대로 on_result에 전달 (processed_indices 순서 보장)
+    - 워커는 전달된 결과보다 최대 prefetch개까지만 앞서 나감 (목표 개수 초과 수집 방지)
+    - min_interval: 전체 워커 기준 이동 간격 (네이버 요청 제한 대응)
+    """
+
+    def __init__(self,
+                 context,
+                 fetch: Callable[[Any, Any], Awaitable[Optional[Dict]]],
+                 workers: int = 3,
+                 min_interval: float = 0.5,
+                 prefetch: Optional[int] = None):
+        self.context = context
+        self.fetch = fetch  # async fetch(page, item) -> Optional[Dict]
+        self.workers = max(1, workers)
+        self.min_interval = min_interval
+        self.prefetch = prefetch or self.workers * 2
+        self.pages: List = []
+
+        # 이동 간격 제어 (전체 워커 공유)
+        self._throttle_lock = asyncio.Lock()
+        self._last_start = 0.0
+
+        # 통계
+        self.fetched_count = 0
+        self.error_count = 0
+        self.busy_time = 0.0  # 워커 누적 작업 시간 (초)
+
+    async def start(self):
+        """워커 탭 열기 (이미 열려 있으면 재사용)"""
+        while len(self.pages) < self.workers:
+            self.pages.append(await self.context.new_page())
+
+    async def close(self):
+        """워커 탭 모두 닫기"""
+        for detail_page in self.pages:
+            try:
+                if not detail_page.is_closed():
+                    await detail_page.close()
+            except:
+                pass
+        self.pages = []
+
+    async def _throttle(self):
+        """이동 간격 보장 (min_interval)"""
+        if self.min_interval <= 0:
+            return
+        async with self._throttle_lock:
+            wait = self._last_start + self.min_interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_start = time.monotonic()
+
+    async def run(self,
+                  items: List[Any],
+                  on_result: Callable[[Any, Any], Awaitable[bool]]):
+        """
+        작업 목록을 병렬 처리하고 결과를 순서대로 전달
+
+        Args:
+            items: 작업 목록 (예: [(idx, url), ...])
+            on_result: async on_result(item, result) -> bool
+                       result는 수집 결과 dict/None 또는 예외 객체
+                       False 반환 시 남은 작업 중단
+
+        Returns:
+            None
+        """
+        if not items:
+            return
+
+        await self.start()
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for position, item in enumerate(items):
+            queue.put_nowait((position, item))
+
+        results: Dict[int, Any] = {}
+        ready = asyncio.Condition()
+        window = asyncio.Semaphore(self.prefetch)
+
+        async def worker(slot: int):
+            while True:
+                await window.acquire()
+                try:
+                    position, item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    window.release()
+                    return
+
+                await self._throttle()
+                started = time.monotonic()
+                try:
+                    # 탭이 닫혔으면 (크래시 등) 새 탭으로 교체
+                    detail_page = self.pages[slot]
+                    if detail_page.is_closed():
+                        detail_page = await self.context.new_page()
+                        self.pages[slot] = detail_page
+
+                    result = await self.fetch(detail_page, item)
+                    self.fetched_count += 1
+                except Exception as e:
+                    result = e
+                    self.error_count += 1
+                self.busy_time += time.monotonic() - started
+
+                async with ready:
+                    results[position] = result
+                    ready.notify_all()
+
+        tasks = [asyncio.create_task(worker(slot)) for slot in range(len(self.pages))]
+
+        try:
+            for position in range(len(items)):
+                async with ready:
+                    await ready.wait_for(lambda: position in results)
+                    result = results.pop(position)
+                window.release()
+
+                if not await on_result(items[position], result):
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,107 @@
+"""
+상세 페이지 내장 상품 데이터 (JSON-LD / 앱 상태) 경로 정의 + 필드 출처 통계
+상세 페이지는 <script>에 구조화된 상품 데이터를 미리 넣어둠
+(JSON-LD, window.__PRELOADED_STATE__ 같은 직렬화된 앱 상태)
+→ EXTRACT_DETAIL_JS가 같은 evaluate 안에서 먼저 읽고, 없는 필드만 DOM 탐색
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+# =====================================================
+# 앱 상태 (상품 객체 기준 경로, 먼저 나오는 값 사용)
+# =====================================================
+# 상품 객체 = 상품명 경로와 가격 경로에 모두 값이 있는 첫 객체 (상태 트리 너비 우선 탐색)
+# - 스마트스토어/브랜드스토어: window.__PRELOADED_STATE__.product.A
+# - Next.js 페이지: window.__NEXT_DATA__ / script#__NEXT_DATA__
+APP_STATE_GLOBALS = ('__PRELOADED_STATE__', '__NEXT_DATA__', '__APOLLO_STATE__')
+
+# 상품 객체 위치 (먼저 확인, 없으면 너비 우선 탐색)
+APP_STATE_PRODUCT_PATHS = ('product.A', 'props.pageProps.product', 'props.pageProps.initialState.product.A')
+
+APP_STATE_PATHS = {
+    'product_name': ['name', 'productName', 'dispName'],
+    'price_text': ['benefitsView.discountedSalePrice', 'discountedSalePrice', 'salePrice', 'price'],
+    'discount_rate': ['benefitsView.discountedRatio', 'discountedRatio', 'discountRate'],
+    'review_count': ['reviewAmount.totalReviewCount', 'totalReviewCount', 'reviewCount'],
+    'rating': ['reviewAmount.averageReviewScore', 'averageReviewScore', 'reviewScore'],
+    'brand_name': ['naverShoppingSearchInfo.brandName', 'brandName', 'brand.name'],
+    'search_tags': ['seoInfo.sellerTags', 'sellerTags', 'tags'],
+    'thumbnail_url': ['representImage.url', 'productImages.0.url', 'imageUrl'],
+}
+
+# =====================================================
+# JSON-LD (@type Product 객체 기준 경로)
+# =====================================================
+JSON_LD_PATHS = {
+    'product_name': ['name'],
+    'price_text': ['offers.price', 'offers.lowPrice', 'offers.0.price'],
+    'review_count': ['aggregateRating.reviewCount', 'aggregateRating.ratingCount'],
+    'rating': ['aggregateRating.ratingValue'],
+    'brand_name': ['brand.name', 'brand'],
+    'search_tags': ['keywords'],
+    'thumbnail_url': ['image.0', 'image.url', 'image'],
+}
+
+# 출처 (우선순위 순): 앱 상태 > JSON-LD > 레이아웃 템플릿 셀렉터 > DOM 탐색 > 리스트 응답 보충
+FIELD_SOURCES = ('app_state', 'json_ld', 'template', 'dom', 'listing')
+
+
+def embedded_state_context(enabled: bool = True) -> Dict:
+    """EXTRACT_DETAIL_JS 인자 중 내장 데이터 부분 (비활성화면 빈 dict → DOM 탐색만)"""
+    if not enabled:
+        return {}
+    return {
+        'state_globals': list(APP_STATE_GLOBALS),
+        'state_product_paths': list(APP_STATE_PRODUCT_PATHS),
+        'state_paths': APP_STATE_PATHS,
+        'json_ld_paths': JSON_LD_PATHS,
+    }
+
+
+class FieldProvenance:
+    """
+    필드별 출처 집계 (product_data['_field_sources'] 기준)
+
+    사용 예:
+        provenance = FieldProvenance()
+        provenance.record(product_data)
+        provenance.print_stats()   # [필드 출처] rating: app_state 95, dom 3, 없음 2 ...
+    """
+
+    def __init__(self, fields: Optional[List[str]] = None):
+        self.fields = fields or [
+            'product_name', 'price', 'discount_rate', 'review_count',
+            'rating', 'brand_name', 'search_tags', 'thumbnail_url'
+        ]
+        self.pages = 0
+        self.counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def record(self, product_data: Optional[Dict]):
+        """상품 1개의 필드 출처 집계 (출처 없는 필드는 '없음')"""
+        if not product_data:
+            return
+        sources = product_data.get('_field_sources') or {}
+        self.pages += 1
+        for field_name in self.fields:
+            self.counts[field_name][sources.get(field_name, 'none')] += 1
+
+    def get_stats(self) -> Dict:
+        return {
+            'pages': self.pages,
+            'fields': {field: dict(counts) for field, counts in self.counts.items()},
+        }
+
+    def print_stats(self):
+        """필드 출처 통계 출력"""
+        if not self.pages:
+            return
+        print(f"[필드 출처] 상품 {self.pages}개")
+        for field_name in self.fields:
+            counts = self.counts.get(field_name, {})
+            order = list(FIELD_SOURCES) + ['none']
+            detail = ', '.join(
+                f"{'없음' if source == 'none' else source} {counts[source]}"
+                for source in order if counts.get(source)
+            )
+            print(f"  - {field_name}: {detail}")
@@ -0,0 +1,97 @@
+"""
+상품 카드 핸들 레지스트리
+순번(seq) 또는 상품 ID(nvMid)로 카드 1개만 조회 (상품마다 query_selector_all 제거)
+크롤링이 앞으로 진행되면 지나간 ElementHandle을 dispose해서 핸들이 쌓이지 않게 함
+"""
+
+from typing import Dict, Optional, Union
+
+from src.core.listing_queue import ListingQueue
+
+
+def _css_attr_value(value: str) -> str:
+    """CSS 속성 셀렉터용 따옴표 이스케이프"""
+    return value.replace('\\', '\\\\').replace('"', '\\"')
+
+
+class ProductHandleRegistry:
+    """
+    리스트 카드 ElementHandle 관리
+
+    - 카드 식별: data-crawl-seq (큐 순번), data-crawl-id (상품 ID) - ListingQueue 옵저버가 부여
+    - resolve(): 셀렉터 1개로 카드 1개만 조회 (query_selector)
+    - 현재 seq보다 keep개 이상 뒤처진 핸들은 자동 dispose
+
+    사용 예:
+        handles = ProductHandleRegistry(listing_queue)
+        product = await handles.resolve(page, idx)        # 순번
+        product = await handles.resolve(page, '8291482')  # 상품 ID
+        await handles.dispose_all()
+    """
+
+    def __init__(self, queue: ListingQueue, keep: int = 2):
+        self.queue = queue
+        self.keep = keep  # 현재 상품 이전에 남겨둘 핸들 수
+        self._handles: Dict[int, object] = {}
+
+        # 통계
+        self.resolved_count = 0
+        self.disposed_count = 0
+
+    def selector_for(self, ref: Union[int, str]) -> str:
+        """순번(int) 또는 상품 ID(str) → 카드 셀렉터"""
+        if isinstance(ref, int):
+            return f'a[data-crawl-seq="{ref}"]'
+        return f'a[data-crawl-id="{_css_attr_value(ref)}"]'
+
+    def seq_of(self, ref: Union[int, str]) -> Optional[int]:
+        """상품 ID → 순번 (큐에 없으면 None)"""
+        if isinstance(ref, int):
+            return ref
+        return self.queue.seq_of(ref)
+
+    async def resolve(self, page, ref: Union[int, str]):
+        """
+        카드 1개 조회 + 지나간 핸들 정리
+
+        Returns:
+            ElementHandle 또는 None (카드가 DOM에 없음)
+        """
+        seq = self.seq_of(ref)
+        if seq is not None:
+            await self._release(seq)  # 같은 카드 이전 핸들
+            await self.advance(seq)
+
+        handle = await page.query_selector(self.selector_for(ref))
+        if handle is None:
+            return None
+
+        self.resolved_count += 1
+        if seq is not None:
+            self._handles[seq] = handle
+        return handle
+
+    async def advance(self, seq: int):
+        """seq - keep 이전 핸들 모두 dispose"""
+        for old_seq in [s for s in self._handles if s < seq - self.keep]:
+            await self._release(old_seq)
+
+    async def _release(self, seq: int):
+        handle = self._handles.pop(seq, None)
+        if handle is None:
+            return
+        try:
+            await handle.dispose()
+        except Exception:
+            pass  # 페이지가 닫혔거나 이미 해제됨
+        self.disposed_count += 1
+
+    async def dispose_all(self):
+        """남은 핸들 전부 해제 (배치/크롤링 종료 시)"""
+        for seq in list(self._handles):
+            await self._release(seq)
+
+    @property
+    def live_count(self) -> int:
+        """현재 살아 있는 핸들 수"""
+        return len(self._handles)
@@ -0,0 +1,142 @@
+"""
+상세 페이지 레이아웃 템플릿 캐시
+레이아웃 지문(호스트 레이아웃 + 구조 마커) → 필드별 셀렉터
+같은 레이아웃의 다음 페이지부터는 텍스트 노드 탐색 없이 학습된 셀렉터로 바로 추출
+(지문 계산/템플릿 적용/학습은 EXTRACT_DETAIL_JS 안에서 page.evaluate 1회로 처리)
+"""
+
+import json
+import os
+from typing import Dict, Optional
+
+from src.utils.selector_stats import layout_key
+
+# =====================================================
+# 구조 마커 (존재 여부 비트열이 지문이 됨)
+# =====================================================
+# 같은 호스트라도 스토어 종류/배포 버전에 따라 DOM 구조가 다름
+# → 난독화 클래스(배포마다 바뀜) + 페이지 구성 요소로 구분
+FINGERPRINT_MARKERS = (
+    'h3.DCVBehA8ZB',                      # 상품명 (현재 배포 클래스)
+    'strong.Izp3Con8h8',                  # 가격 (현재 배포 클래스)
+    'script[type="application/ld+json"]',  # 구조화 데이터
+    '#__NEXT_DATA__',                     # Next.js 앱 (브랜드스토어 일부)
+    'table th',                           # 상품정보 표 (브랜드 셀)
+)
+
+
+class LayoutTemplateCache:
+    """
+    레이아웃 지문별 필드 셀렉터 캐시 ({지문: {필드: 셀렉터}})
+
+    - payload(): EXTRACT_DETAIL_JS에 넘길 인자 (레이아웃 키 + 마커 + 템플릿 전체)
+    - update(): 추출 결과의 적중/무효화/학습 결과 반영
+      - 템플릿 셀렉터가 안 맞고 탐색으로 찾은 필드 → 해당 셀렉터 무효화 후 새로 학습한 셀렉터로 교체
+      - 탐색으로도 못 찾은 필드 (할인 없는 상품 등) → 템플릿 유지
+    - 파일 저장은 save()에서만 (크롤링 중에는 메모리만 갱신)
+    """
+
+    def __init__(self, path: Optional[str] = None, enabled: bool = True):
+        self.path = path
+        self.enabled = enabled
+        self.templates: Dict[str, Dict[str, str]] = {}
+        self._dirty = False
+
+        # 이번 실행 통계
+        self.pages = 0  # 추출한 페이지 수
+        self.template_pages = 0  # 템플릿이 있던 페이지 수
+        self.field_hits = 0  # 템플릿 셀렉터로 바로 찾은 필드 수
+        self.invalidated = 0  # 더 이상 안 맞아서 교체/삭제한 셀렉터 수
+        self.learned = 0  # 새로 학습한 셀렉터 수
+
+        if path:
+            self.load()
+
+    def payload(self, url: Optional[str]) -> Optional[Dict]:
+        """EXTRACT_DETAIL_JS 인자 (비활성화면 None → 템플릿 없이 탐색만)"""
+        if not self.enabled:
+            return None
+        return {
+            'layout': layout_key(url),
+            'markers': list(FINGERPRINT_MARKERS),
+            'templates': self.templates,
+        }
+
+    def update(self, raw: Dict):
+        """추출 결과(fingerprint, template_hits, template_misses, learned) 반영"""
+        fingerprint = raw.get('fingerprint')
+        if not self.enabled or not fingerprint:
+            return
+
+        self.pages += 1
+        template = self.templates.get(fingerprint)
+        if template:
+            self.template_pages += 1
+        self.field_hits += len(raw.get('template_hits') or [])
+
+        learned = raw.get('learned') or {}
+        misses = raw.get('template_misses') or []
+        if not learned and not misses:
+            return
+
+        template = self.templates.setdefault(fingerprint, {})
+        for field_name in misses:
+            if template.pop(field_name, None) is not None:
+                self.invalidated += 1
+        for field_name, selector in learned.items():
+            template[field_name] = selector
+            self.learned += 1
+        if not template:
+            del self.templates[fingerprint]
+        self._dirty = True
+
+    def load(self):
+        """템플릿 파일 로드 (없거나 깨져 있으면 빈 캐시로 시작)"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.templates = {
+                fingerprint: {field: str(selector) for field, selector in fields.items()}
+                for fingerprint, fields in data.get('templates', {}).items()
+            }
+        except Exception as e:
+            print(f"[레이아웃 템플릿] {self.path} 로드 실패 - 새로 학습: {e}")
+            self.templates = {}
+
+    def save(self) -> bool:
+        """변경된 템플릿을 파일에 저장 (임시 파일에 쓴 뒤 교체 → 중간에 끊겨도 기존 파일 유지)"""
+        if not self.path or not self._dirty:
+            return False
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'templates': self.templates}, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+            return True
+        except Exception as e:
+            print(f"[레이아웃 템플릿] {self.path} 저장 실패: {e}")
+            return False
+
+    def get_stats(self) -> Dict:
+        return {
+            'pages': self.pages,
+            'template_pages': self.template_pages,
+            'field_hits': self.field_hits,
+            'invalidated': self.invalidated,
+            'learned': self.learned,
+            'layouts': len(self.templates),
+        }
+
+    def print_stats(self):
+        """템플릿 통계 출력"""
+        if not self.enabled:
+            return
+        print(f"[레이아웃 템플릿] 페이지 {self.pages}개 중 템플릿 사용 {self.template_pages}개 | "
+              f"템플릿 적중 필드 {self.field_hits}개 | 학습 {self.learned}개 | 무효화 {self.invalidated}개 | "
+              f"레이아웃 {len(self.templates)}종")
@@ -0,0 +1,132 @@
+"""
+상세 페이지 지연 로딩 필드 정책
+브랜드 표/검색 태그처럼 스크롤해야 렌더링되는 영역을 필드별로 판단
+→ 첫 추출에 이미 있거나 상품에 없는 것이 확실한 필드는 스크롤/대기 생략
+→ 필요한 필드만 해당 위치로 스크롤 후 필드별 시간 예산 안에서 영역 등장 대기
+"""
+
+import time
+from typing import Dict, List, Optional
+
+# =====================================================
+# 브라우저 내부 확인 스크립트 (필드 영역이 렌더링됐는지)
+# =====================================================
+LAZY_PROBE_JS = r'''(field) => {
+    if (field === 'brand_name') {
+        for (const cell of document.querySelectorAll('th, td')) {
+            if ((cell.textContent || '').trim() === '브랜드' && cell.nextElementSibling) return true;
+        }
+        return false;
+    }
+    if (field === 'search_tags') {
+        for (const link of document.querySelectorAll('a')) {
+            if ((link.textContent || '').trim().startsWith('#')) return true;
+        }
+        return false;
+    }
+    return false;
+}'''
+
+_SCROLL_JS = '(ratio) => window.scrollTo(0, document.body.scrollHeight * ratio)'
+
+# 기본 필드 설정 (CRAWL_CONFIG['lazy_fields']['fields']가 없을 때)
+DEFAULT_LAZY_FIELDS = {
+    'brand_name': {'scroll_to': 0.3, 'budget': 1.5, 'trust_embedded': False},
+    'search_tags': {'scroll_to': 0.5, 'budget': 2.0, 'trust_embedded': True},
+}
+
+
+class LazyFieldPolicy:
+    """
+    필드별 스크롤/대기 판단 + 예산 사용 기록
+
+    사용 예:
+        policy = LazyFieldPolicy(CRAWL_CONFIG['lazy_fields'])
+        raw = await page.evaluate(EXTRACT_DETAIL_JS, context)
+        if await policy.run(page, waits, raw):       # 대기한 필드가 있으면 True
+            raw = await page.evaluate(EXTRACT_DETAIL_JS, context)
+
+    필드 설정:
+        scroll_to: 스크롤 위치 (페이지 높이 비율)
+        budget: 최대 대기 (초) - 영역이 나타나면 바로 끝남
+        trust_embedded: 앱 상태 상품 객체에 필드 경로가 있는데 값이 비어 있으면 상품에 없는 것으로 보고 대기 생략
+                        (경로 자체가 없으면 앱 상태가 모르는 필드 → 대기)
+
+    enabled=False면 값이 있어도 항상 모든 필드를 스크롤/대기 (기존 동작)
+    """
+
+    def __init__(self, config: Optional[Dict] = None):
+        config = config or {}
+        self.enabled = config.get('enabled', True)
+        self.fields: Dict[str, Dict] = config.get('fields') or DEFAULT_LAZY_FIELDS
+
+        # 필드별 통계
+        self.field_stats: Dict[str, Dict] = {
+            field_name: {'present': 0, 'trusted': 0, 'waited': 0, 'found': 0, 'exhausted': 0, 'time': 0.0}
+            for field_name in self.fields
+        }
+
+    def plan(self, raw: Dict) -> List[str]:
+        """
+        스크롤/대기가 필요한 필드 (스크롤 위치 순)
+
+        Args:
+            raw: EXTRACT_DETAIL_JS 첫 추출 결과
+        """
+        state_fields = set((raw.get('embedded') or {}).get('state_fields') or ())
+        needed = []
+        for field_name, spec in self.fields.items():
+            stats = self.field_stats[field_name]
+            if self.enabled and raw.get(field_name):
+                stats['present'] += 1
+            elif self.enabled and spec.get('trust_embedded') and field_name in state_fields:
+                stats['trusted'] += 1
+            else:
+                needed.append(field_name)
+        return sorted(needed, key=lambda name: self.fields[name].get('scroll_to', 0))
+
+    async def run(self, page, waits, raw: Dict) -> bool:
+        """
+        필요한 필드만 스크롤 + 예산 안에서 대기
+
+        Args:
+            waits: WaitEngine (대기 이름 'lazy_<필드>'로 지연 시간도 함께 기록)
+
+        Returns:
+            bool: 대기한 필드가 있으면 True (다시 추출 필요)
+        """
+        needed = self.plan(raw)
+        for field_name in needed:
+            spec = self.fields[field_name]
+            stats = self.field_stats[field_name]
+            started = time.monotonic()
+            try:
+                await page.evaluate(_SCROLL_JS, spec.get('scroll_to', 0.5))
+            except Exception:
+                pass
+            found = await waits.for_function(
+                page, LAZY_PROBE_JS, field_name, f'lazy_{field_name}', timeout=spec.get('budget', 2.0)
+            )
+            stats['waited'] += 1
+            stats['time'] += time.monotonic() - started
+            if found:
+                stats['found'] += 1
+            else:
+                stats['exhausted'] += 1
+        return bool(needed)
+
+    def get_stats(self) -> Dict:
+        return {field_name: dict(stats) for field_name, stats in self.field_stats.items()}
+
+    def print_stats(self):
+        """필드별 예산 사용 통계 출력"""
+        for field_name, stats in self.field_stats.items():
+            total = stats['present'] + stats['trusted'] + stats['waited']
+            if not total:
+                continue
+            budget = self.fields[field_name].get('budget', 2.0)
+            avg = stats['time'] / stats['waited'] if stats['waited'] else 0.0
+            print(f"[지연 필드] {field_name}: 페이지 {total}개 | 이미 있음 {stats['present']} | "
+                  f"내장 데이터 기준 없음 {stats['trusted']} | 대기 {stats['waited']} "
+                  f"(찾음 {stats['found']}, 예산 소진 {stats['exhausted']}) | "
+                  f"평균 {avg:.2f}s / 예산 {budget:.1f}s")
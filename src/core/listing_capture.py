@@ -0,0 +1,317 @@
+"""
+리스트 페이지 네트워크 응답 캡처
+무한 스크롤이 받아오는 XHR/fetch JSON 응답에서 상품 후보 레코드 추출
+(DOM 스크래핑 없이 상품 ID, 가격, 상품명 확보 → 크롤링 큐에 바로 전달)
+"""
+
+import asyncio
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+# =====================================================
+# 필드 별칭 (네이버 API마다 키 이름이 다름 → 먼저 나오는 키 사용)
+# =====================================================
+FIELD_ALIASES = {
+    'nv_mid': ['nvMid', 'nvmid', 'catalogId'],
+    'product_id': ['channelProductNo', 'productNo', 'mallProductId', 'productId'],
+    'product_name': ['productName', 'productTitle', 'name', 'title'],
+    'price': ['discountedSalePrice', 'salePrice', 'lowPrice', 'price', 'mobilePrice'],
+    'discount_rate': ['discountedRatio', 'discountRate', 'discountRatio'],
+    'review_count': ['reviewCount', 'totalReviewCount', 'reviewCountSum'],
+    'rating': ['averageReviewScore', 'reviewScore', 'scoreInfo', 'rating'],
+    'product_url': ['productUrl', 'mallProductUrl', 'crUrl', 'linkUrl', 'url'],
+    'thumbnail_url': ['imageUrl', 'representImageUrl', 'thumbnailUrl', 'image'],
+    'brand_name': ['brandName', 'brand'],
+    'mall_name': ['mallName', 'channelName', 'storeName'],
+}
+
+# 범용 'id' 키는 숫자 카탈로그 ID일 때만 nv_mid로 사용 (옵션/필터 객체의 id 제외)
+_GENERIC_ID_KEY = 'id'
+_CATALOG_ID = re.compile(r'\d{8,}')
+
+# 상품 레코드로 인정하는 최소 조건: ID + 상품명 + 가격
+_REQUIRED = ('nv_mid', 'product_name', 'price')
+
+# 캡처 대상 응답 URL 패턴 (JSON 응답 중 이 패턴이 포함된 것만 파싱)
+LISTING_URL_PATTERNS = ('/api/', 'search', 'product', 'graphql')
+
+
+def _first(item: Dict, keys: List[str]) -> Any:
+    """별칭 목록 중 값이 있는 첫 번째 키의 값"""
+    for key in keys:
+        value = item.get(key)
+        if value not in (None, ''):
+            return value
+    return None
+
+
+def _to_int(value: Any) -> Optional[int]:
+    """'39,900' / 39900.0 / '30%' → 정수"""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    digits = re.sub(r'[^\d]', '', str(value))
+    return int(digits) if digits else None
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """'4.8' / 4.8 / 48(10점 만점 x10) → 실수"""
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        match = re.search(r'\d+(\.\d+)?', str(value))
+        if not match:
+            return None
+        number = float(match.group(0))
+    return number / 10 if number > 5 else number
+
+
+def _extract_product_no(url: Optional[str]) -> Optional[str]:
+    """상세 URL의 /products/<id>"""
+    if not url:
+        return None
+    match = re.search(r'/products/(\d+)', url)
+    return match.group(1) if match else None
+
+
+def normalize_record(item: Dict) -> Optional[Dict]:
+    """
+    JSON 객체 1개를 상품 후보 레코드로 변환
+
+    Returns:
+        dict 또는 None (상품 객체가 아니면)
+    """
+    record = {field: _first(item, keys) for field, keys in FIELD_ALIASES.items()}
+    if record['nv_mid'] is None:
+        generic_id = item.get(_GENERIC_ID_KEY)
+        if not isinstance(generic_id, bool) and _CATALOG_ID.fullmatch(str(generic_id)):
+            record['nv_mid'] = generic_id
+
+    if any(record[field] in (None, '') for field in _REQUIRED):
+        return None
+    if not isinstance(record['product_name'], str):
+        return None
+
+    record['nv_mid'] = str(record['nv_mid'])
+    record['price'] = _to_int(record['price'])
+    if record['price'] is None:
+        return None
+
+    record['discount_rate'] = _to_int(record['discount_rate'])
+    record['review_count'] = _to_int(record['review_count'])
+    record['rating'] = _to_float(record['rating'])
+
+    for field in ('product_url', 'thumbnail_url', 'brand_name', 'mall_name'):
+        if record[field] is not None and not isinstance(record[field], str):
+            record[field] = None
+
+    # 상세 페이지 상품 ID (DB product_id와 같은 체계) - 없으면 URL에서 추출
+    product_id = record['product_id']
+    record['product_id'] = str(product_id) if product_id else _extract_product_no(record['product_url'])
+    return record
+
+
+def _merge_missing(existing: Dict, record: Dict):
+    """같은 상품이 다시 나오면 비어 있던 값만 보충"""
+    for field, value in record.items():
+        if existing.get(field) is None and value is not None:
+            existing[field] = value
+
+
+def parse_listing_payload(payload: Any) -> List[Dict]:
+    """
+    리스트 API 응답(JSON)에서 상품 후보 레코드 추출
+
+    응답 구조가 API마다 달라서 전체를 순회하며 상품처럼 생긴 객체만 수집
+    (예: data.products[], shoppingResult.products[], items[].item)
+
+    Args:
+        payload: response.json() 결과
+
+    Returns:
+        list: 응답 안 등장 순서대로 정리된 레코드 (같은 nv_mid는 1개로 병합)
+    """
+    records = []
+    by_nv_mid = {}
+    stack = [payload]
+
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            record = normalize_record(node)
+            if record:
+                existing = by_nv_mid.get(record['nv_mid'])
+                if existing is None:
+                    by_nv_mid[record['nv_mid']] = record
+                    records.append(record)
+                else:
+                    _merge_missing(existing, record)
+                continue  # 상품 객체 내부(옵션 등)는 더 내려가지 않음
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+    return records
+
+
+# 상세 페이지에서 못 찾았을 때 리스트 응답 값으로 보충할 필드
+FILL_FIELDS = ('brand_name', 'price', 'discount_rate', 'review_count', 'rating', 'thumbnail_url')
+
+
+def is_listing_response(response, url_patterns=LISTING_URL_PATTERNS) -> bool:
+    """리스트 상품 응답 후보인지 (XHR/fetch + JSON + URL 패턴)"""
+    try:
+        if response.request.resource_type not in ('xhr', 'fetch'):
+            return False
+        if 'json' not in (response.headers.get('content-type') or ''):
+            return False
+        return any(pattern in response.url for pattern in url_patterns)
+    except Exception:
+        return False
+
+
+def fill_from_listing(product_data: Dict, record: Optional[Dict]) -> Dict:
+    """
+    상세 페이지 수집 결과의 빈 필드를 리스트 응답 레코드로 보충 (상세 페이지 값이 우선)
+
+    Args:
+        product_data: SimpleCrawler 형식 상품 데이터 (제자리 수정)
+        record: parse_listing_payload 레코드 (None이면 그대로 반환)
+    """
+    if not product_data or not record:
+        return product_data
+
+    sources = product_data.get('_field_sources')
+    for field in FILL_FIELDS:
+        if not product_data.get(field) and record.get(field) is not None:
+            product_data[field] = record[field]
+            if sources is not None:
+                sources[field] = 'listing'
+    return product_data
+
+
+class ListingResponseCapture:
+    """
+    page.on('response') 기반 리스트 응답 캡처
+
+    사용 예:
+        capture = ListingResponseCapture()
+        capture.attach(page)
+        ...
+        record = capture.lookup(href)          # 리스트 href(nvMid/상품 URL)로 조회
+    """
+
+    def __init__(self, url_patterns=LISTING_URL_PATTERNS, debug: bool = False):
+        self.url_patterns = tuple(url_patterns)
+        self.debug = debug
+        self.records: List[Dict] = []          # 도착 순서 (seq = 인덱스)
+        self.by_nv_mid: Dict[str, Dict] = {}
+        self.by_product_id: Dict[str, Dict] = {}
+        self._tasks = set()
+
+        # 통계
+        self.responses_seen = 0
+        self.responses_parsed = 0
+        self.parse_errors = 0
+
+    def attach(self, page):
+        """리스트 페이지에 응답 리스너 등록"""
+        page.on('response', self._on_response)
+
+    def detach(self, page):
+        """응답 리스너 해제"""
+        try:
+            page.remove_listener('response', self._on_response)
+        except Exception:
+            pass
+
+    def _on_response(self, response):
+        """응답 이벤트 (동기 콜백) → 본문 파싱은 비동기 태스크로"""
+        if not is_listing_response(response, self.url_patterns):
+            return
+
+        self.responses_seen += 1
+        task = asyncio.ensure_future(self._handle(response))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _handle(self, response):
+        try:
+            payload = await response.json()
+        except Exception:
+            self.parse_errors += 1
+            return
+        self.ingest(response.url, payload)
+
+    def ingest(self, url: str, payload: Any) -> int:
+        """
+        응답 본문 1개 반영 (녹화된 응답 파일로 오프라인 테스트할 때도 사용)
+
+        Returns:
+            int: 새로 추가된 레코드 수
+        """
+        records = parse_listing_payload(payload)
+        if records:
+            self.responses_parsed += 1
+
+        added = 0
+        for record in records:
+            if record['nv_mid'] in self.by_nv_mid:
+                # 같은 상품이 다시 오면 비어 있던 값만 보충
+                existing = self.by_nv_mid[record['nv_mid']]
+                _merge_missing(existing, record)
+                if existing['product_id']:
+                    self.by_product_id.setdefault(existing['product_id'], existing)
+                continue
+
+            record['seq'] = len(self.records)
+            record['source_url'] = url
+            self.records.append(record)
+            self.by_nv_mid[record['nv_mid']] = record
+            if record['product_id']:
+                self.by_product_id[record['product_id']] = record
+            added += 1
+
+        if self.debug and added:
+            print(f"   [응답 캡처] {url[:60]} → 신규 {added}개 (누적 {len(self.records)}개)")
+        return added
+
+    def ingest_file(self, path: str) -> int:
+        """녹화된 응답 JSON 파일 반영 ({"url": ..., "body": ...} 또는 본문만)"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict) and 'body' in data:
+            return self.ingest(data.get('url', path), data['body'])
+        return self.ingest(path, data)
+
+    async def flush(self):
+        """진행 중인 응답 파싱 완료 대기"""
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def lookup(self, href_or_nv_mid: str) -> Optional[Dict]:
+        """
+        리스트 href 또는 nvMid로 레코드 조회
+
+        - href에 nvMid=... 파라미터가 있으면 nvMid로
+        - href가 /products/<id> 형식이면 상품 ID로
+        - 그 외에는 값 자체를 nvMid로 간주
+        """
+        if not href_or_nv_mid:
+            return None
+        match = re.search(r'nvMid=(\d+)', href_or_nv_mid)
+        if match:
+            return self.by_nv_mid.get(match.group(1))
+        product_no = _extract_product_no(href_or_nv_mid)
+        if product_no:
+            return self.by_product_id.get(product_no)
+        return self.by_nv_mid.get(href_or_nv_mid)
+
+    def print_stats(self):
+        """캡처 통계 출력"""
+        print(f"[응답 캡처] 응답 {self.responses_seen}개 확인 | 상품 응답 {self.responses_parsed}개 | "
+              f"레코드 {len(self.records)}개 | 파싱 실패 {self.parse_errors}개")
@@ -0,0 +1,193 @@
+"""
+리스트 페이지 증분 필터링 (MutationObserver)
+새로 삽입된 상품 카드만 분류해서 window.__crawlQueue에 순번(seq)과 함께 추가
+Python은 마지막으로 읽은 seq 이후만 가져감 (스크롤마다 전체 카드 재검사 제거)
+"""
+
+from typing import Dict, List, Optional
+
+# =====================================================
+# 브라우저 내부 스크립트
+# =====================================================
+
+# 옵저버 설치 + 아직 분류 안 된 기존 카드 분류 (여러 번 호출해도 옵저버는 1개)
+# - 정렬 옵션(#product-sort-address-container)보다 문서 순서상 뒤에 있는 카드만 선택
+#   (getBoundingClientRect 레이아웃 계산 없이 compareDocumentPosition 사용)
+# - "FOR YOU 연관 추천"(aria-labelledby에 related_recommend_product_information) 제외
+# - 같은 상품(nvMid)이 다시 렌더링되면 기존 seq 재사용 (큐에 중복 추가 안 함)
+# - 선택된 카드: data-crawl-seq(순번) + data-crawl-id(상품 ID, 없으면 href) 고정 속성
+# - 정렬 옵션이 아직 없으면 requireSort=true일 때 분류 보류 (다음 설치 호출 때 재검사)
+INSTALL_JS = r'''([requireSort]) => {
+    const LINK = 'a[class*="ProductCard_link"]';
+    const state = window.__crawlFilter || (window.__crawlFilter = {
+        queue: [],
+        keyToSeq: new Map(),
+        stats: {total: 0, filtered: 0, aboveSort: 0, recommendations: 0, rerendered: 0},
+        labelPatterns: [],
+        observer: null,
+        sort: null
+    });
+    window.__crawlQueue = state.queue;
+    state.requireSort = requireSort;
+
+    const keyOf = (href) => {
+        const match = href.match(/nvMid=(\d+)/) || href.match(/\/products\/(\d+)/);
+        return match ? match[1] : href;
+    };
+
+    const sortContainer = () => {
+        if (!state.sort || !state.sort.isConnected) {
+            state.sort = document.querySelector('#product-sort-address-container');
+        }
+        return state.sort;
+    };
+
+    const classify = (link) => {
+        if (link.hasAttribute('data-filtered')) return;
+
+        const sort = sortContainer();
+        if (!sort && state.requireSort) return;  // 분류 보류
+
+        state.stats.total++;
+        const labelId = link.getAttribute('aria-labelledby') || '';
+        if (labelId && state.labelPatterns.length < 5 && !state.labelPatterns.includes(labelId)) {
+            state.labelPatterns.push(labelId);
+        }
+
+        const below = !sort || (!sort.contains(link) &&
+            !!(sort.compareDocumentPosition(link) & Node.DOCUMENT_POSITION_FOLLOWING));
+        if (!below) {
+            state.stats.aboveSort++;
+            link.setAttribute('data-filtered', 'false');
+            return;
+        }
+        if (labelId.includes('related_recommend_product_information')) {
+            state.stats.recommendations++;
+            link.setAttribute('data-filtered', 'false');
+            return;
+        }
+
+        const href = link.href || '';
+        const key = keyOf(href);
+        let seq = state.keyToSeq.get(key);
+        if (seq === undefined) {
+            seq = state.queue.length;
+            state.keyToSeq.set(key, seq);
+            state.queue.push({seq: seq, href: href || null, key: key});
+            state.stats.filtered++;
+        } else {
+            state.stats.rerendered++;
+        }
+        link.setAttribute('data-filtered', 'true');
+        link.setAttribute('data-crawl-seq', String(seq));
+        link.setAttribute('data-crawl-id', key);
+    };
+
+    if (!state.observer) {
+        state.observer = new MutationObserver((mutations) => {
+            for (const mutation of mutations) {
+                for (const node of mutation.addedNodes) {
+                    if (node.nodeType !== 1) continue;
+                    if (node.matches(LINK)) {
+                        classify(node);
+                    } else if (node.firstElementChild) {
+                        node.querySelectorAll(LINK).forEach(classify);  // 삽입된 서브트리만 검사
+                    }
+                }
+            }
+        });
+        state.observer.observe(document.body, {childList: true, subtree: true});
+    }
+
+    document.querySelectorAll(LINK).forEach(classify);
+
+    return {
+        hasSortContainer: !!sortContainer(),
+        queueLength: state.queue.length,
+        stats: Object.assign({}, state.stats),
+        labelPatterns: state.labelPatterns.slice()
+    };
+}'''
+
+# fromSeq 이후 항목만 반환 (큐 인덱스 = seq 이므로 slice 비용은 새 항목 수에 비례)
+DRAIN_JS = r'''(fromSeq) => {
+    const state = window.__crawlFilter;
+    if (!state) return null;
+    return {
+        items: state.queue.slice(fromSeq),
+        stats: Object.assign({}, state.stats)
+    };
+}'''
+
+# 큐 길이가 minLength 이상이 되면 true (wait_for_function 조건)
+QUEUE_LENGTH_JS = '(minLength) => (window.__crawlQueue || []).length >= minLength'
+
+
+class ListingQueue:
+    """
+    리스트 페이지 상품 큐 (Python 쪽)
+
+    - seq = 필터링된 상품의 고정 순번 (카드에 data-crawl-seq로 표시)
+    - hrefs[seq] = 상품 링크
+
+    사용 예:
+        queue = ListingQueue()
+        info = await queue.install(page)
+        new_items = await queue.drain(page)   # 마지막 drain 이후 새 상품
+        total = len(queue)
+    """
+
+    def __init__(self):
+        self.hrefs: List[Optional[str]] = []
+        self.keys: List[str] = []
+        self.key_to_seq: Dict[str, int] = {}
+        self.stats: Dict = {}
+
+    def __len__(self):
+        return len(self.hrefs)
+
+    async def install(self, page, require_sort: bool = True) -> Dict:
+        """
+        옵저버 설치 + 기존 카드 분류 후 큐 읽기
+
+        Args:
+            require_sort: False면 정렬 옵션이 없어도 모든 카드 선택 (필터링 실패 시 Fallback)
+
+        Returns:
+            dict: {hasSortContainer, queueLength, stats, labelPatterns}
+        """
+        info = await page.evaluate(INSTALL_JS, [require_sort])
+        await self.drain(page)
+        return info
+
+    async def drain(self, page) -> Optional[List[Dict]]:
+        """
+        마지막으로 읽은 seq 이후 새 항목 가져오기
+
+        Returns:
+            list: 새 항목 [{seq, href, key}] / None: 페이지가 새로 로드되어 큐가 사라짐
+        """
+        result = await page.evaluate(DRAIN_JS, len(self.hrefs))
+        if result is None:
+            return None
+
+        self.stats = result['stats']
+        items = result['items']
+        for item in items:
+            self.append(item['href'], item['key'])
+        return items
+
+    def append(self, href: Optional[str], key: str) -> int:
+        """항목 1개 추가 → seq 반환"""
+        seq = len(self.hrefs)
+        self.hrefs.append(href)
+        self.keys.append(key)
+        self.key_to_seq.setdefault(key, seq)
+        return seq
+
+    def href(self, seq: int) -> Optional[str]:
+        return self.hrefs[seq] if 0 <= seq < len(self.hrefs) else None
+
+    def seq_of(self, key: str) -> Optional[int]:
+        """상품 ID(nvMid) → seq"""
+        return self.key_to_seq.get(key)
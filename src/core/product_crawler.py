@@ -592,6 +592,7 @@ class WomensClothingManualCaptcha:
                 await asyncio.sleep(3)
 
                 await browser.close()
+                self.helper.save_stats()  # 셀렉터 적중 통계 (다음 실행의 시도 순서)
 
                 # DB 세션 종료 (커넥션 재사용)
                 if self.history_id:
@@ -612,6 +613,7 @@ class WomensClothingManualCaptcha:
                 print(f"[오류] {str(e)}")
                 import traceback
                 traceback.print_exc()
+                self.helper.save_stats()
 
                 # DB 세션 종료 (에러) - 커넥션 재사용
                 if self.history_id:
@@ -795,33 +797,35 @@ class WomensClothingManualCaptcha:
         except:
             pass
 
+        # 1~6, 8, 9. 셀렉터 필드 일괄 해결 (page.evaluate 1회 - 필드별 try_selectors/extract 왕복 제거)
+        fields = await self.helper.resolve_all(page, {
+            "상품명": SELECTORS['product_name'],
+            "브랜드": SELECTORS['brand_name'],
+            "가격": SELECTORS['price'],
+            "할인율": SELECTORS['discount_rate'],
+            "리뷰 수": SELECTORS['review_count'],
+            "평점": SELECTORS['rating'],
+            "썸네일": {'selectors': SELECTORS['thumbnail'], 'attribute': 'src'},
+            "품절": SELECTORS['is_sold_out'],
+        })
+
         # 1. 상품명 (product_name) - TEXT NOT NULL
-        elem = await self.helper.try_selectors(page, SELECTORS['product_name'], "상품명")
-        detail_info['detail_product_name'] = await self.helper.extract_text(elem, "상품명")
+        detail_info['detail_product_name'] = fields["상품명"]['text']
 
         # 2. 브랜드명 (brand_name) - VARCHAR(100)
-        elem = await self.helper.try_selectors(page, SELECTORS['brand_name'], "브랜드")
-        detail_info['brand_name'] = await self.helper.extract_text(elem, "브랜드")
+        detail_info['brand_name'] = fields["브랜드"]['text']
 
         # 3. 가격 (price) - INTEGER
-        elem = await self.helper.try_selectors(page, SELECTORS['price'], "가격")
-        price_text = await self.helper.extract_text(elem, "가격")
-        detail_info['detail_price'] = self.helper.clean_price(price_text)
+        detail_info['detail_price'] = self.helper.clean_price(fields["가격"]['text'])
 
         # 4. 할인율 (discount_rate) - INTEGER
-        elem = await self.helper.try_selectors(page, SELECTORS['discount_rate'], "할인율")
-        discount_text = await self.helper.extract_text(elem, "할인율")
-        detail_info['discount_rate'] = self.helper.clean_discount_rate(discount_text)
+        detail_info['discount_rate'] = self.helper.clean_discount_rate(fields["할인율"]['text'])
 
         # 5. 리뷰 수 (review_count) - INTEGER
-        elem = await self.helper.try_selectors(page, SELECTORS['review_count'], "리뷰 수")
-        review_text = await self.helper.extract_text(elem, "리뷰 수")
-        detail_info['detail_review_count'] = self.helper.clean_review_count(review_text)
+        detail_info['detail_review_count'] = self.helper.clean_review_count(fields["리뷰 수"]['text'])
 
         # 6. 평점 (rating) - DECIMAL(2,1)
-        elem = await self.helper.try_selectors(page, SELECTORS['rating'], "평점")
-        rating_text = await self.helper.extract_text(elem, "평점")
-        detail_info['rating'] = self.helper.clean_rating(rating_text)
+        detail_info['rating'] = self.helper.clean_rating(fields["평점"]['text'])
 
         # 7. 검색 태그 (search_tags) - TEXT[]
         # 구조 기반: "관련 태그" 찾은 후 다음 ul > a 리스트
@@ -868,12 +872,10 @@ class WomensClothingManualCaptcha:
             detail_info['search_tags'] = []
 
         # 8. 썸네일 (thumbnail_url) - TEXT
-        elem = await self.helper.try_selectors(page, SELECTORS['thumbnail'], "썸네일")
-        detail_info['thumbnail_url'] = await self.helper.extract_attribute(elem, "src", "썸네일")
+        detail_info['thumbnail_url'] = fields["썸네일"]['attribute']
 
         # 9. 품절 여부 (is_sold_out) - BOOLEAN
-        elem = await self.helper.try_selectors(page, SELECTORS['is_sold_out'], "품절")
-        detail_info['is_sold_out'] = (elem is not None)
+        detail_info['is_sold_out'] = fields["품절"]['selector'] is not None
 
         # 10. URL (product_url) - TEXT
         detail_info['detail_page_url'] = page.url
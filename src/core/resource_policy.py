@@ -0,0 +1,173 @@
+"""
+리소스 차단 정책 (context.route)
+페이지 역할(listing/detail)별로 리소스 타입 + URL 패턴 차단
+차단 요청 수와 절약한 바이트(추정)를 실행 단위로 기록
+"""
+
+from typing import Dict, Optional
+
+# 응답 크기를 아직 못 본 리소스 타입의 기본 추정치 (bytes)
+DEFAULT_SIZE_ESTIMATE = {
+    'image': 60_000,
+    'media': 500_000,
+    'font': 40_000,
+    'stylesheet': 30_000,
+    'script': 50_000,
+    'xhr': 2_000,
+    'fetch': 2_000,
+    'ping': 200,
+    'beacon': 200,
+    'other': 5_000,
+}
+
+ROLES = ('listing', 'detail')
+
+
+class ResourcePolicy:
+    """
+    BrowserContext 전체 요청을 가로채 페이지 역할별 정책 적용
+
+    - 역할을 지정하지 않은 페이지(클릭 팝업, 워커 탭)는 default_role(detail)로 처리
+    - 차단한 요청은 다운로드되지 않으므로 크기는 같은 타입 응답의 평균 content-length로 추정
+
+    사용 예:
+        policy = ResourcePolicy(CRAWL_CONFIG['resource_policy'])
+        await policy.install(context)
+        policy.set_role(page, 'listing')
+        ...
+        policy.print_stats()
+    """
+
+    def __init__(self, config: Dict, default_role: str = 'detail'):
+        self.enabled = config.get('enabled', True)
+        self.default_role = default_role
+        self.rules = {}
+        for role in ROLES:
+            rule = config.get(role) or {}
+            self.rules[role] = {
+                'block_types': set(rule.get('block_types') or []),
+                'block_patterns': tuple(rule.get('block_patterns') or []),
+                'allow_patterns': tuple(rule.get('allow_patterns') or []),
+            }
+
+        self._page_roles: Dict[object, str] = {}
+
+        # 통계 (실행 단위)
+        self.allowed_count = {role: 0 for role in ROLES}
+        self.blocked_count = {role: {} for role in ROLES}  # role → {resource_type: n}
+        self.bytes_saved = 0
+        self._size_samples: Dict[str, list] = {}  # resource_type → [합계, 개수]
+
+    async def install(self, context):
+        """context에 라우팅 + 응답 크기 관찰 등록"""
+        if not self.enabled:
+            return
+        await context.route('**/*', self._handle_route)
+        context.on('response', self._on_response)
+
+    def set_role(self, page, role: str):
+        """페이지 역할 지정 ('listing' 또는 'detail')"""
+        if role not in ROLES:
+            raise ValueError(f"role은 {ROLES} 중 하나여야 합니다: {role}")
+        self._page_roles[page] = role
+
+    def role_of(self, page) -> str:
+        return self._page_roles.get(page, self.default_role)
+
+    def should_block(self, role: str, resource_type: str, url: str) -> bool:
+        """정책 판정 (순수 함수 - 오프라인 테스트용)"""
+        rule = self.rules.get(role) or self.rules[self.default_role]
+        if any(pattern in url for pattern in rule['allow_patterns']):
+            return False
+        if resource_type in rule['block_types']:
+            return True
+        return any(pattern in url for pattern in rule['block_patterns'])
+
+    async def _handle_route(self, route, request):
+        """route 핸들러 - 차단이면 abort, 아니면 fallback (그대로 요청)"""
+        try:
+            page = request.frame.page
+        except Exception:
+            page = None  # 서비스 워커 등 프레임 없는 요청
+        role = self.role_of(page)
+        resource_type = request.resource_type
+
+        if self.should_block(role, resource_type, request.url):
+            self._record_blocked(role, resource_type)
+            try:
+                await route.abort('blockedbyclient')
+            except Exception:
+                pass
+            return
+
+        self.allowed_count[role] += 1
+        try:
+            await route.fallback()  # 다른 route 핸들러가 있으면 넘기고, 없으면 그대로 요청
+        except Exception:
+            pass  # 페이지가 이미 닫힌 경우
+
+    def _on_response(self, response):
+        """통과한 응답의 content-length로 타입별 평균 크기 학습"""
+        try:
+            length = response.headers.get('content-length')
+            if not length:
+                return
+            resource_type = response.request.resource_type
+            sample = self._size_samples.setdefault(resource_type, [0, 0])
+            sample[0] += int(length)
+            sample[1] += 1
+        except Exception:
+            pass
+
+    def estimate_size(self, resource_type: str) -> int:
+        """리소스 타입 평균 크기 (관찰값 우선, 없으면 기본 추정치)"""
+        sample = self._size_samples.get(resource_type)
+        if sample and sample[1]:
+            return sample[0] // sample[1]
+        return DEFAULT_SIZE_ESTIMATE.get(resource_type, DEFAULT_SIZE_ESTIMATE['other'])
+
+    def _record_blocked(self, role: str, resource_type: str):
+        counts = self.blocked_count[role]
+        counts[resource_type] = counts.get(resource_type, 0) + 1
+        self.bytes_saved += self.estimate_size(resource_type)
+
+    def get_stats(self) -> Dict:
+        """실행 통계 (GUI/로그용)"""
+        blocked_total = sum(sum(counts.values()) for counts in self.blocked_count.values())
+        allowed_total = sum(self.allowed_count.values())
+        return {
+            'blocked': blocked_total,
+            'allowed': allowed_total,
+            'blocked_by_role': {role: dict(counts) for role, counts in self.blocked_count.items()},
+            'bytes_saved': self.bytes_saved,
+        }
+
+    def print_stats(self, detail_pages: Optional[int] = None):
+        """
+        차단 통계 출력
+
+        Args:
+            detail_pages: 수집한 상세 페이지 수 (페이지당 절약량 표시용)
+        """
+        if not self.enabled:
+            return
+
+        stats = self.get_stats()
+        total = stats['blocked'] + stats['allowed']
+        ratio = stats['blocked'] / total * 100 if total else 0
+
+        print("\n" + "="*60)
+        print("[통계] 리소스 차단")
+        print("="*60)
+        print(f"요청 {total}개 중 {stats['blocked']}개 차단 ({ratio:.1f}%)")
+        for role in ROLES:
+            counts = self.blocked_count[role]
+            if counts:
+                detail = ', '.join(f"{t} {n}" for t, n in sorted(counts.items(), key=lambda x: -x[1]))
+                print(f"  {role:8s}: {detail}")
+        print(f"절약 (추정): {stats['bytes_saved'] / 1024 / 1024:.1f} MB", end='')
+        if detail_pages:
+            print(f" | 상세 페이지당 {stats['bytes_saved'] / detail_pages / 1024:.0f} KB")
+        else:
+            print()
+        print("="*60)
@@ -5,8 +5,6 @@
 """
 
 import asyncio
-import re
-from datetime import datetime
 from playwright.async_api import async_playwright
 from typing import Optional, List, Dict
 import sys
@@ -16,6 +14,19 @@ import time
 # DB Connector import
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from src.database.db_connector import DatabaseConnector
+from src.database.batch_writer import BatchWriter
+from src.database.async_store import AsyncProductStore
+from src.core.detail_pool import DetailWorkerPool
+from src.core.detail_extractor import EXTRACT_DETAIL_JS, build_product_data
+from src.core.layout_templates import LayoutTemplateCache
+from src.core.embedded_state import FieldProvenance, embedded_state_context
+from src.core.lazy_fields import LazyFieldPolicy
+from src.core.wait_engine import WaitEngine
+from src.core.listing_capture import ListingResponseCapture, fill_from_listing, is_listing_response
+from src.core.resource_policy import ResourcePolicy
+from src.core.listing_queue import ListingQueue, QUEUE_LENGTH_JS
+from src.core.handle_registry import ProductHandleRegistry
+from src.core.browser_recycler import BrowserRecycler
 
 
 class SimpleCrawler:
@@ -31,7 +42,18 @@ class SimpleCrawler:
                  category_id: str = "10000107",
                  product_count: Optional[int] = None,  # None = 무한
                  headless: bool = False,
-                 save_to_db: bool = True):
+                 save_to_db: bool = True,
+                 detail_mode: str = "click",  # "click" = 클릭 후 팝업 탭, "direct" = URL 직접 이동
+                 detail_workers: int = 1,  # 상세 탭 수 (2 이상이면 direct 모드로 병렬 수집)
+                 capture_listing: bool = False,  # 리스트 API 응답에서 상품 ID/가격/상품명 캡처
+                 block_resources: Optional[bool] = None,  # 리소스 차단 (None = CRAWL_CONFIG 설정 사용)
+                 throughput_mode: bool = False,  # 시각 효과(테두리/오버레이/slow_mo) 끄고 최대 속도
+                 recycle_after: Optional[int] = None,  # N개 수집마다 브라우저 재시작 (None = 무한 모드만 CRAWL_CONFIG 설정, 0 = 끔)
+                 recycle_rss_mb: Optional[float] = None):  # 브라우저 RSS 상한 MB (None = 무한 모드만 CRAWL_CONFIG 설정, 0 = 끔)
+        # config는 DB_PASSWORD 검증 포함 → 모듈 import가 아니라 생성 시점에 로드
+        from src.utils.config import CRAWL_CONFIG
+        self.config = CRAWL_CONFIG
+
         self.category_name = category_name
         self.category_id = category_id
         self.product_count = product_count  # None이면 무한 수집
@@ -42,182 +64,133 @@ class SimpleCrawler:
 
         # DB 연결 (save_to_db가 True일 때만) - 세션 유지 방식
         self.db = DatabaseConnector() if save_to_db else None
+        self.store = None  # DB 호출 전용 스레드 (이벤트 루프 차단 방지, crawl()마다 생성)
         self.db_connected = False
+        self.db_writer = None  # 백그라운드 일괄 저장 (CRAWL_CONFIG['db_writer'], DB 연결 후 시작)
 
         # 통계 추적
         self.start_time = None
         self.saved_count = 0  # DB 저장 성공
-        self.skipped_count = 0  # 중복 스킵
+        self.skipped_count = 0  # 중복 스킵 (클릭 전 중복 체크 + DB에 이미 있음)
+        self.unchanged_count = 0  # DB 저장 시 내용이 같아 갱신 안 함 (content_hash)
+        self.loop = None  # 저장 스레드 결과를 이벤트 루프로 넘길 때 사용 (crawl()에서 설정)
 
         # Sliding Window 설정 (오버레이 메모리 최적화)
         self.OVERLAY_WINDOW = 10  # 현재 상품 ±10개만 오버레이 유지
 
+        # 처리량 모드: 상품마다 3~4회 하던 오버레이 evaluate + smooth 스크롤 + slow_mo 생략
+        # (수집 순서/중복 체크/저장 방식은 동일, 사람이 화면을 볼 필요 없을 때 사용)
+        self.throughput_mode = throughput_mode
+        self.SLOW_MO = 0 if throughput_mode else 300  # 브라우저 동작 간 지연 (ms)
+
+        # 상세 페이지 수집 방식
+        # - click: 상품 클릭 → 팝업 탭 (기존 방식)
+        # - direct: href 일괄 추출 → 상세 탭에서 goto(url) (팝업 경쟁 없음, 병렬 가능)
+        if detail_mode not in ("click", "direct"):
+            raise ValueError(f"detail_mode는 'click' 또는 'direct'여야 합니다: {detail_mode}")
+        self.detail_workers = max(1, detail_workers)
+        self.detail_mode = "direct" if self.detail_workers > 1 else detail_mode
+        self.DETAIL_MIN_INTERVAL = 0.5  # 워커 전체 기준 상세 페이지 이동 간격 (초)
+        self.DETAIL_READY_SELECTOR = 'h3.DCVBehA8ZB'  # 상세 페이지 준비 완료 기준 (상품명)
+        self.detail_pool = None
+
+        # 레이아웃 템플릿 (같은 레이아웃 상세 페이지는 학습된 셀렉터로 바로 추출, CRAWL_CONFIG['layout_templates'])
+        template_config = CRAWL_CONFIG.get('layout_templates', {})
+        self.layout_templates = LayoutTemplateCache(
+            path=template_config.get('path'),
+            enabled=template_config.get('enabled', True)
+        )
+
+        # 내장 상품 데이터 (JSON-LD / 앱 상태) 먼저 읽기 + 필드별 출처 집계 (CRAWL_CONFIG['embedded_state'])
+        self.embedded_context = embedded_state_context(CRAWL_CONFIG.get('embedded_state', {}).get('enabled', True))
+        self.provenance = FieldProvenance()
+
+        # 지연 로딩 필드 (브랜드 표/검색 태그) - 첫 추출에 없는 필드만 스크롤 + 대기 (CRAWL_CONFIG['lazy_fields'])
+        self.lazy_fields = LazyFieldPolicy(CRAWL_CONFIG.get('lazy_fields'))
+
+        # 이벤트 기반 대기 (고정 sleep 대체 + 대기별 지연 시간 기록)
+        self.waits = WaitEngine()
+
+        # 리스트 상품 큐 (MutationObserver 증분 필터링, 인덱스 = data-crawl-seq)
+        self.listing_queue = ListingQueue()
+        self.handles = ProductHandleRegistry(self.listing_queue)  # 카드 1개씩 조회 + 지나간 핸들 dispose
+
+        # 리스트 응답 캡처 (무한 스크롤 XHR JSON → 상품 후보 레코드)
+        # - 클릭 전 중복 체크: 리스트 href가 광고/리다이렉트 URL이어도 실제 상품 ID로 확인
+        # - 상세 페이지에서 못 찾은 필드 보충 (가격, 리뷰 수 등)
+        self.listing_capture = ListingResponseCapture() if capture_listing else None
+
+        # 리소스 차단 정책 (리스트/상세 역할별 이미지·폰트·비콘 차단, CRAWL_CONFIG['resource_policy'])
+        policy_config = dict(CRAWL_CONFIG.get('resource_policy', {}))
+        if block_resources is not None:
+            policy_config['enabled'] = block_resources
+        self.resource_policy = ResourcePolicy(policy_config) if policy_config.get('enabled') else None
+
+        # 브라우저 재시작 (무한 수집 장시간 실행 시 메모리 누적 방지, CRAWL_CONFIG['recycle'])
+        # - 재시작 후 카테고리 재진입 → 처리한 상품 ID는 건너뛰고 마지막 위치까지 빠르게 스크롤
+        recycle_config = CRAWL_CONFIG.get('recycle', {})
+        infinite = product_count is None
+        if recycle_after is None:
+            recycle_after = recycle_config.get('after_products') if infinite else None
+        if recycle_rss_mb is None:
+            recycle_rss_mb = recycle_config.get('max_rss_mb') if infinite else None
+        self.recycler = BrowserRecycler(after_products=recycle_after, max_rss_mb=recycle_rss_mb)
+        self.RESTORE_SCROLL_STEP = recycle_config.get('restore_scroll_step', 3000)
+        self.RESTORE_MARGIN = 40  # 마지막 처리 위치보다 이만큼 더 로드되면 복원 중단 (상품이 사라진 경우)
+
     async def crawl(self) -> List[Dict]:
         """크롤링 실행"""
         async with async_playwright() as p:
-            browser = await p.firefox.launch(
-                headless=self.headless,
-                slow_mo=300,
-                args=['--start-maximized']  # 브라우저 최대화로 시작
-            )
+            if self.throughput_mode:
+                print("[처리량 모드] 시각 효과 끔 - 테두리/오버레이/smooth 스크롤/slow_mo 생략")
 
-            # 📌 viewport 설정 설명:
-            # - viewport는 무한 스크롤을 위해 반드시 필요! (no_viewport=True 사용 금지)
-            # - 네이버는 "화면에 보이는 영역"을 감지해서 새 상품을 로드함
-            # - no_viewport=True → 무한 높이 → "이미 다 보임" → 추가 로드 안 함
-            context = await browser.new_context(
-                viewport={'width': 1920, 'height': 1080},  # 고정 크기 (Intersection Observer 작동용)
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0",
-                locale='ko-KR',
-                timezone_id='Asia/Seoul'
-            )
-
-            page = await context.new_page()
+            browser, context, page = await self._launch_browser(p)
 
             try:
                 # DB 연결 (세션 유지)
                 if self.save_to_db and self.db:
                     try:
-                        self.db.connect()
+                        # 연결 풀 상한: DB 스레드(+ 일괄 저장 스레드) 수 + 여유
+                        writer_enabled = self.config.get('db_writer', {}).get('enabled')
+                        self.db.reserve_connections(2 if writer_enabled else 1)
+
+                        self.loop = asyncio.get_running_loop()
+                        self.store = AsyncProductStore(self.db)
+                        await self.store.connect()
                         self.db_connected = True
                         print("[DB] 연결 성공")
-                    except Exception as e:
-                        print(f"[DB] 연결 실패: {str(e)}")
-                        self.db_connected = False
 
-                # 1. 네이버 메인 → 쇼핑 진입
-                print("[1/4] 네이버 메인 페이지 접속...")
-                await page.goto('https://www.naver.com')
-                await page.wait_for_load_state('domcontentloaded')
-                await asyncio.sleep(2)
-
-                # 쇼핑 클릭 (광고가 가려도 강제 클릭)
-                print("[2/4] 쇼핑 버튼 클릭...")
-                shopping_selector = '#shortcutArea > ul > li:nth-child(4) > a'
-                await page.locator(shopping_selector).click(timeout=10000, force=True)
-                await asyncio.sleep(2)
-
-                # 새 탭 전환
-                all_pages = context.pages
-                if len(all_pages) > 1:
-                    page = all_pages[-1]
-                    await page.wait_for_load_state('networkidle')
-
-                # 2. 카테고리 진입 (CRAWLING_LESSONS_LEARNED.md 검증된 방법)
-                print(f"[3/4] '{self.category_name}' 카테고리 진입...")
-                category_btn = await page.wait_for_selector('button:has-text("카테고리")', timeout=10000)
-                await category_btn.click()
-
-                # 카테고리 메뉴가 나타날 때까지 대기 (최대 5초)
-                await asyncio.sleep(1)
-
-                # 우선순위별 셀렉터 fallback (문서 1293-1296줄)
-                category_elem = None
-
-                # 1순위: ID 기반 (⭐⭐⭐⭐⭐) - 명시적 대기
-                if self.category_id:
-                    try:
-                        category_elem = await page.wait_for_selector(f'#cat_layer_item_{self.category_id}', timeout=5000)
-                    except:
-                        pass
+                        # 중복 체크 스냅샷 (카드마다 SELECT 대신 로컬 조회)
+                        snapshot_config = self.config.get('dedupe_snapshot', {})
+                        if snapshot_config.get('enabled'):
+                            scope = self.category_name if snapshot_config.get('per_category') else None
+                            await self.store.run(self.db.load_known_product_ids, category_name=scope)
 
-                # 2순위: data-id 속성 (⭐⭐⭐⭐)
-                if not category_elem and self.category_id:
-                    try:
-                        category_elem = await page.wait_for_selector(f'[data-id="{self.category_id}"]', timeout=3000)
-                    except:
-                        pass
-
-                # 3순위: data-name 속성 (⭐⭐⭐)
-                if not category_elem:
-                    try:
-                        category_elem = await page.wait_for_selector(f'a[data-name="{self.category_name}"]', timeout=3000)
-                    except:
-                        pass
+                        # 리스트 href(nvMid) → 상품 ID 매핑 (클릭 전 중복 체크가 실제 상품 ID로 판정되도록)
+                        await self.store.run(self.db.load_product_id_map)
 
-                if not category_elem:
-                    raise Exception(f"카테고리 '{self.category_name}' (ID: {self.category_id})를 찾을 수 없습니다")
-
-                await category_elem.click()
-                await asyncio.sleep(3)
-
-                # 캡차 체크 및 자동 포커스
-                print("\n" + "="*60)
-                print("[!] 캡차 확인 중...")
-                print("="*60)
-
-                # 캡차 입력 필드 찾기 (네이버 캡차 input 셀렉터)
-                captcha_input = None
-                try:
-                    # 캡차 입력 필드가 있는지 확인 (1초 대기)
-                    # 실제 테스트로 확인된 셀렉터: input#rcpt_answer, input[name='captcha']
-                    captcha_input = await page.wait_for_selector(
-                        'input#rcpt_answer, input[name="captcha"], input.input_text',
-                        timeout=1000,
-                        state='visible'
-                    )
-                except:
-                    # 캡차가 없으면 넘어감
-                    pass
-
-                if captcha_input:
-                    # 캡차가 있으면 입력 필드에 포커스
-                    print("🔔 캡차 감지! 입력 필드에 포커스를 맞췄습니다.")
-                    print("브라우저에서 캡차를 입력하고 Enter를 누르세요")
-                    print("="*60)
-
-                    # 입력 필드에 포커스 및 하이라이트
-                    await captcha_input.focus()
-                    await captcha_input.click()
-
-                    # 입력 필드를 노란색으로 하이라이트 (시각적 피드백)
-                    await page.evaluate("""
-                        (element) => {
-                            element.style.border = '3px solid #FFD700';
-                            element.style.boxShadow = '0 0 10px #FFD700';
-                            element.style.animation = 'pulse 1s infinite';
-
-                            // 애니메이션 추가
-                            if (!document.getElementById('captcha-pulse-style')) {
-                                const style = document.createElement('style');
-                                style.id = 'captcha-pulse-style';
-                                style.innerHTML = `
-                                    @keyframes pulse {
-                                        0% { box-shadow: 0 0 10px #FFD700; }
-                                        50% { box-shadow: 0 0 20px #FFD700; }
-                                        100% { box-shadow: 0 0 10px #FFD700; }
-                                    }
-                                `;
-                                document.head.appendChild(style);
-                            }
-                        }
-                    """, captcha_input)
-
-                    # 캡차 해결 대기 (최대 30초)
-                    for i in range(30, 0, -5):
-                        print(f"[대기] 캡차 입력 대기 중... {i}초 남음")
-
-                        # 캡차 입력 필드가 사라졌는지 확인 (실제 셀렉터 사용!)
-                        try:
-                            await page.wait_for_selector(
-                                'input#rcpt_answer, input[name="captcha"], input.input_text',
-                                timeout=1000,
-                                state='hidden'
-                            )
-                            print("[✓] 캡차 해결 완료!")
-                            break
-                        except:
-                            pass
-
-                        await asyncio.sleep(5)
-                else:
-                    # 캡차가 없는 경우 짧게 대기
-                    print("캡차 없음 - 페이지 로딩 대기 (5초)")
-                    await asyncio.sleep(5)
+                        # 백그라운드 일괄 저장 (상품마다 커밋 대신 N개/N초마다 INSERT 1회)
+                        writer_config = self.config.get('db_writer', {})
+                        if writer_config.get('enabled'):
+                            try:
+                                self.db_writer = BatchWriter(
+                                    batch_size=writer_config.get('batch_size', 50),
+                                    flush_interval=writer_config.get('flush_interval', 2.0),
+                                    max_queue=writer_config.get('max_queue', 1000),
+                                    on_result=self._on_db_result
+                                )
+                                await self.store.run(self.db_writer.start)  # 연결 생성도 DB 스레드에서
+                                print(f"[DB] 일괄 저장 사용 - {self.db_writer.batch_size}개 또는 "
+                                      f"{self.db_writer.flush_interval}초마다 저장")
+                            except Exception as e:
+                                print(f"[DB] 일괄 저장 시작 실패: {str(e)} - 상품마다 저장")
+                                self.db_writer = None
+                    except Exception as e:
+                        print(f"[DB] 연결 실패: {str(e)}")
+                        self.db_connected = False
 
-                print("[OK] 대기 완료! 크롤링 시작...\n")
-                print("="*60)
-                await asyncio.sleep(2)
+                # 1~2. 네이버 메인 → 쇼핑 → 카테고리 진입 (+ 캡차 대기)
+                page = await self._enter_category(context, page)
 
                 # 3. 무한 스크롤 수집 시작
                 if self.product_count:
@@ -242,17 +215,18 @@ class SimpleCrawler:
                 except:
                     print("[INFO] 기본 셀렉터 사용")
 
-                # 초기 배치 크기 결정 (실제 상품만)
-                # 상품 목록을 더 정확하게 선택
-                initial_links = await page.query_selector_all('a[class*="ProductCard_link"]')
+                # 초기 배치 크기 결정 (개수만 필요 → 핸들 생성 없이 브라우저 안에서 카운트)
+                initial_count = await page.evaluate(
+                    '''() => document.querySelectorAll('a[class*="ProductCard_link"]').length'''
+                )
 
                 # 광고나 추천 상품 필터링 (상위 6개 이후부터 시작)
-                if len(initial_links) > 6:
+                if initial_count > 6:
                     # 처음 6개는 잘 작동하니까 유지, 7번째부터 재검증
-                    print(f"[DEBUG] 전체 링크 수: {len(initial_links)}개")
+                    print(f"[DEBUG] 전체 링크 수: {initial_count}개")
 
-                batch_size = len(initial_links)
-                print(f"\n초기 상품 수: {len(initial_links)}개 → 배치 크기: {batch_size}개")
+                batch_size = initial_count
+                print(f"\n초기 상품 수: {initial_count}개 → 배치 크기: {batch_size}개")
 
                 collected_count = 0
                 processed_indices = set()  # 이미 처리한 상품 인덱스 추적
@@ -354,112 +328,28 @@ class SimpleCrawler:
 
                             print("\n[필터링] 정렬 옵션 아래 상품만 선택 중...", flush=True)
 
-                            # JavaScript로 필터링 (브라우저 크래시 방지)
-                            print(f"[필터링] 첫 번째 배치 필터링 시작...", flush=True)
-
-                            try:
-                                filtered_count = await page.evaluate('''() => {
-                                    // 1. 정렬 옵션 찾기
-                                    const sort = document.querySelector('#product-sort-address-container');
-                                    if (!sort) return {total: 0, filtered: 0, aboveSort: 0, recommendations: 0, labelPatterns: []};
-
-                                    const sortY = sort.getBoundingClientRect().bottom;
-
-                                    // 2. 모든 상품 링크 찾기
-                                    const allLinks = Array.from(document.querySelectorAll('a[class*="ProductCard_link"]'));
-
-                                    // 3. 정렬 옵션 아래 상품만 필터링하고 표시
-                                    // [OK] v1.5.9+ "FOR YOU 연관 추천" 섹션 제외 (aria-labelledby 체크)
-                                    let filteredCount = 0;
-                                    let aboveSortCount = 0;
-                                    let recommendationCount = 0;
-                                    const labelPatterns = new Set();
-
-                                    allLinks.forEach(link => {
-                                        const rect = link.getBoundingClientRect();
-                                        const labelId = link.getAttribute('aria-labelledby') || '';
-
-                                        // aria-labelledby 패턴 수집 (처음 5개만)
-                                        if (labelId && labelPatterns.size < 5) {
-                                            labelPatterns.add(labelId);
-                                        }
-
-                                        // "FOR YOU 연관 추천" 섹션 상품 확인
-                                        const isRecommendation = labelId.includes('related_recommend_product_information');
-
-                                        if (rect.top <= sortY) {
-                                            // 정렬 옵션 위 (제외)
-                                            aboveSortCount++;
-                                            link.setAttribute('data-filtered', 'false');
-                                        } else if (isRecommendation) {
-                                            // FOR YOU 추천 (제외)
-                                            recommendationCount++;
-                                            link.setAttribute('data-filtered', 'false');
-                                        } else {
-                                            // 정상 상품 (선택)
-                                            link.setAttribute('data-filtered', 'true');
-                                            filteredCount++;
-                                        }
-                                    });
-
-                                    return {
-                                        total: allLinks.length,
-                                        filtered: filteredCount,
-                                        aboveSort: aboveSortCount,
-                                        recommendations: recommendationCount,
-                                        labelPatterns: Array.from(labelPatterns)
-                                    };
-                                }''')
-                                print(f"[DEBUG] evaluate() 성공, 결과 타입: {type(filtered_count)}", flush=True)
-                            except Exception as eval_err:
-                                print(f"[!!] JavaScript evaluate() 실패!", flush=True)
-                                print(f"  에러 타입: {type(eval_err).__name__}", flush=True)
-                                print(f"  에러 메시지: {str(eval_err)[:200]}", flush=True)
-                                # Fallback: 빈 결과 반환
-                                filtered_count = {
-                                    'total': 0,
-                                    'filtered': 0,
-                                    'aboveSort': 0,
-                                    'recommendations': 0,
-                                    'labelPatterns': []
-                                }
+                            # 증분 필터 설치: 기존 카드 1회 분류 + 이후 삽입되는 카드만 MutationObserver로 분류
+                            print(f"[필터링] 첫 번째 배치 필터링 + 증분 옵저버 설치...", flush=True)
+                            filter_info = await self.listing_queue.install(page)
+                            filter_stats = filter_info['stats']
 
                             print(f"[필터링 결과]", flush=True)
-                            print(f"  전체 링크: {filtered_count['total']}개", flush=True)
-                            print(f"  - 정렬 옵션 위: {filtered_count['aboveSort']}개 (제외)", flush=True)
-                            print(f"  - FOR YOU 추천: {filtered_count['recommendations']}개 (제외)", flush=True)
-                            print(f"  - 정상 상품: {filtered_count['filtered']}개 (선택)", flush=True)
-                            if filtered_count['labelPatterns']:
+                            print(f"  전체 링크: {filter_stats['total']}개", flush=True)
+                            print(f"  - 정렬 옵션 위: {filter_stats['aboveSort']}개 (제외)", flush=True)
+                            print(f"  - FOR YOU 추천: {filter_stats['recommendations']}개 (제외)", flush=True)
+                            print(f"  - 정상 상품: {filter_stats['filtered']}개 (선택)", flush=True)
+                            if filter_info['labelPatterns']:
                                 print(f"[셀렉터 패턴] aria-labelledby 예시 (처음 5개):", flush=True)
-                                for pattern in filtered_count['labelPatterns']:
+                                for pattern in filter_info['labelPatterns']:
                                     print(f"  - {pattern}", flush=True)
 
-                            # 필터링된 상품만 가져오기
-                            product_links = await page.query_selector_all('a[data-filtered="true"]')
-
-                            # v1.7.6 디버그: 필터링된 상품 URL 샘플 출력
-                            if len(product_links) > 0:
-                                sample_urls = await page.evaluate('''() => {
-                                    const links = document.querySelectorAll('a[data-filtered="true"]');
-                                    const samples = [];
-                                    const indices = [0, 10, 20, 30, 40, 50, 60, 70, 80, 90];  // 샘플 인덱스
-                                    indices.forEach(i => {
-                                        if (i < links.length) {
-                                            const url = links[i].href || '';
-                                            const productId = url.match(/nvMid=(\d+)/);
-                                            samples.push({
-                                                index: i,
-                                                productId: productId ? productId[1] : 'N/A'
-                                            });
-                                        }
-                                    });
-                                    return samples;
-                                }''')
+                            # v1.7.6 디버그: 필터링된 상품 ID 샘플 출력 (큐에서 10개씩)
+                            if len(self.listing_queue) > 0:
                                 print(f"[필터링 샘플] 10개씩 확인:", flush=True)
-                                for sample in sample_urls:
-                                    print(f"  [{sample['index']}번] product_id: {sample['productId']}", flush=True)
+                                for sample_idx in range(0, min(len(self.listing_queue), 100), 10):
+                                    print(f"  [{sample_idx}번] product_id: {self.listing_queue.keys[sample_idx][:30]}", flush=True)
 
-                            if len(product_links) == 0:
+                            if len(self.listing_queue) == 0:
                                 # 필터링 실패 시 전체 사용
                                 print(f"\n[!!] [필터링 실패] 필터링된 상품이 0개입니다!", flush=True)
                                 print(f"  원인 분석 중...", flush=True)
@@ -485,10 +375,10 @@ class SimpleCrawler:
                                 await page.screenshot(path=screenshot_path)
                                 print(f"  스크린샷 저장: {screenshot_path}", flush=True)
 
-                                # Fallback: 전체 상품 사용
+                                # Fallback: 정렬 옵션 없이 전체 상품 사용
                                 print(f"\n  → Fallback: 전체 상품 사용 시도...", flush=True)
-                                product_links = await page.query_selector_all('a[class*="ProductCard_link"]')
-                                print(f"  → Fallback 결과: {len(product_links)}개 발견", flush=True)
+                                await self.listing_queue.install(page, require_sort=False)
+                                print(f"  → Fallback 결과: {len(self.listing_queue)}개 발견", flush=True)
 
                         except Exception as e:
                             # 에러 시 기본 셀렉터 사용
@@ -513,51 +403,33 @@ class SimpleCrawler:
 
                             # Fallback
                             print(f"\n  → Fallback: 기본 셀렉터 사용...", flush=True)
-                            product_links = await page.query_selector_all('a[class*="ProductCard_link"]')
-                            print(f"  → Fallback 결과: {len(product_links)}개 발견", flush=True)
+                            try:
+                                await self.listing_queue.install(page, require_sort=False)
+                            except Exception:
+                                pass  # 페이지 크래시 - 아래에서 0개 처리
+                            print(f"  → Fallback 결과: {len(self.listing_queue)}개 발견", flush=True)
+
+                        # 브라우저 재시작 후: 마지막 처리 상품까지 빠르게 스크롤 (처리한 상품은 아래에서 SKIP)
+                        if self.recycler.last_key and len(self.listing_queue) > 0:
+                            await self._restore_position(page)
                     else:
                         # [OK] v1.5.7+ 두 번째 배치부터도 필터링된 상품만 사용
                         # [OK] v1.5.9+ "FOR YOU 연관 추천" 섹션 제외 (aria-labelledby 체크)
                         print(f"\n[필터링] 배치 {batch_num} - 새로운 상품 필터링 중...", flush=True)
 
-                        # 스크롤 후 새로운 상품 필터링
-                        new_filtered = await page.evaluate('''() => {
-                            const sort = document.querySelector('#product-sort-address-container');
-                            if (!sort) return {newFiltered: 0, newRecommendations: 0};
-
-                            const sortY = sort.getBoundingClientRect().bottom;
-                            const allLinks = Array.from(document.querySelectorAll('a[class*="ProductCard_link"]'));
-
-                            let newFilteredCount = 0;
-                            let newRecommendationCount = 0;
-
-                            allLinks.forEach(link => {
-                                const rect = link.getBoundingClientRect();
-                                const labelId = link.getAttribute('aria-labelledby') || '';
-                                const isRecommendation = labelId.includes('related_recommend_product_information');
-
-                                // 아직 필터링 안 된 상품만 처리
-                                if (!link.hasAttribute('data-filtered')) {
-                                    if (rect.top > sortY && !isRecommendation) {
-                                        link.setAttribute('data-filtered', 'true');
-                                        newFilteredCount++;
-                                    } else if (isRecommendation) {
-                                        newRecommendationCount++;
-                                    }
-                                }
-                            });
-
-                            return {newFiltered: newFilteredCount, newRecommendations: newRecommendationCount};
-                        }''')
+                        # 옵저버가 이미 분류한 새 상품만 가져오기 (전체 카드 재검사 없음)
+                        new_items = await self.listing_queue.drain(page)
+                        if new_items is None:
+                            print(f"\n[!!] 필터 상태가 사라짐 - 페이지 리로드 감지", flush=True)
+                            break
+                        queue_stats = self.listing_queue.stats
 
                         print(f"[필터링 결과] 새로 추가:", flush=True)
-                        print(f"  - 정상 상품: {new_filtered['newFiltered']}개", flush=True)
-                        print(f"  - FOR YOU 추천: {new_filtered['newRecommendations']}개 (제외)", flush=True)
+                        print(f"  - 정상 상품: {len(new_items)}개", flush=True)
+                        print(f"  - FOR YOU 추천 (누적): {queue_stats.get('recommendations', 0)}개 (제외)", flush=True)
+                        print(f"  총 필터링된 상품: {len(self.listing_queue)}개", flush=True)
 
-                        product_links = await page.query_selector_all('a[data-filtered="true"]')
-                        print(f"  총 필터링된 상품: {len(product_links)}개", flush=True)
-
-                    current_total = len(product_links)
+                    current_total = len(self.listing_queue)
 
                     # v1.7.3 필터링 0개 에러 처리
                     if current_total == 0:
@@ -585,259 +457,131 @@ class SimpleCrawler:
                     duplicates_in_batch = 0  # 중복 skip
                     errors_in_batch = 0  # 오류 skip
 
-                    # 현재 로드된 모든 상품 처리 (필터링으로 광고 이미 제외됨)
-                    for idx in range(batch_start, batch_end):
-                        # 목표 개수 도달 체크
-                        if self.product_count and collected_count >= self.product_count:
-                            print(f"\n목표 개수 도달! {collected_count}개 수집 완료")
-                            break
+                    if self.detail_pool:
+                        # [direct 모드] URL 일괄 추출 → 상세 탭 워커 풀로 수집 (결과는 인덱스 순서대로 기록)
+                        batch_stats = await self._process_batch_direct(
+                            page, batch_start, batch_end, processed_indices, collected_count
+                        )
+                        collected_count += batch_stats['collected']
+                        collected_in_batch += batch_stats['collected']
+                        duplicates_in_batch += batch_stats['duplicates']
+                        errors_in_batch += batch_stats['errors']
+                    else:
+                        # 현재 로드된 모든 상품 처리 (필터링으로 광고 이미 제외됨)
+                        for idx in range(batch_start, batch_end):
+                            # 목표 개수 도달 체크
+                            if self.product_count and collected_count >= self.product_count:
+                                print(f"\n목표 개수 도달! {collected_count}개 수집 완료")
+                                break
 
-                        if self.should_stop:
-                            break
+                            if self.should_stop:
+                                break
 
-                        # [XX] v1.5.7+ 하드코딩된 "첫 14개 건너뛰기" 제거
-                        # JavaScript 필터링으로 이미 추천순 아래만 선택됨
+                            # [XX] v1.5.7+ 하드코딩된 "첫 14개 건너뛰기" 제거
+                            # JavaScript 필터링으로 이미 추천순 아래만 선택됨
 
-                        # 이미 처리한 상품은 건너뛰기
-                        if idx in processed_indices:
-                            continue
+                            # 이미 처리한 상품은 건너뛰기
+                            if idx in processed_indices:
+                                continue
 
-                        try:
-                            # [OK] v1.5.7+ 필터링된 상품만 가져오기
-                            fresh_links = await page.query_selector_all('a[data-filtered="true"]')
-                            if idx >= len(fresh_links):
-                                print(f"[{idx+1}번] 상품 인덱스 초과 - SKIP")
+                            # 브라우저 재시작 전에 처리한 상품 (카드 조회/DB 체크 없이 SKIP)
+                            if self.recycler.is_handled(self.listing_queue.keys[idx]):
                                 processed_indices.add(idx)
                                 continue
 
-                            product = fresh_links[idx]
-
-                            # 🚀 최적화: 클릭 전 중복 체크
-                            if self.save_to_db and self.db and self.db_connected:
-                                try:
-                                    # URL에서 product_id 추출
-                                    product_url = await product.get_attribute('href')
-                                    if product_url:
-                                        product_id = self.db.extract_product_id(product_url)
-                                        print(f"[{idx+1}번] 중복 체크 중... (ID: {product_id[:30]}...)", flush=True)
-
-                                        # DB 중복 체크
-                                        if self.db.is_duplicate_product(product_id, {}):
-                                            self.skipped_count += 1
-                                            duplicates_in_batch += 1  # 배치 중복 카운트
-                                            print(f"  └─> ✓ DB에 이미 존재 - SKIP", flush=True)
-
-                                            # 🧹 Sliding Window: 오래된 오버레이 제거
-                                            if idx > self.OVERLAY_WINDOW:
-                                                old_idx = idx - self.OVERLAY_WINDOW - 1
-                                                await page.evaluate(f'''() => {{
-                                                    const oldOverlay = document.getElementById('product-overlay-{old_idx}');
-                                                    if (oldOverlay) {{
-                                                        oldOverlay.remove();
-                                                    }}
-                                                }}''')
-
-                                            # 회색 테두리 (중복 Skip)
-                                            await page.evaluate(f'''(index) => {{
-                                                const links = document.querySelectorAll('a[data-filtered="true"]');
-                                                const link = links[index];
-                                                if (link) {{
-                                                    link.style.border = '5px solid #888888';
-                                                    link.style.boxShadow = '0 0 20px #888888';
-
-                                                    const overlay = document.createElement('div');
-                                                    overlay.id = 'product-overlay-' + index;
-                                                    overlay.style.cssText = `
-                                                        position: absolute;
-                                                        top: 0;
-                                                        left: 0;
-                                                        background: rgba(136, 136, 136, 0.9);
-                                                        color: white;
-                                                        padding: 10px;
-                                                        font-size: 20px;
-                                                        font-weight: bold;
-                                                        z-index: 10000;
-                                                        pointer-events: none;
-                                                    `;
-                                                    overlay.textContent = '[{idx+1}번] SKIP - 중복';
-                                                    link.appendChild(overlay);
-
-                                                    link.scrollIntoView({{ block: 'center', behavior: 'smooth' }});
-                                                }}
-                                            }}''', idx)
-                                            await asyncio.sleep(0.3)
-
-                                            processed_indices.add(idx)
-                                            continue
-                                        else:
-                                            print(f"  └─> ✓ 신규 상품 - 수집 진행", flush=True)
-                                except Exception as e:
-                                    print(f"[{idx+1}번] 중복 체크 오류: {str(e)[:50]} - 수집 진행", flush=True)
-
-                            # 여기까지 왔다는 것은 실제로 처리할 상품
-                            processed_indices.add(idx)
-
-                            # 🧹 Sliding Window: 오래된 오버레이 제거 (메모리 최적화)
-                            if idx > self.OVERLAY_WINDOW:
-                                old_idx = idx - self.OVERLAY_WINDOW - 1
-                                await page.evaluate(f'''() => {{
-                                    const oldOverlay = document.getElementById('product-overlay-{old_idx}');
-                                    if (oldOverlay) {{
-                                        oldOverlay.remove();
-                                        console.log('[Overlay] #{old_idx+1}번 오버레이 제거 (Sliding Window)');
-                                    }}
-                                }}''')
-
-                            # 🎨 시각적 피드백: 노란 테두리 (클릭 준비)
-                            print(f"[{idx+1}번] 클릭 준비 중...", flush=True)
-                            await page.evaluate(f'''(index) => {{
-                                const links = document.querySelectorAll('a[data-filtered="true"]');
-                                const link = links[index];
-                                if (link) {{
-                                    // 노란 테두리 + 오버레이 텍스트
-                                    link.style.border = '5px solid #FFD700';
-                                    link.style.boxShadow = '0 0 20px #FFD700';
-                                    link.style.position = 'relative';
-
-                                    // 상품 번호 오버레이
-                                    const overlay = document.createElement('div');
-                                    overlay.id = 'product-overlay-' + index;
-                                    overlay.style.cssText = `
-                                        position: absolute;
-                                        top: 0;
-                                        left: 0;
-                                        background: rgba(255, 215, 0, 0.9);
-                                        color: black;
-                                        padding: 10px;
-                                        font-size: 20px;
-                                        font-weight: bold;
-                                        z-index: 10000;
-                                        pointer-events: none;
-                                    `;
-                                    overlay.textContent = '[{idx+1}번] 클릭 준비 중...';
-                                    link.appendChild(overlay);
-
-                                    link.scrollIntoView({{ block: 'center', behavior: 'smooth' }});
-                                }}
-                            }}''', idx)
-                            await asyncio.sleep(0.5)
-
-                            # 🎨 빨간 테두리 (클릭 진행)
-                            print(f"[{idx+1}번] 클릭 진행 중...", flush=True)
-                            await page.evaluate(f'''(index) => {{
-                                const links = document.querySelectorAll('a[data-filtered="true"]');
-                                const link = links[index];
-                                if (link) {{
-                                    link.style.border = '5px solid #FF0000';
-                                    link.style.boxShadow = '0 0 20px #FF0000';
-
-                                    const overlay = document.getElementById('product-overlay-' + index);
-                                    if (overlay) {{
-                                        overlay.style.background = 'rgba(255, 0, 0, 0.9)';
-                                        overlay.style.color = 'white';
-                                        overlay.textContent = '[{idx+1}번] 클릭 중...';
-                                    }}
-                                }}
-                            }}''', idx)
-
-                            await product.click(timeout=10000)
-                            await asyncio.sleep(3)
-
-                            # 새 탭 찾기
-                            all_pages = context.pages
-                            if len(all_pages) <= 1:
-                                errors_in_batch += 1  # 오류 카운트
-                                print(f"[{idx+1}번] 탭 열림 실패 - SKIP", flush=True)
-                                # 회색 테두리 (Skip)
-                                await page.evaluate(f'''(index) => {{
-                                    const links = document.querySelectorAll('a[data-filtered="true"]');
-                                    const link = links[index];
-                                    if (link) {{
-                                        link.style.border = '5px solid #888888';
-                                        link.style.boxShadow = '0 0 20px #888888';
-
-                                        const overlay = document.getElementById('product-overlay-' + index);
-                                        if (overlay) {{
-                                            overlay.style.background = 'rgba(136, 136, 136, 0.9)';
-                                            overlay.style.color = 'white';
-                                            overlay.textContent = '[{idx+1}번] SKIP - 탭 열림 실패';
-                                        }}
-                                    }}
-                                }}''', idx)
-                                await asyncio.sleep(0.5)
-                                continue
+                            try:
+                                # [OK] v1.5.7+ 필터링된 상품 URL (큐에 이미 있음 - 핸들/왕복 없음)
+                                product_url = self.listing_queue.href(idx)
 
-                            detail_page = all_pages[-1]
-                            await detail_page.wait_for_load_state('domcontentloaded')
-                            await asyncio.sleep(2)  # 1초 → 2초 (페이지 로드 대기)
-
-                            # 상품 정보 수집
-                            product_data = await self._collect_product_info(detail_page)
-
-                            if product_data and product_data.get('product_name'):
-                                self.products_data.append(product_data)
-                                collected_count += 1
-                                collected_in_batch += 1  # 이번 배치에서 수집한 개수
-
-                                # 🎨 초록 테두리 (수집 완료)
-                                print(f"[{idx+1}번] 수집 완료 - {product_data.get('product_name', '')[:30]}...", flush=True)
-                                await page.evaluate(f'''(index) => {{
-                                    const links = document.querySelectorAll('a[data-filtered="true"]');
-                                    const link = links[index];
-                                    if (link) {{
-                                        link.style.border = '5px solid #00FF00';
-                                        link.style.boxShadow = '0 0 20px #00FF00';
-
-                                        const overlay = document.getElementById('product-overlay-' + index);
-                                        if (overlay) {{
-                                            overlay.style.background = 'rgba(0, 255, 0, 0.9)';
-                                            overlay.style.color = 'black';
-                                            overlay.textContent = '[{idx+1}번] ✓ 수집 완료';
-                                        }}
-                                    }}
-                                }}''', idx)
-                                await asyncio.sleep(0.3)
-
-                                # 메모리 최적화: 1000개 초과 시 오래된 데이터 정리 (마지막 500개만 유지)
-                                if len(self.products_data) > 1000:
-                                    self.products_data = self.products_data[-500:]
-
-                                # 즉시 DB 저장 (세션 유지)
+                                # 🚀 최적화: 클릭 전 중복 체크 (중복이면 카드 핸들도 만들지 않음)
                                 if self.save_to_db and self.db and self.db_connected:
                                     try:
-                                        result = self.db.save_product(self.category_name, product_data)
-                                        if result == 'saved':
-                                            self.saved_count += 1
-                                            product_data['_db_status'] = 'saved'
-                                        elif result == 'skipped':
-                                            self.skipped_count += 1
-                                            product_data['_db_status'] = 'skipped'
+                                        # URL에서 product_id 추출
+                                        if product_url:
+                                            product_id = self._resolve_product_id(product_url)
+                                            print(f"[{idx+1}번] 중복 체크 중... (ID: {product_id[:30]}...)", flush=True)
+
+                                            # DB 중복 체크 (스냅샷이 있으면 로컬 조회, 없으면 DB 스레드에서 SELECT)
+                                            if await self.store.is_duplicate(product_id):
+                                                self.skipped_count += 1
+                                                duplicates_in_batch += 1  # 배치 중복 카운트
+                                                print(f"  └─> ✓ DB에 이미 존재 - SKIP", flush=True)
+
+                                                # 회색 테두리 (중복 Skip)
+                                                await self._mark_product(page, idx, '#888888', 'SKIP - 중복', scroll=True)
+
+                                                processed_indices.add(idx)
+                                                continue
+                                            else:
+                                                print(f"  └─> ✓ 신규 상품 - 수집 진행", flush=True)
                                     except Exception as e:
-                                        product_data['_db_status'] = 'error'
-                                        print(f"[{collected_count}] DB 저장 실패: {str(e)}")
-                                else:
-                                    product_data['_db_status'] = 'none'
+                                        print(f"[{idx+1}번] 중복 체크 오류: {str(e)[:50]} - 수집 진행", flush=True)
 
-                                # 간략한 진행 메시지만 출력
-                                print(f"수집 중... {collected_count}개", end='\r')
+                                # 카드 1개만 조회 (지나간 카드 핸들은 레지스트리가 dispose)
+                                product = await self.handles.resolve(page, idx)
+                                if product is None:
+                                    print(f"[{idx+1}번] 상품 카드 없음 - SKIP")
+                                    processed_indices.add(idx)
+                                    continue
 
-                                # 50개마다 상세 테이블 출력
-                                if collected_count % 50 == 0:
-                                    self._print_products_table(collected_count)
-                            else:
-                                print(f"[{idx+1}번] 수집 실패 (상품명 없음) - SKIP")
+                                # 여기까지 왔다는 것은 실제로 처리할 상품
+                                processed_indices.add(idx)
 
-                            # 탭 닫기
-                            await detail_page.close()
-                            await asyncio.sleep(0.5)
+                                # 🎨 시각적 피드백: 노란 테두리 (클릭 준비) - Sliding Window로 오래된 오버레이 제거
+                                print(f"[{idx+1}번] 클릭 준비 중...", flush=True)
+                                await self._mark_product(page, idx, '#FFD700', '클릭 준비 중...', text_color='black', scroll=True)
+
+                                # 🎨 빨간 테두리 (클릭 진행)
+                                print(f"[{idx+1}번] 클릭 진행 중...", flush=True)
+                                await self._mark_product(page, idx, '#FF0000', '클릭 중...')
+
+                                # 클릭 → 새 탭 이벤트 대기 (context.pages[-1] 추측 대신 팝업 이벤트로 정확한 탭 획득)
+                                detail_page = await self.waits.for_new_page(
+                                    context, lambda: product.click(timeout=10000), 'click_popup', timeout=10
+                                )
+                                if detail_page is None:
+                                    errors_in_batch += 1  # 오류 카운트
+                                    print(f"[{idx+1}번] 탭 열림 실패 - SKIP", flush=True)
+                                    # 회색 테두리 (Skip)
+                                    await self._mark_product(page, idx, '#888888', 'SKIP - 탭 열림 실패')
+                                    continue
+
+                                # 상세 페이지 준비 대기 (고정 2초 → 상품명 요소 등장)
+                                await self._wait_detail_ready(detail_page, idx)
+
+                                # 상품 정보 수집
+                                product_data = await self._collect_product_info(detail_page)
+                                if self.listing_capture and product_data:
+                                    fill_from_listing(
+                                        product_data, self.listing_capture.lookup(product_url or detail_page.url)
+                                    )
+
+                                if product_data and product_data.get('product_name'):
+                                    collected_count += 1
+                                    collected_in_batch += 1  # 이번 배치에서 수집한 개수
+
+                                    # 🎨 초록 테두리 (수집 완료)
+                                    print(f"[{idx+1}번] 수집 완료 - {product_data.get('product_name', '')[:30]}...", flush=True)
+                                    await self._mark_product(page, idx, '#00FF00', '✓ 수집 완료', text_color='black')
+
+                                    # 메모리 보관 + 즉시 DB 저장 + 진행 출력
+                                    await self._record_product(product_data, collected_count, listing_url=product_url)
+                                else:
+                                    print(f"[{idx+1}번] 수집 실패 (상품명 없음) - SKIP")
 
-                            # [XX] scrollTo(0, 0) 제거 - 네이버 무한 스크롤 방해
-                            # 탭 닫으면 자동으로 원래 페이지로 돌아오고 스크롤 위치 유지됨
+                                # 탭 닫기
+                                await detail_page.close()
 
-                        except Exception as e:
-                            errors_in_batch += 1  # 오류 카운트
-                            print(f"[{idx+1}번] 오류: {str(e)[:50]} - SKIP", flush=True)
-                            continue
+                                # [XX] scrollTo(0, 0) 제거 - 네이버 무한 스크롤 방해
+                                # 탭 닫으면 자동으로 원래 페이지로 돌아오고 스크롤 위치 유지됨
+
+                            except Exception as e:
+                                errors_in_batch += 1  # 오류 카운트
+                                print(f"[{idx+1}번] 오류: {str(e)[:50]} - SKIP", flush=True)
+                                continue
+
+                    # 배치 종료 - 남은 카드 핸들 해제 (다음 배치는 새 순번만 처리)
+                    await self.handles.dispose_all()
 
                     # 목표 개수 도달 시 종료
                     print(f"[DEBUG] 목표 체크 - product_count={self.product_count}, collected={collected_count}")
@@ -850,6 +594,22 @@ class SimpleCrawler:
                         print(f"[DEBUG] 사용자 중지 요청으로 종료")
                         break
 
+                    # 브라우저 재시작 (N개 수집 또는 메모리 임계치 초과) → 카테고리 재진입 후 배치 1부터
+                    recycle_reason = self.recycler.check(collected_count)
+                    if recycle_reason:
+                        try:
+                            browser, context, page = await self._recycle_browser(
+                                p, browser, processed_indices, recycle_reason
+                            )
+                        except Exception as e:
+                            print(f"\n[재시작] 브라우저 재시작 실패: {str(e)[:80]} - 수집 종료", flush=True)
+                            break
+                        self.recycler.start_session(collected_count)
+                        processed_indices = set()  # 새 리스트 페이지 = 새 순번
+                        batch_num = 0
+                        consecutive_failures = 0
+                        continue
+
                     # 배치 처리 완료 → 스크롤하여 다음 배치 로드
                     # 조건: 모든 상품 처리 완료 (batch_end >= current_total)
                     print(f"\n[DEBUG] batch_end={batch_end}, current_total={current_total}, 조건={batch_end >= current_total}")
@@ -880,12 +640,18 @@ class SimpleCrawler:
                             print(f"  스크롤 위치: {scroll_pos}px", flush=True)
                             print(f"  문서 높이: {doc_height}px", flush=True)
 
-                            # [OK] 페이지 안정화 대기 (DOM 변경 완료)
-                            await asyncio.sleep(2)
+                            # [OK] 페이지 안정화 대기 (DOM 변경이 멈출 때까지, 최대 2초)
+                            await self.waits.for_dom_quiet(page, 'listing_settle', timeout=2)
 
                             # [OK] v1.5.7+ 조금씩만 스크롤 (페이지 재정렬 방지)
                             print(f"\n[스크롤 실행] 800px씩 조금씩 스크롤 (페이지 재정렬 방지)", flush=True)
 
+                            # 스크롤이 부르는 리스트 API 응답 대기 (스크롤 전에 등록 → 빠른 응답도 놓치지 않음)
+                            # 응답이 오면 카드 대기를 일찍 끝내는 데만 사용 (응답이 없어도 재시도 횟수는 그대로)
+                            listing_response = asyncio.ensure_future(self.waits.for_response(
+                                page, is_listing_response, 'scroll_listing_response', timeout=5
+                            ))
+
                             # 현재 스크롤 위치에서 800px만 더 스크롤 (조금씩!)
                             scroll_result = await page.evaluate('''() => {
                                 const currentScroll = window.pageYOffset;
@@ -899,11 +665,8 @@ class SimpleCrawler:
                             }''')
 
                             print(f"  스크롤: {scroll_result['before']}px → {scroll_result['after']}px (+800px)", flush=True)
-                            print(f"  대기 중... (1.5초)", flush=True)
-                            await asyncio.sleep(1.5)
 
                             # 스크롤 후 위치 확인
-                            await asyncio.sleep(1)
                             scroll_pos_after = await page.evaluate('window.pageYOffset')
                             doc_height_after = await page.evaluate('document.body.scrollHeight')
                             print(f"[스크롤 후 상태]", flush=True)
@@ -913,55 +676,34 @@ class SimpleCrawler:
                             else:
                                 print(f"  문서 높이: {doc_height_after}px (변화 없음)", flush=True)
 
-                            # 재시도 로직: 최대 3번까지 확인 (각 5초 대기)
-                            print(f"\n[새 상품 대기] 최대 3회 확인 (각 5초 대기)", flush=True)
+                            # 재시도 로직: 최대 3번까지 확인 (각 최대 5초, 새 카드가 붙으면 즉시 진행)
+                            print(f"\n[새 상품 대기] 최대 3회 확인 (각 최대 5초)", flush=True)
                             loaded = False
                             for attempt in range(3):
-                                print(f"\n  [시도 {attempt+1}/3] 5초 대기 후 상품 확인...", flush=True)
-                                await asyncio.sleep(5)  # 5초 대기
-
-                                # [OK] v1.5.9+ 스크롤 후 새로운 상품 필터링 (추천 제외)
-                                filter_result = await page.evaluate('''() => {
-                                    const sort = document.querySelector('#product-sort-address-container');
-                                    if (!sort) return {newFiltered: 0, newRecommendations: 0, totalLinks: 0};
-
-                                    const sortY = sort.getBoundingClientRect().bottom;
-                                    const allLinks = Array.from(document.querySelectorAll('a[class*="ProductCard_link"]'));
-
-                                    let newFilteredCount = 0;
-                                    let newRecommendationCount = 0;
-
-                                    allLinks.forEach(link => {
-                                        const rect = link.getBoundingClientRect();
-                                        const labelId = link.getAttribute('aria-labelledby') || '';
-                                        const isRecommendation = labelId.includes('related_recommend_product_information');
-
-                                        // 아직 필터링 안 된 상품만 처리
-                                        if (!link.hasAttribute('data-filtered')) {
-                                            if (rect.top > sortY && !isRecommendation) {
-                                                link.setAttribute('data-filtered', 'true');
-                                                newFilteredCount++;
-                                            } else if (isRecommendation) {
-                                                newRecommendationCount++;
-                                            }
-                                        }
-                                    });
-
-                                    return {
-                                        newFiltered: newFilteredCount,
-                                        newRecommendations: newRecommendationCount,
-                                        totalLinks: allLinks.length
-                                    };
-                                }''')
-
-                                # [OK] 필터링된 상품만 카운트
-                                product_links_after = await page.query_selector_all('a[data-filtered="true"]')
-                                after_scroll = len(product_links_after)
+                                print(f"\n  [시도 {attempt+1}/3] 새 상품 카드 대기 (최대 5초)...", flush=True)
+                                # 옵저버가 새 상품을 큐에 넣을 때까지 대기 (큐 길이만 확인 - 카드 재검사 없음)
+                                # 리스트 응답이 먼저 도착하면 바로 렌더링 안정화 후 확인
+                                await self.waits.for_function(
+                                    page, QUEUE_LENGTH_JS, before_scroll + 1, 'scroll_new_products', timeout=5,
+                                    early=listing_response
+                                )
+                                # 카드 묶음 렌더링이 끝날 때까지 짧게 안정화
+                                await self.waits.for_dom_quiet(
+                                    page, 'scroll_render_settle', quiet_ms=200, grace_ms=200, timeout=1
+                                )
+
+                                # [OK] v1.5.9+ 옵저버가 분류한 새 상품만 가져오기 (추천 제외)
+                                new_items = await self.listing_queue.drain(page)
+                                if new_items is None:
+                                    print(f"  [!!] 필터 상태가 사라짐 - 페이지 리로드 감지", flush=True)
+                                    break
+                                queue_stats = self.listing_queue.stats
+                                after_scroll = len(self.listing_queue)
 
                                 print(f"  [필터링 결과]", flush=True)
-                                print(f"    전체 링크: {filter_result['totalLinks']}개", flush=True)
-                                print(f"    새로 필터링: {filter_result['newFiltered']}개", flush=True)
-                                print(f"    새로운 추천: {filter_result['newRecommendations']}개 (제외)", flush=True)
+                                print(f"    전체 링크: {queue_stats.get('total', 0)}개", flush=True)
+                                print(f"    새로 필터링: {len(new_items)}개", flush=True)
+                                print(f"    추천 제외 (누적): {queue_stats.get('recommendations', 0)}개", flush=True)
                                 print(f"    현재 총 필터링: {after_scroll}개 (이전: {before_scroll}개)", flush=True)
 
                                 if after_scroll > before_scroll:
@@ -980,7 +722,10 @@ class SimpleCrawler:
                                     loaded = True
                                     break
                                 elif attempt < 2:
-                                    print(f"  [..] 아직 새 상품 없음 - 다시 대기 ({(attempt+1)*5}초 경과)", flush=True)
+                                    print(f"  [..] 아직 새 상품 없음 - 다시 대기", flush=True)
+
+                            if not listing_response.done():
+                                listing_response.cancel()
 
                             if not loaded:
                                 consecutive_failures += 1  # 실패 카운트 증가
@@ -1005,24 +750,569 @@ class SimpleCrawler:
                         print(f"[배치 {batch_num}] 처리 완료 - 다음 배치로 진행 (아직 {current_total - batch_end}개 남음)")
                         continue
 
+                # 대기 중인 저장 완료 후 최종 결과 출력
+                if self.db_writer:
+                    await self.db_writer.flush_async()
+
                 # 최종 테이블 출력 (50의 배수가 아닌 경우)
                 if len(self.products_data) % 50 != 0:
                     self._print_products_table(len(self.products_data), final=True)
                 else:
                     print(f"\n\n수집 완료! 총 {len(self.products_data)}개 → DB 저장됨")
 
+                # 대기 지연 시간 통계 (어디서 시간을 쓰는지 확인용)
+                self.waits.print_stats()
+                self.recycler.print_stats()
+                if self.db_writer:
+                    self.db_writer.print_stats()
+                if self.store:
+                    self.store.print_stats()
+                if self.db and self.db.pool:
+                    self.db.pool.print_stats()
+                if self.listing_capture:
+                    self.listing_capture.print_stats()
+                if self.resource_policy:
+                    self.resource_policy.print_stats(detail_pages=collected_count)
+                self.layout_templates.print_stats()
+                self.provenance.print_stats()
+                self.lazy_fields.print_stats()
+
             finally:
-                # DB 연결 종료
-                if self.db_connected and self.db:
+                # 워커 탭 정리
+                if self.detail_pool:
+                    await self.detail_pool.close()
+
+                # 남은 상품 저장 (중지/오류로 끝나도 큐에 있는 상품은 저장)
+                if self.db_writer:
+                    await self.db_writer.close_async()
+
+                # DB 연결 종료 (던져둔 매핑 저장 등 남은 작업 완료 후)
+                if self.store:
                     try:
-                        self.db.close()
-                        print("[DB] 연결 종료")
-                    except:
+                        await self.store.close()
+                    except Exception:
                         pass
+                self.layout_templates.save()
                 await browser.close()
 
             return self.products_data
 
+    async def _launch_browser(self, p):
+        """
+        브라우저 + 컨텍스트 + 리스트 탭 생성 (첫 실행/재시작 공통)
+
+        Returns:
+            (browser, context, page)
+        """
+        browser = await p.firefox.launch(
+            headless=self.headless,
+            slow_mo=self.SLOW_MO,
+            args=['--start-maximized']  # 브라우저 최대화로 시작
+        )
+
+        # 📌 viewport 설정 설명:
+        # - viewport는 무한 스크롤을 위해 반드시 필요! (no_viewport=True 사용 금지)
+        # - 네이버는 "화면에 보이는 영역"을 감지해서 새 상품을 로드함
+        # - no_viewport=True → 무한 높이 → "이미 다 보임" → 추가 로드 안 함
+        context = await browser.new_context(
+            viewport={'width': 1920, 'height': 1080},  # 고정 크기 (Intersection Observer 작동용)
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0",
+            locale='ko-KR',
+            timezone_id='Asia/Seoul'
+        )
+
+        # 리소스 차단 (역할 미지정 탭 = 상세 페이지 정책)
+        if self.resource_policy:
+            await self.resource_policy.install(context)
+
+        page = await context.new_page()
+        if self.resource_policy:
+            self.resource_policy.set_role(page, 'listing')
+
+        # 상세 탭 워커 풀 (direct 모드, detail_workers=1이면 순차)
+        if self.detail_mode == "direct":
+            self.detail_pool = DetailWorkerPool(
+                context,
+                self._fetch_detail,
+                workers=self.detail_workers,
+                min_interval=self.DETAIL_MIN_INTERVAL
+            )
+            print(f"[direct 모드] 상품 URL 직접 이동 - 상세 탭 {self.detail_workers}개")
+
+        return browser, context, page
+
+    async def _enter_category(self, context, page):
+        """
+        네이버 메인 → 쇼핑 탭 → 카테고리 진입 + 캡차 대기 (첫 실행/재시작 공통)
+
+        Returns:
+            카테고리 리스트 페이지 (쇼핑 새 탭)
+        """
+        # 1. 네이버 메인 → 쇼핑 진입
+        print("[1/4] 네이버 메인 페이지 접속...")
+        await page.goto('https://www.naver.com')
+        await page.wait_for_load_state('domcontentloaded')
+        await asyncio.sleep(2)
+
+        # 쇼핑 클릭 (광고가 가려도 강제 클릭)
+        print("[2/4] 쇼핑 버튼 클릭...")
+        shopping_selector = '#shortcutArea > ul > li:nth-child(4) > a'
+        await page.locator(shopping_selector).click(timeout=10000, force=True)
+        await asyncio.sleep(2)
+
+        # 새 탭 전환
+        all_pages = context.pages
+        if len(all_pages) > 1:
+            page = all_pages[-1]
+            await page.wait_for_load_state('networkidle')
+
+        if self.resource_policy:
+            self.resource_policy.set_role(page, 'listing')
+
+        # 리스트 응답 캡처 시작 (카테고리 진입 전에 등록해야 첫 페이지 응답도 받음)
+        if self.listing_capture:
+            self.listing_capture.attach(page)
+            print("[응답 캡처] 리스트 API 응답 캡처 시작")
+
+        # 2. 카테고리 진입 (CRAWLING_LESSONS_LEARNED.md 검증된 방법)
+        print(f"[3/4] '{self.category_name}' 카테고리 진입...")
+        category_btn = await page.wait_for_selector('button:has-text("카테고리")', timeout=10000)
+        await category_btn.click()
+
+        # 카테고리 메뉴가 나타날 때까지 대기 (최대 5초)
+        await asyncio.sleep(1)
+
+        # 우선순위별 셀렉터 fallback (문서 1293-1296줄)
+        category_elem = None
+
+        # 1순위: ID 기반 (⭐⭐⭐⭐⭐) - 명시적 대기
+        if self.category_id:
+            try:
+                category_elem = await page.wait_for_selector(f'#cat_layer_item_{self.category_id}', timeout=5000)
+            except:
+                pass
+
+        # 2순위: data-id 속성 (⭐⭐⭐⭐)
+        if not category_elem and self.category_id:
+            try:
+                category_elem = await page.wait_for_selector(f'[data-id="{self.category_id}"]', timeout=3000)
+            except:
+                pass
+
+        # 3순위: data-name 속성 (⭐⭐⭐)
+        if not category_elem:
+            try:
+                category_elem = await page.wait_for_selector(f'a[data-name="{self.category_name}"]', timeout=3000)
+            except:
+                pass
+
+        if not category_elem:
+            raise Exception(f"카테고리 '{self.category_name}' (ID: {self.category_id})를 찾을 수 없습니다")
+
+        await category_elem.click()
+        await asyncio.sleep(3)
+
+        # 캡차 체크 및 자동 포커스
+        print("\n" + "="*60)
+        print("[!] 캡차 확인 중...")
+        print("="*60)
+
+        # 캡차 입력 필드 찾기 (네이버 캡차 input 셀렉터)
+        captcha_input = None
+        try:
+            # 캡차 입력 필드가 있는지 확인 (1초 대기)
+            # 실제 테스트로 확인된 셀렉터: input#rcpt_answer, input[name='captcha']
+            captcha_input = await page.wait_for_selector(
+                'input#rcpt_answer, input[name="captcha"], input.input_text',
+                timeout=1000,
+                state='visible'
+            )
+        except:
+            # 캡차가 없으면 넘어감
+            pass
+
+        if captcha_input:
+            # 캡차가 있으면 입력 필드에 포커스
+            print("🔔 캡차 감지! 입력 필드에 포커스를 맞췄습니다.")
+            print("브라우저에서 캡차를 입력하고 Enter를 누르세요")
+            print("="*60)
+
+            # 입력 필드에 포커스 및 하이라이트
+            await captcha_input.focus()
+            await captcha_input.click()
+
+            # 입력 필드를 노란색으로 하이라이트 (시각적 피드백)
+            await page.evaluate("""
+                (element) => {
+                    element.style.border = '3px solid #FFD700';
+                    element.style.boxShadow = '0 0 10px #FFD700';
+                    element.style.animation = 'pulse 1s infinite';
+
+                    // 애니메이션 추가
+                    if (!document.getElementById('captcha-pulse-style')) {
+                        const style = document.createElement('style');
+                        style.id = 'captcha-pulse-style';
+                        style.innerHTML = `
+                            @keyframes pulse {
+                                0% { box-shadow: 0 0 10px #FFD700; }
+                                50% { box-shadow: 0 0 20px #FFD700; }
+                                100% { box-shadow: 0 0 10px #FFD700; }
+                            }
+                        `;
+                        document.head.appendChild(style);
+                    }
+                }
+            """, captcha_input)
+
+            # 캡차 해결 대기 (최대 30초)
+            for i in range(30, 0, -5):
+                print(f"[대기] 캡차 입력 대기 중... {i}초 남음")
+
+                # 캡차 입력 필드가 사라졌는지 확인 (실제 셀렉터 사용!)
+                try:
+                    await page.wait_for_selector(
+                        'input#rcpt_answer, input[name="captcha"], input.input_text',
+                        timeout=1000,
+                        state='hidden'
+                    )
+                    print("[✓] 캡차 해결 완료!")
+                    break
+                except:
+                    pass
+
+                await asyncio.sleep(5)
+        else:
+            # 캡차가 없는 경우 짧게 대기
+            print("캡차 없음 - 페이지 로딩 대기 (5초)")
+            await asyncio.sleep(5)
+
+        print("[OK] 대기 완료! 크롤링 시작...\n")
+        print("="*60)
+        await asyncio.sleep(2)
+
+        return page
+
+    async def _recycle_browser(self, p, browser, processed_indices: set, reason: str):
+        """
+        브라우저 재시작 - 처리 기록 저장 → 기존 브라우저 종료 → 새 브라우저로 카테고리 재진입
+
+        Returns:
+            (browser, context, page) - 새 리스트 페이지 (큐/핸들 레지스트리도 새로 생성)
+        """
+        print(f"\n{'='*60}", flush=True)
+        print(f"[재시작] {reason} → 브라우저 재시작 (#{self.recycler.recycle_count + 1})", flush=True)
+        print(f"{'='*60}", flush=True)
+
+        self.recycler.remember(self.listing_queue.keys, processed_indices)
+
+        await self.handles.dispose_all()
+        if self.detail_pool:
+            await self.detail_pool.close()
+            self.detail_pool = None  # 새 컨텍스트로 다시 생성
+        try:
+            await browser.close()
+        except Exception:
+            pass  # 이미 종료됨
+
+        self.listing_queue = ListingQueue()
+        self.handles = ProductHandleRegistry(self.listing_queue)
+
+        browser, context, page = await self._launch_browser(p)
+        try:
+            page = await self._enter_category(context, page)
+        except Exception:
+            await browser.close()
+            raise
+        return browser, context, page
+
+    async def _restore_position(self, page):
+        """
+        재시작 후 위치 복원 - 마지막 처리 상품이 큐에 나타날 때까지 크게 스크롤
+
+        중단 조건: 마지막 처리 상품 발견 / 이전 위치보다 RESTORE_MARGIN개 더 로드 (상품이 사라진 경우)
+                  / 새 상품 3회 연속 없음
+        """
+        target = self.recycler.last_key
+        limit = self.recycler.last_position + self.RESTORE_MARGIN
+        print(f"\n[위치 복원] 마지막 처리 상품 {target} (이전 {self.recycler.last_position}번째)까지 스크롤...", flush=True)
+
+        rounds = 0
+        misses = 0
+        while (self.listing_queue.seq_of(target) is None and len(self.listing_queue) < limit
+               and misses < 3 and not self.should_stop):
+            rounds += 1
+            before = len(self.listing_queue)
+            await page.evaluate('(step) => window.scrollBy(0, step)', self.RESTORE_SCROLL_STEP)
+            await self.waits.for_function(page, QUEUE_LENGTH_JS, before + 1, 'restore_scroll', timeout=5)
+            new_items = await self.listing_queue.drain(page)
+            if new_items is None:
+                break  # 페이지 리로드 - 배치 루프에서 처리
+            misses = 0 if new_items else misses + 1
+
+        seq = self.listing_queue.seq_of(target)
+        if seq is not None:
+            print(f"  [OK] 스크롤 {rounds}회 - {seq+1}번 위치 복원 (로드된 상품 {len(self.listing_queue)}개)", flush=True)
+        else:
+            print(f"  [!!] 마지막 처리 상품 없음 - 스크롤 {rounds}회, 로드된 상품 {len(self.listing_queue)}개부터 진행", flush=True)
+
+    async def _process_batch_direct(self, page, batch_start: int, batch_end: int,
+                                    processed_indices: set, collected_count: int) -> Dict[str, int]:
+        """
+        direct 모드 배치 처리 - 클릭 없이 URL로 상세 페이지 수집 (워커 풀 사용)
+
+        Args:
+            page: 리스트 페이지
+            batch_start: 배치 시작 인덱스 (0-based)
+            batch_end: 배치 끝 인덱스 (미포함)
+            processed_indices: 처리 완료 인덱스 (결과 순서대로 추가됨)
+            collected_count: 배치 시작 전 누적 수집 개수
+
+        Returns:
+            dict: {'collected': n, 'duplicates': n, 'errors': n}
+        """
+        stats = {'collected': 0, 'duplicates': 0, 'errors': 0}
+
+        # 필터링된 상품 URL은 큐에 이미 있음 (페이지 조회 없음)
+        hrefs = self.listing_queue.hrefs[batch_start:batch_end]
+
+        # 리스트 응답 파싱이 끝난 뒤 조회 (스크롤 직후 도착한 응답 포함)
+        if self.listing_capture:
+            await self.listing_capture.flush()
+
+        work_items = []
+        for offset, href in enumerate(hrefs):
+            idx = batch_start + offset
+            if idx in processed_indices:
+                continue
+
+            # 브라우저 재시작 전에 처리한 상품 (DB 체크 없이 SKIP)
+            if self.recycler.is_handled(self.listing_queue.keys[idx]):
+                processed_indices.add(idx)
+                continue
+
+            if not href:
+                print(f"[{idx+1}번] URL 없음 - SKIP", flush=True)
+                stats['errors'] += 1
+                processed_indices.add(idx)
+                continue
+
+            # 🚀 클릭 전 중복 체크 (순차 모드와 동일)
+            if await self._is_known_product(href):
+                self.skipped_count += 1
+                stats['duplicates'] += 1
+                print(f"[{idx+1}번] DB에 이미 존재 - SKIP", flush=True)
+                await self._mark_product(page, idx, '#888888', 'SKIP - 중복')
+                processed_indices.add(idx)
+                continue
+
+            record = self.listing_capture.lookup(href) if self.listing_capture else None
+            work_items.append((idx, href, record))
+
+        print(f"[direct 모드] {len(work_items)}개 상품 → 상세 탭 {self.detail_workers}개로 수집", flush=True)
+
+        async def on_result(item, product_data) -> bool:
+            idx = item[0]
+            processed_indices.add(idx)
+
+            if isinstance(product_data, Exception):
+                stats['errors'] += 1
+                print(f"[{idx+1}번] 오류: {str(product_data)[:50]} - SKIP", flush=True)
+                await self._mark_product(page, idx, '#888888', 'SKIP - 오류')
+            elif product_data and product_data.get('product_name'):
+                stats['collected'] += 1
+                print(f"[{idx+1}번] 수집 완료 - {product_data.get('product_name', '')[:30]}...", flush=True)
+                await self._mark_product(page, idx, '#00FF00', '✓ 수집 완료', text_color='black')
+                await self._record_product(product_data, collected_count + stats['collected'], listing_url=item[1])
+            else:
+                print(f"[{idx+1}번] 수집 실패 (상품명 없음) - SKIP")
+
+            if self.should_stop:
+                return False
+            if self.product_count and collected_count + stats['collected'] >= self.product_count:
+                print(f"\n목표 개수 도달! {collected_count + stats['collected']}개 수집 완료")
+                return False
+            return True
+
+        await self.detail_pool.run(work_items, on_result)
+        return stats
+
+    async def _fetch_detail(self, detail_page, item) -> Optional[Dict]:
+        """
+        워커 탭에서 상품 URL로 이동 후 정보 수집 (DetailWorkerPool용)
+
+        고정 sleep 대신 결정적 이벤트로 대기:
+        1. goto 응답 + domcontentloaded
+        2. 상품명 요소 등장 (에러/품절 페이지면 타임아웃 후 그대로 수집 → 상품명 없음 SKIP)
+
+        item: (idx, url, 리스트 응답 레코드 또는 None) - 레코드로 빈 필드 보충
+        """
+        idx, url, record = item
+        await detail_page.goto(url, wait_until='domcontentloaded', timeout=30000)
+        await self._wait_detail_ready(detail_page, idx)
+        product_data = await self._collect_product_info(detail_page)
+        return fill_from_listing(product_data, record)
+
+    async def _wait_detail_ready(self, detail_page, idx: int):
+        """상세 페이지 준비 대기 - domcontentloaded + 상품명 요소 등장 (최대 10초)"""
+        try:
+            await detail_page.wait_for_load_state('domcontentloaded')
+        except Exception:
+            pass
+
+        ready = await self.waits.for_selector(
+            detail_page, self.DETAIL_READY_SELECTOR, 'detail_ready', timeout=10, state='attached'
+        )
+        if not ready:
+            print(f"[{idx+1}번] 상품명 요소 대기 시간 초과 - 현재 상태로 수집", flush=True)
+
+    async def _is_known_product(self, product_url: str) -> bool:
+        """클릭 전 중복 체크 - DB에 이미 있는 상품이면 True (스냅샷에 없으면 DB 스레드에서 확인)"""
+        if not (self.save_to_db and self.db and self.db_connected):
+            return False
+
+        try:
+            product_id = self._resolve_product_id(product_url)
+            return await self.store.is_duplicate(product_id)
+        except Exception as e:
+            print(f"  중복 체크 오류: {str(e)[:50]} - 수집 진행", flush=True)
+            return False
+
+    def _resolve_product_id(self, product_url: str) -> str:
+        """
+        리스트 href → DB product_id
+
+        리스트 응답 캡처가 켜져 있으면 응답의 상품 번호 우선 사용, 없으면 DB 매핑 캐시(nvMid → 상품 ID)
+        (리스트 href가 /products/<id> 형식이 아니면 URL 해시로 떨어져 중복 체크가 안 되던 문제)
+        """
+        if self.listing_capture:
+            record = self.listing_capture.lookup(product_url)
+            if record and record.get('product_id'):
+                return record['product_id']
+        return self.db.extract_product_id(product_url)
+
+    async def _mark_product(self, page, idx: int, color: str, label: str,
+                            text_color: str = 'white', scroll: bool = False):
+        """
+        리스트 페이지 상품 카드에 상태 테두리 + 오버레이 표시 (Sliding Window 포함)
+
+        화면을 보는 사람용 표시라서 throughput_mode에서는 아무것도 하지 않음 (evaluate 호출 없음)
+
+        Args:
+            color: 테두리/오버레이 색 (#RRGGBB)
+            label: 오버레이 문구 ('[N번] ' 뒤에 붙음)
+            scroll: 카드를 화면 중앙으로 부드럽게 스크롤
+        """
+        if self.throughput_mode:
+            return
+
+        try:
+            await page.evaluate('''([index, color, textColor, label, windowSize, scroll]) => {
+                // 🧹 Sliding Window: 오래된 오버레이 제거
+                const oldOverlay = document.getElementById('product-overlay-' + (index - windowSize - 1));
+                if (oldOverlay) {
+                    oldOverlay.remove();
+                }
+
+                const link = document.querySelector('a[data-crawl-seq="' + index + '"]');
+                if (!link) return;
+
+                link.style.border = '5px solid ' + color;
+                link.style.boxShadow = '0 0 20px ' + color;
+                link.style.position = 'relative';
+
+                let overlay = document.getElementById('product-overlay-' + index);
+                if (!overlay) {
+                    overlay = document.createElement('div');
+                    overlay.id = 'product-overlay-' + index;
+                    overlay.style.cssText = `
+                        position: absolute;
+                        top: 0;
+                        left: 0;
+                        padding: 10px;
+                        font-size: 20px;
+                        font-weight: bold;
+                        z-index: 10000;
+                        pointer-events: none;
+                    `;
+                    link.appendChild(overlay);
+                }
+                overlay.style.background = color + 'E6';  // 90% 불투명
+                overlay.style.color = textColor;
+                overlay.textContent = '[' + (index + 1) + '번] ' + label;
+
+                if (scroll) {
+                    link.scrollIntoView({ block: 'center', behavior: 'smooth' });
+                }
+            }''', [idx, color, text_color, label, self.OVERLAY_WINDOW, scroll])
+        except:
+            pass
+
+    async def _record_product(self, product_data: Dict, collected_count: int, listing_url: Optional[str] = None):
+        """
+        수집 완료 상품 기록 (메모리 보관 + DB 저장 + 진행 출력)
+
+        DB 저장은 일괄 저장 스레드가 켜져 있으면 큐에 넣기만 함 (_db_status = 'pending' → 저장 후 결과로 갱신)
+        큐가 가득 차면 자리가 날 때까지 await (이벤트 루프는 멈추지 않음)
+        일괄 저장을 끄면 DB 스레드에 던져두고 바로 반환 (이벤트 루프에서 커밋 대기 없음)
+        listing_url: 리스트 카드 href - 상세 페이지의 실제 상품 ID와 매핑 저장 (다음 실행 클릭 전 중복 체크용)
+        """
+        self.products_data.append(product_data)
+        self.provenance.record(product_data)
+
+        # 메모리 최적화: 1000개 초과 시 오래된 데이터 정리 (마지막 500개만 유지)
+        if len(self.products_data) > 1000:
+            self.products_data = self.products_data[-500:]
+
+        # DB 저장 (일괄 저장 스레드 또는 즉시 저장)
+        if self.save_to_db and self.db and self.db_connected:
+            if listing_url and product_data.get('product_id'):
+                self.store.submit(self.db.remember_product_id, listing_url, product_data['product_id'])
+            if self.db_writer:
+                await self.db_writer.submit_async(self.category_name, product_data)  # _db_status = 'pending' → 저장 후 갱신
+            else:
+                product_data['_db_status'] = 'pending'
+                self.store.submit(self._save_product_now, product_data, collected_count)
+        else:
+            product_data['_db_status'] = 'none'
+
+        # 간략한 진행 메시지만 출력
+        print(f"수집 중... {collected_count}개", end='\r')
+
+        # 50개마다 상세 테이블 출력
+        if collected_count % 50 == 0:
+            self._print_products_table(collected_count)
+
+    def _save_product_now(self, product_data: Dict, collected_count: int):
+        """상품 1개 즉시 저장 (일괄 저장을 쓰지 않을 때, DB 스레드에서 실행)"""
+        try:
+            result = self.db.save_product(self.category_name, product_data)
+            if result in ('saved', 'updated'):
+                product_data['_db_status'] = 'saved'
+            elif result in ('skipped', 'unchanged'):
+                product_data['_db_status'] = 'skipped'
+            else:
+                product_data['_db_status'] = 'error'
+        except Exception as e:
+            product_data['_db_status'] = 'error'
+            print(f"[{collected_count}] DB 저장 실패: {str(e)}")
+            return
+        self.loop.call_soon_threadsafe(self._count_db_result, product_data, result)
+
+    def _on_db_result(self, product_data: Dict, result: str):
+        """일괄 저장 결과 (저장 스레드에서 호출) → 카운트는 이벤트 루프에서 (스레드 간 += 경합 방지)"""
+        self.loop.call_soon_threadsafe(self._count_db_result, product_data, result)
+
+    def _count_db_result(self, product_data: Dict, result: str):
+        """DB 저장 결과 반영 (이벤트 루프에서만 실행) - 카운트 + 중복 체크 스냅샷 갱신"""
+        if result in ('saved', 'updated'):
+            self.saved_count += 1
+            if self.db and self.db.known_ids is not None and product_data.get('product_id'):
+                self.db.known_ids.add(product_data['product_id'])
+        elif result == 'skipped':
+            self.skipped_count += 1  # DB에 이미 있음 (DO NOTHING)
+        elif result == 'unchanged':
+            self.unchanged_count += 1
+
     def _print_products_table(self, count: int, final: bool = False):
         """50개 단위로 수집된 모든 상품 정보를 테이블로 출력"""
         print("\n")  # 진행 메시지 줄바꿈
@@ -1047,6 +1337,8 @@ class SimpleCrawler:
             print(f"  총 수집      : {count}개")
             print(f"  DB 저장      : {self.saved_count}개 ({self.saved_count/count*100:.1f}%)")
             print(f"  중복 스킵    : {self.skipped_count}개 ({self.skipped_count/count*100:.1f}%)")
+            if self.unchanged_count:
+                print(f"  변경 없음    : {self.unchanged_count}개 ({self.unchanged_count/count*100:.1f}%)")
         else:
             print(f"  총 수집      : {count}개")
 
@@ -1091,6 +1383,8 @@ class SimpleCrawler:
                 db_icon = 'DUP'
             elif db_status == 'error':
                 db_icon = 'ERR'
+            elif db_status == 'pending':
+                db_icon = '...'
             else:
                 db_icon = 'N/A'
 
@@ -1100,135 +1394,20 @@ class SimpleCrawler:
         print()
 
     async def _collect_product_info(self, page) -> Optional[Dict]:
-        """상품 정보 수집 (13개 필드)"""
-        data = {}
-
+        """상품 정보 수집 (13개 필드) - evaluate 1회로 일괄 추출, 지연 로딩 필드가 없을 때만 스크롤 후 재추출"""
         try:
-            # 1. product_id (URL에서 추출)
-            url = page.url
-            match = re.search(r'/products/(\d+)', url)
-            data['product_id'] = match.group(1) if match else None
-
-            # 2. category_name
-            data['category_name'] = self.category_name
-
-            # 3. product_name
-            elem = await page.query_selector('h3.DCVBehA8ZB')
-            data['product_name'] = await elem.inner_text() if elem else None
-
-            # 4. brand_name (테이블에서) - 스크롤 없이 바로 수집
-            brand_result = await page.evaluate('''() => {
-                const allElements = document.querySelectorAll('td, th');
-                for (let elem of allElements) {
-                    const text = elem.textContent || '';
-                    if (text.trim() === '브랜드') {
-                        const nextTd = elem.nextElementSibling;
-                        if (nextTd) {
-                            const brandValue = nextTd.textContent.trim();
-                            if (brandValue && brandValue.length < 50) {
-                                return brandValue;
-                            }
-                        }
-                    }
-                }
-                return null;
-            }''')
-            data['brand_name'] = brand_result
-
-            # 5. price
-            elem = await page.query_selector('strong.Izp3Con8h8')
-            if elem:
-                price_text = await elem.inner_text()
-                price_clean = re.sub(r'[^\d]', '', price_text)
-                data['price'] = int(price_clean) if price_clean else None
-            else:
-                data['price'] = None
-
-            # 6. discount_rate (JavaScript evaluate)
-            discount_result = await page.evaluate('''() => {
-                const allElements = document.querySelectorAll('*');
-                for (let elem of allElements) {
-                    const text = elem.textContent || '';
-                    if (text.includes('%') && text.length < 20) {
-                        const match = text.match(/(\\d+)%/);
-                        if (match && elem.children.length <= 1) {
-                            return match[1];
-                        }
-                    }
-                }
-                return null;
-            }''')
-            data['discount_rate'] = int(discount_result) if discount_result else None
-
-            # 7. review_count
-            review_result = await page.evaluate('''() => {
-                const allElements = document.querySelectorAll('*');
-                for (let elem of allElements) {
-                    const text = elem.textContent || '';
-                    if (text.includes('리뷰') && text.length < 20) {
-                        const match = text.match(/리뷰\\s*(\\d+)/);
-                        if (match) {
-                            return match[1];
-                        }
-                    }
-                }
-                return null;
-            }''')
-            data['review_count'] = int(review_result) if review_result else 0
-
-            # 8. rating
-            rating_result = await page.evaluate('''() => {
-                const allElements = document.querySelectorAll('*');
-                for (let elem of allElements) {
-                    const text = elem.textContent || '';
-                    if ((text.includes('평점') || text.includes('별점')) && text.length < 30) {
-                        const match = text.match(/(\\d+\\.\\d+)/);
-                        if (match) {
-                            return parseFloat(match[1]);
-                        }
-                    }
-                }
-                return null;
-            }''')
-            data['rating'] = rating_result
-
-            # 9. search_tags (최적화: 2번만 스크롤)
-            # 30% 스크롤 (brand_name 위치)
-            await page.evaluate('window.scrollTo(0, document.body.scrollHeight * 0.3)')
-            await asyncio.sleep(1.5)
-
-            # 50% 스크롤 (search_tags 위치)
-            await page.evaluate('window.scrollTo(0, document.body.scrollHeight * 0.5)')
-            await asyncio.sleep(2.0)
-
-            # 태그 수집
-            all_tags_found = set()
-            all_links = await page.query_selector_all('a')
-            for link in all_links:
-                try:
-                    text = await link.inner_text()
-                    if text and text.strip().startswith('#'):
-                        clean_tag = text.strip().replace('#', '').strip()
-                        if 1 < len(clean_tag) < 30:
-                            all_tags_found.add(clean_tag)
-                except:
-                    pass
-
-            data['search_tags'] = list(all_tags_found)
-
-            # 10. product_url
-            data['product_url'] = url
-
-            # 11. thumbnail_url
-            elem = await page.query_selector('img[class*="image"]')
-            data['thumbnail_url'] = await elem.get_attribute('src') if elem else None
-
-            # 12, 13. 타임스탬프
-            now = datetime.now()
-            data['crawled_at'] = now.isoformat()
-            data['updated_at'] = now.isoformat()
-
-            return data
+            # 13개 필드 일괄 추출 (브라우저 안에서 한 번에 처리)
+            # 내장 데이터 → 레이아웃 템플릿 셀렉터 → DOM 탐색 순 (앞에서 찾은 필드는 뒤 단계 생략)
+            context = dict(self.embedded_context)
+            context.update(self.layout_templates.payload(page.url) or {})
+            raw = await page.evaluate(EXTRACT_DETAIL_JS, context)
+
+            # 지연 로딩 필드 (30% 브랜드 표, 50% 검색 태그): 없는 필드만 스크롤 + 필드별 예산 안에서 대기
+            if await self.lazy_fields.run(page, self.waits, raw):
+                raw = await page.evaluate(EXTRACT_DETAIL_JS, context)
+
+            self.layout_templates.update(raw)
+            return build_product_data(raw, page.url, self.category_name)
 
         except Exception as e:
             print(f"   수집 오류: {str(e)[:50]}")
@@ -0,0 +1,237 @@
+"""
+이벤트 기반 대기 엔진
+고정 asyncio.sleep 대신 실제 페이지 신호(DOM 변경, 요소 표시, 네트워크 응답)로 대기
+모든 대기는 타임아웃이 있고, 대기 이름별로 소요 시간을 기록
+"""
+
+import asyncio
+import time
+from typing import Callable, Dict, Optional
+
+# =====================================================
+# 브라우저 내부 대기 스크립트 (MutationObserver)
+# =====================================================
+
+# DOM 변경이 quietMs 동안 없으면 완료 (graceMs 안에 변경이 한 번도 없어도 완료)
+_QUIET_JS = r'''([quietMs, graceMs, timeoutMs]) => new Promise((resolve) => {
+    let quietTimer = null;
+    let limitTimer = null;
+    let observer = null;
+    const finish = (ok) => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(limitTimer);
+        resolve(ok);
+    };
+    observer = new MutationObserver(() => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => finish(true), quietMs);
+    });
+    observer.observe(document.documentElement, {childList: true, subtree: true});
+    quietTimer = setTimeout(() => finish(true), graceMs);
+    limitTimer = setTimeout(() => finish(false), timeoutMs);
+})'''
+
+
+class WaitEngine:
+    """
+    신호 기반 대기 + 대기별 지연 시간 기록
+
+    사용 예:
+        waits = WaitEngine()
+        ok = await waits.for_selector(page, 'h3', 'detail_ready', timeout=10)
+        waits.print_stats()
+    """
+
+    def __init__(self, debug: bool = False):
+        self.debug = debug
+        self.wait_stats: Dict[str, Dict] = {}  # 대기 이름별 통계
+
+    async def for_selector(
+        self,
+        page,
+        selector: str,
+        name: str,
+        timeout: float = 10.0,
+        state: str = 'visible'
+    ) -> bool:
+        """
+        요소가 나타날 때까지 대기
+
+        Args:
+            page: Playwright Page
+            selector: 대기할 셀렉터
+            name: 통계용 대기 이름
+            timeout: 최대 대기 (초)
+            state: 'attached', 'visible', 'hidden', 'detached'
+
+        Returns:
+            bool: 시간 안에 신호가 오면 True
+        """
+        started = time.monotonic()
+        try:
+            await page.wait_for_selector(selector, state=state, timeout=timeout * 1000)
+            ok = True
+        except Exception:
+            ok = False
+        self._record(name, started, ok)
+        return ok
+
+    async def for_new_page(self, context, action: Callable, name: str, timeout: float = 10.0):
+        """
+        action 실행으로 열리는 새 탭을 기다려 반환 (context.pages[-1] 추측 대신 이벤트 사용)
+
+        Args:
+            context: BrowserContext
+            action: 새 탭을 여는 async 함수 (예: lambda: product.click())
+            name: 통계용 대기 이름
+            timeout: 최대 대기 (초)
+
+        Returns:
+            새 Page 또는 None (시간 초과)
+        """
+        started = time.monotonic()
+        try:
+            async with context.expect_page(timeout=timeout * 1000) as page_info:
+                await action()
+            new_page = await page_info.value
+            ok = True
+        except Exception:
+            new_page = None
+            ok = False
+        self._record(name, started, ok)
+        return new_page
+
+    async def for_dom_quiet(
+        self,
+        page,
+        name: str,
+        quiet_ms: int = 300,
+        grace_ms: int = 500,
+        timeout: float = 2.0
+    ) -> bool:
+        """
+        DOM 변경이 멈출 때까지 대기 (지연 로딩 영역 렌더링 완료 감지)
+
+        Args:
+            quiet_ms: 마지막 변경 후 이만큼 조용하면 완료
+            grace_ms: 변경이 한 번도 없을 때 완료까지 대기
+            timeout: 최대 대기 (초) - 기존 고정 sleep 값을 상한으로 사용
+
+        Returns:
+            bool: 시간 안에 안정화되면 True
+        """
+        started = time.monotonic()
+        try:
+            ok = await page.evaluate(_QUIET_JS, [quiet_ms, grace_ms, int(timeout * 1000)])
+        except Exception:
+            ok = False
+        self._record(name, started, ok)
+        return ok
+
+    async def for_function(
+        self,
+        page,
+        expression: str,
+        arg,
+        name: str,
+        timeout: float = 5.0,
+        polling: int = 100,
+        early: Optional[asyncio.Future] = None
+    ) -> bool:
+        """
+        브라우저 안 조건식이 참이 될 때까지 대기 (예: 상품 큐 길이)
+
+        Args:
+            expression: arg를 받는 JS 함수 문자열
+            polling: 확인 간격 (ms) - 백그라운드 탭에서도 동작하도록 requestAnimationFrame 대신 시간 간격 사용
+            early: 성공 신호 future (예: for_response) - 값이 오면 조건을 더 기다리지 않고 True
+                   None으로 끝나면 (신호 없음) 무시하고 조건을 끝까지 기다림
+
+        Returns:
+            bool: 시간 안에 조건을 만족하거나 성공 신호가 오면 True
+        """
+        started = time.monotonic()
+        wait = asyncio.ensure_future(
+            page.wait_for_function(expression, arg=arg, timeout=timeout * 1000, polling=polling)
+        )
+        try:
+            if early is not None and not early.done():
+                await asyncio.wait({wait, early}, return_when=asyncio.FIRST_COMPLETED)
+                if not wait.done() and not early.cancelled() and early.result() is not None:
+                    wait.cancel()
+                    self._record(name, started, True)
+                    return True
+            await wait
+            ok = True
+        except Exception:
+            ok = False
+        self._record(name, started, ok)
+        return ok
+
+    async def for_response(
+        self,
+        page,
+        predicate: Callable,
+        name: str,
+        timeout: float = 5.0
+    ):
+        """
+        조건에 맞는 네트워크 응답이 끝날 때까지 대기
+
+        Args:
+            predicate: response -> bool (예: lambda r: 'products' in r.url)
+
+        Returns:
+            Response 또는 None (시간 초과)
+        """
+        started = time.monotonic()
+        try:
+            response = await page.wait_for_event('response', predicate=predicate, timeout=timeout * 1000)
+            await response.finished()
+            ok = True
+        except Exception:
+            response = None
+            ok = False
+        self._record(name, started, ok)
+        return response
+
+    # 통계 (내부용)
+    def _record(self, name: str, started: float, ok: bool):
+        """대기 소요 시간 기록"""
+        elapsed = time.monotonic() - started
+        stats = self.wait_stats.setdefault(
+            name, {'count': 0, 'timeouts': 0, 'total': 0.0, 'max': 0.0}
+        )
+        stats['count'] += 1
+        stats['total'] += elapsed
+        stats['max'] = max(stats['max'], elapsed)
+        if not ok:
+            stats['timeouts'] += 1
+
+        if self.debug:
+            print(f"   [대기] {name}: {elapsed*1000:.0f}ms {'OK' if ok else '시간 초과'}")
+
+    def get_stats(self, name: str) -> Optional[Dict]:
+        """대기 이름별 통계 (평균 포함)"""
+        stats = self.wait_stats.get(name)
+        if not stats:
+            return None
+        return dict(stats, avg=stats['total'] / stats['count'])
+
+    def print_stats(self):
+        """대기별 지연 시간 통계 출력"""
+        if not self.wait_stats:
+            print("\n[통계] 대기 기록 없음")
+            return
+
+        print("\n" + "="*60)
+        print("[통계] 대기 지연 시간")
+        print("="*60)
+
+        for name, stats in sorted(self.wait_stats.items()):
+            avg_ms = stats['total'] / stats['count'] * 1000
+            print(f"{name:24s} | {stats['count']:4d}회 | 평균 {avg_ms:6.0f}ms | "
+                  f"최대 {stats['max']*1000:6.0f}ms | 시간 초과 {stats['timeouts']:3d}회")
+
+        print("="*60)
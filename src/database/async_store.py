@@ -0,0 +1,118 @@
+"""
+비동기 DB 접근 (Playwright 이벤트 루프를 막지 않도록 psycopg2 호출을 전용 스레드에서 실행)
+크롤러는 중복 체크/저장을 await 하거나 던져두기만 하고, 그동안 브라우저 작업(응답 처리, 타이머)은 계속 진행
+"""
+
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Set
+
+from src.database.db_connector import DatabaseConnector
+
+
+class AsyncProductStore:
+    """
+    DatabaseConnector 비동기 래퍼
+
+    - DB 호출은 스레드 1개짜리 executor에서만 실행 (psycopg2 연결을 한 스레드에 고정, 호출 순서 유지)
+    - 스냅샷으로 판정되는 중복 체크는 스레드 왕복 없이 바로 반환
+    - 매핑 저장처럼 결과가 필요 없는 쓰기는 submit()으로 던져두고 close() 때 완료 대기
+    - 상품 저장 배치는 BatchWriter(별도 연결)가 담당
+
+    사용 예:
+        store = AsyncProductStore(DatabaseConnector())
+        await store.connect()
+        if not await store.is_duplicate(product_id):
+            ...
+        store.submit(store.db.remember_product_id, listing_url, product_id)
+        await store.close()
+    """
+
+    def __init__(self, db: DatabaseConnector):
+        self.db = db
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='db-store')
+        self._pending: Set[asyncio.Future] = set()
+        self._closed = False
+
+        # 통계
+        self.calls = 0          # 스레드에서 실행한 DB 호출
+        self.local_hits = 0     # 스냅샷으로 바로 판정한 중복 체크
+        self.wait_seconds = 0.0  # await 한 DB 호출의 누적 대기 시간
+        self.errors = 0         # submit() 작업 실패
+
+    async def run(self, func: Callable, *args, **kwargs):
+        """DB 호출 1개를 전용 스레드에서 실행하고 결과 대기 (예외는 그대로 전달)"""
+        loop = asyncio.get_running_loop()
+        started = time.monotonic()
+        self.calls += 1
+        try:
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+        finally:
+            self.wait_seconds += time.monotonic() - started
+
+    def submit(self, func: Callable, *args, **kwargs) -> Optional[asyncio.Future]:
+        """결과를 기다리지 않는 DB 호출 (이벤트 루프 안에서 호출, 실패는 로그만)"""
+        if self._closed:
+            print("[DB] 비동기 저장소가 종료됨 - 요청 무시")
+            return None
+        loop = asyncio.get_running_loop()
+        self.calls += 1
+        future = loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+        self._pending.add(future)
+        future.add_done_callback(self._on_done)
+        return future
+
+    async def connect(self):
+        """DB 연결 (연결도 전용 스레드에서 생성)"""
+        await self.run(self.db.connect)
+
+    async def is_duplicate(self, product_id: str) -> bool:
+        """중복 체크 - 스냅샷으로 판정되면 바로 반환, 아니면 스레드에서 SELECT"""
+        known = self.db.check_known_locally(product_id)
+        if known is not None:
+            self.local_hits += 1
+            return known
+        return await self.run(self.db.is_duplicate_product, product_id, {})
+
+    async def drain(self):
+        """submit()으로 던진 작업이 모두 끝날 때까지 대기"""
+        while self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+
+    async def close(self):
+        """남은 작업 완료 → 연결 종료 → 스레드 종료 (여러 번 호출해도 안전)"""
+        if self._closed:
+            return
+        await self.drain()
+        self._closed = True
+        try:
+            if self.db.conn is not None:
+                await self.run(self.db.close)
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def _on_done(self, future: asyncio.Future):
+        self._pending.discard(future)
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.errors += 1
+            print(f"[DB] 백그라운드 DB 작업 실패: {str(error)[:80]}")
+
+    def get_stats(self) -> Dict:
+        return {
+            'calls': self.calls,
+            'local_hits': self.local_hits,
+            'wait_seconds': self.wait_seconds,
+            'errors': self.errors,
+        }
+
+    def print_stats(self):
+        """비동기 DB 접근 통계 출력"""
+        if not self.calls and not self.local_hits:
+            return
+        print(f"\n[통계] DB 스레드 호출 {self.calls}회 (대기 {self.wait_seconds:.2f}초) | "
+              f"스냅샷 즉시 판정 {self.local_hits}회 | 백그라운드 실패 {self.errors}회")
@@ -0,0 +1,210 @@
+"""
+백그라운드 일괄 DB 저장
+크롤링 루프는 큐에 넣기만 하고, 전용 스레드가 개수/시간 기준으로 모아 INSERT 1회 + 커밋 1회로 저장
+저장 결과(saved/skipped/failed)는 상품별로 _db_status에 다시 기록
+"""
+
+import asyncio
+import atexit
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.database.db_connector import DatabaseConnector
+
+# 큐 제어 신호
+_STOP = object()
+
+# upsert_products 결과 → _db_status (갱신은 저장, 내용이 같아 건너뛴 행은 중복과 같게 표시)
+DB_STATUS = {'saved': 'saved', 'updated': 'saved', 'unchanged': 'skipped', 'skipped': 'skipped', 'failed': 'error'}
+
+
+class BatchWriter:
+    """
+    크기 제한 큐 + 저장 스레드
+
+    - batch_size개가 모이거나 첫 상품이 들어온 뒤 flush_interval초가 지나면 저장
+    - 큐가 가득 차면 submit이 대기 (DB가 느려도 메모리가 무한히 늘지 않음)
+    - 이벤트 루프에서는 submit_async/flush_async/close_async 사용
+      (큐가 가득 차거나 저장을 기다려도 루프는 멈추지 않고 await로 대기)
+    - close() / 프로세스 종료(atexit) 시 남은 상품 모두 저장
+    - DB 연결은 저장 스레드 전용 (크롤러 연결과 트랜잭션이 섞이지 않음)
+
+    사용 예:
+        writer = BatchWriter(on_result=callback)
+        writer.start()
+        writer.submit('여성의류', product_data)   # _db_status = 'pending'
+        writer.close()
+    """
+
+    def __init__(self,
+                 db_factory: Callable[[], DatabaseConnector] = DatabaseConnector,
+                 batch_size: int = 50,
+                 flush_interval: float = 2.0,
+                 max_queue: int = 1000,
+                 skip_duplicates: bool = True,
+                 on_result: Optional[Callable[[Dict, str], None]] = None):
+        self.db_factory = db_factory
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.skip_duplicates = skip_duplicates
+        self.on_result = on_result  # (product_data, upsert_products 결과) - 저장 스레드에서 호출
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._db: Optional[DatabaseConnector] = None
+        self._closed = False
+
+        # 통계
+        self.stats = {'saved': 0, 'skipped': 0, 'failed': 0}  # 'updated'/'unchanged'는 나올 때 추가
+        self.flush_count = 0
+        self.flush_seconds = 0.0
+        self.backpressure_waits = 0  # 큐가 가득 차서 submit_async가 await한 횟수
+
+    def start(self):
+        """DB 연결 + 저장 스레드 시작 (연결 실패 시 예외)"""
+        self._db = self.db_factory()
+        self._db.connect()
+        self._thread = threading.Thread(target=self._run, name='db-batch-writer', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)  # 크래시/강제 종료 시에도 남은 상품 저장
+
+    def submit(self, category_name: str, product_data: Dict):
+        """저장 요청 (결과는 나중에 product_data['_db_status']에 기록)"""
+        if self._closed or self._thread is None:
+            product_data['_db_status'] = 'error'
+            print("[DB] 저장 스레드가 종료됨 - 저장 실패")
+            return
+        product_data['_db_status'] = 'pending'
+        self._queue.put((category_name, product_data))
+
+    async def submit_async(self, category_name: str, product_data: Dict):
+        """
+        이벤트 루프용 저장 요청
+
+        큐에 자리가 있으면 바로 넣고 반환, 가득 찼으면 자리가 날 때까지 await
+        (대기는 기본 executor 스레드에서 → 다른 페이지/핸들러는 계속 실행)
+        """
+        if self._closed or self._thread is None:
+            self.submit(category_name, product_data)  # 실패 처리는 동기 submit과 동일
+            return
+        product_data['_db_status'] = 'pending'
+        item = (category_name, product_data)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.backpressure_waits += 1
+            await asyncio.get_running_loop().run_in_executor(None, self._queue.put, item)
+
+    async def flush_async(self, timeout: float = 30.0) -> bool:
+        """flush()를 이벤트 루프 밖에서 기다림"""
+        return await asyncio.get_running_loop().run_in_executor(None, self.flush, timeout)
+
+    async def close_async(self, timeout: float = 60.0):
+        """close()를 이벤트 루프 밖에서 기다림"""
+        await asyncio.get_running_loop().run_in_executor(None, self.close, timeout)
+
+    def flush(self, timeout: float = 30.0) -> bool:
+        """지금까지 넣은 상품이 모두 저장될 때까지 대기"""
+        if self._closed or self._thread is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 60.0):
+        """남은 상품 저장 후 스레드/연결 종료 (여러 번 호출해도 안전)"""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            atexit.unregister(self.close)
+        except Exception:
+            pass
+
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                print(f"[DB] 저장 스레드 종료 대기 시간 초과 - 미저장 {self._queue.qsize()}개")
+
+        if self._db is not None:
+            try:
+                self._db.close()
+            except Exception:
+                pass
+
+    @property
+    def pending(self) -> int:
+        """큐에서 대기 중인 상품 수 (대략)"""
+        return self._queue.qsize()
+
+    # 저장 스레드 (내부용)
+    def _run(self):
+        batch: List[Tuple[str, Dict]] = []
+        deadline = 0.0
+
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if batch else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None  # 시간 기준 flush
+
+            if item is _STOP:
+                self._flush(batch)
+                return
+
+            if isinstance(item, threading.Event):
+                self._flush(batch)
+                batch = []
+                item.set()
+                continue
+
+            if item is not None:
+                if not batch:
+                    deadline = time.monotonic() + self.flush_interval
+                batch.append(item)
+                if len(batch) < self.batch_size:
+                    continue
+
+            self._flush(batch)
+            batch = []
+
+    def _flush(self, batch: List[Tuple[str, Dict]]):
+        """배치 1개 저장 + 상품별 결과 기록"""
+        if not batch:
+            return
+
+        started = time.monotonic()
+        try:
+            results = self._db.upsert_products(batch, skip_duplicates=self.skip_duplicates)
+        except Exception as e:
+            print(f"[DB] 일괄 저장 오류: {e}")
+            results = ['failed'] * len(batch)
+        self.flush_count += 1
+        self.flush_seconds += time.monotonic() - started
+
+        for (_, product_data), result in zip(batch, results):
+            result = result or 'failed'
+            self.stats[result] = self.stats.get(result, 0) + 1
+            product_data['_db_status'] = DB_STATUS.get(result, 'error')
+            if self.on_result:
+                try:
+                    self.on_result(product_data, result)
+                except Exception as e:
+                    print(f"[DB] 저장 결과 처리 오류: {e}")
+
+    def print_stats(self):
+        """일괄 저장 통계 출력"""
+        if not self.flush_count:
+            return
+        rows = sum(self.stats.values())
+        avg_ms = self.flush_seconds / self.flush_count * 1000
+        print(f"\n[통계] 일괄 저장 {self.flush_count}회 (평균 {rows / self.flush_count:.1f}개, {avg_ms:.0f}ms) | "
+              f"저장 {self.stats['saved']} / 갱신 {self.stats.get('updated', 0)} / "
+              f"변경 없음 {self.stats.get('unchanged', 0)} / "
+              f"중복 {self.stats['skipped']} / 실패 {self.stats['failed']} | "
+              f"큐 대기 {self.backpressure_waits}회 | "
+              f"가격/리뷰 이력 {getattr(self._db, 'snapshot_count', 0)}행")
@@ -0,0 +1,308 @@
+"""
+대량 적재 (COPY → 스테이징 테이블 → products 병합 1회)
+분리 구조(product_info + product_metrics)면 두 테이블에 한 문장으로 병합
+백필, data/*.json 가져오기처럼 한 번에 수천~수만 개를 넣을 때 사용
+행 단위 UPSERT 대신 COPY로 스테이징에 넣고 INSERT ... SELECT 1회로 병합
+"""
+
+import glob
+import io
+import json
+import os
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.database.db_connector import DatabaseConnector, SNAPSHOT_INSERT_SQL
+
+# 스테이징 컬럼 타입 (products와 같은 순서, 제약 조건 없음 → 잘못된 행은 병합 단계에서 걸러냄)
+STAGING_COLUMN_TYPES = {
+    'product_id': 'VARCHAR(255)',
+    'category_name': 'VARCHAR(100)',
+    'product_name': 'TEXT',
+    'brand_name': 'VARCHAR(100)',
+    'price': 'INTEGER',
+    'discount_rate': 'INTEGER',
+    'review_count': 'INTEGER',
+    'rating': 'DECIMAL(2,1)',
+    'search_tags': 'TEXT[]',
+    'product_url': 'TEXT',
+    'thumbnail_url': 'TEXT',
+    'content_hash': 'VARCHAR(32)',
+}
+
+
+def _copy_text(value) -> str:
+    """COPY text 형식 필드 1개 (NULL = \\N, 역슬래시/탭/줄바꿈 이스케이프)"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, (list, tuple)):
+        value = _pg_array(value)
+    text = str(value)
+    return (text.replace('\\', '\\\\').replace('\t', '\\t')
+                .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+def _pg_array(items: Iterable) -> str:
+    """파이썬 리스트 → PostgreSQL 배열 리터럴 ({"a","b"})"""
+    quoted = []
+    for item in items:
+        if item is None:
+            quoted.append('NULL')
+        else:
+            quoted.append('"' + str(item).replace('\\', '\\\\').replace('"', '\\"') + '"')
+    return '{' + ','.join(quoted) + '}'
+
+
+class BulkLoader:
+    """
+    COPY 기반 대량 적재
+
+    - 스테이징: UNLOGGED 테이블 (WAL 기록 없음) - 프로세스별 이름으로 만들고 적재 후 삭제
+    - 병합: INSERT INTO products SELECT ... FROM 스테이징 ON CONFLICT 1회
+    - 상품 ID/상품명이 없는 행은 병합하지 않음 ('failed'로 집계)
+    - content_hash 컬럼이 있으면 갱신 모드에서 해시가 다른 행만 갱신 ('updated' / 'unchanged' 구분)
+    - 분리 구조면 product_info(해시 비교) / product_metrics(값 비교)를 각각 병합 - 가격만 바뀐 상품은 'updated'
+    - product_snapshots 테이블이 있으면 가격/리뷰가 마지막 이력과 다른 상품만 이력 추가 (스테이징에서 INSERT 1회)
+
+    사용 예:
+        db = DatabaseConnector()
+        db.connect()
+        loader = BulkLoader(db)
+        result = loader.load('여성의류', products)
+        result = loader.import_json_files(['data/womens_products_20251101.json'])
+    """
+
+    def __init__(self, db: DatabaseConnector, chunk_size: int = 50000):
+        self.db = db
+        self.chunk_size = chunk_size  # COPY 1회당 행 수
+        self.staging_table = f"products_staging_{os.getpid()}"
+
+    def load(self, category_name: Optional[str], products: List[Dict],
+             skip_duplicates: bool = True) -> Dict:
+        """
+        상품 목록 적재
+
+        Args:
+            category_name: 카테고리 이름 (None이면 상품 데이터의 category_name/category 사용)
+            products: 상품 데이터 (SimpleCrawler 형식 또는 detail_page_info 형식)
+            skip_duplicates: True면 이미 있는 상품 유지, False면 최신 값으로 갱신
+
+        Returns:
+            dict: {'saved', 'updated', 'unchanged', 'skipped', 'failed', 'snapshots', 'rows', 'seconds', 'rows_per_sec'}
+        """
+        started = time.monotonic()
+        split = self.db.has_metrics_split()
+        hashed = split or self.db.has_content_hash()
+        snapshots = self.db.has_snapshots()
+        columns = DatabaseConnector.PRODUCT_COLUMNS + (('content_hash',) if hashed else ())
+        rows, converted = self._build_rows(category_name, products, hashed)
+        failed = len(products) - converted  # 변환 실패
+        repeated = converted - len(rows)  # 같은 목록 안 중복 상품 (마지막 값만 적재)
+
+        cursor = self.db.conn.cursor()
+        copy_failed = False
+        try:
+            self._create_staging(cursor, columns)
+            for start in range(0, len(rows), self.chunk_size):
+                buffer = io.StringIO()
+                for row in rows[start:start + self.chunk_size]:
+                    buffer.write('\t'.join(_copy_text(v) for v in row) + '\n')
+                buffer.seek(0)
+                cursor.copy_expert(
+                    f"COPY {self.staging_table} ({', '.join(columns)}) "
+                    f"FROM STDIN WITH (FORMAT text)",
+                    buffer
+                )
+
+            cursor.execute(
+                f"SELECT COUNT(*) FROM {self.staging_table} "
+                f"WHERE product_id IS NULL OR product_name IS NULL"
+            )
+            invalid = cursor.fetchone()[0]
+
+            if split:
+                cursor.execute(self._merge_split_sql(skip_duplicates))
+            else:
+                cursor.execute(self._merge_sql(skip_duplicates, hashed))
+            if hashed:
+                inserted, updated = cursor.fetchone()  # 신규 / 해시가 달라 갱신
+            else:
+                inserted, updated = cursor.rowcount, 0
+
+            snapshot_rows = self._record_snapshots(cursor) if snapshots else 0
+            cursor.execute(f"DROP TABLE IF EXISTS {self.staging_table}")
+            self.db.conn.commit()
+        except Exception as e:
+            self.db.conn.rollback()
+            print(f"[대량 적재] COPY 실패: {e} - 일괄 UPSERT로 대체")
+            copy_failed = True
+        finally:
+            cursor.close()
+
+        if copy_failed:
+            return self._fallback(category_name, products, skip_duplicates, started)
+
+        if self.db.known_ids is not None:
+            self.db.known_ids.update(row[0] for row in rows if row[0])
+
+        valid = len(rows) - invalid
+        untouched = valid - inserted - updated  # DO NOTHING 또는 해시가 같아 건너뜀
+        unchanged = 0 if skip_duplicates else untouched
+        result = {
+            'saved': inserted,
+            'updated': updated,
+            'unchanged': unchanged,
+            'skipped': untouched - unchanged + repeated,
+            'failed': failed + invalid,
+            'snapshots': snapshot_rows,
+            'rows': len(products),
+        }
+        return self._finish(result, started)
+
+    def import_json_files(self, paths: Iterable[str], category_name: Optional[str] = None,
+                          skip_duplicates: bool = True) -> Dict:
+        """
+        save_to_json 결과 파일 가져오기 ({'category', 'products': [...]} 또는 상품 배열)
+
+        Args:
+            paths: 파일 경로 또는 glob 패턴 (예: 'data/*.json')
+            category_name: 지정하면 파일의 category 대신 사용
+        """
+        files = []
+        for path in paths:
+            files.extend(sorted(glob.glob(path)) if any(c in path for c in '*?[') else [path])
+
+        totals = {'saved': 0, 'updated': 0, 'unchanged': 0, 'skipped': 0, 'failed': 0, 'snapshots': 0,
+                  'rows': 0, 'seconds': 0.0, 'files': 0}
+        for path in files:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except Exception as e:
+                print(f"[대량 적재] {path} 읽기 실패: {e}")
+                continue
+
+            if isinstance(data, dict):
+                products = data.get('products', [])
+                file_category = category_name or data.get('category')
+            else:
+                products = data
+                file_category = category_name
+
+            print(f"[대량 적재] {path} - {len(products)}개 ({file_category or '상품별 카테고리'})")
+            result = self.load(file_category, products, skip_duplicates)
+            for key in ('saved', 'updated', 'unchanged', 'skipped', 'failed', 'snapshots', 'rows', 'seconds'):
+                totals[key] += result[key]
+            totals['files'] += 1
+
+        totals['rows_per_sec'] = totals['rows'] / totals['seconds'] if totals['seconds'] else 0.0
+        return totals
+
+    # 내부용
+    def _build_rows(self, category_name: Optional[str], products: List[Dict],
+                    hashed: bool = False) -> Tuple[List[tuple], int]:
+        """상품 → 행 (같은 상품 ID는 마지막 값 사용, hashed면 content_hash 추가) + 변환 성공 개수"""
+        rows: Dict[str, tuple] = {}
+        converted = 0
+        for product in products:
+            try:
+                category = category_name or product.get('category_name') or product.get('category')
+                row = self.db._product_row(category, product)
+                if hashed:
+                    row = row + (self.db.row_hash(row),)
+            except Exception as e:
+                print(f"[대량 적재] 상품 데이터 변환 실패: {e}")
+                continue
+            rows[row[0]] = row
+            converted += 1
+        return list(rows.values()), converted
+
+    def _create_staging(self, cursor, columns: Tuple[str, ...]):
+        definitions = ',\n'.join(f"{name} {STAGING_COLUMN_TYPES[name]}" for name in columns)
+        cursor.execute(f"DROP TABLE IF EXISTS {self.staging_table}")
+        cursor.execute(f"CREATE UNLOGGED TABLE {self.staging_table} (\n{definitions}\n)")
+
+    def _merge_sql(self, skip_duplicates: bool, hashed: bool = False) -> str:
+        """스테이징 → products 병합 (hashed면 신규/갱신 개수를 1행으로 반환)"""
+        columns, conflict = self.db._upsert_clause(skip_duplicates, hashed)
+        merge = f"""
+            INSERT INTO products ({columns}, crawled_at, updated_at)
+            SELECT {columns}, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+            FROM {self.staging_table}
+            WHERE product_id IS NOT NULL AND product_name IS NOT NULL
+            ON CONFLICT (product_id) {conflict}
+        """
+        if not hashed:
+            return merge
+        return f"""
+            WITH merged AS ({merge} RETURNING (xmax = 0) AS inserted)
+            SELECT COUNT(*) FILTER (WHERE inserted), COUNT(*) FILTER (WHERE NOT inserted)
+            FROM merged
+        """
+
+    def _merge_split_sql(self, skip_duplicates: bool) -> str:
+        """
+        스테이징 → product_info + product_metrics 병합 (한 문장, 신규/갱신 개수를 1행으로 반환)
+
+        갱신 = product_info가 갱신됐거나 product_metrics 값이 바뀐 기존 상품
+        (product_metrics의 FK 검사는 문장 끝에 실행되므로 같은 문장에서 추가한 product_info 행을 참조 가능)
+        """
+        info_sql, metrics_sql = self.db._split_upsert_sql(
+            skip_duplicates,
+            source=f"""SELECT {{columns}}, {{timestamps}}
+            FROM {self.staging_table}
+            WHERE product_id IS NOT NULL AND product_name IS NOT NULL"""
+        )
+        return f"""
+            WITH info AS ({info_sql}),
+            metrics AS ({metrics_sql})
+            SELECT
+                (SELECT COUNT(*) FROM info WHERE inserted),
+                (SELECT COUNT(*) FROM (
+                    SELECT product_id FROM info WHERE NOT inserted
+                    UNION SELECT product_id FROM metrics
+                    EXCEPT SELECT product_id FROM info WHERE inserted
+                ) changed)
+        """
+
+    def _record_snapshots(self, cursor) -> int:
+        """스테이징 → product_snapshots (추적 값이 바뀐 상품만, 실패해도 상품 병합은 유지)"""
+        source = f"""(
+            SELECT product_id, price, discount_rate::smallint AS discount_rate, review_count,
+                   (rating * 10)::smallint AS rating_x10
+            FROM {self.staging_table}
+            WHERE product_id IS NOT NULL AND product_name IS NOT NULL
+              AND NOT (price IS NULL AND discount_rate IS NULL
+                       AND COALESCE(review_count, 0) = 0 AND rating IS NULL)
+        ) AS v"""
+        cursor.execute("SAVEPOINT product_snapshots")
+        try:
+            cursor.execute(SNAPSHOT_INSERT_SQL.format(source=source))
+            inserted = cursor.rowcount
+            cursor.execute("RELEASE SAVEPOINT product_snapshots")
+        except Exception as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT product_snapshots")
+            print(f"[대량 적재] 가격/리뷰 이력 저장 실패: {e}")
+            return 0
+        self.db.snapshot_count += inserted
+        return inserted
+
+    def _fallback(self, category_name, products, skip_duplicates, started) -> Dict:
+        """COPY 실패 시 (타입이 맞지 않는 행 등) execute_values 일괄 UPSERT로 적재"""
+        result = {'saved': 0, 'updated': 0, 'unchanged': 0, 'skipped': 0, 'failed': 0, 'rows': len(products)}
+        snapshots_before = self.db.snapshot_count
+        items = [(category_name or p.get('category_name') or p.get('category'), p) for p in products]
+        for status in self.db.upsert_products(items, skip_duplicates):
+            result[status or 'failed'] += 1
+        result['snapshots'] = self.db.snapshot_count - snapshots_before
+        return self._finish(result, started)
+
+    @staticmethod
+    def _finish(result: Dict, started: float) -> Dict:
+        seconds = time.monotonic() - started
+        result['seconds'] = seconds
+        result['rows_per_sec'] = result['rows'] / seconds if seconds else 0.0
+        print(f"[대량 적재] 저장 {result['saved']}개 | 갱신 {result['updated']}개 | 변경 없음 {result['unchanged']}개 "
+              f"| 스킵 {result['skipped']}개 | 실패 {result['failed']}개 | 이력 {result['snapshots']}행 "
+              f"| {seconds:.2f}초 ({result['rows_per_sec']:,.0f}행/초)")
+        return result
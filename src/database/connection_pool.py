@@ -0,0 +1,219 @@
+"""
+PostgreSQL 연결 풀 (프로세스당 1개)
+크롤러 DB 스레드, 일괄 저장 스레드, save_to_database 호출이 연결을 새로 열지 않고 재사용
+오래 쉬던 연결은 꺼낼 때 상태 확인, 끊긴 연결은 버리고 새로 연결
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+
+import psycopg2
+
+
+class PoolTimeout(Exception):
+    """acquire_timeout 안에 빈 연결을 얻지 못함"""
+
+
+class ConnectionPool:
+    """
+    스레드 안전 연결 풀
+
+    - 연결 1개는 한 번에 한 스레드만 사용 (acquire → 사용 → release)
+    - max_size: 동시에 열 수 있는 연결 상한 (reserve()로 사용 스레드 수에 맞춰 늘림)
+    - health_check_interval초 이상 쉬던 연결은 꺼낼 때 SELECT 1 확인, 실패하면 버리고 새로 연결
+    - 반납 시 끝나지 않은 트랜잭션은 롤백, 끊긴 연결은 닫고 버림
+
+    사용 예:
+        pool = get_pool(host='localhost', port='5432', dbname='naver', user='postgres', password='...')
+        conn = pool.acquire()
+        try:
+            ...
+        finally:
+            pool.release(conn)
+    """
+
+    def __init__(self,
+                 connect_factory: Callable[[], object],
+                 max_size: int = 2,
+                 max_connections: int = 8,
+                 spare_connections: int = 1,
+                 health_check_interval: float = 30.0,
+                 acquire_timeout: float = 10.0):
+        self.connect_factory = connect_factory
+        self.max_connections = max(1, max_connections)  # reserve()로도 넘지 않는 상한
+        self.max_size = min(max(1, max_size), self.max_connections)
+        self.spare_connections = spare_connections
+        self.health_check_interval = health_check_interval
+        self.acquire_timeout = acquire_timeout
+        self.pid = os.getpid()  # fork된 자식 프로세스는 부모 연결을 쓰지 않음 (get_pool이 새로 생성)
+
+        self._idle: List[Tuple[object, float]] = []  # (연결, 반납 시각)
+        self._in_use = 0
+        self._cond = threading.Condition()
+
+        # 통계
+        self.stats = {
+            'created': 0,           # 새로 연 연결
+            'closed': 0,            # 닫고 버린 연결 (끊김/상태 확인 실패 포함)
+            'reused': 0,            # 풀에서 재사용한 횟수
+            'waits': 0,             # 빈 연결이 없어 대기한 횟수
+            'health_check_failures': 0,
+            'reconnects': 0,        # 사용 중 끊겨 다시 연결한 횟수 (DatabaseConnector.reconnect)
+        }
+
+    def reserve(self, db_threads: int) -> int:
+        """DB를 쓰는 스레드 수에 맞춰 상한 조정 (스레드 수 + 여유, max_connections 이내, 줄이지는 않음)"""
+        with self._cond:
+            wanted = min(db_threads + self.spare_connections, self.max_connections)
+            if wanted > self.max_size:
+                self.max_size = wanted
+                self._cond.notify_all()
+            return self.max_size
+
+    def acquire(self):
+        """연결 1개 꺼내기 (쉬는 연결 재사용 → 상한 미만이면 새로 연결 → 아니면 반납 대기)"""
+        deadline = time.monotonic() + self.acquire_timeout
+        with self._cond:
+            while True:
+                while self._idle:
+                    conn, released_at = self._idle.pop()
+                    if self._healthy(conn, released_at):
+                        self._in_use += 1
+                        self.stats['reused'] += 1
+                        return conn
+                    self._discard(conn)
+
+                if self._in_use < self.max_size:
+                    self._in_use += 1  # 연결 생성 중에도 자리 확보 (다른 스레드가 상한을 넘지 않도록)
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolTimeout(
+                        f"DB 연결 풀 대기 시간 초과 ({self.acquire_timeout}초, 사용 중 {self._in_use}/{self.max_size})"
+                    )
+                self.stats['waits'] += 1
+                self._cond.wait(remaining)
+
+        try:
+            conn = self.connect_factory()
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self.stats['created'] += 1
+        return conn
+
+    def release(self, conn, discard: bool = False):
+        """연결 반납 (discard=True 또는 끊긴 연결이면 닫고 버림)"""
+        if conn is None:
+            return
+        if not discard and not getattr(conn, 'closed', 0):
+            try:
+                conn.rollback()  # 끝나지 않은 트랜잭션 정리 (진행 중이 아니면 아무것도 안 함)
+                if getattr(conn, 'autocommit', False):
+                    conn.autocommit = False  # 마이그레이션 스크립트 등이 바꾼 설정 원복
+            except Exception:
+                discard = True
+        else:
+            discard = True
+
+        with self._cond:
+            self._in_use = max(0, self._in_use - 1)
+            if discard or self.pid != os.getpid():
+                self._discard(conn)
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    def record_reconnect(self):
+        with self._cond:
+            self.stats['reconnects'] += 1
+
+    def close_all(self):
+        """쉬는 연결 모두 닫기 (사용 중인 연결은 반납 시 닫힘)"""
+        with self._cond:
+            while self._idle:
+                conn, _ = self._idle.pop()
+                self._discard(conn)
+
+    def _healthy(self, conn, released_at: float) -> bool:
+        if getattr(conn, 'closed', 0):
+            return False
+        if time.monotonic() - released_at < self.health_check_interval:
+            return True
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+            finally:
+                cursor.close()
+            conn.rollback()
+            return True
+        except Exception:
+            self.stats['health_check_failures'] += 1
+            return False
+
+    def _discard(self, conn):
+        self.stats['closed'] += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def get_stats(self) -> Dict:
+        """연결 수 + 재연결 등 누적 통계"""
+        with self._cond:
+            stats = dict(self.stats)
+            stats.update({
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'open': self._in_use + len(self._idle),
+                'max_size': self.max_size,
+            })
+        return stats
+
+    def print_stats(self):
+        """연결 풀 통계 출력"""
+        stats = self.get_stats()
+        if not stats['created']:
+            return
+        print(f"\n[통계] DB 연결 풀: 열림 {stats['open']}/{stats['max_size']} (사용 중 {stats['in_use']}) | "
+              f"생성 {stats['created']} / 재사용 {stats['reused']} / 대기 {stats['waits']} | "
+              f"재연결 {stats['reconnects']} / 상태 확인 실패 {stats['health_check_failures']}")
+
+
+# 프로세스 전역 풀 (접속 정보별 1개)
+_pools: Dict[tuple, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(**connect_kwargs) -> ConnectionPool:
+    """
+    접속 정보별 공유 풀 (CRAWL_CONFIG['db_pool'] 설정)
+
+    Args:
+        connect_kwargs: psycopg2.connect 인자 (host, port, dbname, user, password)
+    """
+    key = tuple(sorted(connect_kwargs.items()))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool.pid != os.getpid():
+            from src.utils.config import CRAWL_CONFIG  # config는 DB_PASSWORD 검증 포함 → 실제 연결 시점에 로드
+            config = CRAWL_CONFIG.get('db_pool', {})
+            pool = ConnectionPool(
+                lambda: psycopg2.connect(**connect_kwargs),
+                max_size=1 + config.get('spare_connections', 1),
+                max_connections=config.get('max_connections', 8),
+                spare_connections=config.get('spare_connections', 1),
+                health_check_interval=config.get('health_check_interval', 30.0),
+                acquire_timeout=config.get('acquire_timeout', 10.0),
+            )
+            _pools[key] = pool
+        return pool
+
@@ -1,23 +1,84 @@
 """
 PostgreSQL 데이터베이스 연결 및 저장 모듈
 """
+import functools
+import hashlib
+import json
 import os
 import re
-from datetime import datetime
-from typing import List, Dict, Optional
+from datetime import date, datetime
+from typing import List, Dict, Optional, Set, Tuple
+from urllib.parse import urlsplit
 import psycopg2
 from psycopg2.extras import execute_values
 from dotenv import load_dotenv
 
+from src.database.connection_pool import ConnectionPool, get_pool
+
 # 환경변수 로드
 load_dotenv()
 
 
+def _reconnecting(method):
+    """연결이 끊겨 실패하면 재연결 후 1회 다시 실행 (실패한 배치/조회를 그대로 재시도)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        except Exception as e:
+            if not self._connection_lost(e) or not self.reconnect(e):
+                raise
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def content_hash(row: tuple) -> str:
+    """
+    변경 감지 해시 (product_id를 뺀 나머지 컬럼, md5 hex 32자)
+
+    Args:
+        row: _product_row 결과 (PRODUCT_COLUMNS 순서)
+    """
+    payload = json.dumps(list(row[1:]), ensure_ascii=False, default=str, separators=(',', ':'))
+    return hashlib.md5(payload.encode('utf-8')).hexdigest()
+
+
+# 가격/리뷰 이력 추가 - 상품별 마지막 이력과 추적 값이 다를 때만 1행 (source: v(product_id, price, discount_rate, review_count, rating_x10))
+SNAPSHOT_INSERT_SQL = """
+    INSERT INTO product_snapshots (product_id, price, discount_rate, review_count, rating_x10)
+    SELECT v.product_id, v.price, v.discount_rate, v.review_count, v.rating_x10
+    FROM {source}
+    LEFT JOIN LATERAL (
+        SELECT s.price, s.discount_rate, s.review_count, s.rating_x10
+        FROM product_snapshots s
+        WHERE s.product_id = v.product_id
+        ORDER BY s.captured_at DESC
+        LIMIT 1
+    ) last ON TRUE
+    WHERE last IS NULL
+       OR (last.price, last.discount_rate, last.review_count, last.rating_x10)
+          IS DISTINCT FROM (v.price, v.discount_rate, v.review_count, v.rating_x10)
+    RETURNING product_id
+"""
+
+
+def snapshot_partition(month: date) -> Tuple[str, date, date]:
+    """월별 파티션 (이름, 시작일, 다음 달 시작일) - 예: product_snapshots_202611"""
+    start = month.replace(day=1)
+    end = date(start.year + start.month // 12, start.month % 12 + 1, 1)
+    return f"product_snapshots_{start:%Y%m}", start, end
+
+
 class DatabaseConnector:
     """PostgreSQL 데이터베이스 연결 및 작업 클래스"""
 
-    def __init__(self):
-        """DB 연결 설정 초기화"""
+    def __init__(self, pool: Optional[ConnectionPool] = None):
+        """
+        DB 연결 설정 초기화
+
+        Args:
+            pool: 연결 풀 (None이면 접속 정보별 프로세스 공유 풀 사용)
+        """
         self.host = os.getenv('DB_HOST', 'localhost')
         self.port = os.getenv('DB_PORT', '5432')
         self.dbname = os.getenv('DB_NAME', 'naver')
@@ -33,17 +94,36 @@ class DatabaseConnector:
             )
 
         self.conn = None
+        self.pool = pool
+        self.reconnects = 0  # 이 커넥터에서 끊긴 연결을 다시 연결한 횟수
+
+        # 중복 체크 스냅샷 (load_known_product_ids 이후 카드마다 SELECT 대신 로컬 조회)
+        self.known_ids: Optional[Set[str]] = None
+        self.known_ids_scope: Optional[str] = None  # None = 전체 상품, 카테고리 이름 = 해당 카테고리만
+        self.duplicate_queries = 0  # 스냅샷으로 판정하지 못해 DB에 물어본 횟수
+
+        # 리스트 키(nvMid 등) → 상품 ID 매핑 캐시 (product_id_map 테이블, load_product_id_map으로 로드)
+        self.id_map: Dict[str, str] = {}
+        self.id_map_enabled = True  # 테이블이 없으면 False (migrate_add_product_id_map.py 실행 필요)
+
+        # products.content_hash 컬럼 여부 (None = 아직 확인 안 함, False면 migrate_add_content_hash.py 실행 필요)
+        self.content_hash_enabled: Optional[bool] = None
+
+        # product_info + product_metrics 분리 구조 여부 (None = 아직 확인 안 함, products는 호환 뷰)
+        self.metrics_split_enabled: Optional[bool] = None
+
+        # product_snapshots 테이블 여부 (None = 아직 확인 안 함, False면 migrate_add_product_snapshots.py 실행 필요)
+        self.snapshots_enabled: Optional[bool] = None
+        self.snapshot_partitions: Set[str] = set()  # 확인/생성한 월별 파티션 이름
+        self.snapshot_count = 0  # 추가한 이력 행 수
 
     def connect(self):
-        """데이터베이스 연결"""
+        """데이터베이스 연결 (풀에서 꺼냄 - 쉬는 연결이 있으면 재사용)"""
+        if self.pool is None:
+            self.pool = get_pool(host=self.host, port=self.port, dbname=self.dbname,
+                                 user=self.user, password=self.password)
         try:
-            self.conn = psycopg2.connect(
-                host=self.host,
-                port=self.port,
-                dbname=self.dbname,
-                user=self.user,
-                password=self.password
-            )
+            self.conn = self.pool.acquire()
             print(f"[DB] 연결 성공: {self.dbname}@{self.host}")
             return self.conn
         except Exception as e:
@@ -51,11 +131,61 @@ class DatabaseConnector:
             raise
 
     def close(self):
-        """데이터베이스 연결 종료"""
+        """데이터베이스 연결 종료 (풀에 반납)"""
         if self.conn:
-            self.conn.close()
+            if self.pool is not None:
+                self.pool.release(self.conn)
+            else:
+                self.conn.close()
+            self.conn = None
             print("[DB] 연결 종료")
 
+    def reserve_connections(self, db_threads: int) -> int:
+        """DB를 쓰는 스레드 수에 맞춰 풀 상한 조정 (connect 전에 호출)"""
+        if self.pool is None:
+            self.pool = get_pool(host=self.host, port=self.port, dbname=self.dbname,
+                                 user=self.user, password=self.password)
+        return self.pool.reserve(db_threads)
+
+    def _connection_lost(self, error: Exception, cursor=None) -> bool:
+        """
+        연결 자체가 끊긴 오류인지 (쿼리 오류/타임아웃은 재연결하지 않음)
+
+        Args:
+            cursor: 실패한 커서 - 주면 self.conn 대신 커서의 연결을 확인
+                    (중간에 다른 메서드가 재연결해서 self.conn이 이미 새 연결일 수 있음)
+        """
+        if not isinstance(error, (psycopg2.OperationalError, psycopg2.InterfaceError)):
+            return False
+        conn = getattr(cursor, 'connection', None) if cursor is not None else self.conn
+        return conn is None or bool(getattr(conn, 'closed', 0))
+
+    def reconnect(self, error: Optional[Exception] = None) -> bool:
+        """
+        끊긴 연결을 버리고 새 연결로 교체
+
+        Returns:
+            bool: 재연결 성공 여부
+        """
+        reason = str(error).strip().splitlines()[0][:80] if error else '연결 끊김'
+        if self.pool is not None:
+            self.pool.release(self.conn, discard=True)
+        self.conn = None
+
+        try:
+            if self.pool is None:
+                self.pool = get_pool(host=self.host, port=self.port, dbname=self.dbname,
+                                     user=self.user, password=self.password)
+            self.conn = self.pool.acquire()
+        except Exception as e:
+            print(f"[DB] 재연결 실패 ({reason}): {e}")
+            return False
+
+        self.reconnects += 1
+        self.pool.record_reconnect()
+        print(f"[DB] 연결 끊김 ({reason}) → 재연결 성공")
+        return True
+
     def validate_category(self, category_name: str) -> bool:
         """
         카테고리가 DB에 존재하는지 확인
@@ -103,9 +233,162 @@ class DatabaseConnector:
         if match:
             return match.group(1)
 
-        # 패턴 매칭 실패 시 URL 전체를 해시
-        return str(abs(hash(product_url)))
+        # 매핑 캐시 (상세 페이지에서 확인된 리스트 키 → 상품 ID)
+        mapped = self.id_map.get(self.listing_key(product_url))
+        if mapped:
+            return mapped
+
+        # 패턴 매칭 실패 시 리스트 키를 해시 (프로세스마다 바뀌는 hash() 대신 고정 해시)
+        digest = hashlib.sha1(self.listing_key(product_url).encode('utf-8')).hexdigest()
+        return str(int(digest[:15], 16))
+
+    @staticmethod
+    def listing_key(product_url: str) -> str:
+        """
+        리스트 href → 매핑 키
+
+        - nvMid= 파라미터가 있으면 nvMid (카탈로그/광고 리다이렉트 URL)
+        - 없으면 쿼리/프래그먼트를 뗀 URL (추적 파라미터가 달라도 같은 키)
+        """
+        match = re.search(r'[?&]nvMid=(\d+)', product_url or '')
+        if match:
+            return match.group(1)
+        parts = urlsplit(product_url or '')
+        return f"{parts.netloc}{parts.path}" if parts.netloc else (product_url or '')
+
+    def load_product_id_map(self, itersize: int = 20000) -> int:
+        """
+        product_id_map 테이블 전체를 캐시로 로드 (세션 시작 시 1회, 서버 사이드 커서)
+
+        Returns:
+            int: 로드한 매핑 개수 (테이블이 없으면 0 + 매핑 기능 끔)
+        """
+        cursor = self.conn.cursor(name='product_id_map')
+        cursor.itersize = itersize
+
+        try:
+            cursor.execute("SELECT listing_key, product_id FROM product_id_map")
+            for listing_key, product_id in cursor:
+                self.id_map[listing_key] = product_id
+        except Exception as e:
+            print(f"[DB] 상품 ID 매핑 로드 실패: {e}")
+            print("     → database/migrate_add_product_id_map.py 실행 필요 (매핑 없이 진행)")
+            cursor.close()
+            self.conn.rollback()
+            self.id_map_enabled = False
+            return 0
+
+        cursor.close()
+        self.conn.commit()
+        print(f"[DB] 상품 ID 매핑: {len(self.id_map):,}개 로드")
+        return len(self.id_map)
+
+    @_reconnecting
+    def remember_product_id(self, listing_url: str, product_id: str) -> bool:
+        """
+        리스트 href ↔ 상품 ID 매핑 저장 (상세 페이지에서 실제 상품 ID를 확인한 뒤 호출)
+
+        Returns:
+            bool: 새 매핑이면 True
+        """
+        if not listing_url or not product_id:
+            return False
+        if re.search(r'/products/\d+', listing_url):
+            return False  # href에 이미 상품 ID가 있음 - 매핑 불필요
+
+        key = self.listing_key(listing_url)
+        if self.id_map.get(key) == product_id:
+            return False
+        self.id_map[key] = product_id
+
+        if not self.id_map_enabled:
+            return True
+
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(
+                """
+                INSERT INTO product_id_map (listing_key, product_id)
+                VALUES (%s, %s)
+                ON CONFLICT (listing_key)
+                DO UPDATE SET product_id = EXCLUDED.product_id, updated_at = CURRENT_TIMESTAMP
+                """,
+                (key, product_id)
+            )
+            self.conn.commit()
+        except Exception as e:
+            if self._connection_lost(e):
+                raise  # 재연결 후 다시 실행 (@_reconnecting)
+            self.conn.rollback()
+            print(f"[DB] 상품 ID 매핑 저장 실패: {e}")
+        finally:
+            cursor.close()
+        return True
+
+    def load_known_product_ids(self, category_name: Optional[str] = None, itersize: int = 20000) -> int:
+        """
+        저장된 product_id를 한 번에 읽어 중복 체크 스냅샷 생성 (세션 시작 시 1회)
 
+        서버 사이드 커서로 itersize개씩 스트리밍 → 상품이 수만 개여도 결과 전체를 한 번에 받지 않음
+        이후 is_duplicate_product는 DB 왕복 없이 스냅샷에서 판정, save_product 성공 시 스냅샷에 추가
+
+        Args:
+            category_name: 지정하면 해당 카테고리 상품만 로드 (스냅샷에 없으면 DB 재확인)
+                           None이면 전체 상품 로드 (스냅샷에 없으면 신규로 판정)
+            itersize: 서버 사이드 커서 1회 전송 행 수
+
+        Returns:
+            int: 로드한 product_id 개수
+        """
+        started = datetime.now()
+        known: Set[str] = set()
+        cursor = self.conn.cursor(name='known_product_ids')  # 이름 있는 커서 = 서버 사이드
+        cursor.itersize = itersize
+
+        try:
+            if category_name:
+                cursor.execute(
+                    "SELECT product_id FROM products WHERE category_name = %s",
+                    (category_name,)
+                )
+            else:
+                cursor.execute("SELECT product_id FROM products")
+
+            for (product_id,) in cursor:
+                known.add(product_id)
+
+        except Exception as e:
+            print(f"[DB] 중복 체크 스냅샷 로드 실패: {e} - 상품마다 DB 조회")
+            cursor.close()
+            self.conn.rollback()
+            return 0
+
+        cursor.close()
+        self.conn.commit()  # 서버 사이드 커서 트랜잭션 종료
+
+        self.known_ids = known
+        self.known_ids_scope = category_name
+        elapsed = (datetime.now() - started).total_seconds()
+        scope = f"'{category_name}' 카테고리" if category_name else "전체"
+        print(f"[DB] 중복 체크 스냅샷: {scope} {len(known):,}개 로드 ({elapsed:.1f}초)")
+        return len(known)
+
+    def check_known_locally(self, product_id: str) -> Optional[bool]:
+        """
+        스냅샷만으로 중복 판정 (DB 왕복 없음)
+
+        Returns:
+            True/False: 판정 완료, None: DB 확인 필요 (스냅샷 없음 또는 카테고리 스냅샷에 없음)
+        """
+        if self.known_ids is None:
+            return None
+        if product_id in self.known_ids:
+            return True
+        if self.known_ids_scope is None:
+            return False  # 전체 스냅샷에 없음 = 신규
+        return None  # 카테고리 스냅샷에 없음 → 다른 카테고리에 저장됐을 수 있으므로 DB 확인
+
+    @_reconnecting
     def is_duplicate_product(self, product_id: str, product_data: Dict) -> bool:
         """
         DB에 동일한 상품이 이미 있는지 확인 (핵심 필드만 비교)
@@ -121,6 +404,11 @@ class DatabaseConnector:
         Returns:
             bool: True면 중복(스킵), False면 신규
         """
+        known = self.check_known_locally(product_id)
+        if known is not None:
+            return known
+
+        self.duplicate_queries += 1
         cursor = self.conn.cursor()
 
         try:
@@ -131,112 +419,555 @@ class DatabaseConnector:
             )
             result = cursor.fetchone()
 
+            if result is not None and self.known_ids is not None:
+                self.known_ids.add(product_id)
+
             # 있으면 중복 (True), 없으면 신규 (False)
             return result is not None
 
         except Exception as e:
+            if self._connection_lost(e):
+                raise  # 재연결 후 다시 실행 (@_reconnecting)
             print(f"[DB] 중복 체크 중 오류: {e}")
             return False
         finally:
             cursor.close()
 
+    # 상품 UPSERT 컬럼 (13개 필드 - crawled_at/updated_at은 DB 시간)
+    PRODUCT_COLUMNS = (
+        'product_id', 'category_name', 'product_name',
+        'brand_name', 'price', 'discount_rate', 'review_count', 'rating',
+        'search_tags', 'product_url', 'thumbnail_url',
+    )
+
+    # 분리 구조에서 product_metrics로 가는 자주 바뀌는 컬럼 (나머지는 product_info)
+    METRIC_COLUMNS = ('price', 'discount_rate', 'review_count', 'rating')
+    INFO_COLUMNS = (
+        'product_id', 'category_name', 'product_name',
+        'brand_name', 'search_tags', 'product_url', 'thumbnail_url',
+    )
+
+    def _product_row(self, category_name: str, product_data: Dict) -> tuple:
+        """
+        상품 딕셔너리 → PRODUCT_COLUMNS 순서 튜플
+
+        SimpleCrawler 형식(단순 딕셔너리)과 기존 형식(detail_page_info/product_info) 모두 지원
+        """
+        # product_id 추출
+        product_id = product_data.get('product_id')
+        if not product_id:
+            product_url = product_data.get('product_url', '')
+            product_id = self.extract_product_id(product_url)
+
+        # SimpleCrawler 형식 지원 (단순 딕셔너리)
+        if 'product_name' in product_data:
+            # SimpleCrawler 형식
+            product_name = product_data.get('product_name')
+            brand_name = product_data.get('brand_name')
+            price = product_data.get('price')
+            discount_rate = product_data.get('discount_rate')
+            review_count = product_data.get('review_count', 0)
+            rating = product_data.get('rating')
+            search_tags = product_data.get('search_tags', [])
+            thumbnail_url = product_data.get('thumbnail_url')
+            product_url = product_data.get('product_url', '')
+        else:
+            # 기존 형식 (detail_page_info/product_info)
+            detail_info = product_data.get('detail_page_info', {})
+            product_info = product_data.get('product_info', {})
+
+            product_name = detail_info.get('detail_product_name') or product_info.get('product_name', f"상품_{product_id}")
+            brand_name = detail_info.get('brand_name') or product_info.get('brand', None)
+            price = detail_info.get('detail_price') or (int(product_info.get('price', 0)) if product_info.get('price') else None)
+            discount_rate = detail_info.get('discount_rate') or (int(product_info.get('discount_rate', 0)) if product_info.get('discount_rate') else None)
+            review_count = detail_info.get('detail_review_count') or (int(product_info.get('review_count', 0)) if product_info.get('review_count') else 0)
+            rating = detail_info.get('rating') or (float(product_info.get('rating', 0)) if product_info.get('rating') else None)
+            search_tags = detail_info.get('search_tags', [])
+            thumbnail_url = detail_info.get('thumbnail_url') or product_info.get('thumbnail_url', None)
+            product_url = product_data.get('product_url', '')
+
+        return (
+            product_id, category_name, product_name,
+            brand_name, price, discount_rate, review_count, rating,
+            search_tags, product_url, thumbnail_url
+        )
+
+    @_reconnecting
     def save_product(self, category_name: str, product_data: Dict, skip_duplicates: bool = True) -> str:
         """
         상품 데이터 저장
 
+        content_hash 컬럼이 있으면 해시가 다를 때만 기존 행을 갱신 (같으면 행/updated_at 그대로)
+
         Args:
             category_name: 카테고리 이름 (예: "여성의류")
             product_data: 상품 데이터 딕셔너리
             skip_duplicates: True면 중복 데이터 스킵
 
         Returns:
-            str: 'saved', 'skipped', 'failed'
+            str: 'saved' (신규), 'updated' (내용 변경), 'unchanged' (내용 같음), 'skipped', 'failed'
         """
-        cursor = self.conn.cursor()
-
+        cursor = None
         try:
-            # product_id 추출
-            product_id = product_data.get('product_id')
-            if not product_id:
-                product_url = product_data.get('product_url', '')
-                product_id = self.extract_product_id(product_url)
+            row = self._product_row(category_name, product_data)
+            product_id = row[0]
 
-            # 중복 체크
+            # 중복 체크 (재연결될 수 있음 → 커서는 이후에 현재 연결로 생성)
             if skip_duplicates and self.is_duplicate_product(product_id, product_data):
+                self._record_skipped_snapshots([row])  # 건너뛰어도 수집한 가격/리뷰는 이력에 기록
                 return 'skipped'
 
-            # SimpleCrawler 형식 지원 (단순 딕셔너리)
-            if 'product_name' in product_data:
-                # SimpleCrawler 형식
-                product_name = product_data.get('product_name')
-                brand_name = product_data.get('brand_name')
-                price = product_data.get('price')
-                discount_rate = product_data.get('discount_rate')
-                review_count = product_data.get('review_count', 0)
-                rating = product_data.get('rating')
-                search_tags = product_data.get('search_tags', [])
-                thumbnail_url = product_data.get('thumbnail_url')
-                product_url = product_data.get('product_url', '')
-            else:
-                # 기존 형식 (detail_page_info/product_info)
-                detail_info = product_data.get('detail_page_info', {})
-                product_info = product_data.get('product_info', {})
-
-                product_name = detail_info.get('detail_product_name') or product_info.get('product_name', f"상품_{product_id}")
-                brand_name = detail_info.get('brand_name') or product_info.get('brand', None)
-                price = detail_info.get('detail_price') or (int(product_info.get('price', 0)) if product_info.get('price') else None)
-                discount_rate = detail_info.get('discount_rate') or (int(product_info.get('discount_rate', 0)) if product_info.get('discount_rate') else None)
-                review_count = detail_info.get('detail_review_count') or (int(product_info.get('review_count', 0)) if product_info.get('review_count') else 0)
-                rating = detail_info.get('rating') or (float(product_info.get('rating', 0)) if product_info.get('rating') else None)
-                search_tags = detail_info.get('search_tags', [])
-                thumbnail_url = detail_info.get('thumbnail_url') or product_info.get('thumbnail_url', None)
-                product_url = product_data.get('product_url', '')
-
-            # 상품 데이터 저장 (UPSERT) - 13개 필드
+            self.has_snapshots()
+            split = self.has_metrics_split()
+            hashed = split or self.has_content_hash()
+            cursor = self.conn.cursor()
+
+            if split:
+                result = self._save_split(cursor, row)
+                self._record_snapshots(cursor, [row])
+                self.conn.commit()
+                if self.known_ids is not None:
+                    self.known_ids.add(product_id)
+                return result
+
+            # 상품 데이터 저장 (UPSERT) - 13개 필드 (+ content_hash)
+            values = row + (content_hash(row),) if hashed else row
+            columns, conflict = self._upsert_clause(skip_duplicates=False, hashed=hashed)
             cursor.execute(
-                """
-                INSERT INTO products (
-                    product_id, category_name, product_name,
-                    brand_name, price, discount_rate, review_count, rating,
-                    search_tags, product_url, thumbnail_url,
-                    crawled_at, updated_at
-                )
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                ON CONFLICT (product_id)
-                DO UPDATE SET
-                    category_name = EXCLUDED.category_name,
-                    product_name = EXCLUDED.product_name,
-                    brand_name = EXCLUDED.brand_name,
-                    price = EXCLUDED.price,
-                    discount_rate = EXCLUDED.discount_rate,
-                    review_count = EXCLUDED.review_count,
-                    rating = EXCLUDED.rating,
-                    search_tags = EXCLUDED.search_tags,
-                    product_url = EXCLUDED.product_url,
-                    thumbnail_url = EXCLUDED.thumbnail_url,
-                    updated_at = CURRENT_TIMESTAMP
+                f"""
+                INSERT INTO products ({columns}, crawled_at, updated_at)
+                VALUES ({', '.join(['%s'] * len(values))}, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                ON CONFLICT (product_id) {conflict}
+                {'RETURNING (xmax = 0) AS inserted' if hashed else ''}
                 """,
-                (
-                    product_id, category_name, product_name,
-                    brand_name, price, discount_rate, review_count, rating,
-                    search_tags, product_url, thumbnail_url
-                )
+                values
             )
 
+            result = 'saved'
+            if hashed:
+                returned = cursor.fetchone()
+                if returned is None:
+                    result = 'unchanged'  # 해시가 같아 갱신 안 함
+                elif not returned[0]:
+                    result = 'updated'
+
+            self._record_snapshots(cursor, [row])  # 같은 트랜잭션 (가격/리뷰가 바뀌었을 때만)
             self.conn.commit()
+            if self.known_ids is not None:
+                self.known_ids.add(product_id)  # 스냅샷 최신 유지
             # 개별 로그 제거 (50개 단위 테이블로 대체)
-            return 'saved'
+            return result
 
         except Exception as e:
+            if self._connection_lost(e, cursor):
+                raise  # 재연결 후 다시 실행 (@_reconnecting)
             self.conn.rollback()
             print(f"[DB] 상품 저장 실패: {e}")
             return 'failed'
+        finally:
+            if cursor is not None:
+                cursor.close()
+
+    def _save_split(self, cursor, row: tuple) -> str:
+        """product_info / product_metrics에 1행씩 UPSERT → 'saved' / 'updated' / 'unchanged'"""
+        info, metrics = self._split_row(row)
+        info_sql, metrics_sql = self._split_upsert_sql(
+            skip_duplicates=False, source="VALUES ({placeholders}, {timestamps})"
+        )
+        cursor.execute(info_sql, info)
+        info_returned = cursor.fetchone()
+        cursor.execute(metrics_sql, metrics)
+        metrics_returned = cursor.fetchone()
+
+        if info_returned is not None:
+            return 'saved' if info_returned[1] else 'updated'
+        return 'updated' if metrics_returned is not None else 'unchanged'
+
+    @_reconnecting
+    def upsert_products(self, items: List[tuple], skip_duplicates: bool = True) -> List[str]:
+        """
+        여러 상품을 INSERT 1회 + 커밋 1회로 저장 (execute_values)
+
+        - skip_duplicates=True: ON CONFLICT DO NOTHING → RETURNING에 없는 행은 'skipped'
+        - skip_duplicates=False: ON CONFLICT DO UPDATE (기존 save_product와 같은 UPSERT)
+          content_hash 컬럼이 있으면 해시가 다른 행만 갱신 → 'updated', 같으면 'unchanged'
+        - 분리 구조면 product_info / product_metrics에 각각 INSERT 1회 (같은 트랜잭션)
+        - 가격/할인율/리뷰 수/평점이 마지막 이력과 다른 상품은 product_snapshots에 1행 추가
+          (중복으로 건너뛴 상품도 포함 - 스냅샷 판정이든 DO NOTHING이든 이번에 수집한 값을 기록)
+        - 배치 전체가 실패하면 행 단위 save_product로 다시 시도 (문제 행만 'failed')
+        - 연결이 끊겨 실패하면 재연결 후 같은 배치를 다시 실행
+
+        Args:
+            items: [(category_name, product_data)]
+
+        Returns:
+            list: 행마다 'saved' / 'updated' / 'unchanged' / 'skipped' / 'failed' (items 순서)
+        """
+        results: List[Optional[str]] = [None] * len(items)
+        rows = []
+        known_rows: Dict[str, tuple] = {}  # 스냅샷으로 건너뛴 행 (DB 전송 안 함, 이력만 기록)
+        row_index: Dict[str, int] = {}  # product_id → items 인덱스 (배치 안 첫 행)
+
+        for i, (category_name, product_data) in enumerate(items):
+            try:
+                row = self._product_row(category_name, product_data)
+            except Exception as e:
+                print(f"[DB] 상품 데이터 변환 실패: {e}")
+                results[i] = 'failed'
+                continue
+
+            product_id = row[0]
+            if product_id in row_index or product_id in known_rows:
+                results[i] = 'skipped'  # 같은 배치 안 중복 (한 INSERT에서 같은 키 두 번 갱신 불가)
+                continue
+            if skip_duplicates and self.known_ids is not None and product_id in self.known_ids:
+                results[i] = 'skipped'  # 스냅샷으로 판정 (DB 전송 안 함)
+                known_rows[product_id] = row
+                continue
+
+            row_index[product_id] = i
+            rows.append(row)
+
+        if not rows:
+            self._record_skipped_snapshots(list(known_rows.values()))
+            return results
+
+        split = self.has_metrics_split()
+        hashed = split or self.has_content_hash()
+        self.has_snapshots()
+
+        cursor = self.conn.cursor()
+        try:
+            if split:
+                written = self._upsert_split(cursor, rows, skip_duplicates)
+            else:
+                written = self._upsert_products_table(cursor, rows, skip_duplicates, hashed)
+            self._record_snapshots(cursor, rows + list(known_rows.values()))  # 같은 트랜잭션, 배치당 INSERT 1회
+            self.conn.commit()
+        except Exception as e:
+            if self._connection_lost(e, cursor):
+                raise  # 재연결 후 배치 전체 다시 실행 (@_reconnecting)
+            self.conn.rollback()
+            print(f"[DB] 일괄 저장 실패: {e} - 행 단위로 재시도")
+            for product_id, i in row_index.items():
+                category_name, product_data = items[i]
+                results[i] = self.save_product(category_name, product_data, skip_duplicates)
+            self._record_skipped_snapshots(list(known_rows.values()))
+            return results
+        finally:
+            cursor.close()
+
+        for product_id, i in row_index.items():
+            if product_id in written:
+                results[i] = written[product_id]
+                if self.known_ids is not None:
+                    self.known_ids.add(product_id)
+            elif skip_duplicates:
+                results[i] = 'skipped'  # DO NOTHING으로 건너뜀 (DB에 이미 있음)
+            else:
+                results[i] = 'unchanged'  # content_hash가 같아 갱신 안 함
+        return results
+
+    def _upsert_products_table(self, cursor, rows: List[tuple], skip_duplicates: bool,
+                               hashed: bool) -> Dict[str, str]:
+        """products 테이블 1개에 INSERT 1회 (분리 전 구조) → 쓴 행 {product_id: 'saved'/'updated'}"""
+        if hashed:
+            rows = [row + (content_hash(row),) for row in rows]
+        columns, conflict = self._upsert_clause(skip_duplicates, hashed)
+        returned = execute_values(
+            cursor,
+            f"""
+            INSERT INTO products ({columns}, crawled_at, updated_at)
+            VALUES %s
+            ON CONFLICT (product_id) {conflict}
+            RETURNING product_id, (xmax = 0) AS inserted
+            """,
+            rows,
+            template=f"({', '.join(['%s'] * len(rows[0]))}, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)",
+            page_size=len(rows),
+            fetch=True
+        )
+        # 신규면 xmax = 0
+        return {product_id: 'saved' if inserted else 'updated' for product_id, inserted in returned}
+
+    def _upsert_split(self, cursor, rows: List[tuple], skip_duplicates: bool) -> Dict[str, str]:
+        """
+        product_info / product_metrics에 각각 INSERT 1회 (분리 구조) → 쓴 행 {product_id: 'saved'/'updated'}
+
+        product_info는 content_hash가 다를 때만, product_metrics는 값이 다를 때만 갱신
+        (가격만 바뀐 상품은 좁은 product_metrics 행만 HOT update)
+        """
+        split_rows = [self._split_row(row) for row in rows]
+        info_sql, metrics_sql = self._split_upsert_sql(skip_duplicates, "VALUES %s")
+        info = execute_values(
+            cursor, info_sql, [info for info, _ in split_rows],
+            template=f"({', '.join(['%s'] * (len(self.INFO_COLUMNS) + 1))}, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)",
+            page_size=len(rows), fetch=True
+        )
+        metrics = execute_values(
+            cursor, metrics_sql, [metrics for _, metrics in split_rows],
+            template=f"({', '.join(['%s'] * (len(self.METRIC_COLUMNS) + 1))}, CURRENT_TIMESTAMP)",
+            page_size=len(rows), fetch=True
+        )
+
+        written = {product_id: 'saved' if inserted else 'updated' for product_id, inserted in info}
+        for (product_id,) in metrics:
+            written.setdefault(product_id, 'updated')  # 가격/리뷰만 바뀜
+        return written
+
+    def has_metrics_split(self) -> bool:
+        """product_info + product_metrics 분리 구조인지 (migrate_split_product_metrics.py 이후 products는 호환 뷰)"""
+        if self.metrics_split_enabled is None:
+            cursor = self.conn.cursor()
+            try:
+                cursor.execute("SELECT relkind FROM pg_class WHERE relname = 'product_metrics'")
+                found = cursor.fetchone()
+                self.metrics_split_enabled = found is not None and found[0] == 'r'  # r = 일반 테이블
+            except Exception as e:
+                if self._connection_lost(e):
+                    raise
+                self.conn.rollback()
+                self.metrics_split_enabled = False
+            finally:
+                cursor.close()
+        return self.metrics_split_enabled
+
+    def _info_values(self, row: tuple) -> tuple:
+        """상품 행 → INFO_COLUMNS 값"""
+        values = dict(zip(self.PRODUCT_COLUMNS, row))
+        return tuple(values[col] for col in self.INFO_COLUMNS)
+
+    def _split_row(self, row: tuple) -> Tuple[tuple, tuple]:
+        """상품 행 → (product_info 값 + content_hash, product_metrics 값)"""
+        info = self._info_values(row)
+        values = dict(zip(self.PRODUCT_COLUMNS, row))
+        metrics = (row[0],) + tuple(values[col] for col in self.METRIC_COLUMNS)
+        return info + (content_hash(info),), metrics
+
+    def row_hash(self, row: tuple) -> str:
+        """저장 구조에 맞는 content_hash (분리 구조면 product_info 컬럼만)"""
+        return content_hash(self._info_values(row)) if self.metrics_split_enabled else content_hash(row)
+
+    def _split_upsert_sql(self, skip_duplicates: bool, source: str) -> Tuple[str, str]:
+        """
+        product_info / product_metrics UPSERT 문
+
+        Args:
+            source: 값 부분 - {columns} / {placeholders} / {timestamps} 치환
+                    ("VALUES %s" = execute_values, "SELECT {columns}, {timestamps} FROM 스테이징" = 대량 적재)
+        """
+        info_columns = self.INFO_COLUMNS + ('content_hash',)
+        metric_columns = self.METRIC_COLUMNS
+        if skip_duplicates:
+            info_conflict = metrics_conflict = "DO NOTHING"
+        else:
+            info_conflict = "DO UPDATE SET " + ', '.join(
+                f"{col} = EXCLUDED.{col}" for col in info_columns[1:]
+            ) + (", updated_at = CURRENT_TIMESTAMP "
+                 "WHERE product_info.content_hash IS DISTINCT FROM EXCLUDED.content_hash")
+            metrics_conflict = "DO UPDATE SET " + ', '.join(
+                f"{col} = EXCLUDED.{col}" for col in metric_columns
+            ) + ", updated_at = CURRENT_TIMESTAMP WHERE (" + ', '.join(
+                f"product_metrics.{col}" for col in metric_columns
+            ) + ") IS DISTINCT FROM (" + ', '.join(f"EXCLUDED.{col}" for col in metric_columns) + ")"
+
+        info_sql = f"""
+            INSERT INTO product_info ({', '.join(info_columns)}, crawled_at, updated_at)
+            {source.format(columns=', '.join(info_columns), placeholders=', '.join(['%s'] * len(info_columns)),
+                           timestamps='CURRENT_TIMESTAMP, CURRENT_TIMESTAMP')}
+            ON CONFLICT (product_id) {info_conflict}
+            RETURNING product_id, (xmax = 0) AS inserted
+        """
+        metrics_sql = f"""
+            INSERT INTO product_metrics (product_id, {', '.join(metric_columns)}, updated_at)
+            {source.format(columns='product_id, ' + ', '.join(metric_columns),
+                           placeholders=', '.join(['%s'] * (len(metric_columns) + 1)),
+                           timestamps='CURRENT_TIMESTAMP')}
+            ON CONFLICT (product_id) {metrics_conflict}
+            RETURNING product_id
+        """
+        return info_sql, metrics_sql
+
+    def has_content_hash(self) -> bool:
+        """products.content_hash 컬럼이 있는지 (연결당 1회 확인, 없으면 기존 UPSERT로 동작)"""
+        if self.content_hash_enabled is None:
+            cursor = self.conn.cursor()
+            try:
+                cursor.execute(
+                    """
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_name = 'products' AND column_name = 'content_hash'
+                    """
+                )
+                self.content_hash_enabled = cursor.fetchone() is not None
+            except Exception as e:
+                if self._connection_lost(e):
+                    raise
+                self.conn.rollback()
+                self.content_hash_enabled = False
+            finally:
+                cursor.close()
+            if not self.content_hash_enabled:
+                print("[DB] content_hash 컬럼 없음 - 모든 UPSERT가 행을 갱신 (migrate_add_content_hash.py 실행 필요)")
+        return self.content_hash_enabled
+
+    def has_snapshots(self) -> bool:
+        """
+        product_snapshots 테이블이 있는지 (연결당 1회 확인)
+
+        있으면 DB 서버 기준 이번 달의 파티션도 확인/생성 (달마다 1회, 없으면 DEFAULT 파티션으로 들어가 월 단위 정리가 어려움)
+        """
+        if self.snapshots_enabled is None:
+            cursor = self.conn.cursor()
+            try:
+                cursor.execute("SELECT to_regclass('product_snapshots') IS NOT NULL")
+                found = cursor.fetchone()
+                self.snapshots_enabled = bool(found and found[0])
+            except Exception as e:
+                if self._connection_lost(e):
+                    raise
+                self.conn.rollback()
+                self.snapshots_enabled = False
+            finally:
+                cursor.close()
+        if self.snapshots_enabled:
+            self.ensure_snapshot_partition(self._server_month())
+        return self.snapshots_enabled
+
+    def _server_month(self) -> date:
+        """
+        DB 서버 시계 기준 이번 달 1일
+
+        captured_at은 서버의 CURRENT_TIMESTAMP로 채워지므로 파티션도 서버 시계로 고름
+        (크롤러 PC 시계/시간대가 달라 월말에 어긋나면 이력이 DEFAULT 파티션으로 들어감)
+        """
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute("SELECT date_trunc('month', CURRENT_TIMESTAMP)::date")
+            found = cursor.fetchone()
+            month = found[0] if found else None
+        except Exception as e:
+            if self._connection_lost(e):
+                raise
+            self.conn.rollback()
+            month = None
         finally:
             cursor.close()
+        if isinstance(month, datetime):
+            month = month.date()
+        return month or date.today().replace(day=1)
+
+    def ensure_snapshot_partition(self, day: date) -> bool:
+        """
+        day가 속한 달의 이력 파티션 생성 (달마다 1회, DDL은 따로 커밋 - 이어지는 저장 실패와 무관)
+
+        상품 저장 트랜잭션을 열기 전에 호출 (has_snapshots)
+
+        Returns:
+            bool: 이번 호출에서 생성을 시도했는지 (이미 확인한 달이면 False)
+        """
+        name, start, end = snapshot_partition(day)
+        if name in self.snapshot_partitions:
+            return False
+
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF product_snapshots "
+                f"FOR VALUES FROM ('{start}') TO ('{end}')"
+            )
+            self.conn.commit()
+        except Exception as e:
+            if self._connection_lost(e):
+                raise
+            self.conn.rollback()
+            print(f"[DB] 이력 파티션 {name} 생성 실패: {e} - DEFAULT 파티션 사용")
+        finally:
+            cursor.close()
+        self.snapshot_partitions.add(name)  # 실패해도 같은 달은 다시 시도하지 않음 (배치마다 경고 방지)
+        return True
+
+    @staticmethod
+    def _snapshot_values(row: tuple) -> Optional[tuple]:
+        """상품 행 → 이력 값 (product_id, price, discount_rate, review_count, rating×10), 추적 값이 모두 없으면 None"""
+        price, discount_rate, review_count, rating = row[4], row[5], row[6], row[7]
+        if price is None and discount_rate is None and not review_count and rating is None:
+            return None
+        rating_x10 = int(round(float(rating) * 10)) if rating is not None else None
+        return (row[0], price, discount_rate, review_count, rating_x10)
+
+    def _record_snapshots(self, cursor, rows: List[tuple]) -> int:
+        """
+        추적 값이 바뀐 상품만 product_snapshots에 추가 (호출한 쪽 트랜잭션 안에서 INSERT 1회)
+
+        이력 저장이 실패해도 상품 저장은 유지 (SAVEPOINT로 이력 INSERT만 되돌림)
+        """
+        if not self.snapshots_enabled:
+            return 0
+        values = [v for v in (self._snapshot_values(row) for row in rows) if v]
+        if not values:
+            return 0
+
+        cursor.execute("SAVEPOINT product_snapshots")
+        try:
+            inserted = execute_values(
+                cursor,
+                SNAPSHOT_INSERT_SQL.format(
+                    source="(VALUES %s) AS v (product_id, price, discount_rate, review_count, rating_x10)"
+                ),
+                values,
+                template="(%s, %s::integer, %s::smallint, %s::integer, %s::smallint)",
+                page_size=len(values),
+                fetch=True
+            )
+            cursor.execute("RELEASE SAVEPOINT product_snapshots")
+        except Exception as e:
+            if self._connection_lost(e):
+                raise
+            cursor.execute("ROLLBACK TO SAVEPOINT product_snapshots")
+            print(f"[DB] 가격/리뷰 이력 저장 실패: {e}")
+            return 0
+
+        self.snapshot_count += len(inserted)
+        return len(inserted)
+
+    def _record_skipped_snapshots(self, rows: List[tuple]) -> int:
+        """중복으로 건너뛴 상품의 이력만 기록 (상품 INSERT 없이 이력 INSERT 1회 + 커밋 1회)"""
+        if not rows or not self.has_snapshots():
+            return 0
+        cursor = self.conn.cursor()
+        try:
+            inserted = self._record_snapshots(cursor, rows)
+            self.conn.commit()
+            return inserted
+        except Exception as e:
+            if self._connection_lost(e, cursor):
+                raise
+            self.conn.rollback()
+            print(f"[DB] 가격/리뷰 이력 저장 실패: {e}")
+            return 0
+        finally:
+            cursor.close()
+
+    def _upsert_clause(self, skip_duplicates: bool, hashed: bool) -> Tuple[str, str]:
+        """
+        INSERT 컬럼 목록 + ON CONFLICT 절
+
+        hashed=True면 content_hash 컬럼 포함 + 해시가 다를 때만 갱신 (같으면 dead tuple/WAL 없음)
+        """
+        columns = self.PRODUCT_COLUMNS + (('content_hash',) if hashed else ())
+        if skip_duplicates:
+            return ', '.join(columns), "DO NOTHING"
+        conflict = "DO UPDATE SET " + ', '.join(
+            f"{col} = EXCLUDED.{col}" for col in columns[1:]
+        ) + ", updated_at = CURRENT_TIMESTAMP"
+        if hashed:
+            conflict += " WHERE products.content_hash IS DISTINCT FROM EXCLUDED.content_hash"
+        return ', '.join(columns), conflict
 
     def save_products_batch(self, category_name: str, products_list: List[Dict], skip_duplicates: bool = True) -> Dict[str, int]:
         """
-        여러 상품 일괄 저장
+        여러 상품 일괄 저장 (upsert_products - 배치당 INSERT 1회)
 
         Args:
             category_name: 카테고리 이름
@@ -244,17 +975,62 @@ class DatabaseConnector:
             skip_duplicates: True면 중복 데이터 스킵
 
         Returns:
-            dict: {'saved': n, 'skipped': n, 'failed': n}
+            dict: {'saved': n, 'updated': n, 'unchanged': n, 'skipped': n, 'failed': n}
         """
-        results = {'saved': 0, 'skipped': 0, 'failed': 0}
+        results = {'saved': 0, 'updated': 0, 'unchanged': 0, 'skipped': 0, 'failed': 0}
 
-        for product_data in products_list:
-            result = self.save_product(category_name, product_data, skip_duplicates)
+        for result in self.upsert_products([(category_name, p) for p in products_list], skip_duplicates):
             results[result] += 1
 
-        print(f"[DB] 일괄 저장 완료: 저장 {results['saved']}개 | 스킵 {results['skipped']}개 | 실패 {results['failed']}개")
+        print(f"[DB] 일괄 저장 완료: 저장 {results['saved']}개 | 갱신 {results['updated']}개 | "
+              f"변경 없음 {results['unchanged']}개 | 스킵 {results['skipped']}개 | 실패 {results['failed']}개")
         return results
 
+    def search_products(self, keyword: Optional[str] = None, tag: Optional[str] = None,
+                        category_name: Optional[str] = None, limit: int = 50) -> List[Dict]:
+        """
+        상품명 부분 검색 / 태그 검색 (리뷰 수 많은 순)
+
+        - keyword: 상품명 ILIKE '%keyword%' (idx_product_name_trgm, 3글자 이상일 때 인덱스 사용)
+        - tag: search_tags에 태그 포함 (idx_product_search_tags)
+
+        Returns:
+            list: [{'product_id', 'product_name', 'category_name', 'price', 'review_count', 'search_tags'}]
+        """
+        conditions, params = [], []
+        if keyword:
+            escaped = keyword.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            conditions.append("product_name ILIKE %s")
+            params.append(f"%{escaped}%")
+        if tag:
+            conditions.append("search_tags @> ARRAY[%s]::text[]")
+            params.append(tag)
+        if category_name:
+            conditions.append("category_name = %s")
+            params.append(category_name)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(
+                f"""
+                SELECT product_id, product_name, category_name, price, review_count, search_tags
+                FROM products
+                {where}
+                ORDER BY review_count DESC NULLS LAST
+                LIMIT %s
+                """,
+                params + [limit]
+            )
+            columns = ('product_id', 'product_name', 'category_name', 'price', 'review_count', 'search_tags')
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        except Exception as e:
+            self.conn.rollback()
+            print(f"[DB] 상품 검색 실패: {e}")
+            return []
+        finally:
+            cursor.close()
+
     def get_last_crawl_progress(self, category_name: str) -> Optional[int]:
         """
         특정 카테고리의 마지막 크롤링 진행 상황 조회
@@ -429,22 +1205,32 @@ class DatabaseConnector:
             cursor.close()
 
 
+# 이 개수 이상이면 COPY 대량 적재 사용 (bulk_loader.BulkLoader)
+BULK_LOAD_THRESHOLD = 1000
+
+
 # 간편 함수들
 def save_to_database(category_name: str, products_list: List[Dict], skip_duplicates: bool = True) -> Dict[str, int]:
     """
     간편 DB 저장 함수
 
+    BULK_LOAD_THRESHOLD개 이상이면 COPY → 스테이징 → 병합 1회, 그보다 적으면 일괄 UPSERT
+
     Args:
         category_name: 카테고리 이름 (예: "여성의류")
         products_list: 상품 데이터 리스트
         skip_duplicates: True면 중복 데이터 스킵
 
     Returns:
-        dict: {'saved': n, 'skipped': n, 'failed': n}
+        dict: {'saved': n, 'updated': n, 'unchanged': n, 'skipped': n, 'failed': n}
     """
     db = DatabaseConnector()
     try:
         db.connect()
+        if len(products_list) >= BULK_LOAD_THRESHOLD:
+            from src.database.bulk_loader import BulkLoader
+            result = BulkLoader(db).load(category_name, products_list, skip_duplicates)
+            return {key: result[key] for key in ('saved', 'updated', 'unchanged', 'skipped', 'failed')}
         results = db.save_products_batch(category_name, products_list, skip_duplicates)
         return results
     finally:
@@ -0,0 +1,83 @@
+"""
+조회 패턴 기준 인덱스 목록 (migrate_query_indexes.py / benchmark_queries.py 공용)
+
+- crawl_history: get_last_crawl_progress / start_crawl_session 재개 지점 조회
+  (category_name, crawl_type, status 조건 + start_time 최신순)
+- search_tags: 태그 검색 (search_tags @> ARRAY[...]) → GIN
+- product_name: 부분 검색 (ILIKE '%...%') → pg_trgm 트라이그램 GIN
+  기존 product_name btree는 긴 TEXT에 쓰는 쿼리가 없어 제거
+"""
+
+from typing import List
+
+# (인덱스 이름, 테이블/정의 - {products}는 상품 정보 테이블, 용도)
+QUERY_INDEXES = (
+    ('idx_crawl_history_resume',
+     "crawl_history (category_name, crawl_type, status, start_time DESC)",
+     '재개 지점 조회 (get_last_crawl_progress / start_crawl_session)'),
+    ('idx_product_search_tags',
+     "{products} USING GIN (search_tags)",
+     '태그 검색 (search_tags @> ARRAY[...])'),
+    ('idx_product_name_trgm',
+     "{products} USING GIN (product_name gin_trgm_ops)",
+     '상품명 부분 검색 (ILIKE, 3글자 이상)'),
+)
+
+# 쓰는 쿼리가 없는 인덱스 (쓰기마다 갱신 비용만 듦)
+DROPPED_INDEXES = ('idx_product_name',)
+
+
+def product_table(cursor) -> str:
+    """상품 정보가 저장되는 테이블 (분리 구조면 product_info, 아니면 products)"""
+    cursor.execute("SELECT to_regclass('product_info') IS NOT NULL")
+    return 'product_info' if cursor.fetchone()[0] else 'products'
+
+
+def apply_query_indexes(cursor, concurrently: bool = False) -> List[str]:
+    """
+    현재 스키마(search_path 첫 번째)에 인덱스 적용 - 다시 실행해도 안전
+
+    Args:
+        concurrently: True면 CREATE/DROP INDEX CONCURRENTLY (쓰기 잠금 없음, autocommit 연결 필요)
+
+    Returns:
+        list: 새로 만든 인덱스 이름
+    """
+    option = ' CONCURRENTLY' if concurrently else ''
+    cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    cursor.execute("SELECT current_schema()")
+    schema = cursor.fetchone()[0]  # 이름만 쓰면 search_path의 다른 스키마 인덱스를 지울 수 있음
+    products = product_table(cursor)
+
+    for name in DROPPED_INDEXES:
+        cursor.execute(f"DROP INDEX{option} IF EXISTS {schema}.{name}")
+
+    # CONCURRENTLY 실패로 남은 INVALID 인덱스는 IF NOT EXISTS에 걸리므로 지우고 다시 생성
+    names = [name for name, _, _ in QUERY_INDEXES]
+    cursor.execute(
+        """
+        SELECT c.relname
+        FROM pg_index x
+        JOIN pg_class c ON c.oid = x.indexrelid
+        WHERE NOT x.indisvalid
+          AND c.relnamespace = %s::regnamespace
+          AND c.relname = ANY(%s)
+        """,
+        (schema, names)
+    )
+    for (name,) in cursor.fetchall():
+        cursor.execute(f"DROP INDEX{option} IF EXISTS {schema}.{name}")
+
+    cursor.execute(
+        "SELECT relname FROM pg_class WHERE relnamespace = %s::regnamespace AND relname = ANY(%s)",
+        (schema, names)
+    )
+    existing = {name for (name,) in cursor.fetchall()}
+
+    created = []
+    for name, definition, _ in QUERY_INDEXES:
+        if name in existing:
+            continue
+        cursor.execute(f"CREATE INDEX{option} IF NOT EXISTS {name} ON {definition.format(products=products)}")
+        created.append(name)
+    return created
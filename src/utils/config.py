@@ -32,7 +32,105 @@ CRAWL_CONFIG = {
     'scroll_pause_time': 1.5,
     'batch_size': 100,
     'headless': False,  # False로 하면 브라우저 창이 보임
-    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+
+    # 리소스 차단 정책 (context.route) - 페이지 역할별로 불필요한 요청 차단
+    # - block_types: Playwright request.resource_type 기준
+    # - block_patterns: URL에 포함되면 차단 (분석/광고 비콘 등)
+    # - allow_patterns: 차단 대상이어도 URL에 포함되면 통과 (우선 적용)
+    'resource_policy': {
+        'enabled': True,
+        'listing': {
+            # 리스트는 무한 스크롤(Intersection Observer) + 사용자 화면 확인용 → 이미지/CSS 유지
+            'block_types': ['media', 'font'],
+            'block_patterns': [
+                'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+                'lcs.naver.com', 'nlog.naver.com', 'wcs.naver.net', 'siape.veta.naver.com',
+            ],
+            'allow_patterns': [],
+        },
+        'detail': {
+            # 상세 페이지는 텍스트 + 썸네일 src 속성만 읽음 → 이미지 파일 자체는 필요 없음
+            # (CSS는 유지: 지연 로딩 영역이 레이아웃/스크롤 위치에 의존)
+            'block_types': ['image', 'media', 'font'],
+            'block_patterns': [
+                'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+                'lcs.naver.com', 'nlog.naver.com', 'wcs.naver.net', 'siape.veta.naver.com',
+                'video-phinf.pstatic.net', '/livestream/',
+            ],
+            'allow_patterns': [],
+        },
+    },
+
+    # 중복 체크 스냅샷 - 세션 시작 시 저장된 product_id를 한 번에 로드 (카드마다 SELECT 제거)
+    # - per_category: True면 현재 카테고리 상품만 로드 (스냅샷에 없는 상품만 DB 재확인)
+    'dedupe_snapshot': {
+        'enabled': True,
+        'per_category': False,
+    },
+
+    # 백그라운드 일괄 저장 - batch_size개 또는 flush_interval초마다 INSERT 1회 + 커밋 1회
+    # - max_queue: 저장 대기 상한 (가득 차면 크롤링이 잠깐 대기)
+    'db_writer': {
+        'enabled': True,
+        'batch_size': 50,
+        'flush_interval': 2.0,
+        'max_queue': 1000,
+    },
+
+    # DB 연결 풀 (프로세스당 1개) - 크롤러 DB 스레드/일괄 저장 스레드/save_to_database가 연결 재사용
+    # - max_connections: 프로세스당 연결 상한 (크롤러가 DB 스레드 수 + spare_connections까지 늘림)
+    # - health_check_interval: 이 시간(초) 이상 쉬던 연결은 꺼낼 때 SELECT 1로 확인
+    # - acquire_timeout: 빈 연결 대기 상한 (초)
+    'db_pool': {
+        'max_connections': 8,
+        'spare_connections': 1,
+        'health_check_interval': 30.0,
+        'acquire_timeout': 10.0,
+    },
+
+    # 브라우저 재시작 (무한 수집 모드에서만 기본 적용 - 장시간 실행 시 Firefox 메모리 누적 방지)
+    # - after_products: 브라우저 1회 실행당 수집 상품 수 (0 = 사용 안 함)
+    # - max_rss_mb: 브라우저 프로세스 RSS 합계 상한 MB (0 = 사용 안 함, psutil 필요)
+    'recycle': {
+        'after_products': 500,
+        'max_rss_mb': 3000,
+        'restore_scroll_step': 3000,  # 재진입 후 위치 복원 스크롤 간격 (px)
+    },
+
+    # 셀렉터 시도 순서 (SelectorHelper) - 필드 + 페이지 레이아웃별 최근 성공률 높은 셀렉터부터 시도
+    # - stats_path: 적중 통계 파일 (실행 간 유지, 크롤링 종료 시 저장)
+    # - decay: 기록마다 기존 통계에 곱하는 값 (0.95 ≈ 최근 20회 비중, 레이아웃이 바뀌면 빠르게 반영)
+    'selector_order': {
+        'enabled': True,
+        'stats_path': 'data/selector_stats.json',
+        'decay': 0.95,
+    },
+
+    # 상세 페이지 레이아웃 템플릿 (LayoutTemplateCache) - 레이아웃 지문별로 찾은 셀렉터 재사용
+    # - path: 템플릿 파일 (실행 간 유지, 크롤링 종료 시 저장)
+    # - 템플릿 셀렉터가 안 맞으면 해당 필드만 다시 탐색해서 새 셀렉터로 교체
+    'layout_templates': {
+        'enabled': True,
+        'path': 'data/layout_templates.json',
+    },
+
+    # 상세 페이지 내장 상품 데이터 (JSON-LD / 앱 상태) 우선 사용 - 없는 필드만 DOM 탐색
+    'embedded_state': {
+        'enabled': True,
+    },
+
+    # 상세 페이지 지연 로딩 필드 (LazyFieldPolicy) - 첫 추출에 없는 필드만 스크롤 + 필드별 예산 안에서 대기
+    # - scroll_to: 스크롤 위치 (페이지 높이 비율), budget: 최대 대기 (초, 영역이 나타나면 바로 끝남)
+    # - trust_embedded: 앱 상태를 읽었는데 값이 없으면 상품에 없는 것으로 보고 대기 생략
+    # - enabled False: 항상 모든 필드 스크롤/대기 (기존 30%/50% 고정 스크롤과 같은 비용)
+    'lazy_fields': {
+        'enabled': True,
+        'fields': {
+            'brand_name': {'scroll_to': 0.3, 'budget': 1.5, 'trust_embedded': False},
+            'search_tags': {'scroll_to': 0.5, 'budget': 2.0, 'trust_embedded': True},
+        },
+    },
 }
 
 # =====================================================
@@ -1,19 +1,108 @@
 """
 셀렉터 Helper 함수
 네이버의 난독화된 클래스명 대응을 위한 다중 fallback 시스템
+(실행 간 유지되는 적중 통계로 레이아웃별 시도 순서 조정 - selector_stats.py)
 """
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 from playwright.async_api import Page, ElementHandle
 import re
 
+from src.utils.selector_stats import SelectorStats, layout_key
+
+# =====================================================
+# 브라우저 내부 일괄 해결 스크립트 (resolve_all)
+# =====================================================
+# 필드마다 셀렉터를 순서대로 시도해 첫 번째로 찾은 셀렉터 + 텍스트/속성 반환 (왕복 1회)
+# - 일반 CSS: querySelector / querySelectorAll
+# - Playwright 전용 문법 중 config에서 쓰는 2가지만 브라우저에서 재현
+#   'tag:has-text("x")' → tag 중 텍스트에 x 포함 (대소문자 무시, 문서 순서 첫 번째)
+#   'text="x"'          → 텍스트가 정확히 x인 텍스트 노드의 부모
+# - 그 외 해석 못 하는 셀렉터는 errors로 집계 → Python에서 해당 필드만 기존 방식으로 재시도
+RESOLVE_ALL_JS = r'''(fields) => {
+    const hasText = /^(.*):has-text\("(.*)"\)$/;
+    const exactText = /^text="(.*)"$/;
+    const query = (selector, all) => {
+        let m = selector.match(exactText);
+        if (m) {
+            const found = [];
+            const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+            let node;
+            while ((node = walker.nextNode())) {
+                if (node.nodeValue.trim() === m[1] && node.parentElement) {
+                    found.push(node.parentElement);
+                    if (!all) break;
+                }
+            }
+            return found;
+        }
+        m = selector.match(hasText);
+        if (m) {
+            const needle = m[2].toLowerCase();
+            const found = [];
+            for (const el of document.querySelectorAll(m[1] || '*')) {
+                if ((el.textContent || '').toLowerCase().includes(needle)) {
+                    found.push(el);
+                    if (!all) break;
+                }
+            }
+            return found;
+        }
+        if (all) return Array.from(document.querySelectorAll(selector));
+        const el = document.querySelector(selector);
+        return el ? [el] : [];
+    };
+
+    const out = {};
+    for (const [name, spec] of Object.entries(fields)) {
+        const tried = [];
+        let winner = null, elems = [], errors = 0;
+        for (const selector of spec.selectors) {
+            tried.push(selector);
+            try {
+                elems = query(selector, spec.multiple);
+            } catch (e) {
+                errors++;
+                elems = [];
+            }
+            if (elems.length) {
+                winner = selector;
+                break;
+            }
+        }
+        const first = elems[0];
+        out[name] = {
+            selector: winner,
+            tried: tried,
+            errors: errors,
+            count: elems.length,
+            text: first ? first.innerText : null,
+            texts: spec.multiple ? elems.map(el => el.innerText) : null,
+            attribute: first && spec.attribute ? first.getAttribute(spec.attribute) : null,
+        };
+    }
+    return out;
+}'''
+
 
 class SelectorHelper:
     """셀렉터 시도 및 디버깅을 위한 Helper 클래스"""
 
-    def __init__(self, debug: bool = False):
+    def __init__(self, debug: bool = False, order_stats: Optional[SelectorStats] = None):
         self.debug = debug
         self.selector_stats = {}  # 셀렉터 성공/실패 통계
 
+        # 셀렉터 시도 순서 (CRAWL_CONFIG['selector_order'] - 최근 성공률 높은 셀렉터 먼저)
+        if order_stats is None:
+            from src.utils.config import CRAWL_CONFIG
+            config = CRAWL_CONFIG.get('selector_order', {})
+            order_stats = SelectorStats(
+                path=config.get('stats_path') if config.get('enabled', True) else None,
+                decay=config.get('decay', 0.95),
+                enabled=config.get('enabled', True),
+            )
+        self.order_stats = order_stats
+        self.layout = 'unknown'  # 마지막으로 본 페이지 레이아웃 (요소 기준 탐색에서 사용)
+
     async def try_selectors(
         self,
         page: Page,
@@ -33,29 +122,11 @@ class SelectorHelper:
         Returns:
             찾은 Element(s) 또는 None
         """
-        for idx, selector in enumerate(selectors, 1):
-            try:
-                if multiple:
-                    result = await page.query_selector_all(selector)
-                    if result:
-                        self._log_success(field_name, selector, idx, len(result))
-                        return result
-                else:
-                    result = await page.query_selector(selector)
-                    if result:
-                        self._log_success(field_name, selector, idx)
-                        return result
-
-                if self.debug:
-                    self._log_fail(field_name, selector, idx)
-
-            except Exception as e:
-                if self.debug:
-                    print(f"   [셀렉터 오류] {field_name} - {selector}: {str(e)[:50]}")
-
-        # 모든 셀렉터 실패
-        self._log_all_fail(field_name)
-        return None
+        try:
+            self.layout = layout_key(page.url)
+        except Exception:
+            self.layout = 'unknown'
+        return await self._try_in(page, selectors, field_name, multiple, self.layout)
 
     async def try_selectors_from_element(
         self,
@@ -76,16 +147,31 @@ class SelectorHelper:
         Returns:
             찾은 Element(s) 또는 None
         """
-        for idx, selector in enumerate(selectors, 1):
+        return await self._try_in(element, selectors, field_name, multiple, self.layout)
+
+    async def _try_in(
+        self,
+        root: Union[Page, ElementHandle],
+        selectors: List[str],
+        field_name: str,
+        multiple: bool,
+        layout: str
+    ) -> Optional[Union[ElementHandle, List[ElementHandle]]]:
+        """레이아웃 통계 순서로 셀렉터 시도 + 결과 기록"""
+        tried = []
+        for idx, selector in enumerate(self.order_stats.order(field_name, selectors, layout), 1):
+            tried.append(selector)
             try:
                 if multiple:
-                    result = await element.query_selector_all(selector)
+                    result = await root.query_selector_all(selector)
                     if result:
+                        self.order_stats.record(field_name, tried, selector, layout)
                         self._log_success(field_name, selector, idx, len(result))
                         return result
                 else:
-                    result = await element.query_selector(selector)
+                    result = await root.query_selector(selector)
                     if result:
+                        self.order_stats.record(field_name, tried, selector, layout)
                         self._log_success(field_name, selector, idx)
                         return result
 
@@ -96,9 +182,112 @@ class SelectorHelper:
                 if self.debug:
                     print(f"   [셀렉터 오류] {field_name} - {selector}: {str(e)[:50]}")
 
+        # 모든 셀렉터 실패
+        self.order_stats.record(field_name, tried, None, layout)
         self._log_all_fail(field_name)
         return None
 
+    def save_stats(self) -> bool:
+        """셀렉터 적중 통계 저장 (다음 실행에서 시도 순서에 사용)"""
+        return self.order_stats.save()
+
+    async def resolve_all(
+        self,
+        page: Page,
+        fields: Dict[str, Union[List[str], Dict]]
+    ) -> Dict[str, Dict]:
+        """
+        여러 필드의 셀렉터를 page.evaluate 1회로 해결 (필드마다 try_selectors + extract_* 왕복 제거)
+
+        시도 순서/성공 통계/로그는 try_selectors와 같음 (print_stats 그대로 사용)
+        브라우저에서 해석 못 한 셀렉터가 있고 못 찾은 필드만 try_selectors로 다시 시도
+
+        Args:
+            page: Playwright Page 객체
+            fields: {필드명: 셀렉터 리스트} 또는
+                    {필드명: {'selectors': [...], 'attribute': 'src', 'multiple': False}}
+
+        Returns:
+            {필드명: {'text', 'texts', 'attribute', 'selector', 'count'}}
+            - text: 정리된 텍스트 (extract_text와 같은 정리), 못 찾으면 None
+            - texts: multiple일 때 모든 요소의 정리된 텍스트
+            - attribute: 요청한 속성 값
+            - selector: 찾은 셀렉터 (못 찾으면 None)
+        """
+        try:
+            self.layout = layout_key(page.url)
+        except Exception:
+            self.layout = 'unknown'
+
+        specs = {}
+        for field_name, spec in fields.items():
+            if not isinstance(spec, dict):
+                spec = {'selectors': spec}
+            specs[field_name] = {
+                'selectors': self.order_stats.order(field_name, list(spec['selectors']), self.layout),
+                'attribute': spec.get('attribute'),
+                'multiple': bool(spec.get('multiple', False)),
+            }
+
+        try:
+            raw = await page.evaluate(RESOLVE_ALL_JS, specs)
+        except Exception as e:
+            if self.debug:
+                print(f"   [일괄 셀렉터 오류] {str(e)[:50]} - 필드별로 다시 시도")
+            raw = {}
+
+        results = {}
+        for field_name, spec in specs.items():
+            found = raw.get(field_name)
+            if found is None or (found['selector'] is None and found['errors']):
+                results[field_name] = await self._resolve_one(page, field_name, spec)
+                continue
+
+            if found['selector'] is not None:
+                self.order_stats.record(field_name, found['tried'], found['selector'], self.layout)
+                self._log_success(field_name, found['selector'], len(found['tried']), found['count'])
+            else:
+                self.order_stats.record(field_name, found['tried'], None, self.layout)
+                self._log_all_fail(field_name)
+
+            texts = [self._clean(text) for text in found['texts'] or []]
+            results[field_name] = {
+                'text': self._clean(found['text']),
+                'texts': [text for text in texts if text],
+                'attribute': found['attribute'],
+                'selector': found['selector'],
+                'count': found['count'],
+            }
+        return results
+
+    async def _resolve_one(self, page: Page, field_name: str, spec: Dict) -> Dict:
+        """resolve_all에서 해결 못 한 필드 - try_selectors + extract_* (기존 방식)"""
+        result = await self.try_selectors(page, spec['selectors'], field_name, multiple=spec['multiple'])
+        elements = (result or []) if spec['multiple'] else ([result] if result else [])
+        first = elements[0] if elements else None
+
+        texts = []
+        if spec['multiple']:
+            for element in elements:
+                text = await self.extract_text(element, field_name)
+                if text:
+                    texts.append(text)
+        return {
+            'text': await self.extract_text(first, field_name),
+            'texts': texts,
+            'attribute': await self.extract_attribute(first, spec['attribute'], field_name) if spec['attribute'] else None,
+            'selector': self.selector_stats.get(field_name, {}).get('last_selector') if first else None,
+            'count': len(elements),
+        }
+
+    @staticmethod
+    def _clean(text: Optional[str]) -> Optional[str]:
+        """extract_text(clean=True)와 같은 정리 (공백/개행 정리, 빈 문자열 → None)"""
+        if not text:
+            return None
+        text = ' '.join(text.replace('\n', ' ').split())
+        return text or None
+
     async def find_by_text_then_next(
         self,
         page: Page,
@@ -405,4 +594,9 @@ class SelectorHelper:
             if stats['last_selector']:
                 print(f"  └─ 최근 사용: {stats['last_selector'][:50]}")
 
+        order = self.order_stats.get_stats()
+        if order['lookups']:
+            print("-"*60)
+            print(f"[시도 순서] 필드 찾기 {order['lookups']}회 | 셀렉터 시도 {order['queries']}회 "
+                  f"(평균 {order['queries_per_lookup']:.2f}회) | 첫 시도 적중 {order['first_hits']}회")
         print("="*60)
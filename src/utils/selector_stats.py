@@ -0,0 +1,175 @@
+"""
+셀렉터 적중 통계 (실행 간 유지)
+필드 + 페이지 레이아웃별로 셀렉터 성공률을 기록하고, 최근 성공률이 높은 셀렉터부터 시도하도록 순서 결정
+(config의 SELECTORS 순서는 기록이 없을 때의 기본 순서 + 동점일 때 우선순위)
+
+텍스트 기반(:has-text) / 단순 태그(img, h3) 셀렉터는 순서를 바꾸지 않음
+→ 어느 페이지에서나 뭔가 맞는 catch-all이라 적중률이 항상 높지만 엉뚱한 요소를 고를 수 있음
+"""
+
+import json
+import os
+import re
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+
+_BARE_TAG = re.compile(r'^[a-zA-Z][a-zA-Z0-9]*$')
+_TEXT_MATCH = (':has-text(', ':text(', 'text=')
+
+
+def is_generic(selector: str) -> bool:
+    """텍스트 기반 / 단순 태그 셀렉터인지 (예: 'div:has-text("%")', 'img')"""
+    selector = selector.strip()
+    return bool(_BARE_TAG.match(selector)) or any(marker in selector for marker in _TEXT_MATCH)
+
+
+def layout_key(url: Optional[str]) -> str:
+    """
+    페이지 URL → 레이아웃 키 (스토어 종류마다 DOM 구조가 다름)
+
+    - smartstore.naver.com → 'smartstore'
+    - brand.naver.com → 'brand'
+    - shopping.naver.com/window-products/... → 'window'
+    - 그 외 → 호스트 이름 (없으면 'unknown')
+    """
+    if not url:
+        return 'unknown'
+    parsed = urlparse(url)
+    host = parsed.netloc.lower()
+    if host.startswith('m.'):
+        host = host[2:]
+    if host == 'smartstore.naver.com':
+        return 'smartstore'
+    if host == 'brand.naver.com':
+        return 'brand'
+    if host == 'shopping.naver.com' and '/window-products/' in parsed.path:
+        return 'window'
+    return host or 'unknown'
+
+
+class SelectorStats:
+    """
+    셀렉터별 감쇠 적중 통계 ({레이아웃: {필드: {셀렉터: [적중, 시도]}}})
+
+    - 필드를 한 번 찾을 때마다 해당 필드/레이아웃의 기존 값에 decay를 곱한 뒤 이번 결과를 더함
+      → 최근 기록일수록 비중이 큼 (decay 0.95 ≈ 최근 20회)
+    - 점수 = (적중 + 1) / (시도 + 2): 기록 없는 셀렉터는 0.5 → 자주 실패하는 셀렉터보다 먼저 시도
+    - 순서는 클래스/속성 셀렉터끼리만 바꿈 (is_generic 셀렉터는 config 위치 고정 → fallback은 항상 마지막)
+    - 파일 저장은 save()에서만 (크롤링 중에는 메모리만 갱신)
+    """
+
+    def __init__(self, path: Optional[str] = None, decay: float = 0.95, enabled: bool = True):
+        self.path = path
+        self.decay = decay
+        self.enabled = enabled
+        self.data: Dict[str, Dict[str, Dict[str, List[float]]]] = {}
+        self._dirty = False
+
+        # 이번 실행 통계
+        self.lookups = 0  # 필드 찾기 횟수
+        self.queries = 0  # 셀렉터 시도 횟수 (query_selector 왕복)
+        self.first_hits = 0  # 첫 번째 셀렉터로 찾은 횟수
+
+        if path:
+            self.load()
+
+    def order(self, field_name: str, selectors: List[str], layout: str = 'unknown') -> List[str]:
+        """
+        최근 성공률 높은 순 (동점이면 config 순서)
+
+        텍스트 기반 / 단순 태그 셀렉터는 config 위치 그대로, 나머지 자리만 성공률 순으로 채움
+        """
+        if not self.enabled:
+            return list(selectors)
+        scores = self.data.get(layout, {}).get(field_name, {})
+        ranked = iter(sorted(
+            ((idx, selector) for idx, selector in enumerate(selectors) if not is_generic(selector)),
+            key=lambda item: (-self._score(scores.get(item[1])), item[0])
+        ))
+        return [selector if is_generic(selector) else next(ranked)[1] for selector in selectors]
+
+    def record(self, field_name: str, tried: List[str], winner: Optional[str], layout: str = 'unknown'):
+        """
+        필드 찾기 결과 기록
+
+        Args:
+            tried: 시도한 셀렉터 (시도 순서, winner 포함)
+            winner: 찾은 셀렉터 (모두 실패면 None)
+        """
+        self.lookups += 1
+        self.queries += len(tried)
+        if winner is not None and len(tried) == 1:
+            self.first_hits += 1
+
+        scores = self.data.setdefault(layout, {}).setdefault(field_name, {})
+        for entry in scores.values():
+            entry[0] *= self.decay
+            entry[1] *= self.decay
+        for selector in tried:
+            entry = scores.setdefault(selector, [0.0, 0.0])
+            entry[1] += 1
+            if selector == winner:
+                entry[0] += 1
+        self._dirty = True
+
+    def load(self):
+        """통계 파일 로드 (없거나 깨져 있으면 빈 통계로 시작)"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.data = {
+                layout: {
+                    field: {selector: [float(v[0]), float(v[1])] for selector, v in selectors.items()}
+                    for field, selectors in fields.items()
+                }
+                for layout, fields in data.get('layouts', {}).items()
+            }
+        except Exception as e:
+            print(f"[셀렉터 통계] {self.path} 로드 실패 - 새로 기록: {e}")
+            self.data = {}
+
+    def save(self) -> bool:
+        """변경된 통계를 파일에 저장 (임시 파일에 쓴 뒤 교체 → 중간에 끊겨도 기존 파일 유지)"""
+        if not self.path or not self._dirty:
+            return False
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            data = {
+                'decay': self.decay,
+                'layouts': {
+                    layout: {
+                        field: {selector: [round(v[0], 4), round(v[1], 4)] for selector, v in selectors.items()}
+                        for field, selectors in fields.items()
+                    }
+                    for layout, fields in self.data.items()
+                },
+            }
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+            return True
+        except Exception as e:
+            print(f"[셀렉터 통계] {self.path} 저장 실패: {e}")
+            return False
+
+    def get_stats(self) -> Dict:
+        return {
+            'lookups': self.lookups,
+            'queries': self.queries,
+            'first_hits': self.first_hits,
+            'queries_per_lookup': self.queries / self.lookups if self.lookups else 0.0,
+        }
+
+    @staticmethod
+    def _score(entry: Optional[List[float]]) -> float:
+        if not entry:
+            return 0.5
+        hits, tries = entry
+        return (hits + 1) / (tries + 2)
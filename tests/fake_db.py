@@ -0,0 +1,265 @@
+"""
+DB 테스트 공용 가짜 연결 + 상품/커넥터 헬퍼 (실제 PostgreSQL 없이 db_connector / bulk_loader / query_indexes 검증)
+
+- 테이블은 dict/set으로 보관, 스키마 확인 쿼리는 연결 플래그로 응답
+- execute_values는 fake_execute_values로 대체 (patch_execute_values(monkeypatch))
+- 실행한 쿼리는 conn.queries에 (커서 이름, 공백 정리한 SQL, 파라미터)로 기록
+- drop_next=True면 다음 쿼리에서 연결 끊김 (psycopg2.OperationalError, closed = 2)
+
+주의: ON CONFLICT / IS DISTINCT FROM / 이력 비교 규칙은 이 파일이 흉내 낸 것
+→ 이 가짜 연결을 쓰는 테스트는 db_connector의 흐름(어떤 SQL을 만들고, 돌려받은 행을 어떻게 집계하는지)만 검증
+  SQL이 실제 PostgreSQL에서 같은 결과를 내는지는 확인하지 않음 (마이그레이션 후 실제 DB에서 확인 필요)
+
+사용 예:
+    def test_x(monkeypatch):
+        patch_execute_values(monkeypatch)
+        db = make_connector(hash_column=True)
+        assert upsert(db, [make_product('1', 1000)]) == ['saved']
+"""
+import os
+import sys
+from datetime import date
+from pathlib import Path
+
+import psycopg2
+
+sys.path.append(str(Path(__file__).parent.parent))
+os.environ.setdefault('DB_PASSWORD', 'test')
+from src.database.db_connector import DatabaseConnector
+
+
+class FakeCursor:
+    """psycopg2 커서 흉내 (이름 있는 서버 사이드 커서, 반복, COPY 포함)"""
+
+    def __init__(self, conn, name=None):
+        self.connection = conn
+        self.name = name
+        self.itersize = None
+        self.rowcount = -1
+        self.closed = False
+        self.rows = []
+
+    def execute(self, sql, params=None):
+        sql = ' '.join(sql.split())
+        conn = self.connection
+        if conn.closed or conn.drop_next:
+            conn.closed = 2  # psycopg2: 서버 쪽에서 끊기면 closed = 2
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+        conn.queries.append((self.name, sql, params))
+        self.rows = []
+
+        # 스키마 확인
+        if 'information_schema.columns' in sql:
+            self.rows = [(1,)] if conn.hash_column else []
+        elif "relname = 'product_metrics'" in sql:
+            self.rows = [('r',)] if conn.split else []  # r = 일반 테이블 (분리 전은 뷰/없음)
+        elif "to_regclass('product_snapshots')" in sql:
+            self.rows = [(conn.snapshot_table,)]
+        elif "to_regclass('product_info')" in sql:
+            self.rows = [(conn.split,)]
+        elif "date_trunc('month', CURRENT_TIMESTAMP)" in sql:
+            self.rows = [(conn.server_month,)]
+        elif 'current_schema()' in sql:
+            self.rows = [('crawl',)]
+        elif 'indisvalid' in sql:
+            self.rows = []
+        elif sql.startswith('SELECT relname FROM pg_class'):
+            self.rows = [(name,) for name in conn.indexes]
+
+        # 중복 체크 / 상품 ID 매핑
+        elif sql.startswith('SELECT product_id FROM products'):
+            self.rows = [(pid,) for pid in conn.products
+                         if not params or conn.categories.get(pid) == params[0]]
+        elif sql.startswith('SELECT 1 FROM products'):
+            self.rows = [(1,)] if params[0] in conn.products else []
+        elif 'FROM product_id_map' in sql:
+            self.rows = list(conn.id_map.items())
+        elif sql.startswith('INSERT INTO product_id_map'):
+            conn.id_map[params[0]] = params[1]
+
+        # COPY 대량 적재 (스테이징 → products 병합)
+        elif sql.startswith('SELECT COUNT(*)'):
+            self.rows = [(sum(1 for r in conn.staged if r[0] is None or r[2] is None),)]
+        elif 'INSERT INTO products' in sql and '_staging' in sql:
+            valid = [r for r in conn.staged if r[0] is not None and r[2] is not None]
+            if 'DO NOTHING' in sql:
+                new_ids = [r[0] for r in valid if r[0] not in conn.products]
+            else:
+                new_ids = [r[0] for r in valid]
+            conn.products.update(dict.fromkeys(new_ids))
+            self.rowcount = len(new_ids)
+
+        # save_product 1행 UPSERT
+        elif sql.startswith('INSERT INTO products'):
+            self.rows = [(inserted,) for _, inserted in conn.upsert_products(sql, [params])]
+
+    def copy_expert(self, sql, buffer):
+        self.connection.queries.append((self.name, sql, None))
+        for line in buffer.read().splitlines():
+            self.connection.staged.append([None if v == '\\N' else v for v in line.split('\t')])
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    """
+    테이블:
+        products: {product_id: content_hash} (해시 컬럼 없이 저장하면 None, 상품 ID 목록만 줘도 됨)
+        categories: {product_id: category_name} (카테고리 스냅샷 로드용)
+        info / metrics: 분리 구조 {product_id: content_hash} / {product_id: (price, discount_rate, review_count, rating)}
+        snapshots: {product_id: [이력 값]}
+        id_map: product_id_map {listing_key: product_id}
+        staged: COPY로 받은 스테이징 행
+
+    스키마 플래그:
+        hash_column: products.content_hash 컬럼 있음
+        split: product_info / product_metrics 분리 구조
+        snapshot_table: product_snapshots 테이블 있음 (fail_snapshots=True면 이력 INSERT 실패)
+        indexes: 현재 스키마에 이미 있는 인덱스 이름
+        server_month: DB 서버 시계 기준 이번 달 1일 (기본: 오늘 기준)
+
+    연결 상태:
+        closed: psycopg2와 같은 값 (0 = 열림, 1 = close(), 2 = 끊김)
+        drop_next: 다음 쿼리에서 연결 끊김
+    """
+
+    def __init__(self, products=(), categories=None, id_map=None, hash_column=False, split=False,
+                 snapshot_table=False, indexes=(), drop_next=False):
+        self.products = dict(products) if isinstance(products, dict) else dict.fromkeys(products)
+        self.categories = dict(categories or {})
+        self.products.update(dict.fromkeys(pid for pid in self.categories if pid not in self.products))
+        self.info = {}
+        self.metrics = {}
+        self.snapshots = {}
+        self.id_map = dict(id_map or {})
+        self.staged = []
+
+        self.hash_column = hash_column
+        self.split = split
+        self.snapshot_table = snapshot_table
+        self.fail_snapshots = False
+        self.indexes = set(indexes)
+        self.server_month = date.today().replace(day=1)
+
+        self.closed = 0
+        self.drop_next = drop_next
+        self.autocommit = False
+
+        self.queries = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    @property
+    def statements(self):
+        """실행한 SQL (공백 정리)"""
+        return [sql for _, sql, _ in self.queries]
+
+    def cursor(self, name=None):
+        return FakeCursor(self, name)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        if self.closed:
+            raise psycopg2.InterfaceError("connection already closed")
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = 1
+
+    def upsert_products(self, sql, rows):
+        """products ON CONFLICT 흉내 (DO NOTHING / DO UPDATE [WHERE 해시 다름]) → 쓴 행 [(product_id, 신규 여부)]"""
+        hashed = 'content_hash' in sql.split('VALUES')[0]
+        returned = []
+        for row in rows:
+            product_id = row[0]
+            new_hash = row[-1] if hashed else None
+            if product_id not in self.products:
+                self.products[product_id] = new_hash
+                returned.append((product_id, True))
+            elif 'DO NOTHING' in sql:
+                continue
+            elif 'IS DISTINCT FROM' in sql and self.products[product_id] == new_hash:
+                continue
+            else:
+                self.products[product_id] = new_hash
+                returned.append((product_id, False))
+        return returned
+
+
+def fake_execute_values(cursor, sql, rows, template=None, page_size=100, fetch=False):
+    """
+    psycopg2.extras.execute_values 대체 - 테이블별 ON CONFLICT 동작 흉내
+
+    - products: FakeConnection.upsert_products
+    - product_info: 해시가 다를 때만 갱신, product_metrics: 값이 다를 때만 갱신
+    - product_snapshots: 마지막 이력과 다를 때만 추가
+    """
+    conn = cursor.connection
+    sql = ' '.join(sql.split())
+    conn.queries.append((cursor.name, sql, None))
+    returned = []
+
+    if 'INSERT INTO product_snapshots' in sql:
+        if conn.fail_snapshots:
+            raise RuntimeError("no partition of relation found")
+        for row in rows:
+            history = conn.snapshots.setdefault(row[0], [])
+            if not history or history[-1] != row[1:]:
+                history.append(row[1:])
+                returned.append((row[0],))
+    elif 'INSERT INTO product_info' in sql:
+        for row in rows:
+            product_id, new_hash = row[0], row[-1]
+            if product_id not in conn.info:
+                conn.info[product_id] = new_hash
+                returned.append((product_id, True))
+            elif 'DO NOTHING' not in sql and conn.info[product_id] != new_hash:
+                conn.info[product_id] = new_hash
+                returned.append((product_id, False))
+    elif 'INSERT INTO product_metrics' in sql:
+        for row in rows:
+            product_id, values = row[0], row[1:]
+            if product_id not in conn.metrics:
+                conn.metrics[product_id] = values
+                returned.append((product_id,))
+            elif 'DO NOTHING' not in sql and conn.metrics[product_id] != values:
+                conn.metrics[product_id] = values
+                returned.append((product_id,))
+    elif 'INSERT INTO products' in sql:
+        returned = conn.upsert_products(sql, rows)
+    return returned
+
+
+def patch_execute_values(monkeypatch):
+    """db_connector.execute_values → fake_execute_values (테스트가 끝나면 monkeypatch가 되돌림)"""
+    monkeypatch.setattr('src.database.db_connector.execute_values', fake_execute_values)
+
+
+def make_connector(**flags) -> DatabaseConnector:
+    """가짜 연결을 붙인 DatabaseConnector (flags는 FakeConnection 인자)"""
+    db = DatabaseConnector()
+    db.conn = FakeConnection(**flags)
+    return db
+
+
+def make_product(product_id, price, name=None, review_count=10, rating=4.5, **fields):
+    """테스트 상품 데이터 (할인율 10%, 추가 필드는 fields로)"""
+    return dict({'product_id': product_id, 'product_name': name or f'상품 {product_id}', 'price': price,
+                 'discount_rate': 10, 'review_count': review_count, 'rating': rating}, **fields)
+
+
+def upsert(db, products, skip_duplicates=True, category_name='여성의류'):
+    """같은 카테고리 상품 목록을 upsert_products 1회로 저장"""
+    return db.upsert_products([(category_name, p) for p in products], skip_duplicates)
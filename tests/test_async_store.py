@@ -0,0 +1,133 @@
+"""
+비동기 DB 접근 테스트 (실제 DB 없이 가짜 커넥터 사용)
+목적: DB 호출은 전용 스레드 1개에서만 실행 + 느린 DB 호출 중에도 이벤트 루프가 멈추지 않음
+      + 스냅샷으로 판정되는 중복 체크는 스레드 왕복 없음 + 종료 시 던져둔 작업 완료
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+os.environ.setdefault('DB_PASSWORD', 'test')
+from src.database.db_connector import DatabaseConnector
+from src.database.async_store import AsyncProductStore
+
+
+class SlowConnector(DatabaseConnector):
+    """DB 호출마다 delay초 블로킹 + 호출한 스레드 기록"""
+
+    def __init__(self, delay=0.0, existing=()):
+        super().__init__()
+        self.delay = delay
+        self.existing = set(existing)
+        self.threads = []
+        self.remembered = {}
+
+    def _blocking(self):
+        self.threads.append(threading.current_thread().name)
+        time.sleep(self.delay)
+
+    def connect(self):
+        self._blocking()
+        self.conn = object()
+
+    def close(self):
+        self._blocking()
+        self.conn = None
+
+    def is_duplicate_product(self, product_id, product_data):
+        self._blocking()
+        self.duplicate_queries += 1
+        return product_id in self.existing
+
+    def remember_product_id(self, listing_url, product_id):
+        self._blocking()
+        self.remembered[listing_url] = product_id
+        return True
+
+
+def test_db_calls_run_off_loop():
+    """느린 SELECT 중에도 다른 코루틴(브라우저 작업 대신)이 계속 실행"""
+    db = SlowConnector(delay=0.2, existing={'111'})
+
+    async def main():
+        store = AsyncProductStore(db)
+        await store.connect()
+
+        ticks = []
+
+        async def browser_work():
+            for _ in range(10):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.02)
+
+        duplicate, _ = await asyncio.gather(store.is_duplicate('111'), browser_work())
+        await store.close()
+        return duplicate, ticks
+
+    duplicate, ticks = asyncio.run(main())
+    assert duplicate
+    assert len(ticks) == 10
+    assert max(b - a for a, b in zip(ticks, ticks[1:])) < 0.15  # 0.2초 SELECT 동안 루프가 멈추지 않음
+    assert all(name.startswith('db-store') for name in db.threads)
+    assert len(set(db.threads)) == 1  # 연결/조회/종료 모두 같은 스레드
+
+
+def test_snapshot_hit_skips_thread():
+    """스냅샷으로 판정되면 DB 스레드 호출 없음, 카테고리 스냅샷에 없으면 스레드에서 확인"""
+    db = SlowConnector(existing={'222'})
+
+    async def main():
+        store = AsyncProductStore(db)
+        db.known_ids = {'111'}
+        db.known_ids_scope = None
+        results = [await store.is_duplicate('111'), await store.is_duplicate('333')]
+        assert store.calls == 0 and store.local_hits == 2
+
+        db.known_ids_scope = '여성의류'
+        results.append(await store.is_duplicate('222'))
+        assert store.calls == 1
+        await store.close()
+        return results
+
+    assert asyncio.run(main()) == [True, False, True]
+    assert db.duplicate_queries == 1
+
+
+def test_close_waits_for_submitted_writes():
+    """submit()은 바로 반환, close()는 남은 쓰기 완료 후 연결 종료 + 실패는 로그만"""
+    db = SlowConnector(delay=0.05)
+
+    async def main():
+        store = AsyncProductStore(db)
+        await store.connect()
+
+        started = time.monotonic()
+        for i in range(3):
+            store.submit(db.remember_product_id, f'https://cr.shopping.naver.com/?nvMid={i}', str(i))
+        store.submit(lambda: 1 / 0)
+        assert time.monotonic() - started < 0.05  # 기다리지 않음
+
+        await store.close()
+        await store.close()  # 두 번 호출해도 안전
+        assert store.submit(db.remember_product_id, 'late', '9') is None
+        return store
+
+    store = asyncio.run(main())
+    assert len(db.remembered) == 3
+    assert store.errors == 1
+    assert db.conn is None
+    assert db.threads[-1] == db.threads[0]  # 종료도 같은 DB 스레드에서
+
+
+if __name__ == "__main__":
+    print("=== 비동기 DB 접근 테스트 ===\n")
+    test_db_calls_run_off_loop()
+    print("✓ DB 호출 중 이벤트 루프 진행")
+    test_snapshot_hit_skips_thread()
+    print("✓ 스냅샷 즉시 판정")
+    test_close_waits_for_submitted_writes()
+    print("✓ 종료 시 남은 쓰기 완료")
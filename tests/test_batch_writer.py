@@ -0,0 +1,160 @@
+"""
+백그라운드 일괄 저장 테스트 (실제 DB 없이 가짜 커넥터 사용)
+목적: 개수/시간 기준 배치 저장 + 상품별 _db_status 갱신 + 종료 시 남은 상품 저장
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+os.environ.setdefault('DB_PASSWORD', 'test')
+from src.database.batch_writer import BatchWriter
+
+
+class FakeConnector:
+    """upsert_products 호출(배치)마다 기록, ID가 'dup'으로 시작하면 skipped, 'bad'면 failed"""
+
+    def __init__(self):
+        self.batches = []
+        self.connected = False
+        self.closed = False
+
+    def connect(self):
+        self.connected = True
+
+    def close(self):
+        self.closed = True
+
+    def upsert_products(self, items, skip_duplicates=True):
+        self.batches.append([p['product_id'] for _, p in items])
+        results = []
+        for _, product in items:
+            product_id = product['product_id']
+            if product_id.startswith('dup'):
+                results.append('skipped')
+            elif product_id.startswith('bad'):
+                results.append('failed')
+            else:
+                results.append('saved')
+        return results
+
+
+def _writer(**kwargs):
+    db = FakeConnector()
+    writer = BatchWriter(db_factory=lambda: db, **kwargs)
+    writer.start()
+    return writer, db
+
+
+def test_flush_by_size_and_status():
+    """batch_size개마다 INSERT 1회, 결과는 상품별 _db_status로"""
+    results = []
+    writer, db = _writer(batch_size=3, flush_interval=60,
+                         on_result=lambda product, result: results.append(result))
+    products = [{'product_id': pid} for pid in ['1', 'dup2', 'bad3', '4']]
+    for product in products:
+        writer.submit('여성의류', product)
+    assert products[3]['_db_status'] == 'pending'
+
+    assert writer.flush()
+    assert db.batches == [['1', 'dup2', 'bad3'], ['4']]
+    assert [p['_db_status'] for p in products] == ['saved', 'skipped', 'error', 'saved']
+    assert results == ['saved', 'skipped', 'failed', 'saved']
+    assert writer.stats == {'saved': 2, 'skipped': 1, 'failed': 1}
+    writer.close()
+
+
+def test_flush_by_interval():
+    """batch_size 미만이어도 flush_interval이 지나면 저장"""
+    writer, db = _writer(batch_size=100, flush_interval=0.1)
+    product = {'product_id': '10'}
+    writer.submit('여성의류', product)
+
+    deadline = time.monotonic() + 2
+    while product['_db_status'] == 'pending' and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert product['_db_status'] == 'saved'
+    assert db.batches == [['10']]
+    writer.close()
+
+
+def test_close_flushes_remaining():
+    """종료 시 큐에 남은 상품 저장 + 연결 종료, 종료 후 요청은 error"""
+    writer, db = _writer(batch_size=100, flush_interval=60)
+    products = [{'product_id': str(i)} for i in range(5)]
+    for product in products:
+        writer.submit('여성의류', product)
+
+    writer.close()
+    writer.close()  # 두 번 호출해도 안전
+    assert db.batches == [['0', '1', '2', '3', '4']]
+    assert all(p['_db_status'] == 'saved' for p in products)
+    assert db.closed
+    assert not any(t.name == 'db-batch-writer' and t.is_alive() for t in threading.enumerate())
+
+    late = {'product_id': '99'}
+    writer.submit('여성의류', late)
+    assert late['_db_status'] == 'error'
+
+
+class SlowConnector(FakeConnector):
+    """release가 set될 때까지 저장이 끝나지 않는 커넥터 (DB 지연 재현)"""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def upsert_products(self, items, skip_duplicates=True):
+        self.release.wait(5)
+        return super().upsert_products(items, skip_duplicates)
+
+
+def test_async_backpressure_keeps_loop_running():
+    """큐가 가득 차도 submit_async는 await로 대기 → 그동안 다른 코루틴 계속 실행"""
+    db = SlowConnector()
+    writer = BatchWriter(db_factory=lambda: db, batch_size=1, flush_interval=60, max_queue=1)
+    writer.start()
+    products = [{'product_id': str(i)} for i in range(4)]
+
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while not db.release.is_set():
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        async def release_later():
+            await asyncio.sleep(0.2)
+            db.release.set()
+
+        async def produce():
+            for product in products:
+                await writer.submit_async('여성의류', product)
+
+        await asyncio.gather(ticker(), release_later(), produce())
+        assert await writer.flush_async()
+        await writer.close_async()
+        return ticks
+
+    ticks = asyncio.run(run())
+    assert ticks >= 10  # 저장이 막힌 0.2초 동안 루프가 계속 돎
+    assert writer.backpressure_waits >= 1
+    assert [p['_db_status'] for p in products] == ['saved'] * 4
+    assert db.closed
+
+
+if __name__ == "__main__":
+    print("=== 백그라운드 일괄 저장 테스트 ===\n")
+    test_flush_by_size_and_status()
+    print("✓ 개수 기준 저장 + 상태 갱신")
+    test_flush_by_interval()
+    print("✓ 시간 기준 저장")
+    test_close_flushes_remaining()
+    print("✓ 종료 시 남은 상품 저장")
+    test_async_backpressure_keeps_loop_running()
+    print("✓ 큐가 가득 차도 이벤트 루프 유지")
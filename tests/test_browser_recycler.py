@@ -0,0 +1,67 @@
+"""
+브라우저 재시작 정책 테스트 (브라우저 없이)
+목적: 수집 개수/메모리 기준 재시작 판단 + 재진입 후 처리한 상품 SKIP 확인
+"""
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.core.browser_recycler import BrowserRecycler
+
+
+def test_recycle_after_products():
+    """브라우저 1회 실행당 수집 개수 기준 (재시작 후 다시 0부터)"""
+    recycler = BrowserRecycler(after_products=100)
+    assert recycler.check(99) is None
+    assert recycler.check(100) is not None
+
+    recycler.start_session(100)
+    assert recycler.recycle_count == 1
+    assert recycler.check(150) is None
+    assert recycler.check(200) is not None
+
+    assert not BrowserRecycler().enabled
+    assert BrowserRecycler(after_products=0).check(10_000) is None
+
+
+def test_recycle_on_rss():
+    """메모리 기준 (측정 실패 시 재시작 안 함)"""
+    readings = [1200.0, 3100.0, None]
+    recycler = BrowserRecycler(max_rss_mb=3000, rss_probe=lambda: readings.pop(0))
+
+    assert recycler.check(0) is None
+    reason = recycler.check(0)
+    assert reason is not None and '3100MB' in reason
+    assert recycler.check(0) is None
+    assert recycler.enabled
+
+
+def test_remember_and_skip_handled():
+    """재시작 직전 처리 기록 → 새 리스트에서 처리한 상품만 SKIP"""
+    recycler = BrowserRecycler(after_products=10)
+    keys = ['101', '102', '103', '104', '105']
+    recycler.remember(keys, {0, 1, 3})
+
+    assert recycler.last_key == '104'
+    assert recycler.last_position == 4
+
+    new_listing = ['101', '999', '102', '104', '105']  # 재진입 후 순서가 조금 바뀜
+    skipped = [key for key in new_listing if recycler.is_handled(key)]
+    assert skipped == ['101', '102', '104']
+    assert recycler.restored_skips == 3
+    assert not recycler.is_handled(None)
+
+    # 다음 재시작 때 기록 누적
+    recycler.remember(new_listing, {1, 4})
+    assert recycler.handled_keys == {'101', '102', '104', '999', '105'}
+    assert recycler.last_key == '105'
+
+
+if __name__ == "__main__":
+    print("=== 브라우저 재시작 정책 테스트 ===\n")
+    test_recycle_after_products()
+    print("✓ 수집 개수 기준 재시작")
+    test_recycle_on_rss()
+    print("✓ 메모리 기준 재시작")
+    test_remember_and_skip_handled()
+    print("✓ 처리 기록 + 재진입 SKIP")
@@ -0,0 +1,85 @@
+"""
+COPY 대량 적재 테스트 (실제 DB 없이 가짜 연결 사용)
+목적: COPY text 형식 이스케이프 + 스테이징 → 병합 1회 + JSON 파일 가져오기 집계 확인
+"""
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+os.environ.setdefault('DB_PASSWORD', 'test')
+from src.database.db_connector import DatabaseConnector
+from src.database.bulk_loader import BulkLoader, _copy_text
+from fake_db import FakeConnection
+
+
+def _loader(products=()):
+    db = DatabaseConnector()
+    db.conn = FakeConnection(products)
+    return BulkLoader(db), db.conn
+
+
+def test_copy_text_escaping():
+    """NULL/탭/줄바꿈/역슬래시/배열 필드 변환"""
+    assert _copy_text(None) == '\\N'
+    assert _copy_text('a\tb\nc\\d') == 'a\\tb\\nc\\\\d'
+    assert _copy_text(39900) == '39900'
+    assert _copy_text(['린넨', '셔츠 "원피스"']) == '{"린넨","셔츠 \\\\"원피스\\\\""}'
+
+
+def test_load_merges_once():
+    """COPY 후 병합 1회 + 커밋 1회, 기존 상품은 skipped, 상품명 없는 행은 failed"""
+    loader, conn = _loader(products={'111'})
+    products = [
+        {'product_id': '111', 'product_name': '기존 상품', 'price': 1000},
+        {'product_id': '222', 'product_name': '새 상품\t탭', 'price': 2000, 'search_tags': ['a', 'b']},
+        {'product_id': '222', 'product_name': '새 상품 (마지막 값)', 'price': 2100},
+        {'product_id': '333', 'product_name': None},
+    ]
+    result = loader.load('여성의류', products)
+
+    assert result['saved'] == 1
+    assert result['skipped'] == 2  # DB에 있음 1 + 목록 안 중복 1
+    assert result['failed'] == 1
+    assert result['rows'] == 4 and result['rows_per_sec'] > 0
+
+    assert len(conn.staged) == 3
+    assert conn.staged[1][2] == '새 상품 (마지막 값)'
+    assert sum('INSERT INTO products' in s for s in conn.statements) == 1
+    assert any(s.startswith('CREATE UNLOGGED TABLE products_staging_') for s in conn.statements)
+    assert conn.commits == 1
+
+
+def test_import_json_files(tmp_path):
+    """save_to_json 형식 파일 여러 개 가져오기 (파일의 category 사용)"""
+    for i in range(2):
+        data = {
+            'category': '여성의류',
+            'total_count': 1,
+            'products': [{
+                'product_url': f'https://smartstore.naver.com/main/products/90{i}',
+                'detail_page_info': {'detail_product_name': f'상품 {i}', 'detail_price': 1000 + i},
+            }],
+        }
+        (tmp_path / f'womens_products_{i}.json').write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+
+    loader, conn = _loader()
+    totals = loader.import_json_files([str(tmp_path / '*.json')])
+
+    assert totals['files'] == 2
+    assert totals['saved'] == 2
+    assert set(conn.products) == {'900', '901'}
+    assert conn.staged[0][1] == '여성의류'
+
+
+if __name__ == "__main__":
+    import tempfile
+    print("=== COPY 대량 적재 테스트 ===\n")
+    test_copy_text_escaping()
+    print("✓ COPY text 이스케이프")
+    test_load_merges_once()
+    print("✓ 스테이징 → 병합 1회")
+    with tempfile.TemporaryDirectory() as tmp:
+        test_import_json_files(Path(tmp))
+    print("✓ JSON 파일 가져오기")
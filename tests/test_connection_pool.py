@@ -0,0 +1,152 @@
+"""
+DB 연결 풀 + 재연결 테스트 (실제 DB 없이 가짜 연결 사용)
+목적: 연결 재사용 + 상한/대기 + 오래 쉰 연결 상태 확인 + 끊긴 연결 재연결 후 실패한 배치 재시도
+"""
+import os
+import sys
+import threading
+from pathlib import Path
+
+import psycopg2
+
+sys.path.append(str(Path(__file__).parent.parent))
+os.environ.setdefault('DB_PASSWORD', 'test')
+from src.database.connection_pool import ConnectionPool, PoolTimeout
+from src.database.db_connector import DatabaseConnector
+from fake_db import FakeConnection
+
+
+def _pool(**kwargs):
+    created = []
+
+    def factory():
+        conn = FakeConnection(snapshot_table=True)
+        created.append(conn)
+        return conn
+
+    return ConnectionPool(factory, **kwargs), created
+
+
+def test_reuse_and_limit():
+    """반납한 연결 재사용 + 상한 도달 시 대기 후 타임아웃, reserve()로 상한 증가"""
+    pool, created = _pool(max_size=1, max_connections=3, spare_connections=1, acquire_timeout=0.1)
+    conn = pool.acquire()
+    pool.release(conn)
+    assert pool.acquire() is conn
+    assert len(created) == 1
+
+    try:
+        pool.acquire()
+        assert False, "상한 초과 시 PoolTimeout"
+    except PoolTimeout:
+        pass
+
+    assert pool.reserve(2) == 3  # DB 스레드 2개 + 여유 1개
+    assert pool.reserve(10) == 3  # max_connections 초과 안 함
+    second = pool.acquire()
+    assert second is not conn
+
+    stats = pool.get_stats()
+    assert stats['created'] == 2 and stats['reused'] == 1 and stats['waits'] >= 1
+    assert stats['in_use'] == 2 and stats['open'] == 2
+
+
+def test_waiter_gets_released_connection():
+    """상한에서 대기 중인 스레드는 반납된 연결을 받음"""
+    pool, created = _pool(max_size=1, acquire_timeout=2)
+    conn = pool.acquire()
+    got = []
+    waiter = threading.Thread(target=lambda: got.append(pool.acquire()))
+    waiter.start()
+    pool.release(conn)
+    waiter.join(2)
+    assert got == [conn]
+    assert len(created) == 1
+
+
+def test_health_check_discards_broken():
+    """끊긴 연결/오래 쉬다 SELECT 1 실패한 연결은 버리고 새로 연결"""
+    pool, created = _pool(max_size=2, health_check_interval=0)
+    conn = pool.acquire()
+    pool.release(conn)
+    conn.drop_next = True  # 쉬는 동안 서버가 연결 종료
+
+    fresh = pool.acquire()
+    assert fresh is not conn
+    assert conn.closed
+    assert pool.get_stats()['health_check_failures'] == 1
+
+    fresh.closed = 1
+    pool.release(fresh)  # 닫힌 연결은 풀에 돌려놓지 않음
+    assert pool.get_stats()['idle'] == 0
+
+
+def test_reconnect_retries_failed_save():
+    """저장 중 연결이 끊기면 재연결 후 같은 저장을 다시 실행 (upsert_products 배치도 같은 방식)"""
+    pool, created = _pool(max_size=2)
+    db = DatabaseConnector(pool=pool)
+    db.connect()
+    first = db.conn
+    first.drop_next = True
+
+    result = db.save_product('여성의류', {'product_id': '111', 'product_name': '린넨 셔츠'},
+                             skip_duplicates=False)
+    assert result == 'saved'
+    assert db.conn is not first and first.closed
+    assert db.conn.commits == 2  # 이력 파티션 생성 1회 + 저장 1회
+    assert db.reconnects == 1
+    assert pool.get_stats()['reconnects'] == 1
+
+    db.close()
+    assert db.conn is None
+    assert pool.get_stats()['idle'] == 1  # 닫지 않고 풀에 반납
+
+
+def test_reconnect_inside_duplicate_check():
+    """중복 체크 중 연결이 끊겨 재연결되면 저장도 새 연결에서 실행 (끊긴 연결의 커서 사용 안 함)"""
+    pool, created = _pool(max_size=2)
+    db = DatabaseConnector(pool=pool)
+    db.connect()
+    first = db.conn
+    first.drop_next = True
+
+    result = db.save_product('여성의류', {'product_id': '222', 'product_name': '린넨 바지'})
+    assert result == 'saved'
+    assert db.reconnects == 1
+    assert db.conn is not first
+    assert db.conn.commits == 2  # 이력 파티션 생성 1회 + 저장 1회
+    assert any(sql.startswith('INSERT INTO products') for sql in db.conn.statements)
+
+
+def test_query_error_does_not_reconnect():
+    """연결이 살아 있는 쿼리 오류는 재연결하지 않음"""
+    pool, _ = _pool()
+    db = DatabaseConnector(pool=pool)
+    db.connect()
+    assert not db._connection_lost(psycopg2.OperationalError("canceling statement due to statement timeout"))
+    assert not db._connection_lost(ValueError("bad row"))
+    db.conn.closed = 2
+    assert db._connection_lost(psycopg2.InterfaceError("connection already closed"))
+
+    # 실패한 커서의 연결 기준 (self.conn은 이미 재연결된 새 연결)
+    stale = FakeConnection()
+    stale.closed = 2
+    db.conn = FakeConnection()
+    assert db._connection_lost(psycopg2.InterfaceError("connection already closed"), stale.cursor())
+    assert not db._connection_lost(psycopg2.InterfaceError("connection already closed"))
+
+
+if __name__ == "__main__":
+    print("=== DB 연결 풀 + 재연결 테스트 ===\n")
+    test_reuse_and_limit()
+    print("✓ 연결 재사용 + 상한")
+    test_waiter_gets_released_connection()
+    print("✓ 반납 대기")
+    test_health_check_discards_broken()
+    print("✓ 상태 확인 실패 연결 교체")
+    test_reconnect_retries_failed_save()
+    print("✓ 끊긴 연결 재연결 + 재시도")
+    test_reconnect_inside_duplicate_check()
+    print("✓ 중복 체크 중 재연결")
+    test_query_error_does_not_reconnect()
+    print("✓ 쿼리 오류는 재연결 안 함")
@@ -0,0 +1,85 @@
+"""
+content_hash 변경 감지 테스트 (실제 DB 없이 가짜 연결 + execute_values 대체)
+목적: 내용이 같은 상품은 UPSERT가 행을 갱신하지 않음 + 'updated' / 'unchanged' 구분 집계
+      (해시 비교는 fake_db가 흉내 - 여기서는 생성한 SQL 조건과 RETURNING 결과 집계만 검증)
+"""
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+os.environ.setdefault('DB_PASSWORD', 'test')
+from src.database.db_connector import content_hash
+from src.database.bulk_loader import BulkLoader
+from fake_db import make_connector, make_product, patch_execute_values
+
+
+def _product(product_id, price):
+    return make_product(product_id, price, search_tags=['린넨'])
+
+
+def test_hash_covers_mutable_fields():
+    """상품 ID를 뺀 컬럼 기준 - 같은 내용이면 같은 해시, 가격이 바뀌면 다른 해시"""
+    db = make_connector(hash_column=True)
+    row = db._product_row('여성의류', _product('1', 1000))
+    assert content_hash(row) == content_hash(db._product_row('여성의류', _product('1', 1000)))
+    assert content_hash(row) != content_hash(db._product_row('여성의류', _product('1', 1100)))
+    assert len(content_hash(row)) == 32
+
+
+def test_upsert_skips_unchanged_rows(monkeypatch):
+    """갱신 모드: 신규 'saved', 내용 변경 'updated', 내용 같음 'unchanged' (행 갱신 없음)"""
+    patch_execute_values(monkeypatch)
+    db = make_connector(hash_column=True)
+    first = db.upsert_products([('여성의류', _product(pid, 1000)) for pid in ('1', '2')],
+                               skip_duplicates=False)
+    assert first == ['saved', 'saved']
+
+    items = [('여성의류', _product('1', 1000)), ('여성의류', _product('2', 900)),
+             ('여성의류', _product('3', 500))]
+    assert db.upsert_products(items, skip_duplicates=False) == ['unchanged', 'updated', 'saved']
+
+    sql = db.conn.statements[-1]
+    assert 'content_hash = EXCLUDED.content_hash' in sql
+    assert 'WHERE products.content_hash IS DISTINCT FROM EXCLUDED.content_hash' in sql
+
+    totals = db.save_products_batch('여성의류', [_product('1', 1000), _product('2', 800)],
+                                    skip_duplicates=False)
+    assert totals == {'saved': 0, 'updated': 1, 'unchanged': 1, 'skipped': 0, 'failed': 0}
+
+
+def test_without_column_keeps_old_upsert(monkeypatch):
+    """content_hash 컬럼이 없으면 (마이그레이션 전) 기존 UPSERT - 모든 중복 행 갱신"""
+    patch_execute_values(monkeypatch)
+    db = make_connector(hash_column=False)
+    db.upsert_products([('여성의류', _product('1', 1000))], skip_duplicates=False)
+    assert db.upsert_products([('여성의류', _product('1', 1000))], skip_duplicates=False) == ['updated']
+    assert 'content_hash' not in db.conn.statements[-1]
+    assert db.content_hash_enabled is False
+
+
+def test_bulk_merge_counts_inserted_and_updated():
+    """대량 적재 병합: 해시 조건 + 신규/갱신 개수 1행 반환"""
+    loader = BulkLoader(make_connector(hash_column=True))
+    sql = ' '.join(loader._merge_sql(skip_duplicates=False, hashed=True).split())
+    assert sql.startswith('WITH merged AS ( INSERT INTO products')
+    assert 'IS DISTINCT FROM EXCLUDED.content_hash RETURNING (xmax = 0) AS inserted' in sql
+    assert 'COUNT(*) FILTER (WHERE NOT inserted)' in sql
+
+    rows, converted = loader._build_rows('여성의류', [_product('1', 1000)], hashed=True)
+    assert converted == 1 and rows[0][-1] == content_hash(rows[0][:-1])
+
+
+if __name__ == "__main__":
+    import pytest
+    print("=== content_hash 변경 감지 테스트 ===\n")
+    test_hash_covers_mutable_fields()
+    print("✓ 해시 계산")
+    with pytest.MonkeyPatch.context() as mp:
+        test_upsert_skips_unchanged_rows(mp)
+    print("✓ 변경 없음/갱신 구분")
+    with pytest.MonkeyPatch.context() as mp:
+        test_without_column_keeps_old_upsert(mp)
+    print("✓ 컬럼 없을 때 기존 UPSERT")
+    test_bulk_merge_counts_inserted_and_updated()
+    print("✓ 대량 적재 병합 SQL")
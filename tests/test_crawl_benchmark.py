@@ -0,0 +1,493 @@
+"""
+크롤러 성능 벤치마크 (네트워크 없이 합성 페이지 사용)
+목적: 최적화 전/후 페이지당 처리 시간 비교
+
+실행: python tests/test_crawl_benchmark.py
+"""
+import asyncio
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from playwright.async_api import async_playwright
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.core.detail_extractor import EXTRACT_DETAIL_JS, build_product_data
+from src.core.resource_policy import ResourcePolicy
+
+from src.core.simple_crawler import SimpleCrawler
+from src.core.listing_queue import ListingQueue
+from src.core.handle_registry import ProductHandleRegistry
+
+# config는 로드 시 DB_PASSWORD를 확인함 (SELECTORS 사용 + SimpleCrawler 생성, 벤치마크는 DB에 연결하지 않음)
+os.environ.setdefault('DB_PASSWORD', 'benchmark')
+from src.utils.config import SELECTORS
+from src.utils.selector_helper import SelectorHelper
+from src.utils.selector_stats import SelectorStats
+
+
+# =====================================================
+# 합성 상세 페이지 (실제 스마트스토어와 비슷한 규모)
+# =====================================================
+def build_detail_html(nav_links: int = 300, filler_blocks: int = 1500, reviews: int = 300) -> str:
+    """헤더 링크 + 요약 영역 + 상세 본문 + 리뷰 + 태그가 있는 상세 페이지"""
+    parts = ['<html><body><header><nav>']
+    parts += [f'<a href="/menu/{i}">메뉴 {i}</a>' for i in range(nav_links)]
+    parts.append('</nav><div class="banner"><span>최대 50% 쿠폰</span></div></header>')
+
+    # 요약 영역
+    parts.append('''
+        <div class="summary">
+            <div class="title"><h3 class="DCVBehA8ZB">벤치마크 테스트 원피스</h3></div>
+            <div class="rating"><span>평점</span> <strong>4.8</strong></div>
+            <div class="review"><a href="#review">리뷰 <strong>1,234</strong></a></div>
+            <div class="price"><span>30%</span> <strong class="Izp3Con8h8">39,900원</strong></div>
+            <img class="image_thumb" src="https://shop-phinf.pstatic.net/thumb.jpg">
+        </div>
+    ''')
+
+    # 상세 본문 (필러)
+    parts.append('<div class="detail">')
+    for i in range(filler_blocks):
+        parts.append(f'<div class="block"><p>상세 설명 문단 {i}</p><span>옵션 {i}</span></div>')
+    parts.append('<table><tr><th>브랜드</th><td>벤치브랜드</td></tr><tr><th>소재</th><td>면</td></tr></table>')
+    parts.append('</div>')
+
+    # 리뷰 목록
+    parts.append('<ul class="reviews">')
+    for i in range(reviews):
+        parts.append(f'<li><span>구매자 {i}</span><p>좋아요 {i}</p><a href="/r/{i}">더보기</a></li>')
+    parts.append('</ul>')
+
+    # 관련 태그
+    parts.append('<div><span>관련 태그</span><ul>')
+    for i in range(12):
+        parts.append(f'<li><a href="/search?q=tag{i}">#태그{i:02d}</a></li>')
+    parts.append('</ul></div></body></html>')
+    return ''.join(parts)
+
+
+# =====================================================
+# 기존 방식 (v1.8.5 _collect_product_info - 스크롤 대기 제외)
+# =====================================================
+async def legacy_collect(page) -> dict:
+    data = {}
+    elem = await page.query_selector('h3.DCVBehA8ZB')
+    data['product_name'] = await elem.inner_text() if elem else None
+
+    data['brand_name'] = await page.evaluate('''() => {
+        for (let elem of document.querySelectorAll('td, th')) {
+            if ((elem.textContent || '').trim() === '브랜드') {
+                const next = elem.nextElementSibling;
+                if (next && next.textContent.trim().length < 50) return next.textContent.trim();
+            }
+        }
+        return null;
+    }''')
+
+    elem = await page.query_selector('strong.Izp3Con8h8')
+    if elem:
+        price_clean = re.sub(r'[^\d]', '', await elem.inner_text())
+        data['price'] = int(price_clean) if price_clean else None
+
+    data['discount_rate'] = await page.evaluate('''() => {
+        for (let elem of document.querySelectorAll('*')) {
+            const text = elem.textContent || '';
+            if (text.includes('%') && text.length < 20) {
+                const match = text.match(/(\\d+)%/);
+                if (match && elem.children.length <= 1) return match[1];
+            }
+        }
+        return null;
+    }''')
+
+    data['review_count'] = await page.evaluate('''() => {
+        for (let elem of document.querySelectorAll('*')) {
+            const text = elem.textContent || '';
+            if (text.includes('리뷰') && text.length < 20) {
+                const match = text.match(/리뷰\\s*(\\d+)/);
+                if (match) return match[1];
+            }
+        }
+        return null;
+    }''')
+
+    data['rating'] = await page.evaluate('''() => {
+        for (let elem of document.querySelectorAll('*')) {
+            const text = elem.textContent || '';
+            if ((text.includes('평점') || text.includes('별점')) && text.length < 30) {
+                const match = text.match(/(\\d+\\.\\d+)/);
+                if (match) return parseFloat(match[1]);
+            }
+        }
+        return null;
+    }''')
+
+    tags = set()
+    for link in await page.query_selector_all('a'):
+        text = await link.inner_text()
+        if text and text.strip().startswith('#'):
+            clean = text.strip().replace('#', '').strip()
+            if 1 < len(clean) < 30:
+                tags.add(clean)
+    data['search_tags'] = list(tags)
+
+    elem = await page.query_selector('img[class*="image"]')
+    data['thumbnail_url'] = await elem.get_attribute('src') if elem else None
+    return data
+
+
+async def optimized_collect(page) -> dict:
+    raw = await page.evaluate(EXTRACT_DETAIL_JS)
+    return build_product_data(raw, page.url, '벤치마크')
+
+
+async def _time_per_page(page, collect, repeat: int) -> float:
+    """페이지당 평균 처리 시간 (ms)"""
+    await collect(page)  # 워밍업
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await collect(page)
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+async def bench_extraction(browser, repeat: int = 10):
+    """[1] 상세 페이지 필드 추출: 기존 ~8회 + 링크 수만큼 왕복 vs evaluate 1회"""
+    page = await browser.new_page()
+    await page.set_content(build_detail_html())
+
+    legacy = await legacy_collect(page)
+    optimized = await optimized_collect(page)
+    assert optimized['product_name'] == legacy['product_name']
+    assert optimized['price'] == legacy['price']
+    assert sorted(optimized['search_tags']) == sorted(legacy['search_tags'])
+
+    legacy_ms = await _time_per_page(page, legacy_collect, repeat)
+    optimized_ms = await _time_per_page(page, optimized_collect, repeat)
+    await page.close()
+
+    print("[1] 상세 페이지 필드 추출 (페이지당)")
+    print(f"    기존 방식   : {legacy_ms:8.1f} ms")
+    print(f"    일괄 추출   : {optimized_ms:8.1f} ms  (x{legacy_ms / optimized_ms:.1f})")
+    print(f"    리뷰 수     : 기존 {legacy['review_count']} → 일괄 {optimized['review_count']} (쉼표 처리)")
+
+
+# =====================================================
+# 가짜 상세 페이지 서버 (route.fulfill) - 이미지/폰트/비콘 포함
+# =====================================================
+BENCH_ORIGIN = 'https://bench.local'
+BENCH_POLICY = {
+    'enabled': True,
+    'listing': {'block_types': ['media', 'font'], 'block_patterns': ['/beacon']},
+    'detail': {'block_types': ['image', 'media', 'font'], 'block_patterns': ['/beacon']},
+}
+
+
+def build_resource_page_html(images: int = 40, fonts: int = 3, beacons: int = 5) -> str:
+    """상세 페이지 HTML + 외부 리소스 (이미지/폰트/비콘)"""
+    parts = [f'<html><head><style>'
+             + ''.join(f'@font-face {{ font-family: f{i}; src: url({BENCH_ORIGIN}/font/{i}.woff2); }}'
+                       for i in range(fonts))
+             + 'body { font-family: f0, f1, f2; }</style></head><body>']
+    parts.append(build_detail_html(nav_links=50, filler_blocks=200, reviews=50))
+    parts += [f'<img class="image_review" src="{BENCH_ORIGIN}/img/{i}.jpg">' for i in range(images)]
+    parts += [f'<script>fetch("{BENCH_ORIGIN}/beacon?e={i}").catch(() => {{}});</script>' for i in range(beacons)]
+    parts.append('</body></html>')
+    return ''.join(parts)
+
+
+async def _serve_bench(route):
+    """bench.local 요청 응답 (리소스마다 20ms 지연 + 크기 있는 본문)"""
+    url = route.request.url
+    if url.endswith('/detail'):
+        await route.fulfill(status=200, content_type='text/html; charset=utf-8', body=build_resource_page_html())
+        return
+    await asyncio.sleep(0.02)
+    if '/img/' in url:
+        await route.fulfill(status=200, content_type='image/jpeg', body=b'\0' * 60_000)
+    elif '/font/' in url:
+        await route.fulfill(status=200, content_type='font/woff2', body=b'\0' * 40_000)
+    else:
+        await route.fulfill(status=204, body=b'')
+
+
+async def _time_detail_load(browser, policy, repeat: int) -> float:
+    """상세 페이지 load 이벤트까지 평균 시간 (ms)"""
+    context = await browser.new_context()
+    await context.route(f'{BENCH_ORIGIN}/**', _serve_bench)
+    if policy:
+        await policy.install(context)  # 나중에 등록 → 먼저 실행, 통과 시 fallback으로 가짜 서버
+    page = await context.new_page()
+
+    await page.goto(f'{BENCH_ORIGIN}/detail', wait_until='load')  # 워밍업
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await page.goto(f'{BENCH_ORIGIN}/detail', wait_until='load')
+    elapsed = (time.perf_counter() - started) / repeat * 1000
+    await context.close()
+    return elapsed
+
+
+async def bench_resource_policy(browser, repeat: int = 5):
+    """[2] 리소스 차단: 상세 페이지 load 시간 + 차단 요청/절약 바이트"""
+    baseline_ms = await _time_detail_load(browser, None, repeat)
+    policy = ResourcePolicy(BENCH_POLICY)
+    blocked_ms = await _time_detail_load(browser, policy, repeat)
+    stats = policy.get_stats()
+
+    print("\n[2] 리소스 차단 (상세 페이지 load까지)")
+    print(f"    차단 없음   : {baseline_ms:8.1f} ms")
+    print(f"    차단 정책   : {blocked_ms:8.1f} ms  (x{baseline_ms / blocked_ms:.1f})")
+    print(f"    차단 요청   : {stats['blocked']}개 / 전체 {stats['blocked'] + stats['allowed']}개 "
+          f"{stats['blocked_by_role']['detail']}")
+    print(f"    절약 (추정) : {stats['bytes_saved'] / (repeat + 1) / 1024:.0f} KB/페이지")
+
+
+# =====================================================
+# 합성 리스트 페이지 (필터링된 상품 카드)
+# =====================================================
+def build_listing_html(cards: int = 200) -> str:
+    parts = ['<html><body><div style="display:grid;grid-template-columns:repeat(4,300px);gap:20px">']
+    for i in range(cards):
+        parts.append(
+            f'<a class="ProductCard_link" data-filtered="true" href="https://smartstore.naver.com/s/products/{i}" '
+            f'style="display:block;height:400px"><img src="data:,"><span>상품 {i}</span></a>'
+        )
+    parts.append('</div></body></html>')
+    return ''.join(parts)
+
+
+async def _time_listing_loop(browser, crawler, products: int) -> float:
+    """클릭 모드 상품 1개당 리스트 페이지 작업 (카드 조회 + href + 오버레이 3단계) 평균 시간 (ms)"""
+    page = await browser.new_page()
+    await page.set_content(build_listing_html())
+
+    started = time.perf_counter()
+    for idx in range(products):
+        links = await page.query_selector_all('a[data-filtered="true"]')
+        await links[idx].get_attribute('href')
+        await crawler._mark_product(page, idx, '#FFD700', '클릭 준비 중...', text_color='black', scroll=True)
+        await crawler._mark_product(page, idx, '#FF0000', '클릭 중...')
+        await links[idx].hover()  # 클릭 대신 (slow_mo가 적용되는 입력 동작)
+        await crawler._mark_product(page, idx, '#00FF00', '✓ 수집 완료', text_color='black')
+    elapsed = (time.perf_counter() - started) / products * 1000
+    await page.close()
+    return elapsed
+
+
+async def bench_throughput_mode(p, products: int = 20):
+    """[3] 처리량 모드: 오버레이 evaluate + smooth 스크롤 + slow_mo 생략"""
+    results = {}
+    for throughput_mode in (False, True):
+        crawler = SimpleCrawler(save_to_db=False, throughput_mode=throughput_mode, block_resources=False)
+        browser = await p.firefox.launch(headless=True, slow_mo=crawler.SLOW_MO)
+        try:
+            results[throughput_mode] = await _time_listing_loop(browser, crawler, products)
+        finally:
+            await browser.close()
+
+    visual_ms, fast_ms = results[False], results[True]
+    print("\n[3] 처리량 모드 (상품 1개당 리스트 페이지 작업)")
+    print(f"    시각 효과   : {visual_ms:8.1f} ms  (slow_mo=300, 오버레이 3회)")
+    print(f"    처리량 모드 : {fast_ms:8.1f} ms  (x{visual_ms / fast_ms:.1f})")
+
+
+# =====================================================
+# 무한 스크롤 필터링: 기존 전체 재검사 vs 증분 옵저버
+# =====================================================
+LEGACY_FILTER_JS = '''() => {
+    const sort = document.querySelector('#product-sort-address-container');
+    if (!sort) return {newFiltered: 0, totalLinks: 0};
+    const sortY = sort.getBoundingClientRect().bottom;
+    const allLinks = Array.from(document.querySelectorAll('a[class*="ProductCard_link"]'));
+    let newFilteredCount = 0;
+    allLinks.forEach(link => {
+        const rect = link.getBoundingClientRect();
+        const labelId = link.getAttribute('aria-labelledby') || '';
+        const isRecommendation = labelId.includes('related_recommend_product_information');
+        if (!link.hasAttribute('data-filtered')) {
+            if (rect.top > sortY && !isRecommendation) {
+                link.setAttribute('data-filtered', 'true');
+                newFilteredCount++;
+            }
+        }
+    });
+    return {newFiltered: newFilteredCount, totalLinks: allLinks.length};
+}'''
+
+APPEND_CARDS_JS = '''([start, count]) => {
+    const grid = document.getElementById('grid');
+    const frag = document.createDocumentFragment();
+    for (let i = start; i < start + count; i++) {
+        const li = document.createElement('li');
+        const a = document.createElement('a');
+        a.className = 'ProductCard_link__x1';
+        a.href = 'https://smartstore.naver.com/s/products/' + i + '?nvMid=' + (80000000 + i);
+        if (i % 10 === 9) a.setAttribute('aria-labelledby', 'related_recommend_product_information_' + i);
+        a.style.cssText = 'display:block;height:300px';
+        a.textContent = '상품 ' + i;
+        li.appendChild(a);
+        frag.appendChild(li);
+    }
+    grid.appendChild(frag);
+}'''
+
+
+def build_scroll_listing_html(top_cards: int = 6) -> str:
+    """정렬 옵션 위 광고 카드 + 빈 상품 그리드"""
+    parts = ['<html><body><div class="top">']
+    parts += [f'<a class="ProductCard_link__ad" href="https://ad/{i}">광고 {i}</a>' for i in range(top_cards)]
+    parts.append('</div><div id="product-sort-address-container"><button>정렬</button></div>')
+    parts.append('<ul id="grid"></ul></body></html>')
+    return ''.join(parts)
+
+
+async def _legacy_batches(page, batches: int, per_batch: int) -> list:
+    """배치마다 카드 추가 → 전체 카드 재검사 + a[data-filtered] 핸들 전체 조회 (기존 방식)"""
+    times = []
+    for b in range(batches):
+        started = time.perf_counter()
+        await page.evaluate(APPEND_CARDS_JS, [b * per_batch, per_batch])
+        await page.evaluate(LEGACY_FILTER_JS)
+        links = await page.query_selector_all('a[data-filtered="true"]')
+        _ = len(links)
+        times.append((time.perf_counter() - started) * 1000)
+    return times
+
+
+async def _observer_batches(page, queue: ListingQueue, batches: int, per_batch: int) -> list:
+    """배치마다 카드 추가 (옵저버가 새 카드만 분류) → 새 항목만 drain (증분 방식)"""
+    times = []
+    for b in range(batches):
+        started = time.perf_counter()
+        await page.evaluate(APPEND_CARDS_JS, [b * per_batch, per_batch])
+        await page.wait_for_function('(n) => window.__crawlQueue.length >= n', arg=len(queue) + 1)
+        await queue.drain(page)
+        times.append((time.perf_counter() - started) * 1000)
+    return times
+
+
+async def bench_incremental_filter(browser, batches: int = 40, per_batch: int = 40):
+    """[4] 스크롤 배치 필터링: 배치가 쌓일수록 기존 방식은 느려짐 (전체 재검사)"""
+    page = await browser.new_page()
+    await page.set_content(build_scroll_listing_html())
+    legacy_times = await _legacy_batches(page, batches, per_batch)
+    legacy_hrefs = await page.evaluate(
+        '''() => Array.from(document.querySelectorAll('a[data-filtered="true"]')).map(a => a.href)'''
+    )
+    await page.close()
+
+    page = await browser.new_page()
+    await page.set_content(build_scroll_listing_html())
+    queue = ListingQueue()
+    await queue.install(page)
+    observer_times = await _observer_batches(page, queue, batches, per_batch)
+    await page.close()
+
+    assert queue.hrefs == legacy_hrefs, "필터링 결과가 기존 방식과 다름"
+
+    first, last = slice(0, 5), slice(-5, None)
+    avg = lambda values: sum(values) / len(values)
+    print(f"\n[4] 스크롤 배치 필터링 ({batches}배치 x {per_batch}개, 최종 {len(queue)}개 선택)")
+    print(f"    기존 방식   : 처음 5배치 {avg(legacy_times[first]):6.1f} ms → 마지막 5배치 {avg(legacy_times[last]):6.1f} ms")
+    print(f"    증분 옵저버 : 처음 5배치 {avg(observer_times[first]):6.1f} ms → 마지막 5배치 {avg(observer_times[last]):6.1f} ms")
+    print(f"    전체 합계   : 기존 {sum(legacy_times):7.1f} ms / 증분 {sum(observer_times):7.1f} ms")
+
+
+async def bench_handle_lookup(browser, cards: int = 2000, samples: int = 20):
+    """[5] 상품 1개 조회: 인덱스마다 query_selector_all vs 레지스트리 단일 조회"""
+    page = await browser.new_page()
+    await page.set_content(build_scroll_listing_html())
+    await page.evaluate(APPEND_CARDS_JS, [0, cards])
+    queue = ListingQueue()
+    await queue.install(page)
+    indices = [len(queue) - samples + i for i in range(samples)]  # 뒤쪽 인덱스 (가장 느린 구간)
+
+    started = time.perf_counter()
+    for idx in indices:
+        fresh_links = await page.query_selector_all('a[data-filtered="true"]')
+        await fresh_links[idx].get_attribute('href')
+    legacy_ms = (time.perf_counter() - started) / samples * 1000
+
+    registry = ProductHandleRegistry(queue)
+    started = time.perf_counter()
+    for idx in indices:
+        handle = await registry.resolve(page, idx)
+        await handle.get_attribute('href')
+    registry_ms = (time.perf_counter() - started) / samples * 1000
+    await registry.dispose_all()
+    await page.close()
+
+    print(f"\n[5] 상품 카드 조회 (필터링 {len(queue)}개 중 뒤쪽 {samples}개)")
+    print(f"    query_selector_all : {legacy_ms:8.1f} ms/개")
+    print(f"    레지스트리 조회    : {registry_ms:8.1f} ms/개  (x{legacy_ms / registry_ms:.1f}, 남은 핸들 {registry.live_count}개)")
+
+
+# =====================================================
+# 셀렉터 일괄 해결 (SelectorHelper.resolve_all)
+# =====================================================
+DETAIL_FIELDS = {
+    "상품명": SELECTORS['product_name'],
+    "브랜드": SELECTORS['brand_name'],
+    "가격": SELECTORS['price'],
+    "할인율": SELECTORS['discount_rate'],
+    "리뷰 수": SELECTORS['review_count'],
+    "평점": SELECTORS['rating'],
+    "썸네일": {'selectors': SELECTORS['thumbnail'], 'attribute': 'src'},
+    "품절": SELECTORS['is_sold_out'],
+}
+
+
+async def _per_field_collect(helper, page) -> dict:
+    """기존 _collect_detail_page_info: 필드마다 try_selectors + extract_text/extract_attribute"""
+    result = {}
+    for field_name, spec in DETAIL_FIELDS.items():
+        selectors = spec['selectors'] if isinstance(spec, dict) else spec
+        elem = await helper.try_selectors(page, selectors, field_name)
+        if isinstance(spec, dict):
+            result[field_name] = await helper.extract_attribute(elem, spec['attribute'], field_name)
+        else:
+            result[field_name] = await helper.extract_text(elem, field_name)
+    return result
+
+
+async def bench_resolve_all(browser, repeat: int = 10):
+    """[6] 셀렉터 필드 8개: 필드별 왕복 (fallback 포함) vs evaluate 1회"""
+    page = await browser.new_page()
+    await page.set_content(build_detail_html())
+    per_field = SelectorHelper(order_stats=SelectorStats(enabled=False))
+    batched = SelectorHelper(order_stats=SelectorStats(enabled=False))
+
+    legacy = await _per_field_collect(per_field, page)
+    resolved = await batched.resolve_all(page, DETAIL_FIELDS)
+    assert resolved["상품명"]['text'] == legacy["상품명"]
+    assert resolved["썸네일"]['attribute'] == legacy["썸네일"]
+    assert batched.selector_stats["가격"]['last_selector'] == per_field.selector_stats["가격"]['last_selector']
+
+    legacy_ms = await _time_per_page(page, lambda pg: _per_field_collect(per_field, pg), repeat)
+    batched_ms = await _time_per_page(page, lambda pg: batched.resolve_all(pg, DETAIL_FIELDS), repeat)
+    await page.close()
+
+    print(f"\n[6] 셀렉터 필드 {len(DETAIL_FIELDS)}개 해결 (페이지당)")
+    print(f"    필드별 왕복 : {legacy_ms:8.1f} ms")
+    print(f"    일괄 해결   : {batched_ms:8.1f} ms  (x{legacy_ms / batched_ms:.1f})")
+
+
+async def main():
+    print("=== 크롤러 성능 벤치마크 (합성 페이지) ===\n")
+    async with async_playwright() as p:
+        browser = await p.firefox.launch(headless=True)
+        try:
+            await bench_extraction(browser)
+            await bench_resource_policy(browser)
+            await bench_incremental_filter(browser)
+            await bench_handle_lookup(browser)
+            await bench_resolve_all(browser)
+        finally:
+            await browser.close()
+        await bench_throughput_mode(p)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
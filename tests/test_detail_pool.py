@@ -0,0 +1,121 @@
+"""
+상세 탭 워커 풀 테스트 (브라우저 없이)
+목적: 결과 순서 보장 + 병렬 처리 + 조기 중단 확인
+"""
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.core.detail_pool import DetailWorkerPool
+
+
+class FakePage:
+    """Playwright Page 대역 (is_closed/close만 사용)"""
+
+    def __init__(self):
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.opened = 0
+
+    async def new_page(self):
+        self.opened += 1
+        return FakePage()
+
+
+async def _fetch(page, item):
+    idx, url = item
+    await asyncio.sleep(random.uniform(0.01, 0.05))  # 페이지마다 로딩 시간 다름
+    if idx == 3:
+        raise RuntimeError("로딩 실패")
+    return {'product_name': f'상품{idx}', 'product_url': url}
+
+
+def test_results_in_index_order():
+    """결과가 완료 순서가 아닌 작업 순서대로 전달되는지"""
+    async def run():
+        context = FakeContext()
+        pool = DetailWorkerPool(context, _fetch, workers=4, min_interval=0)
+        items = [(i, f'https://example.com/products/{i}') for i in range(12)]
+        received = []
+
+        async def on_result(item, result):
+            received.append((item[0], result))
+            return True
+
+        await pool.run(items, on_result)
+        await pool.close()
+        return context, received
+
+    context, received = asyncio.run(run())
+    assert [idx for idx, _ in received] == list(range(12))
+    assert isinstance(received[3][1], RuntimeError)
+    assert received[5][1]['product_name'] == '상품5'
+    assert context.opened == 4
+
+
+def test_parallel_speedup():
+    """워커 4개가 순차 처리보다 빠른지 (거의 선형)"""
+    async def fetch(page, item):
+        await asyncio.sleep(0.05)
+        return {'product_name': 'x'}
+
+    async def timed(workers):
+        pool = DetailWorkerPool(FakeContext(), fetch, workers=workers, min_interval=0)
+
+        async def on_result(item, result):
+            return True
+
+        started = time.monotonic()
+        await pool.run(list(range(16)), on_result)
+        return time.monotonic() - started
+
+    sequential = asyncio.run(timed(1))
+    parallel = asyncio.run(timed(4))
+    assert parallel < sequential / 2.5
+
+
+def test_stop_early():
+    """on_result가 False 반환하면 남은 작업 중단"""
+    async def run():
+        fetched = []
+
+        async def fetch(page, item):
+            fetched.append(item)
+            await asyncio.sleep(0.01)
+            return {'product_name': 'x'}
+
+        pool = DetailWorkerPool(FakeContext(), fetch, workers=2, min_interval=0)
+        received = []
+
+        async def on_result(item, result):
+            received.append(item)
+            return len(received) < 3
+
+        await pool.run(list(range(50)), on_result)
+        return fetched, received
+
+    fetched, received = asyncio.run(run())
+    assert received == [0, 1, 2]
+    assert len(fetched) < 10  # prefetch 범위까지만 미리 수집
+
+
+if __name__ == "__main__":
+    print("=== 상세 탭 워커 풀 테스트 ===\n")
+    test_results_in_index_order()
+    print("✓ 결과 순서 보장")
+    test_parallel_speedup()
+    print("✓ 병렬 처리 속도 향상")
+    test_stop_early()
+    print("✓ 조기 중단")
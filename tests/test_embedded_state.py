@@ -0,0 +1,79 @@
+"""
+내장 상품 데이터 (JSON-LD / 앱 상태) 추출 결과 처리 테스트 (브라우저 없이 EXTRACT_DETAIL_JS 반환값 형태로 검증)
+목적: 내장 데이터 값이 DOM 결과와 같은 형태로 변환 + 필드별 출처 기록 (리스트 응답 보충 포함)
+"""
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.core.detail_extractor import build_product_data
+from src.core.embedded_state import FieldProvenance, embedded_state_context
+from src.core.listing_capture import fill_from_listing
+
+URL = 'https://smartstore.naver.com/shop/products/4829104821'
+
+# 앱 상태에서 대부분 + JSON-LD에서 브랜드, 썸네일은 DOM
+RAW = {
+    'product_name': '린넨 셔츠',
+    'price_text': '25500',
+    'discount_rate': '15',
+    'review_count': '321',
+    'rating': 4.85,
+    'brand_name': '엘디',
+    'search_tags': ['린넨', '여름'],
+    'thumbnail_url': 'https://shop-phinf.pstatic.net/a.jpg',
+    'sources': {
+        'product_name': 'app_state', 'price_text': 'app_state', 'discount_rate': 'app_state',
+        'review_count': 'app_state', 'rating': 'app_state', 'search_tags': 'app_state',
+        'brand_name': 'json_ld', 'thumbnail_url': 'dom',
+    },
+    'embedded': {'app_state': True, 'json_ld': True, 'state_fields': ['product_name', 'price_text']},
+}
+
+
+def test_build_with_sources():
+    """내장 데이터 값이 DOM 결과와 같은 규칙으로 변환 + price_text 출처는 price로 기록"""
+    data = build_product_data(RAW, URL, '여성의류')
+    assert data['product_id'] == '4829104821'
+    assert data['price'] == 25500
+    assert data['discount_rate'] == 15
+    assert data['review_count'] == 321
+    assert data['search_tags'] == ['린넨', '여름']
+    assert data['_field_sources']['price'] == 'app_state'
+    assert data['_field_sources']['brand_name'] == 'json_ld'
+    assert 'price_text' not in data['_field_sources']
+
+    # 출처 없는 결과 (이전 형식) → 빈 출처
+    assert build_product_data({'product_name': 'x'}, URL, '여성의류')['_field_sources'] == {}
+
+    # 비활성화 → 내장 데이터 경로 없이 DOM 탐색만
+    assert embedded_state_context(False) == {}
+    assert 'product.A' in embedded_state_context()['state_product_paths']
+
+
+def test_listing_fill_and_provenance():
+    """리스트 응답으로 보충한 필드는 'listing', 출처별 집계"""
+    raw = dict(RAW, rating=None, sources={'product_name': 'dom', 'price_text': 'dom'})
+    data = build_product_data(raw, URL, '여성의류')
+    fill_from_listing(data, {'rating': 4.5, 'price': 99000})
+    assert data['rating'] == 4.5
+    assert data['price'] == 25500  # 상세 페이지 값 우선
+    assert data['_field_sources']['rating'] == 'listing'
+
+    provenance = FieldProvenance()
+    provenance.record(build_product_data(RAW, URL, '여성의류'))
+    provenance.record(data)
+    provenance.record(None)
+    stats = provenance.get_stats()
+    assert stats['pages'] == 2
+    assert stats['fields']['price'] == {'app_state': 1, 'dom': 1}
+    assert stats['fields']['rating'] == {'app_state': 1, 'listing': 1}
+    assert stats['fields']['brand_name'] == {'json_ld': 1, 'none': 1}
+
+
+if __name__ == "__main__":
+    print("=== 내장 상품 데이터 처리 테스트 ===\n")
+    test_build_with_sources()
+    print("✓ 내장 데이터 변환 + 출처")
+    test_listing_fill_and_provenance()
+    print("✓ 리스트 보충 + 출처 집계")
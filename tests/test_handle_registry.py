@@ -0,0 +1,98 @@
+"""
+상품 카드 핸들 레지스트리 테스트 (브라우저 없이)
+목적: 카드 1개 조회 + 지나간 핸들 dispose + 상품 ID 조회 확인
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.core.listing_queue import ListingQueue
+from src.core.handle_registry import ProductHandleRegistry
+
+
+class FakeHandle:
+    def __init__(self, selector):
+        self.selector = selector
+        self.disposed = False
+
+    async def dispose(self):
+        self.disposed = True
+
+
+class FakePage:
+    """query_selector만 사용 (query_selector_all 호출되면 실패)"""
+
+    def __init__(self, missing=()):
+        self.queries = []
+        self.missing = set(missing)
+
+    async def query_selector(self, selector):
+        self.queries.append(selector)
+        if selector in self.missing:
+            return None
+        return FakeHandle(selector)
+
+    async def query_selector_all(self, selector):
+        raise AssertionError("query_selector_all 호출 금지")
+
+
+def _queue(count: int) -> ListingQueue:
+    queue = ListingQueue()
+    for i in range(count):
+        queue.append(f'https://smartstore.naver.com/s/products/{i}?nvMid={80000 + i}', str(80000 + i))
+    return queue
+
+
+def test_resolve_disposes_old_handles():
+    registry = ProductHandleRegistry(_queue(100), keep=2)
+    page = FakePage()
+
+    async def run():
+        handles = []
+        for idx in range(100):
+            handles.append(await registry.resolve(page, idx))
+        return handles
+
+    handles = asyncio.run(run())
+    assert page.queries[5] == 'a[data-crawl-seq="5"]'
+    assert registry.live_count <= 3  # 현재 + keep개
+    assert all(h.disposed for h in handles[:97])
+    assert not handles[-1].disposed
+    assert registry.resolved_count == 100
+
+    asyncio.run(registry.dispose_all())
+    assert registry.live_count == 0
+    assert handles[-1].disposed
+
+
+def test_resolve_by_product_id():
+    registry = ProductHandleRegistry(_queue(10))
+    page = FakePage()
+
+    handle = asyncio.run(registry.resolve(page, '80007'))
+    assert handle.selector == 'a[data-crawl-id="80007"]'
+    assert registry.seq_of('80007') == 7
+    assert registry.live_count == 1
+
+    # 큐에 없는 ID도 셀렉터로 조회 (핸들은 추적 안 함)
+    asyncio.run(registry.resolve(page, 'https://x/"quoted"'))
+    assert page.queries[-1] == 'a[data-crawl-id="https://x/\\"quoted\\""]'
+    assert registry.live_count == 1
+
+
+def test_missing_card():
+    registry = ProductHandleRegistry(_queue(3))
+    page = FakePage(missing={'a[data-crawl-seq="1"]'})
+    assert asyncio.run(registry.resolve(page, 1)) is None
+    assert registry.live_count == 0
+
+
+if __name__ == "__main__":
+    print("=== 카드 핸들 레지스트리 테스트 ===\n")
+    test_resolve_disposes_old_handles()
+    print("✓ 지나간 핸들 dispose")
+    test_resolve_by_product_id()
+    print("✓ 상품 ID 조회")
+    test_missing_card()
+    print("✓ 카드 없음")
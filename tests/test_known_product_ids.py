@@ -0,0 +1,115 @@
+"""
+중복 체크 스냅샷 + 상품 ID 매핑 테스트 (실제 DB 없이 가짜 연결 사용)
+목적: 서버 사이드 커서로 1회 로드 → 이후 중복 체크는 DB 왕복 없이 로컬 조회 + 저장 시 스냅샷 갱신
+      리스트 href(nvMid) → 상품 ID 매핑으로 클릭 전 중복 체크가 실제 상품 ID로 판정
+"""
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+os.environ.setdefault('DB_PASSWORD', 'test')
+from src.database.db_connector import DatabaseConnector
+from fake_db import FakeConnection
+
+
+def _connector(rows, id_map=None):
+    """rows: [(product_id, category_name)]"""
+    db = DatabaseConnector()
+    db.conn = FakeConnection(categories=dict(rows), id_map=id_map)
+    return db
+
+
+def test_global_snapshot_local_lookup():
+    """전체 스냅샷: 로드 1회 후 중복 체크는 SELECT 없음"""
+    db = _connector([('111', '여성의류'), ('222', '남성의류')])
+    assert db.load_known_product_ids() == 2
+
+    name, sql, _ = db.conn.queries[0]
+    assert name == 'known_product_ids'  # 서버 사이드 커서
+    db.conn.queries.clear()
+
+    assert db.is_duplicate_product('111', {})
+    assert db.is_duplicate_product('222', {})
+    assert not db.is_duplicate_product('333', {})
+    assert db.conn.queries == []
+    assert db.duplicate_queries == 0
+
+
+def test_category_snapshot_falls_back_to_db():
+    """카테고리 스냅샷: 없는 ID만 DB 확인, 확인된 ID는 스냅샷에 추가"""
+    db = _connector([('111', '여성의류'), ('222', '남성의류')])
+    assert db.load_known_product_ids(category_name='여성의류') == 1
+    db.conn.queries.clear()
+
+    assert db.is_duplicate_product('111', {})
+    assert db.duplicate_queries == 0
+
+    assert db.is_duplicate_product('222', {})  # 다른 카테고리에 저장된 상품
+    assert db.duplicate_queries == 1
+    assert db.is_duplicate_product('222', {})  # 두 번째는 로컬
+    assert db.duplicate_queries == 1
+
+    assert not db.is_duplicate_product('333', {})
+    assert db.duplicate_queries == 2
+
+
+def test_save_updates_snapshot():
+    """저장 성공한 상품은 바로 중복으로 판정"""
+    db = _connector([])
+    db.load_known_product_ids()
+
+    result = db.save_product('여성의류', {
+        'product_id': '444',
+        'product_name': '린넨 셔츠',
+        'product_url': 'https://smartstore.naver.com/x/products/444',
+    })
+    assert result == 'saved'
+    assert db.is_duplicate_product('444', {})
+    assert db.save_product('여성의류', {'product_id': '444', 'product_name': '린넨 셔츠'}) == 'skipped'
+
+
+def test_listing_href_maps_to_product_id():
+    """상세 페이지에서 확인한 매핑 저장 → 다음 세션에서 nvMid href로 중복 판정"""
+    ad_href = 'https://cr.shopping.naver.com/adcr.nhn?x=abc&nvMid=83001122334&cat=1'
+
+    db = _connector([('111', '여성의류')])
+    db.load_known_product_ids()
+    assert not db.is_duplicate_product(db.extract_product_id(ad_href), {})
+
+    assert db.remember_product_id(ad_href, '111')
+    assert not db.remember_product_id(ad_href, '111')  # 같은 매핑은 다시 쓰지 않음
+    assert db.conn.id_map == {'83001122334': '111'}
+
+    # 다음 세션: 테이블에서 로드 (추적 파라미터가 달라도 같은 nvMid)
+    next_db = _connector([('111', '여성의류')], id_map=db.conn.id_map)
+    next_db.load_known_product_ids()
+    assert next_db.load_product_id_map() == 1
+    assert next_db.extract_product_id('https://cr.shopping.naver.com/adcr.nhn?nvMid=83001122334&x=zz') == '111'
+    assert next_db.is_duplicate_product(next_db.extract_product_id(ad_href), {})
+
+    # href에 상품 ID가 있으면 매핑하지 않음
+    assert not next_db.remember_product_id('https://smartstore.naver.com/a/products/222', '222')
+
+
+def test_fallback_id_is_stable():
+    """매핑 없는 href는 고정 해시 (프로세스마다 같은 값, 추적 파라미터 무시)"""
+    db = _connector([])
+    first = db.extract_product_id('https://brand.naver.com/shop/catalog/9?NaPm=ct%3D1')
+    assert first == db.extract_product_id('https://brand.naver.com/shop/catalog/9?NaPm=ct%3D2')
+    assert first.isdigit()
+    assert first == '964716997359133210'  # hash() 랜덤화와 무관
+
+
+if __name__ == "__main__":
+    print("=== 중복 체크 스냅샷 + 상품 ID 매핑 테스트 ===\n")
+    test_global_snapshot_local_lookup()
+    print("✓ 전체 스냅샷 로컬 조회")
+    test_category_snapshot_falls_back_to_db()
+    print("✓ 카테고리 스냅샷 + DB 재확인")
+    test_save_updates_snapshot()
+    print("✓ 저장 시 스냅샷 갱신")
+    test_listing_href_maps_to_product_id()
+    print("✓ 리스트 href → 상품 ID 매핑")
+    test_fallback_id_is_stable()
+    print("✓ 고정 해시 Fallback")
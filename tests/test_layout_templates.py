@@ -0,0 +1,93 @@
+"""
+레이아웃 템플릿 캐시 테스트 (브라우저 없이 EXTRACT_DETAIL_JS 반환값 형태로 검증)
+목적: 같은 지문의 다음 페이지에 학습된 셀렉터 전달 + 안 맞는 셀렉터만 무효화/재학습 + 실행 간 유지
+"""
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.core.layout_templates import FINGERPRINT_MARKERS, LayoutTemplateCache
+
+URL = 'https://smartstore.naver.com/shop/products/123'
+FINGERPRINT = 'smartstore:11001'
+
+
+def _raw(hits=(), misses=(), learned=None, fingerprint=FINGERPRINT):
+    """EXTRACT_DETAIL_JS 반환값 중 템플릿 관련 키"""
+    return {
+        'fingerprint': fingerprint,
+        'template_hits': list(hits),
+        'template_misses': list(misses),
+        'learned': learned or {},
+    }
+
+
+def test_learn_then_reuse():
+    """첫 페이지에서 학습 → 다음 페이지 인자에 템플릿 포함 → 적중 시 템플릿 변경 없음"""
+    cache = LayoutTemplateCache()
+    payload = cache.payload(URL)
+    assert payload['layout'] == 'smartstore'
+    assert payload['markers'] == list(FINGERPRINT_MARKERS)
+    assert payload['templates'] == {}
+
+    cache.update(_raw(learned={'review_count': 'span.XyZ12', 'brand_name': 'div.info td'}))
+    assert cache.payload(URL)['templates'][FINGERPRINT] == {
+        'review_count': 'span.XyZ12', 'brand_name': 'div.info td'
+    }
+
+    cache.update(_raw(hits=['review_count', 'brand_name']))
+    stats = cache.get_stats()
+    assert stats['pages'] == 2
+    assert stats['template_pages'] == 1
+    assert stats['field_hits'] == 2
+    assert stats['learned'] == 2
+    assert stats['invalidated'] == 0
+
+    # 비활성화 → 템플릿 없이 탐색만
+    assert LayoutTemplateCache(enabled=False).payload(URL) is None
+
+
+def test_invalidate_and_relearn():
+    """안 맞는 셀렉터만 교체, 새 셀렉터를 못 만들면 삭제, 비면 지문 자체 삭제"""
+    cache = LayoutTemplateCache()
+    cache.update(_raw(learned={'review_count': 'span.old', 'rating': 'em.old'}))
+
+    # 리뷰 셀렉터 변경 (배포로 클래스 변경) → 재학습, 평점은 그대로
+    cache.update(_raw(hits=['rating'], misses=['review_count'], learned={'review_count': 'span.new'}))
+    assert cache.templates[FINGERPRINT] == {'review_count': 'span.new', 'rating': 'em.old'}
+
+    # 셀렉터를 만들 수 없는 요소로 바뀜 → 삭제 (다음 페이지부터 탐색)
+    cache.update(_raw(misses=['review_count', 'rating']))
+    assert FINGERPRINT not in cache.templates
+    assert cache.get_stats()['invalidated'] == 3
+
+    # 다른 지문은 서로 영향 없음
+    cache.update(_raw(learned={'rating': 'em.brand'}, fingerprint='brand:10110'))
+    assert list(cache.templates) == ['brand:10110']
+
+
+def test_persist(tmp_path):
+    """저장 → 새 인스턴스가 같은 템플릿 사용, 변경 없으면 저장 안 함, 깨진 파일은 무시"""
+    path = tmp_path / 'templates' / 'layout_templates.json'
+    cache = LayoutTemplateCache(path=str(path))
+    cache.update(_raw(learned={'discount_rate': 'span.rate'}))
+    assert cache.save() is True
+    assert cache.save() is False
+
+    loaded = LayoutTemplateCache(path=str(path))
+    assert loaded.templates == {FINGERPRINT: {'discount_rate': 'span.rate'}}
+
+    path.write_text('{broken', encoding='utf-8')
+    assert LayoutTemplateCache(path=str(path)).templates == {}
+
+
+if __name__ == "__main__":
+    import tempfile
+    print("=== 레이아웃 템플릿 캐시 테스트 ===\n")
+    test_learn_then_reuse()
+    print("✓ 학습 후 재사용")
+    test_invalidate_and_relearn()
+    print("✓ 무효화 + 재학습")
+    with tempfile.TemporaryDirectory() as tmp:
+        test_persist(Path(tmp))
+    print("✓ 저장/로드")
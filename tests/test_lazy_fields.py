@@ -0,0 +1,95 @@
+"""
+지연 로딩 필드 정책 테스트 (브라우저 없이 가짜 페이지/대기 엔진 사용)
+목적: 이미 있거나 상품에 없는 것이 확실한 필드는 스크롤/대기 생략 + 필요한 필드만 위치 순으로 예산 안에서 대기
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.core.lazy_fields import LazyFieldPolicy
+
+CONFIG = {
+    'enabled': True,
+    'fields': {
+        'search_tags': {'scroll_to': 0.5, 'budget': 2.0, 'trust_embedded': True},
+        'brand_name': {'scroll_to': 0.3, 'budget': 1.5, 'trust_embedded': False},
+    },
+}
+
+
+class FakePage:
+    def __init__(self):
+        self.scrolls = []
+
+    async def evaluate(self, script, arg=None):
+        self.scrolls.append(arg)
+
+
+class FakeWaits:
+    """영역이 나타나는 필드만 True, 대기 예산 기록"""
+
+    def __init__(self, appears=()):
+        self.appears = set(appears)
+        self.calls = []
+
+    async def for_function(self, page, expression, arg, name, timeout=5.0, polling=100):
+        self.calls.append((arg, name, timeout))
+        return arg in self.appears
+
+
+def test_skip_present_and_trusted():
+    """첫 추출에 값이 있으면 생략, 앱 상태에 태그 경로가 있는데 비어 있으면 태그 없는 상품으로 보고 생략"""
+    policy = LazyFieldPolicy(CONFIG)
+    page, waits = FakePage(), FakeWaits()
+    raw = {'brand_name': '엘디', 'search_tags': [],
+           'embedded': {'app_state': True, 'state_fields': ['product_name', 'search_tags']}}
+
+    assert asyncio.run(policy.run(page, waits, raw)) is False
+    assert page.scrolls == [] and waits.calls == []
+
+    stats = policy.get_stats()
+    assert stats['brand_name']['present'] == 1
+    assert stats['search_tags']['trusted'] == 1
+
+
+def test_state_without_field_path_waits():
+    """앱 상태에서 상품을 찾았어도 태그 경로가 없으면 (다른 상품 객체/다른 구조) 대기"""
+    policy = LazyFieldPolicy(CONFIG)
+    page, waits = FakePage(), FakeWaits()
+    raw = {'brand_name': '엘디', 'search_tags': [],
+           'embedded': {'app_state': True, 'state_fields': ['product_name', 'price_text']}}
+
+    assert policy.plan(raw) == ['search_tags']
+    assert asyncio.run(policy.run(page, waits, raw)) is True
+    assert waits.calls == [('search_tags', 'lazy_search_tags', 2.0)]
+    assert policy.get_stats()['search_tags']['trusted'] == 0
+
+
+def test_wait_only_missing_fields():
+    """없는 필드만 스크롤 위치 순으로 대기 + 찾음/예산 소진 기록"""
+    policy = LazyFieldPolicy(CONFIG)
+    page, waits = FakePage(), FakeWaits(appears={'brand_name'})
+    raw = {'brand_name': None, 'search_tags': [], 'embedded': {'app_state': False}}
+
+    assert asyncio.run(policy.run(page, waits, raw)) is True
+    assert page.scrolls == [0.3, 0.5]
+    assert waits.calls == [('brand_name', 'lazy_brand_name', 1.5), ('search_tags', 'lazy_search_tags', 2.0)]
+
+    stats = policy.get_stats()
+    assert stats['brand_name']['found'] == 1
+    assert stats['search_tags']['exhausted'] == 1
+
+    # 정책 끄면 값이 있어도 항상 모든 필드 대기 (기존 고정 스크롤)
+    legacy = LazyFieldPolicy(dict(CONFIG, enabled=False))
+    assert legacy.plan({'brand_name': '엘디', 'search_tags': ['린넨']}) == ['brand_name', 'search_tags']
+
+
+if __name__ == "__main__":
+    print("=== 지연 로딩 필드 정책 테스트 ===\n")
+    test_skip_present_and_trusted()
+    print("✓ 있는 필드/태그 없는 상품 생략")
+    test_state_without_field_path_waits()
+    print("✓ 앱 상태에 필드 경로 없으면 대기")
+    test_wait_only_missing_fields()
+    print("✓ 없는 필드만 예산 안에서 대기")
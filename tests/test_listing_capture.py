@@ -0,0 +1,124 @@
+"""
+리스트 응답 캡처 테스트 (브라우저/네트워크 없이 녹화된 응답 파일 사용)
+목적: 응답 구조가 달라도 상품 ID/가격/상품명 추출 + 중복 병합 + 조회 확인
+"""
+import json
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.core.listing_capture import (
+    ListingResponseCapture,
+    fill_from_listing,
+    parse_listing_payload,
+)
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+
+def _load_capture() -> ListingResponseCapture:
+    capture = ListingResponseCapture()
+    capture.ingest_file(str(FIXTURES / 'listing_response_page1.json'))
+    capture.ingest_file(str(FIXTURES / 'listing_response_page2.json'))
+    return capture
+
+
+def test_parse_products_only():
+    """상품 객체만 추출 (필터/광고 객체 제외, 응답 순서 유지, 중복 제거)"""
+    with open(FIXTURES / 'listing_response_page1.json', encoding='utf-8') as f:
+        body = json.load(f)['body']
+
+    records = parse_listing_payload(body)
+    assert [r['nv_mid'] for r in records] == ['82914823934', '83001122334']
+
+    first = records[0]
+    assert first['product_name'] == '여성 린넨 셔츠 원피스'
+    assert first['price'] == 39900
+    assert first['discount_rate'] == 30
+    assert first['review_count'] == 1234
+    assert first['rating'] == 4.8
+    assert first['product_id'] == '7281934021'  # URL에서 추출
+    assert first['brand_name'] == '데일리브랜드'  # 같은 응답 안 중복 객체에서 병합
+
+    second = records[1]
+    assert second['price'] == 25800
+    assert second['product_id'] == '8811223344'  # channelProductNo
+    assert second['rating'] == 4.6  # 10점 만점 x10 표기
+
+
+def test_capture_merge():
+    """여러 응답 누적: 새 상품만 추가 (도착 순서), 같은 상품은 빈 값만 보충"""
+    capture = ListingResponseCapture()
+    assert capture.ingest_file(str(FIXTURES / 'listing_response_page1.json')) == 2
+
+    assert capture.ingest_file(str(FIXTURES / 'listing_response_page2.json')) == 1
+    new_record = capture.records[-1]
+    assert [r['nv_mid'] for r in capture.records] == ['82914823934', '83001122334', '84455667788']
+    assert new_record['seq'] == 2
+    assert new_record['price'] == 28800  # 할인가 우선
+
+    cardigan = capture.lookup('83001122334')
+    assert cardigan['mall_name'] == '니트하우스'  # 두 번째 응답에서 보충
+    assert cardigan['brand_name'] == '로엠'  # 기존 값 유지
+    assert capture.responses_parsed == 2
+
+
+def test_generic_id_only_for_catalog_ids():
+    """범용 'id' 키는 숫자 카탈로그 ID일 때만 상품 ID로 인정 (옵션/필터 객체 제외)"""
+    payload = {'items': [
+        {'id': 'opt-1', 'name': '베이지', 'price': 0},
+        {'id': 21003, 'name': '로엠', 'price': 1000},
+        {'id': 84455667788, 'name': '와이드 데님 팬츠', 'price': 28800},
+    ]}
+    assert [r['nv_mid'] for r in parse_listing_payload(payload)] == ['84455667788']
+
+
+def test_lookup_by_listing_href():
+    """리스트 href(리다이렉트 nvMid / 상품 URL)로 조회"""
+    capture = _load_capture()
+
+    record = capture.lookup('https://cr.shopping.naver.com/adcr.nhn?x=abc&nvMid=83001122334&cat=1')
+    assert record['product_id'] == '8811223344'
+
+    record = capture.lookup('https://smartstore.naver.com/denim/products/9012345678?NaPm=ct')
+    assert record['nv_mid'] == '84455667788'
+
+    assert capture.lookup('https://smartstore.naver.com/x/products/1') is None
+    assert capture.lookup(None) is None
+
+
+def test_fill_from_listing():
+    """상세 페이지 값 우선, 빈 필드만 리스트 값으로 보충"""
+    capture = _load_capture()
+    product_data = {
+        'product_name': '여성 린넨 셔츠 원피스',
+        'brand_name': None,
+        'price': 37900,
+        'discount_rate': None,
+        'review_count': 0,
+        'rating': None,
+        'thumbnail_url': None,
+    }
+    fill_from_listing(product_data, capture.lookup('82914823934'))
+
+    assert product_data['price'] == 37900
+    assert product_data['brand_name'] == '데일리브랜드'
+    assert product_data['discount_rate'] == 30
+    assert product_data['review_count'] == 1234
+    assert product_data['thumbnail_url'].endswith('82914823934.jpg')
+
+    assert fill_from_listing(None, capture.lookup('82914823934')) is None
+
+
+if __name__ == "__main__":
+    print("=== 리스트 응답 캡처 테스트 ===\n")
+    test_parse_products_only()
+    print("✓ 상품 객체 추출")
+    test_capture_merge()
+    print("✓ 누적 + 중복 병합")
+    test_generic_id_only_for_catalog_ids()
+    print("✓ 범용 id는 카탈로그 ID만")
+    test_lookup_by_listing_href()
+    print("✓ href 조회")
+    test_fill_from_listing()
+    print("✓ 빈 필드 보충")
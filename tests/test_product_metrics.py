@@ -0,0 +1,85 @@
+"""
+product_info / product_metrics 분리 저장 테스트 (실제 DB 없이 가짜 연결 + execute_values 대체)
+목적: 가격/리뷰만 바뀐 상품은 product_metrics만 갱신 + 상품 정보가 바뀌면 product_info 갱신
+      + 분리 전 구조(products 테이블)는 기존 UPSERT 유지
+      (두 테이블의 "다를 때만 갱신" 조건은 fake_db가 흉내 - 여기서는 SQL 조건과 결과 집계만 검증)
+"""
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+os.environ.setdefault('DB_PASSWORD', 'test')
+from src.database.db_connector import DatabaseConnector
+from src.database.bulk_loader import BulkLoader
+from fake_db import make_connector, make_product, patch_execute_values, upsert
+
+
+def test_price_change_updates_metrics_only(monkeypatch):
+    """가격만 바뀜 → product_metrics만 갱신 ('updated'), 상품명 변경 → product_info 갱신"""
+    patch_execute_values(monkeypatch)
+    db = make_connector(split=True)
+    assert upsert(db, [make_product('1', 1000), make_product('2', 2000)], skip_duplicates=False) == ['saved', 'saved']
+    info_hash = db.conn.info['1']
+
+    items = [make_product('1', 900), make_product('2', 2000, name='상품 2 (리뉴얼)'), make_product('3', 500)]
+    assert upsert(db, items, skip_duplicates=False) == ['updated', 'updated', 'saved']
+    assert db.conn.info['1'] == info_hash  # 넓은 행은 그대로
+    assert db.conn.metrics['1'] == (900, 10, 10, 4.5)
+
+    assert upsert(db, [make_product('1', 900)], skip_duplicates=False) == ['unchanged']
+
+    info_sql = next(s for s in db.conn.statements if 'INSERT INTO product_info' in s)
+    metrics_sql = next(s for s in db.conn.statements if 'INSERT INTO product_metrics' in s)
+    assert 'price' not in info_sql.split('VALUES')[0]
+    assert 'WHERE product_info.content_hash IS DISTINCT FROM EXCLUDED.content_hash' in info_sql
+    assert ('WHERE (product_metrics.price, product_metrics.discount_rate, product_metrics.review_count, '
+            'product_metrics.rating) IS DISTINCT FROM') in metrics_sql
+    assert not any('INSERT INTO products' in s for s in db.conn.statements)
+
+
+def test_hash_ignores_metrics():
+    """분리 구조의 content_hash는 product_info 컬럼만 사용 (가격이 바뀌어도 같은 해시)"""
+    db = make_connector(split=True)
+    db.has_metrics_split()
+    row = db._product_row('여성의류', make_product('1', 1000))
+    changed = db._product_row('여성의류', make_product('1', 900, review_count=11))
+    assert db.row_hash(row) == db.row_hash(changed)
+    info, metrics = db._split_row(changed)
+    assert len(info) == len(DatabaseConnector.INFO_COLUMNS) + 1
+    assert metrics == ('1', 900, 10, 11, 4.5)
+
+
+def test_without_split_keeps_products_table(monkeypatch):
+    """product_metrics가 없으면 (마이그레이션 전) products 테이블에 그대로 저장"""
+    patch_execute_values(monkeypatch)
+    db = make_connector(split=False)
+    db.content_hash_enabled = False
+    assert upsert(db, [make_product('1', 1000)], skip_duplicates=False) == ['saved']
+    assert db.metrics_split_enabled is False
+    assert any('INSERT INTO products' in s for s in db.conn.statements)
+
+
+def test_bulk_merge_split_sql():
+    """대량 적재: 두 테이블 병합을 한 문장으로 + 신규/갱신 개수 1행"""
+    loader = BulkLoader(make_connector(split=True))
+    sql = ' '.join(loader._merge_split_sql(skip_duplicates=False).split())
+    assert sql.startswith('WITH info AS ( INSERT INTO product_info')
+    assert 'metrics AS ( INSERT INTO product_metrics' in sql
+    assert f'FROM {loader.staging_table} WHERE product_id IS NOT NULL' in sql
+    assert 'EXCEPT SELECT product_id FROM info WHERE inserted' in sql
+
+
+if __name__ == "__main__":
+    import pytest
+    print("=== product_info / product_metrics 분리 테스트 ===\n")
+    with pytest.MonkeyPatch.context() as mp:
+        test_price_change_updates_metrics_only(mp)
+    print("✓ 가격 변경은 product_metrics만 갱신")
+    test_hash_ignores_metrics()
+    print("✓ 해시는 product_info 컬럼만")
+    with pytest.MonkeyPatch.context() as mp:
+        test_without_split_keeps_products_table(mp)
+    print("✓ 분리 전 구조 유지")
+    test_bulk_merge_split_sql()
+    print("✓ 대량 적재 병합 SQL")
@@ -0,0 +1,127 @@
+"""
+가격/리뷰 이력 테스트 (실제 DB 없이 가짜 연결 + execute_values 대체)
+목적: 상품 UPSERT와 같은 트랜잭션에서 배치당 INSERT 1회 + 추적 값이 바뀐 상품만 이력 추가
+      + 중복으로 건너뛴 상품도 같은 규칙 + 이력 저장 실패는 상품 저장에 영향 없음 + 월별 파티션 범위/생성
+      (마지막 이력과 비교하는 LATERAL 조건은 fake_db가 흉내 - 여기서는 어떤 행을 언제 보내는지만 검증)
+"""
+import os
+import sys
+from datetime import date
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+os.environ.setdefault('DB_PASSWORD', 'test')
+from src.database.db_connector import snapshot_partition
+from fake_db import make_connector, make_product, patch_execute_values, upsert
+
+
+def test_snapshot_only_on_change(monkeypatch):
+    """처음 본 상품은 이력 1행, 값이 같으면 추가 없음, 가격/리뷰가 바뀌면 추가"""
+    patch_execute_values(monkeypatch)
+    db = make_connector(snapshot_table=True)
+    assert upsert(db, [make_product('1', 1000), make_product('2', 2000)]) == ['saved', 'saved']
+    assert db.snapshot_count == 2
+    assert db.conn.snapshots['1'] == [(1000, 10, 10, 45)]  # 평점 4.5 → 45
+
+    # 다시 수집: 상품 1은 그대로, 상품 2는 가격 인하 + 리뷰 증가
+    assert upsert(db, [make_product('1', 1000), make_product('2', 1800, review_count=12)]) == ['skipped', 'skipped']
+    assert db.snapshot_count == 3
+    assert db.conn.snapshots['2'][-1] == (1800, 10, 12, 45)
+    assert len(db.conn.snapshots['1']) == 1
+
+    # 배치당 이력 INSERT 1회, 상품 INSERT와 같은 트랜잭션 (커밋 1회)
+    snapshot_inserts = [s for s in db.conn.statements if 'INSERT INTO product_snapshots' in s]
+    assert len(snapshot_inserts) == 2
+    assert 'LEFT JOIN LATERAL' in snapshot_inserts[0] and 'IS DISTINCT FROM' in snapshot_inserts[0]
+    assert db.conn.commits == 3  # 이번 달 파티션 생성 1회 (따로 커밋) + 배치마다 1회
+
+
+def test_skipped_rows_follow_same_rule(monkeypatch):
+    """스냅샷으로 건너뛴 상품도 DO NOTHING으로 건너뛴 상품처럼 수집한 값을 이력에 기록"""
+    patch_execute_values(monkeypatch)
+    db = make_connector(snapshot_table=True)
+    upsert(db, [make_product('1', 1000)])
+    db.load_known_product_ids()
+
+    # 상품 1은 스냅샷으로 건너뜀 (DB 전송 없음) → 이력은 신규 상품 2와 같은 INSERT로 기록
+    assert upsert(db, [make_product('1', 900), make_product('2', 2000)]) == ['skipped', 'saved']
+    assert db.conn.snapshots['1'][-1] == (900, 10, 10, 45)
+    assert db.snapshot_count == 3
+    assert sum('INSERT INTO product_snapshots' in s for s in db.conn.statements) == 2
+
+    # 배치 전체가 스냅샷으로 건너뛰어도 이력만 기록 + 커밋 (같은 배치 안 중복은 1회)
+    commits = db.conn.commits
+    assert upsert(db, [make_product('1', 800), make_product('1', 800), make_product('2', 2000)]) == ['skipped'] * 3
+    assert db.conn.snapshots['1'][-1] == (800, 10, 10, 45)
+    assert len(db.conn.snapshots['2']) == 1
+    assert db.snapshot_count == 4
+    assert db.conn.commits == commits + 1
+    assert not any('INSERT INTO products' in s for s in db.conn.statements[-3:])
+
+    # 행 단위 저장 (save_product)도 같은 규칙
+    assert db.save_product('여성의류', make_product('2', 1900)) == 'skipped'
+    assert db.conn.snapshots['2'][-1] == (1900, 10, 10, 45)
+
+
+def test_partition_per_month(monkeypatch):
+    """파티션은 달마다 1회 확인/생성 + DDL은 저장 트랜잭션과 별도로 커밋"""
+    patch_execute_values(monkeypatch)
+    db = make_connector(snapshot_table=True)
+    assert db.has_snapshots()
+    assert db.has_snapshots()
+    this_month = snapshot_partition(db.conn.server_month)[0]
+    creates = [s for s in db.conn.statements if s.startswith('CREATE TABLE IF NOT EXISTS')]
+    assert creates == [s for s in creates if this_month in s] and len(creates) == 1
+    assert db.conn.commits == 1  # 저장 없이 DDL만 커밋
+    assert "SELECT date_trunc('month', CURRENT_TIMESTAMP)::date" in db.conn.statements
+
+    # 같은 커넥터로 서버 시계의 달이 바뀌면 새 달 파티션 생성 (크롤러 PC 시계와 무관)
+    db.conn.server_month = date(2027, 1, 1)
+    upsert(db, [make_product('1', 1000)])
+    assert ("CREATE TABLE IF NOT EXISTS product_snapshots_202701 PARTITION OF product_snapshots "
+            "FOR VALUES FROM ('2027-01-01') TO ('2027-02-01')") in db.conn.statements
+    assert db.conn.commits == 3  # 새 달 DDL 1회 + 배치 1회
+    assert db.snapshot_partitions == {this_month, 'product_snapshots_202701'}
+
+    assert db.ensure_snapshot_partition(date(2027, 1, 31)) is False  # 이미 확인한 달
+
+
+def test_snapshot_failure_keeps_product_save(monkeypatch):
+    """이력 INSERT 실패는 SAVEPOINT로 되돌리고 상품 저장은 유지"""
+    patch_execute_values(monkeypatch)
+    db = make_connector(snapshot_table=True)
+    db.conn.fail_snapshots = True
+    assert upsert(db, [make_product('1', 1000)]) == ['saved']
+    assert 'ROLLBACK TO SAVEPOINT product_snapshots' in db.conn.statements
+    assert db.snapshot_count == 0
+
+
+def test_values_and_partitions():
+    """추적 값이 모두 없으면 이력 없음 + 월별 파티션 경계 (12월 → 다음 해 1월)"""
+    db = make_connector(snapshot_table=True)
+    empty = db._product_row('여성의류', {'product_id': '9', 'product_name': '가격 없음'})
+    assert db._snapshot_values(empty) is None
+
+    assert snapshot_partition(date(2026, 12, 15)) == (
+        'product_snapshots_202612', date(2026, 12, 1), date(2027, 1, 1)
+    )
+    assert snapshot_partition(date(2026, 3, 1))[2] == date(2026, 4, 1)
+
+
+if __name__ == "__main__":
+    import pytest
+    print("=== 가격/리뷰 이력 테스트 ===\n")
+    with pytest.MonkeyPatch.context() as mp:
+        test_snapshot_only_on_change(mp)
+    print("✓ 값이 바뀔 때만 이력 추가")
+    with pytest.MonkeyPatch.context() as mp:
+        test_skipped_rows_follow_same_rule(mp)
+    print("✓ 스냅샷/DO NOTHING 건너뜀 모두 이력 기록")
+    with pytest.MonkeyPatch.context() as mp:
+        test_partition_per_month(mp)
+    print("✓ 달마다 파티션 생성 + 별도 커밋")
+    with pytest.MonkeyPatch.context() as mp:
+        test_snapshot_failure_keeps_product_save(mp)
+    print("✓ 이력 실패 시 상품 저장 유지")
+    test_values_and_partitions()
+    print("✓ 이력 값 + 월별 파티션")
@@ -0,0 +1,50 @@
+"""
+조회 인덱스 + 상품 검색 테스트 (실제 DB 없이 가짜 연결 사용)
+목적: 인덱스 교체가 현재 스키마에만 적용되고 다시 실행해도 안전 + 검색 조건이 인덱스를 타는 형태로 생성
+"""
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+os.environ.setdefault('DB_PASSWORD', 'test')
+from src.database.db_connector import DatabaseConnector
+from src.database.query_indexes import QUERY_INDEXES, apply_query_indexes
+from fake_db import FakeConnection
+
+
+def test_apply_indexes_in_current_schema():
+    """제거는 스키마 이름을 붙여 실행 + 분리 구조면 product_info에 생성 + 이미 있는 인덱스는 건너뜀"""
+    conn = FakeConnection(split=True, indexes={'idx_crawl_history_resume'})
+    created = apply_query_indexes(conn.cursor(), concurrently=True)
+
+    assert created == ['idx_product_search_tags', 'idx_product_name_trgm']
+    assert 'CREATE EXTENSION IF NOT EXISTS pg_trgm' in conn.statements
+    assert 'DROP INDEX CONCURRENTLY IF EXISTS crawl.idx_product_name' in conn.statements
+    assert ('CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_product_name_trgm '
+            'ON product_info USING GIN (product_name gin_trgm_ops)') in conn.statements
+    assert not any('idx_crawl_history_resume ON' in s for s in conn.statements)
+
+    # 분리 전 구조는 products 테이블에 생성
+    conn = FakeConnection(split=False)
+    assert len(apply_query_indexes(conn.cursor())) == len(QUERY_INDEXES)
+    assert 'CREATE INDEX IF NOT EXISTS idx_product_search_tags ON products USING GIN (search_tags)' in conn.statements
+
+
+def test_search_products_conditions():
+    """상품명은 ILIKE (와일드카드 이스케이프), 태그는 배열 포함(@>) 조건"""
+    db = DatabaseConnector()
+    db.conn = FakeConnection()
+    assert db.search_products(keyword='50%_할인', tag='린넨', limit=10) == []
+
+    _, sql, params = db.conn.queries[-1]
+    assert 'product_name ILIKE %s AND search_tags @> ARRAY[%s]::text[]' in sql
+    assert params == ['%50\\%\\_할인%', '린넨', 10]
+
+
+if __name__ == "__main__":
+    print("=== 조회 인덱스 + 상품 검색 테스트 ===\n")
+    test_apply_indexes_in_current_schema()
+    print("✓ 현재 스키마에 인덱스 적용")
+    test_search_products_conditions()
+    print("✓ 검색 조건")
@@ -0,0 +1,118 @@
+"""
+리소스 차단 정책 테스트 (브라우저 없이)
+목적: 역할별 판정 + 차단/통과 카운터 + 절약 바이트 추정 확인
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.core.resource_policy import ResourcePolicy, DEFAULT_SIZE_ESTIMATE
+
+POLICY = {
+    'enabled': True,
+    'listing': {'block_types': ['font'], 'block_patterns': ['lcs.naver.com'], 'allow_patterns': []},
+    'detail': {
+        'block_types': ['image', 'font'],
+        'block_patterns': ['lcs.naver.com'],
+        'allow_patterns': ['/keep/'],
+    },
+}
+
+
+class FakeFrame:
+    def __init__(self, page):
+        self.page = page
+
+
+class FakeRequest:
+    def __init__(self, page, resource_type, url):
+        self.frame = FakeFrame(page)
+        self.resource_type = resource_type
+        self.url = url
+
+
+class FakeRoute:
+    def __init__(self):
+        self.result = None
+
+    async def abort(self, error_code=None):
+        self.result = 'abort'
+
+    async def fallback(self):
+        self.result = 'fallback'
+
+
+class FakeResponse:
+    def __init__(self, resource_type, length):
+        self.headers = {'content-length': str(length)}
+        self.request = FakeRequest(None, resource_type, '')
+
+
+def test_should_block_by_role():
+    policy = ResourcePolicy(POLICY)
+    # 리스트: 이미지 유지, 폰트/비콘 차단
+    assert not policy.should_block('listing', 'image', 'https://shopping-phinf.pstatic.net/a.jpg')
+    assert policy.should_block('listing', 'font', 'https://x/a.woff2')
+    assert policy.should_block('listing', 'xhr', 'https://lcs.naver.com/m?u=1')
+    # 상세: 이미지 차단, allow 패턴 우선
+    assert policy.should_block('detail', 'image', 'https://shop-phinf.pstatic.net/a.jpg')
+    assert not policy.should_block('detail', 'image', 'https://shop-phinf.pstatic.net/keep/a.jpg')
+    assert not policy.should_block('detail', 'document', 'https://smartstore.naver.com/x/products/1')
+
+
+def test_route_counters_and_bytes():
+    """역할 미지정 페이지 = detail, 차단 크기는 관찰 평균 우선"""
+    policy = ResourcePolicy(POLICY)
+    listing_page, popup_page = object(), object()
+    policy.set_role(listing_page, 'listing')
+
+    # 리스트에서 이미지 2개 통과 (평균 10,000 bytes 학습)
+    policy._on_response(FakeResponse('image', 8_000))
+    policy._on_response(FakeResponse('image', 12_000))
+
+    async def run():
+        routes = []
+        for page, resource_type, url in [
+            (listing_page, 'image', 'https://a/1.jpg'),
+            (popup_page, 'image', 'https://a/2.jpg'),
+            (popup_page, 'font', 'https://a/f.woff2'),
+            (popup_page, 'document', 'https://smartstore.naver.com/x/products/1'),
+        ]:
+            route = FakeRoute()
+            await policy._handle_route(route, FakeRequest(page, resource_type, url))
+            routes.append(route.result)
+        return routes
+
+    results = asyncio.run(run())
+    assert results == ['fallback', 'abort', 'abort', 'fallback']
+
+    stats = policy.get_stats()
+    assert stats['blocked'] == 2
+    assert stats['allowed'] == 2
+    assert stats['blocked_by_role']['detail'] == {'image': 1, 'font': 1}
+    assert stats['bytes_saved'] == 10_000 + DEFAULT_SIZE_ESTIMATE['font']
+
+
+def test_disabled_policy():
+    policy = ResourcePolicy(dict(POLICY, enabled=False))
+
+    class FakeContext:
+        routed = False
+
+        async def route(self, pattern, handler):
+            self.routed = True
+
+    context = FakeContext()
+    asyncio.run(policy.install(context))
+    assert not context.routed
+
+
+if __name__ == "__main__":
+    print("=== 리소스 차단 정책 테스트 ===\n")
+    test_should_block_by_role()
+    print("✓ 역할별 판정")
+    test_route_counters_and_bytes()
+    print("✓ 차단 카운터 + 절약 바이트")
+    test_disabled_policy()
+    print("✓ 비활성화")
@@ -0,0 +1,104 @@
+"""
+셀렉터 적중 통계 테스트 (브라우저 없이 SelectorStats만 사용)
+목적: 자주 맞는 셀렉터를 먼저 시도 + 감쇠로 최근 결과 우선 + 레이아웃별 분리 + 실행 간 유지
+"""
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.utils.selector_stats import SelectorStats, is_generic, layout_key
+
+PRICE_SELECTORS = ['span.price em', 'strong[class*="price"]', '[class*="total_price"]', 'em[class*="salePrice"]']
+
+
+def _lookup(stats, hit, layout='smartstore'):
+    """try_selectors처럼 통계 순서로 시도 → hit 셀렉터에서 멈춤, 시도 횟수 반환"""
+    tried = []
+    for selector in stats.order('가격', PRICE_SELECTORS, layout):
+        tried.append(selector)
+        if selector == hit:
+            break
+    stats.record('가격', tried, hit if hit in tried else None, layout)
+    return len(tried)
+
+
+def test_order_adapts_to_hits():
+    """기록 없으면 config 순서, 세 번째 셀렉터만 맞으면 다음부터 첫 시도에 적중"""
+    stats = SelectorStats()
+    assert stats.order('가격', PRICE_SELECTORS) == PRICE_SELECTORS
+
+    assert _lookup(stats, '[class*="total_price"]') == 3
+    assert _lookup(stats, '[class*="total_price"]') == 1
+    assert stats.order('가격', PRICE_SELECTORS, 'smartstore')[0] == '[class*="total_price"]'
+    # 실패한 셀렉터는 아직 시도하지 않은 셀렉터보다 뒤로
+    assert stats.order('가격', PRICE_SELECTORS, 'smartstore')[-2:] == ['span.price em', 'strong[class*="price"]']
+
+    # 다른 레이아웃은 영향 없음
+    assert stats.order('가격', PRICE_SELECTORS, 'brand') == PRICE_SELECTORS
+    assert stats.get_stats()['queries_per_lookup'] == 2.0
+
+
+def test_decay_prefers_recent():
+    """오래 맞던 셀렉터가 계속 실패하면 감쇠로 금방 순위가 바뀜"""
+    stats = SelectorStats(decay=0.8)
+    for _ in range(20):
+        _lookup(stats, 'span.price em')
+    for _ in range(6):
+        _lookup(stats, 'em[class*="salePrice"]')
+    assert stats.order('가격', PRICE_SELECTORS, 'smartstore')[0] == 'em[class*="salePrice"]'
+
+
+def test_generic_fallback_stays_last():
+    """항상 맞는 텍스트/단순 태그 fallback은 적중률이 높아도 클래스 셀렉터보다 앞서지 않음"""
+    selectors = PRICE_SELECTORS + ['em:has-text("원")']
+    stats = SelectorStats()
+    for _ in range(10):  # 클래스 셀렉터는 모두 실패, fallback만 적중
+        stats.record('가격', stats.order('가격', selectors), 'em:has-text("원")')
+    assert stats.order('가격', selectors)[-1] == 'em:has-text("원")'
+
+    # 클래스 셀렉터끼리는 그대로 적중 순으로 정렬
+    stats.record('가격', ['em[class*="salePrice"]'], 'em[class*="salePrice"]')
+    assert stats.order('가격', selectors)[0] == 'em[class*="salePrice"]'
+
+    # config에서 앞에 둔 단순 태그(h3)도 위치 고정
+    names = ['h3', 'h3[class*="title"]', '[class*="product_title"]']
+    for _ in range(5):
+        stats.record('상품명', ['h3', '[class*="product_title"]'], '[class*="product_title"]')
+    assert stats.order('상품명', names) == ['h3', '[class*="product_title"]', 'h3[class*="title"]']
+
+    assert is_generic('img') and is_generic('div:has-text("%")') and is_generic('text="관련 태그"')
+    assert not is_generic('img[class*="thumb"]') and not is_generic('span.price em')
+
+
+def test_persist_and_layout_key(tmp_path):
+    """저장 → 새 인스턴스가 같은 순서 사용, 변경 없으면 저장 안 함 + URL → 레이아웃"""
+    path = tmp_path / 'stats' / 'selector_stats.json'
+    stats = SelectorStats(path=str(path))
+    _lookup(stats, 'strong[class*="price"]')
+    assert stats.save() is True
+    assert stats.save() is False  # 변경 없음
+
+    loaded = SelectorStats(path=str(path))
+    assert loaded.order('가격', PRICE_SELECTORS, 'smartstore')[0] == 'strong[class*="price"]'
+
+    path.write_text('{broken', encoding='utf-8')
+    assert SelectorStats(path=str(path)).data == {}  # 깨진 파일은 무시
+
+    assert layout_key('https://smartstore.naver.com/shop/products/123') == 'smartstore'
+    assert layout_key('https://m.brand.naver.com/brand/products/123') == 'brand'
+    assert layout_key('https://shopping.naver.com/window-products/style/123') == 'window'
+    assert layout_key(None) == 'unknown'
+
+
+if __name__ == "__main__":
+    import tempfile
+    print("=== 셀렉터 적중 통계 테스트 ===\n")
+    test_order_adapts_to_hits()
+    print("✓ 적중 셀렉터 우선")
+    test_decay_prefers_recent()
+    print("✓ 감쇠로 최근 결과 우선")
+    test_generic_fallback_stays_last()
+    print("✓ 텍스트/단순 태그 fallback 위치 고정")
+    with tempfile.TemporaryDirectory() as tmp:
+        test_persist_and_layout_key(Path(tmp))
+    print("✓ 저장/로드 + 레이아웃 키")
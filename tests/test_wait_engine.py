@@ -0,0 +1,150 @@
+"""
+대기 엔진 테스트 (브라우저 없이 가짜 페이지 사용)
+목적: 신호가 오면 True/응답 반환 + 시간 초과/오류는 False/None + 대기 이름별 지연 시간 기록
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+from src.core.listing_capture import is_listing_response
+from src.core.wait_engine import WaitEngine
+
+
+class TimeoutError_(Exception):
+    """Playwright TimeoutError 대용"""
+
+
+class FakeRequest:
+    def __init__(self, resource_type):
+        self.resource_type = resource_type
+
+
+class FakeResponse:
+    def __init__(self, url, resource_type='xhr', content_type='application/json'):
+        self.url = url
+        self.request = FakeRequest(resource_type)
+        self.headers = {'content-type': content_type}
+        self.finished_called = False
+
+    async def finished(self):
+        self.finished_called = True
+
+
+class FakePage:
+    """selectors/responses에 있는 신호만 성공, 나머지는 시간 초과 예외"""
+
+    def __init__(self, selectors=(), responses=(), evaluate_result=True):
+        self.selectors = set(selectors)
+        self.responses = list(responses)
+        self.evaluate_result = evaluate_result
+
+    async def wait_for_selector(self, selector, state='visible', timeout=0):
+        await asyncio.sleep(0.01)
+        if selector not in self.selectors:
+            raise TimeoutError_(f'{selector} 시간 초과')
+
+    async def wait_for_function(self, expression, arg=None, timeout=0, polling=100):
+        if not arg:
+            raise TimeoutError_('조건 시간 초과')
+
+    async def wait_for_event(self, event, predicate=None, timeout=0):
+        for response in self.responses:
+            if predicate(response):
+                return response
+        raise TimeoutError_('응답 시간 초과')
+
+    async def evaluate(self, script, arg=None):
+        if isinstance(self.evaluate_result, Exception):
+            raise self.evaluate_result
+        return self.evaluate_result
+
+
+def test_success_and_timeout_paths():
+    """신호가 오면 True, 시간 초과/페이지 오류는 예외 없이 False"""
+    waits = WaitEngine()
+    page = FakePage(selectors={'h3'})
+
+    assert asyncio.run(waits.for_selector(page, 'h3', 'detail_ready')) is True
+    assert asyncio.run(waits.for_selector(page, 'h4', 'detail_ready')) is False
+    assert asyncio.run(waits.for_function(page, '(n) => n', 1, 'queue')) is True
+    assert asyncio.run(waits.for_function(page, '(n) => n', 0, 'queue')) is False
+    assert asyncio.run(waits.for_dom_quiet(page, 'settle')) is True
+    assert asyncio.run(waits.for_dom_quiet(FakePage(evaluate_result=False), 'settle')) is False
+    assert asyncio.run(waits.for_dom_quiet(FakePage(evaluate_result=RuntimeError('closed')), 'settle')) is False
+
+
+def test_for_response_listing():
+    """리스트 응답만 기다림 (완료까지 대기) + 없으면 None"""
+    waits = WaitEngine()
+    image = FakeResponse('https://shopping.naver.com/img/1.jpg', resource_type='image', content_type='image/jpeg')
+    listing = FakeResponse('https://shopping.naver.com/api/search/products?page=2')
+
+    response = asyncio.run(waits.for_response(FakePage(responses=[image, listing]), is_listing_response, 'scroll'))
+    assert response is listing
+    assert listing.finished_called
+
+    assert asyncio.run(waits.for_response(FakePage(responses=[image]), is_listing_response, 'scroll')) is None
+    assert waits.get_stats('scroll')['timeouts'] == 1
+
+
+class SlowPage(FakePage):
+    """조건이 끝내 참이 되지 않는 페이지 (timeout까지 기다린 뒤 시간 초과)"""
+
+    async def wait_for_function(self, expression, arg=None, timeout=0, polling=100):
+        await asyncio.sleep(timeout / 1000)
+        raise TimeoutError_('조건 시간 초과')
+
+
+async def _resolve_later(value):
+    """잠시 뒤 value로 끝나는 신호 (for_response 대용)"""
+    await asyncio.sleep(0.02)
+    return value
+
+
+def test_function_ends_early_only_on_success():
+    """성공 신호(응답)가 오면 조건 대기를 일찍 끝냄 + 신호 없음(None)은 대기를 줄이지 않음"""
+    waits = WaitEngine()
+
+    async def wait_with(signal):
+        early = asyncio.ensure_future(_resolve_later(signal))
+        started = time.monotonic()
+        ok = await waits.for_function(SlowPage(), '(n) => false', 1, 'queue', timeout=0.3, early=early)
+        return ok, time.monotonic() - started
+
+    ok, elapsed = asyncio.run(wait_with(FakeResponse('https://shopping.naver.com/api/search/products')))
+    assert ok is True and elapsed < 0.2
+
+    ok, elapsed = asyncio.run(wait_with(None))
+    assert ok is False and elapsed >= 0.3  # 응답이 없어도 끝까지 대기
+    assert waits.get_stats('queue')['timeouts'] == 1
+
+
+def test_record_and_stats():
+    """대기 이름별 횟수/시간 초과/평균/최대 기록, 기록 없는 이름은 None"""
+    waits = WaitEngine()
+    page = FakePage(selectors={'h3'})
+    for selector in ('h3', 'h3', 'h4'):
+        asyncio.run(waits.for_selector(page, selector, 'detail_ready'))
+
+    stats = waits.get_stats('detail_ready')
+    assert stats['count'] == 3
+    assert stats['timeouts'] == 1
+    assert stats['max'] >= 0.01
+    assert abs(stats['avg'] - stats['total'] / 3) < 1e-9
+    assert waits.get_stats('missing') is None
+
+    waits.print_stats()  # 출력 오류 없음
+
+
+if __name__ == "__main__":
+    print("=== 대기 엔진 테스트 ===\n")
+    test_success_and_timeout_paths()
+    print("✓ 성공/시간 초과 경로")
+    test_for_response_listing()
+    print("✓ 리스트 응답 대기")
+    test_function_ends_early_only_on_success()
+    print("✓ 응답이 오면 조건 대기 단축")
+    test_record_and_stats()
+    print("✓ 대기별 통계")